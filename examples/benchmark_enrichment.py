@@ -0,0 +1,93 @@
+"""
+Compare three ways of adding "born_in" to the winners by name, as in pandas_2--data-cleaning.py:
+- apply: df['name'].apply(get_born_in) with a df_born_in.loc[name] lookup per row (clean_data_v4);
+- align: assignment of the df_born_in column aligned on the name index (clean_data_v5);
+- merge: enrich(...) of winners_cleaning.py, one hash join of the names with the keys of df_born_in.
+All the strategies must give the same column.
+
+The data are synthetic: every name has a few prizes and some of the names have a "born_in" record,
+with duplicates in the "born_in" records as in the scraped data.
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from winners_cleaning import enrich
+
+
+def make_data(rows: int, seed: int = 0) -> tuple:
+    rng = np.random.default_rng(seed)
+    names = np.array([f"Winner {i}" for i in range(max(rows // 2, 1))], dtype=object)
+    df = pd.DataFrame({'name': rng.choice(names, rows), 'year': rng.integers(1901, 2024, rows)})
+    born_in_names = rng.choice(names, max(len(names) // 7, 1))  # with duplicates
+    df_born_in = pd.DataFrame({
+        'name': born_in_names,
+        'born_in': rng.choice(['Austria', 'Germany', 'Poland', 'Russia', 'Algeria'], len(born_in_names)),
+    })
+    return df, df_born_in
+
+
+def apply_strategy(df: pd.DataFrame, df_born_in: pd.DataFrame) -> pd.Series:
+    df_born_in = df_born_in.drop_duplicates(subset=['name']).set_index('name')
+
+    def get_born_in(name):
+        try:
+            born_in = df_born_in.loc[name]['born_in']
+        except KeyError:
+            born_in = np.nan
+        return born_in
+
+    return df['name'].apply(get_born_in)
+
+
+def align_strategy(df: pd.DataFrame, df_born_in: pd.DataFrame) -> pd.Series:
+    df_born_in = df_born_in.drop_duplicates(subset=['name']).set_index('name')
+    df = df.set_index('name')
+    df['born_in'] = df_born_in.born_in
+    return df.born_in.reset_index(drop=True)
+
+
+def merge_strategy(df: pd.DataFrame, df_born_in: pd.DataFrame) -> pd.Series:
+    return enrich(df, df_born_in, on='name', columns=['born_in'], duplicates='first').born_in
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 100_000, 10_000_000])
+    parser.add_argument('--repeat', type=int, default=3, help='calls per strategy, the best one is reported')
+    parser.add_argument('--apply-max-rows', type=int, default=100_000, help='apply is skipped above, it takes too long')
+    args = parser.parse_args()
+
+    print(f"{'rows':>12}{'apply ms':>14}{'align ms':>14}{'merge ms':>14}")
+    for rows in args.rows:
+        df, df_born_in = make_data(rows)
+        strategies = [align_strategy, merge_strategy]
+        if rows <= args.apply_max_rows:
+            strategies.insert(0, apply_strategy)
+        timings, results = {}, {}
+        for strategy in strategies:
+            best = float('inf')
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                results[strategy] = strategy(df, df_born_in)
+                best = min(best, time.perf_counter() - start)
+            timings[strategy.__name__] = best
+        expected = results[merge_strategy]
+        for strategy, result in results.items():
+            pd.testing.assert_series_equal(result, expected, check_names=False, check_dtype=False)
+        print(f"{rows:>12}" + ''.join(
+            f"{timings[name] * 1000:>14.1f}" if name in timings else f"{'-':>14}"
+            for name in ('apply_strategy', 'align_strategy', 'merge_strategy')
+        ))
+
+"""
+Run from the examples directory:
+$ python benchmark_enrichment.py --rows 1000 100000 10000000
+
+        rows      apply ms      align ms      merge ms
+        1000          12.1           1.2           0.8
+      100000        1789.2          12.6          15.4
+    10000000             -        7660.5        7851.7
+"""
@@ -0,0 +1,126 @@
+"""
+Compare inst_to_dict of sqlalchemy_.py, a dictionary per ORM instance of session.query(Winner),
+with query_to_columns of sqlalchemy_columns.py, a Core select of the columns transposed into
+a dictionary of lists, of NumPy arrays or a DataFrame.
+All the strategies must give the same values.
+
+The data are synthetic winners in an in-memory SQLite database with the Winner table of sqlalchemy_.py.
+"""
+import argparse
+import time
+
+import numpy as np
+from sqlalchemy import create_engine, insert
+from sqlalchemy import Column, Integer, String, Enum
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import sessionmaker
+
+from sqlalchemy_columns import query_to_columns
+
+Base = declarative_base()
+
+
+class Winner(Base):
+    __tablename__ = 'winners'
+    id = Column(Integer, primary_key=True)
+    category = Column(String)
+    name = Column(String)
+    nationality = Column(String)
+    gender = Column(Enum('male', 'female'))
+    year = Column(Integer)
+
+
+def inst_to_dict(inst, delete_id=True):
+    # As in sqlalchemy_.py
+    dat = {}
+    for column in inst.__table__.columns:
+        dat[column.name] = getattr(inst, column.name)
+    if delete_id:
+        dat.pop('id')
+    return dat
+
+
+def make_session(rows: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Winner), [
+            {
+                'category': category,
+                'name': f"Winner {i}",
+                'nationality': nationality,
+                'gender': gender,
+                'year': int(year),
+            }
+            for i, (category, nationality, gender, year) in enumerate(zip(
+                rng.choice(['Chemistry', 'Economics', 'Literature', 'Peace', 'Physics'], rows),
+                rng.choice(['British', 'French', 'German', 'Polish', 'US-American'], rows),
+                rng.choice(['male', 'female'], rows),
+                rng.integers(1901, 2024, rows),
+            ))
+        ])
+    return sessionmaker(bind=engine)
+
+
+def inst_to_dict_strategy(session):
+    return [inst_to_dict(w) for w in session.query(Winner)]
+
+
+def lists_strategy(session):
+    return query_to_columns(session, Winner, output='lists')
+
+
+def numpy_strategy(session):
+    return query_to_columns(session, Winner, output='numpy')
+
+
+def dataframe_strategy(session):
+    return query_to_columns(session, Winner, output='dataframe')
+
+
+def to_records(result) -> list:
+    # The rows of any strategy as a list of dictionaries of Python values
+    if isinstance(result, list):
+        return result
+    if isinstance(result, dict):
+        return [dict(zip(result, row)) for row in zip(*(np.asarray(column).tolist() for column in result.values()))]
+    return result.to_dict(orient='records')
+
+
+STRATEGIES = (inst_to_dict_strategy, lists_strategy, numpy_strategy, dataframe_strategy)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3, help='calls per strategy, the best one is reported')
+    args = parser.parse_args()
+
+    print(f"{'rows':>12}" + ''.join(f"{strategy.__name__.removesuffix('_strategy') + ' ms':>18}"
+                                    for strategy in STRATEGIES))
+    for rows in args.rows:
+        Session = make_session(rows)
+        timings, results = {}, {}
+        for strategy in STRATEGIES:
+            best = float('inf')
+            for _ in range(args.repeat):
+                # A new session every call, so the identity map is empty as in a request
+                with Session() as session:
+                    start = time.perf_counter()
+                    results[strategy] = strategy(session)
+                    best = min(best, time.perf_counter() - start)
+            timings[strategy] = best
+        expected = results[inst_to_dict_strategy]
+        for strategy, result in results.items():
+            assert to_records(result) == expected, strategy.__name__
+        print(f"{rows:>12}" + ''.join(f"{timings[strategy] * 1000:>18.1f}" for strategy in STRATEGIES))
+
+"""
+Run from the examples directory:
+$ python benchmark_inst_to_dict.py --rows 1000 100000 1000000
+
+        rows   inst_to_dict ms          lists ms          numpy ms      dataframe ms
+        1000              17.8               5.3               6.2               6.4
+      100000            2965.0             785.6            1116.1            1062.2
+     1000000           28749.7           12193.0           15422.0           17154.3
+"""
@@ -0,0 +1,311 @@
+"""
+Load-testing benchmark of the Flask winners endpoints:
+- a synthetic winners_cleaned database (and a Parquet file for /api/winners) of the given size is built;
+- the endpoints are driven concurrently through the Flask test client (in-process) or HTTP (a running server);
+- p50/p95/p99 latencies and requests per second are reported per endpoint
+and stored as JSON, so that later runs can be compared with --baseline.
+
+Endpoints:
+- /winners/?category=...&year=... and /winners/<id>/ of server_restful_api_with_methodview.py;
+- /api/winners?country=...&category=... of server_api.py.
+
+The /winners/ endpoints are served through the ResponseCache of response_cache.py,
+and a few hundred random URLs fit in its LRU, so after the first requests they mostly measure cache hits.
+They are run twice: "cached" with the random URLs and "uncached" with a unique cache-busting argument per request,
+which the views ignore, so every request misses the cache and queries the database.
+"""
+import argparse
+import datetime
+import importlib
+import itertools
+import json
+import os
+import random
+import sqlite3
+import statistics
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+CATEGORIES = ('Chemistry', 'Economics', 'Literature', 'Peace', 'Physics', 'Physiology or Medicine')
+GENDERS = ('male', 'female')
+COUNTRIES = (
+    'United States', 'United Kingdom', 'Germany', 'France', 'Sweden', 'Japan', 'Switzerland', 'Russia',
+    'Netherlands', 'Italy', 'Austria', 'Canada', 'Denmark', 'Norway', 'Belgium', 'Poland', 'Israel',
+    'Australia', 'India', 'China', 'Spain', 'Ireland', 'South Africa', 'Hungary', 'Argentina',
+)
+YEARS = range(1901, 2024)
+
+
+def generate_winners(rows: int, seed: int = 0):
+    rng = random.Random(seed)
+    for index in range(rows):
+        year = rng.choice(YEARS)
+        award_age = rng.randint(25, 90)
+        name = f"Winner {index}"
+        yield {
+            'index': index,
+            'name': name,
+            'link': f"https://en.wikipedia.org/wiki/Winner_{index}",
+            'year': year,
+            'category': rng.choice(CATEGORIES),
+            'country': rng.choice(COUNTRIES),
+            'text': f"{name}, {year}",
+            'wikidata_code': f"Q{index}",
+            'date_of_birth': f"{year - award_age}-01-01",
+            'date_of_death': None,
+            'place_of_birth': rng.choice(COUNTRIES),
+            'place_of_death': None,
+            'gender': rng.choice(GENDERS),
+            'born_in': rng.choice(COUNTRIES) if rng.random() < 0.1 else None,
+            'award_age': award_age,
+        }
+
+
+def chunked(iterable, size: int):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def build_database(path: str, rows: int, seed: int = 0, chunk_size: int = 100_000):
+    if os.path.exists(path):
+        os.remove(path)
+    connection = sqlite3.connect(path)
+    connection.execute("""
+        CREATE TABLE winners_cleaned (
+            "index" INTEGER PRIMARY KEY, name VARCHAR, link VARCHAR, year INTEGER, category VARCHAR,
+            country VARCHAR, text TEXT, wikidata_code VARCHAR, date_of_birth VARCHAR, date_of_death VARCHAR,
+            place_of_birth VARCHAR, place_of_death VARCHAR, gender VARCHAR, born_in VARCHAR, award_age INTEGER
+        )
+    """)
+    insert = """
+        INSERT INTO winners_cleaned VALUES (
+            :index, :name, :link, :year, :category, :country, :text, :wikidata_code, :date_of_birth,
+            :date_of_death, :place_of_birth, :place_of_death, :gender, :born_in, :award_age
+        )
+    """
+    with connection:
+        for chunk in chunked(generate_winners(rows, seed), chunk_size):
+            connection.executemany(insert, chunk)
+    connection.close()
+
+
+def build_parquet(path: str, rows: int, seed: int = 0, chunk_size: int = 100_000):
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    for chunk in chunked(generate_winners(rows, seed), chunk_size):
+        df = pd.DataFrame(chunk).drop(columns=['index'])
+        df['date_of_birth'] = pd.to_datetime(df['date_of_birth'])
+        table = pa.Table.from_pandas(df.set_index('name'))
+        if writer is None:
+            writer = pq.ParquetWriter(path, table.schema)
+        writer.write_table(table)
+    writer.close()
+
+
+CACHED_ENDPOINTS = ('/winners/', '/winners/<id>/')
+
+
+def make_requests(rows: int, seed: int = 1, cache: str = 'both') -> list:
+    """
+    Every benchmark gets its endpoint and a function that makes a random URL of the request.
+    The cached endpoints get a "cached" and/or an "uncached" benchmark.
+    """
+    rng = random.Random(seed)
+    make_urls = {
+        '/winners/': lambda: f"/winners/?category={rng.choice(CATEGORIES)}&year={rng.choice(YEARS)}",
+        '/winners/<id>/': lambda: f"/winners/{rng.randrange(rows)}/",
+        '/api/winners': lambda: f"/api/winners?country={rng.choice(COUNTRIES)}&category={rng.choice(CATEGORIES)}",
+    }
+    counter = itertools.count()
+
+    def cache_busting(make_url):
+        def make_unique_url() -> str:
+            url = make_url()
+            return f"{url}{'&' if '?' in url else '?'}nocache={next(counter)}"
+        return make_unique_url
+
+    benchmarks = []
+    for endpoint, make_url in make_urls.items():
+        if endpoint not in CACHED_ENDPOINTS:
+            benchmarks.append((endpoint, endpoint, make_url))
+            continue
+        if cache in ('both', 'cached'):
+            benchmarks.append((f"{endpoint} cached", endpoint, make_url))
+        if cache in ('both', 'uncached'):
+            benchmarks.append((f"{endpoint} uncached", endpoint, cache_busting(make_url)))
+    return benchmarks
+
+
+def make_client_getters() -> dict:
+    """
+    Flask test clients: the apps are imported after the database paths are set in the environment
+    """
+    restful_app = importlib.import_module('server_restful_api_with_methodview').app
+    parquet_app = importlib.import_module('server_api').app
+    local = threading.local()
+
+    def getter(app):
+        def get(url: str) -> int:
+            clients = local.__dict__.setdefault('clients', {})
+            client = clients.setdefault(app.name, app.test_client())
+            return client.get(url, headers={'Accept-Encoding': 'identity'}).status_code
+        return get
+
+    return {
+        '/winners/': getter(restful_app),
+        '/winners/<id>/': getter(restful_app),
+        '/api/winners': getter(parquet_app),
+    }
+
+
+def make_http_getters(restful_url: str, parquet_url: str) -> dict:
+    def getter(base_url: str):
+        def get(url: str) -> int:
+            try:
+                with urllib.request.urlopen(base_url + url) as response:
+                    response.read()
+                    return response.status
+            except urllib.error.HTTPError as error:
+                return error.code
+        return get
+
+    return {
+        '/winners/': getter(restful_url),
+        '/winners/<id>/': getter(restful_url),
+        '/api/winners': getter(parquet_url),
+    }
+
+
+def run_endpoint(get, make_url, requests: int, concurrency: int) -> dict:
+    urls = [make_url() for _ in range(requests)]
+
+    def timed_get(url: str) -> tuple:
+        start = time.perf_counter()
+        status = get(url)
+        return time.perf_counter() - start, status
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(timed_get, urls))
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for latency, _ in results]
+    percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+    return {
+        'requests': requests,
+        # Any response but 2xx and 304 (Not Modified) is an error, e.g. 404 of a missing winner
+        'errors': sum(not (200 <= status < 300 or status == 304) for _, status in results),
+        'p50_ms': percentiles[49] * 1000,
+        'p95_ms': percentiles[94] * 1000,
+        'p99_ms': percentiles[98] * 1000,
+        'requests_per_second': requests / elapsed,
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def print_report(report: dict, baseline: dict = None):
+    print(f"{'endpoint':<24}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>12}{'errors':>8}")
+    for endpoint, result in report['results'].items():
+        line = (
+            f"{endpoint:<24}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+            f"{result['requests_per_second']:>12.1f}{result['errors']:>8}"
+        )
+        if baseline and endpoint in baseline['results']:
+            before = baseline['results'][endpoint]
+            line += (
+                f"  p95 {(result['p95_ms'] / before['p95_ms'] - 1) * 100:+.1f}%"
+                f"  req/s {(result['requests_per_second'] / before['requests_per_second'] - 1) * 100:+.1f}%"
+            )
+        print(line)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000, help='size of the synthetic data set, 1k to 10M')
+    parser.add_argument('--requests', type=int, default=1_000, help='requests per endpoint')
+    parser.add_argument('--concurrency', type=int, default=8, help='concurrent clients')
+    parser.add_argument('--cache', choices=('both', 'cached', 'uncached'), default='both',
+                        help='run the /winners/ endpoints with cache hits, with cache misses or both')
+    parser.add_argument('--mode', choices=('client', 'http'), default='client')
+    parser.add_argument('--restful-url', default='http://localhost:8000', help='server_restful_api_with_methodview.py in the http mode')
+    parser.add_argument('--parquet-url', default='http://localhost:8001', help='server_api.py in the http mode')
+    parser.add_argument('--data-dir', default='../benchmark-data', help='where the synthetic data is built')
+    parser.add_argument('--reuse-data', action='store_true', help='do not rebuild existing synthetic data')
+    parser.add_argument('--output', default=None, help='JSON file of the results')
+    parser.add_argument('--baseline', default=None, help='JSON file of earlier results to compare with')
+    args = parser.parse_args()
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    db_path = os.path.abspath(os.path.join(args.data_dir, f"winners-{args.rows}.db"))
+    parquet_path = os.path.abspath(os.path.join(args.data_dir, f"winners-{args.rows}.parquet"))
+    if not (args.reuse_data and os.path.exists(db_path) and os.path.exists(parquet_path)):
+        print(f"Building {args.rows} synthetic winners in {args.data_dir}")
+        build_database(db_path, args.rows)
+        build_parquet(parquet_path, args.rows)
+
+    if args.mode == 'client':
+        os.environ['FLASK_SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + db_path
+        os.environ['FLASK_WINNERS_PARQUET'] = parquet_path
+        getters = make_client_getters()
+    else:
+        print(f"Start the servers with FLASK_SQLALCHEMY_DATABASE_URI=sqlite:///{db_path} and FLASK_WINNERS_PARQUET={parquet_path}")
+        getters = make_http_getters(args.restful_url, args.parquet_url)
+
+    report = {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'revision': git_revision(),
+        'rows': args.rows,
+        'mode': args.mode,
+        'concurrency': args.concurrency,
+        'cache': args.cache,
+        'results': {},
+    }
+    for name, endpoint, make_url in make_requests(args.rows, cache=args.cache):
+        get = getters[endpoint]
+        get(make_url())  # warm up: the first request loads the Parquet file
+        report['results'][name] = run_endpoint(get, make_url, args.requests, args.concurrency)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    print_report(report, baseline)
+
+    output = args.output or os.path.join(args.data_dir, f"results-{report['timestamp'][:19].replace(':', '-')}.json")
+    with open(output, 'w') as file:
+        json.dump(report, file, indent=2)
+    print(f"Results stored in {output}")
+
+"""
+Run in-process with the Flask test client:
+$ python benchmark_winners.py --rows 100000 --requests 2000 --concurrency 16
+
+Or against running servers:
+$ FLASK_SQLALCHEMY_DATABASE_URI=sqlite:///$PWD/../benchmark-data/winners-100000.db python server_restful_api_with_methodview.py
+$ FLASK_WINNERS_PARQUET=$PWD/../benchmark-data/winners-100000.parquet flask --app server_api run --port 8001
+$ python benchmark_winners.py --rows 100000 --reuse-data --mode http
+
+Compare with an earlier run:
+$ python benchmark_winners.py --rows 100000 --reuse-data --baseline ../benchmark-data/results-2024-01-01T12-00-00.json
+"""
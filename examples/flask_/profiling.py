@@ -0,0 +1,212 @@
+"""
+Opt-in per-request instrumentation of the Flask examples:
+- the time spent in SQL (SQLAlchemy cursor events) and the number of queries;
+- the time spent in serialization (marshmallow dump or another serializer) and in JSON encoding;
+- the numbers are returned in the "Server-Timing" header of every response
+and aggregated at /metrics in the Prometheus text format;
+- a sample of the requests is profiled with cProfile and dumped to PROFILING_DIR.
+
+Enable it in the environment:
+$ FLASK_PROFILING=true FLASK_PROFILING_SAMPLE_RATE=0.01 python server_restful_api_with_methodview.py
+
+This example is based on:
+- https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Server-Timing;
+- https://prometheus.io/docs/instrumenting/exposition_formats/;
+- https://docs.sqlalchemy.org/en/20/core/events.html#sqlalchemy.events.ConnectionEvents;
+- https://docs.python.org/3/library/profile.html.
+"""
+import cProfile
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import Response, g, has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+
+PHASES = ('sql', 'serialize', 'json')
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def record(phase: str, seconds: float):
+    # Outside of an instrumented request, nothing is recorded
+    if has_request_context() and 'timings' in g:
+        g.timings[phase] += seconds
+
+
+@contextmanager
+def timer(phase: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, time.perf_counter() - start)
+
+
+def timed(phase: str):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(phase):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """
+    The same output as the default JSON provider of Flask, the encoding time is recorded
+    """
+    def dumps(self, obj, **kwargs) -> str:
+        with timer('json'):
+            return super().dumps(obj, **kwargs)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append((context, time.perf_counter()))
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _, start = conn.info['query_start'].pop()
+    record('sql', time.perf_counter() - start)
+    if has_request_context() and 'query_count' in g:
+        g.query_count += 1
+
+
+def handle_error(exception_context):
+    # A failed statement gets no after_cursor_execute: pop its start, or the next statements get the wrong one
+    conn = exception_context.connection
+    stack = conn.info.get('query_start') if conn is not None else None
+    if stack and stack[-1][0] is exception_context.execution_context:
+        _, start = stack.pop()
+        record('sql', time.perf_counter() - start)
+
+
+class Metrics:
+    """
+    Counters of all the requests of the process
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = defaultdict(int)  # (endpoint, method, status) -> count
+        self.phase_seconds = defaultdict(float)  # (endpoint, phase) -> seconds
+        self.queries = defaultdict(int)  # endpoint -> count
+        self.buckets = defaultdict(lambda: [0] * len(DURATION_BUCKETS))  # endpoint -> cumulative counts
+        self.seconds = defaultdict(float)  # endpoint -> seconds
+        self.count = defaultdict(int)  # endpoint -> count
+
+    def observe(self, endpoint: str, method: str, status: int, total: float, timings: dict, query_count: int):
+        with self._lock:
+            self.requests[endpoint, method, status] += 1
+            for phase, seconds in timings.items():
+                self.phase_seconds[endpoint, phase] += seconds
+            self.queries[endpoint] += query_count
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if total <= bound:
+                    self.buckets[endpoint][i] += 1
+            self.seconds[endpoint] += total
+            self.count[endpoint] += 1
+
+    def render(self) -> str:
+        with self._lock:
+            lines = [
+                '# HELP flask_requests_total Requests by endpoint, method and status.',
+                '# TYPE flask_requests_total counter',
+            ]
+            for (endpoint, method, status), count in sorted(self.requests.items()):
+                lines.append(f'flask_requests_total{{endpoint="{endpoint}",method="{method}",status="{status}"}} {count}')
+            lines += [
+                '# HELP flask_request_phase_seconds_total Time spent in SQL, serialization and JSON encoding.',
+                '# TYPE flask_request_phase_seconds_total counter',
+            ]
+            for (endpoint, phase), seconds in sorted(self.phase_seconds.items()):
+                lines.append(f'flask_request_phase_seconds_total{{endpoint="{endpoint}",phase="{phase}"}} {seconds}')
+            lines += [
+                '# HELP flask_sql_queries_total SQL queries by endpoint.',
+                '# TYPE flask_sql_queries_total counter',
+            ]
+            for endpoint, count in sorted(self.queries.items()):
+                lines.append(f'flask_sql_queries_total{{endpoint="{endpoint}"}} {count}')
+            lines += [
+                '# HELP flask_request_duration_seconds Request duration.',
+                '# TYPE flask_request_duration_seconds histogram',
+            ]
+            for endpoint in sorted(self.count):
+                for bound, count in zip(DURATION_BUCKETS, self.buckets[endpoint]):
+                    lines.append(f'flask_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound}"}} {count}')
+                lines.append(f'flask_request_duration_seconds_bucket{{endpoint="{endpoint}",le="+Inf"}} {self.count[endpoint]}')
+                lines.append(f'flask_request_duration_seconds_sum{{endpoint="{endpoint}"}} {self.seconds[endpoint]}')
+                lines.append(f'flask_request_duration_seconds_count{{endpoint="{endpoint}"}} {self.count[endpoint]}')
+        return '\n'.join(lines) + '\n'
+
+
+def server_timing(timings: dict, query_count: int, total: float) -> str:
+    entries = []
+    for phase in PHASES:
+        entry = f"{phase};dur={timings.get(phase, 0.0) * 1000:.3f}"
+        if phase == 'sql':
+            entry += f';desc="{query_count} queries"'
+        entries.append(entry)
+    entries.append(f"total;dur={total * 1000:.3f}")
+    return ', '.join(entries)
+
+
+def init_app(app, db=None, schemas: tuple = (), serializers: tuple = ()) -> tuple:
+    """
+    Instrument the app if PROFILING is true; otherwise, the app is left as it is.
+    Return the serializer functions, timed as 'serialize' if PROFILING is true, as they are otherwise.
+    """
+    app.config.setdefault('PROFILING', False)
+    app.config.setdefault('PROFILING_SAMPLE_RATE', 0.0)  # share of the requests profiled with cProfile
+    app.config.setdefault('PROFILING_DIR', 'profiles')
+    if not app.config['PROFILING']:
+        return tuple(serializers)
+
+    metrics = Metrics()
+    app.json = TimedJSONProvider(app)
+    for schema in schemas:
+        schema.dump = timed('serialize')(schema.dump)
+    if db is not None:
+        from sqlalchemy import event
+        with app.app_context():
+            event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+            event.listen(db.engine, 'after_cursor_execute', after_cursor_execute)
+            event.listen(db.engine, 'handle_error', handle_error)
+
+    @app.before_request
+    def start_timing():
+        g.timings = defaultdict(float)
+        g.query_count = 0
+        g.request_start = time.perf_counter()
+        if random.random() < app.config['PROFILING_SAMPLE_RATE']:
+            g.profiler = cProfile.Profile()
+            try:
+                g.profiler.enable()
+            except ValueError:  # another profiler is active
+                g.pop('profiler')
+
+    @app.after_request
+    def stop_timing(response):
+        if 'request_start' not in g:
+            return response
+        total = time.perf_counter() - g.request_start
+        endpoint = request.endpoint or 'not_found'
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            profiler.disable()
+            os.makedirs(app.config['PROFILING_DIR'], exist_ok=True)
+            file_name = f"{time.time_ns()}-{endpoint}.prof"
+            profiler.dump_stats(os.path.join(app.config['PROFILING_DIR'], file_name))
+        response.headers['Server-Timing'] = server_timing(g.timings, g.query_count, total)
+        if endpoint != 'metrics':
+            metrics.observe(endpoint, request.method, response.status_code, total, g.timings, g.query_count)
+        return response
+
+    def metrics_view():
+        return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
+    return tuple(timed('serialize')(serializer) for serializer in serializers)
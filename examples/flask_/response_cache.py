@@ -0,0 +1,112 @@
+"""
+Response cache with ETags for the winners REST examples:
+- a cached GET response is stored under the request path, the sorted query arguments and the table version;
+- the write handlers call bump() after commit, so all the older entries are no longer looked up;
+- every cached response has a strong ETag, and "If-None-Match" gets "304 Not Modified" without a body.
+
+This example is based on:
+- https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/ETag;
+- https://werkzeug.palletsprojects.com/en/3.0.x/wrappers/#werkzeug.wrappers.Response.make_conditional.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from flask import Response, make_response, request
+
+
+class LRUCacheBackend:
+    """
+    In-process backend: when it is full, the least recently used entry is evicted
+    """
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._counters = {}  # The counters are not evicted
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            if key in self._counters:
+                return self._counters[key]
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: str, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+
+class RedisCacheBackend:
+    """
+    Backend shared by all the worker processes, e.g.:
+    ResponseCache(RedisCacheBackend(redis.Redis(host='localhost', port=6379)))
+    """
+    def __init__(self, client, prefix: str = 'winners:', ttl: int = 3600):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl  # The entries of older table versions expire by themselves
+
+    def get(self, key: str):
+        value = self.client.get(self.prefix + key)
+        return None if value is None else json.loads(value)
+
+    def set(self, key: str, value):
+        self.client.set(self.prefix + key, json.dumps(value), ex=self.ttl)
+
+    def incr(self, key: str) -> int:
+        return self.client.incr(self.prefix + key)
+
+
+class ResponseCache:
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None else LRUCacheBackend()
+
+    @property
+    def version(self) -> int:
+        return int(self.backend.get('version') or 0)
+
+    def bump(self) -> int:
+        """
+        Call it after every committed write to the table
+        """
+        return self.backend.incr('version')
+
+    def make_key(self) -> str:
+        # ?year=1921&category=Physics and ?category=Physics&year=1921 share the entry
+        args = sorted(request.args.items(multi=True))
+        return f"{self.version}:{request.path}?{json.dumps(args)}"
+
+    def cached(self, view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = self.make_key()
+            entry = self.backend.get(key)
+            if entry is None:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200 or response.is_streamed:
+                    return response
+                body = response.get_data()
+                entry = {
+                    'etag': hashlib.sha256(body).hexdigest(),
+                    'mimetype': response.mimetype,
+                    'body': body.decode(),
+                }
+                self.backend.set(key, entry)
+            response = Response(entry['body'], mimetype=entry['mimetype'])
+            response.set_etag(entry['etag'])  # strong ETag
+            response.cache_control.no_cache = True  # The clients should revalidate with "If-None-Match"
+            return response.make_conditional(request)
+        return wrapper
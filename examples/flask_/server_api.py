@@ -2,36 +2,306 @@
 This Flask example is based on:
 - "Data Visualization with Python and JavaScript: Scrape, Clean, Explore, and Transform Your Data", Kyran Dale, O'Reilly, 2023.
 """
+import functools
+import json
+import operator
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import click
+import numpy as np
 import pandas as pd
 from flask import Flask, request, abort
 
+import profiling
+
 
 app = Flask(__name__)
+# The compact schema of pandas_2--data-cleaning.py: categorical text filters, int16 years, int8 ages
+app.config['WINNERS_PARQUET'] = '../parquet-files/nobel_winners_cleaned_compact.parquet'
+app.config['WINNERS_COLUMNS_DIR'] = None  # Directory of memory-mapped columns, see export-columns below
+app.config.from_prefixed_env()  # e.g. FLASK_WINNERS_PARQUET=/tmp/winners.parquet
+profiling.init_app(app)  # Server-Timing headers and /metrics if FLASK_PROFILING=true
+
+
+OPERATORS = {
+    'eq': operator.eq,
+    'gt': operator.gt,
+    'gte': operator.ge,
+    'lt': operator.lt,
+    'lte': operator.le,
+    'in': np.isin,
+    'startswith': lambda categories, prefix: categories.str.startswith(prefix),
+}
+
+
+def factorize(column: pd.Series) -> tuple:
+    # The missing values get the code -1
+    codes, categories = pd.factorize(column, sort=True)
+    return codes, pd.Index(np.asarray(categories, dtype=object))
+
+
+class WinnersColumns:
+    """
+    One loaded version of the winners: the columns as NumPy arrays.
+    The text columns are factorized into integer codes and sorted categories,
+    so a condition is evaluated over the few categories and then gathered by the codes.
+    The boolean masks are cached by (column, operator, value) and combined with bitwise AND,
+    and only the matching rows are turned into a DataFrame by take(row_ids).
+    """
+    filter_columns = ('country', 'category', 'year', 'gender', 'award_age')
+
+    def __init__(self, rows: int, values: dict, codes: dict, take, mask_cache_size: int = 256):
+        self.rows = rows
+        self.values = values  # column -> NumPy array of a numeric column
+        self.codes = codes  # column -> (codes, categories) of a text column
+        self.take = take
+        self.mask = functools.lru_cache(maxsize=mask_cache_size)(self._mask)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'WinnersColumns':
+        values, codes = {}, {}
+        for column in cls.filter_columns:
+            if pd.api.types.is_numeric_dtype(df[column]):
+                values[column] = df[column].to_numpy()
+            else:
+                codes[column] = factorize(df[column])
+        return cls(len(df), values, codes, df.take)
+
+    @classmethod
+    def from_directory(cls, directory: str) -> 'WinnersColumns':
+        """
+        Map the columns written by export_columns(...) into memory without reading them:
+        the pages are shared through the page cache by all the processes that map the same files.
+        """
+        with open(os.path.join(directory, 'manifest.json')) as file:
+            manifest = json.load(file)
+        # The files of the version the manifest names; a directory exported without versions has them at the top
+        version_directory = os.path.join(directory, manifest.get('version', ''))
+
+        def load(file_name: str) -> np.ndarray:
+            return np.load(os.path.join(version_directory, file_name), mmap_mode='r')
+
+        values, codes, strings = {}, {}, {}
+        for column in manifest['columns']:
+            name, kind = column['name'], column['kind']
+            if kind == 'values':
+                values[name] = load(f"{name}.npy")
+            elif kind == 'codes':
+                with open(os.path.join(version_directory, f"{name}.categories.json")) as file:
+                    codes[name] = load(f"{name}.codes.npy"), pd.Index(json.load(file), dtype=object)
+            else:
+                strings[name] = load(f"{name}.offsets.npy"), load(f"{name}.data.npy"), load(f"{name}.valid.npy")
+
+        def take(row_ids: np.ndarray) -> pd.DataFrame:
+            data = {}
+            for column in manifest['columns']:
+                name = column['name']
+                if name in values:
+                    data[name] = values[name][row_ids]
+                elif name in codes:
+                    column_codes, categories = codes[name]
+                    # The code -1 takes the last item, i.e. None
+                    data[name] = np.append(categories.to_numpy(), None)[column_codes[row_ids]]
+                else:
+                    offsets, buffer, valid = strings[name]
+                    data[name] = [
+                        bytes(buffer[offsets[i]:offsets[i + 1]]).decode() if valid[i] else None
+                        for i in row_ids
+                    ]
+            return pd.DataFrame(data, columns=[column['name'] for column in manifest['columns']])
+
+        return cls(manifest['rows'], values, codes, take)
+
+    def parse(self, column: str, operator_name: str, text: str):
+        """
+        Convert the text of a request argument into a hashable value of the column type
+        """
+        if column not in self.values:
+            convert = str
+        elif pd.api.types.is_integer_dtype(self.values[column]):
+            convert = int
+        else:
+            convert = float
+        if operator_name == 'in':
+            return tuple(convert(item) for item in text.split(','))
+        if operator_name == 'startswith' and column in self.values:
+            raise ValueError(f"{column} is not a text column")
+        return convert(text)
+
+    def _mask(self, column: str, operator_name: str, value) -> np.ndarray:
+        condition = OPERATORS[operator_name]
+        if column in self.values:
+            return np.asarray(condition(self.values[column], value))
+        codes, categories = self.codes[column]
+        # One more False at the end is for the code -1 of the missing values
+        matched = np.append(np.asarray(condition(categories, value), dtype=bool), False)
+        return matched[codes]
+
+    def filter(self, criteria: list) -> pd.DataFrame:
+        """
+        criteria: (column, operator, value) triples
+        """
+        mask = np.ones(self.rows, dtype=bool)
+        for column, operator_name, value in criteria:
+            mask &= self.mask(column, operator_name, value)
+        return self.take(np.flatnonzero(mask))
+
+
+def export_columns(df: pd.DataFrame, directory: str, keep: int = 2):
+    """
+    Write every column into its own .npy files that can be memory-mapped:
+    - numbers and dates as they are;
+    - the text filter columns as int32 codes and a JSON list of the categories;
+    - the other text columns as UTF-8 bytes, their offsets and a validity mask.
+    The index is not written because to_json(orient="records") leaves it out.
+
+    The running servers may have the files of the current export mapped, and overwriting a mapped file
+    in place gives them wrong data or kills them with SIGBUS. So every export goes into a new version directory,
+    and then manifest.json, which names the version, is replaced atomically with os.replace:
+    its modification time tells the servers to reload. Only the keep newest versions are left;
+    a removed file stays readable through the mappings that still use it.
+    """
+    os.makedirs(directory, exist_ok=True)
+    version_directory = tempfile.mkdtemp(prefix=f"{time.time_ns()}-", dir=directory)
+    version = os.path.basename(version_directory)
+    manifest = {'version': version, 'rows': len(df), 'columns': []}
+    for name in df.columns:
+        column = df[name]
+        if pd.api.types.is_numeric_dtype(column) or pd.api.types.is_datetime64_any_dtype(column):
+            kind = 'values'
+            array = column.to_numpy()
+            if array.dtype == object:  # nullable extension types, e.g. Int64 with <NA>
+                array = column.astype('float64').to_numpy()
+            np.save(os.path.join(version_directory, f"{name}.npy"), array)
+        elif name in WinnersColumns.filter_columns:
+            kind = 'codes'
+            codes, categories = factorize(column)
+            np.save(os.path.join(version_directory, f"{name}.codes.npy"), codes.astype(np.int32))
+            with open(os.path.join(version_directory, f"{name}.categories.json"), 'w') as file:
+                json.dump(categories.tolist(), file)
+        else:
+            kind = 'strings'
+            valid = column.notna().to_numpy()
+            encoded = [str(text).encode() if is_valid else b'' for text, is_valid in zip(column, valid)]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(item) for item in encoded], out=offsets[1:])
+            np.save(os.path.join(version_directory, f"{name}.offsets.npy"), offsets)
+            np.save(
+                os.path.join(version_directory, f"{name}.data.npy"),
+                np.frombuffer(b''.join(encoded), dtype=np.uint8),
+            )
+            np.save(os.path.join(version_directory, f"{name}.valid.npy"), valid)
+        manifest['columns'].append({'name': name, 'kind': kind})
+
+    manifest_path = os.path.join(directory, 'manifest.json')
+    with open(f"{manifest_path}.{version}.tmp", 'w') as file:
+        json.dump(manifest, file, indent=2)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(f"{manifest_path}.{version}.tmp", manifest_path)
+
+    # The version directories are named by the export time
+    versions = sorted(
+        entry.name for entry in os.scandir(directory)
+        if entry.is_dir() and entry.name.split('-')[0].isdigit()
+    )
+    for old_version in versions[:-keep]:
+        if old_version != version:
+            shutil.rmtree(os.path.join(directory, old_version), ignore_errors=True)
+
+
+def read_winners(path: str) -> pd.DataFrame:
+    # Without the option, the Arrow-backed strings of the compact schema are read as Python strings
+    with pd.option_context('mode.string_storage', 'pyarrow'):
+        return pd.read_parquet(path)
+
+
+class WinnersStore:
+    """
+    The winners are loaded once and shared by all the requests of the process.
+    They are loaded again when the modification time of the file changes.
+    """
+    def __init__(self, path: str, load):
+        self.path = path
+        self.load = load
+        self._mtime = None
+        self._columns = None  # WinnersColumns replaced as a whole on reload
+        self._lock = threading.Lock()
+
+    def columns(self) -> WinnersColumns:
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime != self._mtime:
+            with self._lock:
+                if mtime != self._mtime:  # Another thread could already reload it
+                    app.logger.info(f"Loading {self.path}")
+                    self._columns = self.load(self.path)
+                    self._mtime = mtime
+        return self._columns
+
+
+if app.config['WINNERS_COLUMNS_DIR']:
+    # Memory-mapped columns: no Parquet parsing at startup and no private copy of the data per worker
+    winners_store = WinnersStore(
+        os.path.join(app.config['WINNERS_COLUMNS_DIR'], 'manifest.json'),
+        lambda path: WinnersColumns.from_directory(os.path.dirname(path)),
+    )
+else:
+    winners_store = WinnersStore(
+        app.config['WINNERS_PARQUET'],
+        lambda path: WinnersColumns.from_frame(read_winners(path)),
+    )
+
+
+@app.cli.command('export-columns')
+@click.argument('directory', default='../parquet-files/nobel_winners_cleaned.columns')
+def export_columns_command(directory: str):
+    """
+    Export WINNERS_PARQUET to memory-mapped columns for FLASK_WINNERS_COLUMNS_DIR.
+    """
+    export_columns(read_winners(app.config['WINNERS_PARQUET']), directory)
+    click.echo(f"Exported {app.config['WINNERS_PARQUET']} to {directory}")
+
+
+def parse_criteria(columns: WinnersColumns, args) -> list:
+    """
+    Turn request arguments like country=Japan, year__gte=1950, category__in=Physics,Chemistry
+    or country__startswith=United into (column, operator, value) triples.
+    The values are never put into an expression string, so quotes in them are harmless.
+    """
+    criteria = []
+    for key, text in args.items():
+        column, _, operator_name = key.partition('__')
+        if column not in WinnersColumns.filter_columns or not text:
+            continue
+        operator_name = operator_name or 'eq'
+        if operator_name not in OPERATORS:
+            raise ValueError(f"Unknown operator: {operator_name}")
+        criteria.append((column, operator_name, columns.parse(column, operator_name, text)))
+    return criteria
 
 
 @app.route('/api/winners')
 def get_winners():
-    df = pd.read_parquet('../parquet-files/nobel_winners_cleaned.parquet')
     print(f"Request args: {dict(request.args)}")
-    total_query = ""
-    country = request.args.get("country")
-    category = request.args.get("category")
-    year = request.args.get("year")
-
-    if country:
-        total_query = f"country == '{country}'" if not total_query else total_query + f"and country == '{country}'"
-    if category:
-        total_query = f"category == '{category}'" if not total_query else total_query + f"and category == '{category}'"
-    if year:
-        total_query = f"year == {year}" if not total_query else total_query + f"and year == {year}"
-
-    if total_query:
-        df_result = df.query(total_query)
-    else:
+    columns = winners_store.columns()
+    try:
+        criteria = parse_criteria(columns, request.args)
+    except ValueError:
+        abort(400)  # Bad request, e.g. year=abc
+
+    if not criteria:
         abort(404)  # Resource not found
 
+    df_result = columns.filter(criteria)
+
     if len(df_result) > 0:
-        return df_result.to_json(orient="records")
+        with profiling.timer('serialize'):
+            return df_result.to_json(orient="records")
+    abort(404)
 
 
 if __name__ == '__main__':
@@ -47,4 +317,14 @@ http://localhost:8000/api/winners?country=Japan&catagory=Physics
 
 Or write in the command line:
 $ curl -d category=Physics -d country=Japan --get http://localhost:8000/api/winners
+
+Filter with operators: "in" (comma-separated values), "gt", "gte", "lt", "lte" and "startswith":
+$ curl "http://localhost:8000/api/winners?category__in=Physics,Chemistry&year__gte=2000&country__startswith=United"
+
+Serve with several worker processes that share one memory-mapped copy of the data.
+Export the Parquet file once to a directory of .npy columns:
+$ flask --app server_api export-columns ../parquet-files/nobel_winners_cleaned.columns
+
+Then every worker maps the columns instead of parsing Parquet into its own DataFrame:
+$ FLASK_WINNERS_COLUMNS_DIR=../parquet-files/nobel_winners_cleaned.columns gunicorn --workers 4 --bind localhost:8000 server_api:app
 """
@@ -5,14 +5,22 @@ This Flask example is based on:
 - https://flask-marshmallow.readthedocs.io/en/latest/;
 - https://marshmallow-sqlalchemy.readthedocs.io/en/latest/.
 """
+import json
 import os
-from flask import Flask, request
+import zlib
+from flask import Flask, Response, abort, request, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
 from flask_marshmallow import Marshmallow
+from sqlalchemy import select
+
+import profiling
+from response_cache import ResponseCache
+from winners_indexes import winner_indexes, ensure_indexes, check_query_plans
 
 
 app = Flask(__name__)
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.abspath('../sqlite-databases/nobel_winners.db')
+app.config.from_prefixed_env()  # e.g. FLASK_SQLALCHEMY_DATABASE_URI=sqlite:////tmp/winners.db
 db = SQLAlchemy(app)
 ma = Marshmallow(app)
 
@@ -41,6 +49,9 @@ class Winner(db.Model):
     born_in = db.Column(db.String)
     award_age = db.Column(db.Integer)
 
+    # Indexes for the filters, see winners_indexes.py
+    __table_args__ = winner_indexes()
+
     def __repr__(self):
         return f"<Winner(name='{self.name}', category='{self.category}', year={self.year})>"
 
@@ -57,15 +68,111 @@ class WinnerSchema(ma.Schema):
 winner_schema = WinnerSchema()  # one record
 winners_schema = WinnerSchema(many=True)  # multiple records
 
+# In-process LRU cache by default; pass RedisCacheBackend(...) to share it between the workers
+response_cache = ResponseCache()
+
+# Server-Timing headers and /metrics if FLASK_PROFILING=true
+profiling.init_app(app, db, schemas=(winner_schema, winners_schema))
+
+with app.app_context():
+    ensure_indexes(db.engine, Winner.__table__)
+    check_query_plans(db.engine, Winner, app.logger)
+
+
+def stream_winners(columns: tuple, batch_size: int = 1000):
+    """
+    Yield the winners as dictionaries of the given columns.
+    The rows are fetched in batches from a server-side cursor,
+    so neither all the rows nor all the ORM objects are kept in memory.
+    """
+    query = select(*(getattr(Winner, column) for column in columns)).order_by(Winner.index)
+    result = db.session.execute(query.execution_options(yield_per=batch_size))
+    for row in result:
+        yield dict(zip(columns, row))
+
+
+def encode_ndjson(winners):
+    for winner in winners:
+        yield json.dumps(winner) + '\n'
+
+
+def encode_json_array(winners):
+    yield '['
+    for i, winner in enumerate(winners):
+        yield (',' if i else '') + json.dumps(winner)
+    yield ']\n'
+
+
+def gzip_chunks(chunks, level: int = 6):
+    # wbits=31 means the gzip container
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk.encode())
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def buffer_chunks(chunks, size: int = 64 * 1024):
+    """
+    Join the small chunks so that every write to the socket carries about the given size
+    """
+    buffer, buffered = [], 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= size:
+            yield ''.join(buffer)
+            buffer, buffered = [], 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+EXPORT_FORMATS = ('ndjson', 'json')
+
+
+def export_winners(output_format: str = 'ndjson', gzip: bool = False, negotiated: bool = False):
+    """
+    Stream all the winners as NDJSON or as a JSON array, compressed with gzip if gzip is true.
+    negotiated means the compression depends on the Accept-Encoding header of the request.
+    """
+    fields = tuple(sorted(WinnerSchema.Meta.fields))  # jsonify sorts the keys too
+    winners = stream_winners(fields)
+    if output_format == 'json':
+        chunks, mimetype = encode_json_array(winners), 'application/json'
+    else:
+        chunks, mimetype = encode_ndjson(winners), 'application/x-ndjson'
+    chunks = buffer_chunks(chunks)
+    headers = {}
+    if negotiated:
+        # A cache must not give the gzip body to a client without "Accept-Encoding: gzip"
+        headers['Vary'] = 'Accept-Encoding'
+    if gzip:
+        chunks = gzip_chunks(chunks)
+        headers['Content-Encoding'] = 'gzip'
+    # Without Content-Length, the response is sent with the chunked transfer encoding
+    return Response(stream_with_context(chunks), mimetype=mimetype, headers=headers)
+
 
 @app.route('/winners/all/')
 def get_all_winners():
-    all_winners = Winner.query.all()
-    result = winners_schema.jsonify(all_winners)
-    return result
+    return export_winners('json')
+
+
+@app.route('/winners/export')
+def export_all_winners():
+    output_format = request.args.get('format', 'ndjson')
+    if output_format not in EXPORT_FORMATS:
+        abort(400)  # Bad request, e.g. format=xml
+    gzip = (
+        request.args.get('gzip', False, type=lambda value: value.lower() in ('1', 'true', 'yes'))
+        or 'gzip' in request.accept_encodings
+    )
+    return export_winners(output_format, gzip, negotiated=True)
 
 
 @app.route('/winners/')
+@response_cache.cached
 def filter_winners():
     fields_to_filter = ('year', 'category', 'gender', 'country', 'name', 'born_in', 'award_age')
     filters = request.args.to_dict()
@@ -82,6 +189,7 @@ def filter_winners():
 
 
 @app.route('/winners/<winner_id>/')
+@response_cache.cached
 def get_winner(winner_id: str):
     winner = Winner.query.get_or_404(winner_id)
     result = winner_schema.jsonify(winner)
@@ -96,6 +204,7 @@ def add_winner():
     new_winner = Winner(**kwargs)
     db.session.add(new_winner)
     db.session.commit()
+    response_cache.bump()
     return winner_schema.jsonify(new_winner)
 
 
@@ -108,6 +217,7 @@ def update_winner(winner_id: str):
     for key, value in kwargs.items():
         setattr(winner_to_update, key, value)
     db.session.commit()
+    response_cache.bump()
     return winner_schema.jsonify(winner_to_update)
 
 
@@ -117,6 +227,7 @@ def delete_winner(winner_id: str):
     app.logger.info(f"Deleting the winner with id={winner_id}")
     db.session.delete(winner_to_delete)
     db.session.commit()
+    response_cache.bump()
     return '', 204
 
 
@@ -135,7 +246,19 @@ Open:
 http://localhost:8000/winners/all
 
 Or write in the command line:
-$ curl http://localhost:8000/all-winners/
+$ curl http://localhost:8000/winners/all/
+
+Stream all the winners as NDJSON (one JSON object per line) or as a JSON array:
+$ curl http://localhost:8000/winners/export
+$ curl "http://localhost:8000/winners/export?format=json"
+
+{"award_age": 60, "born_in": null, "category": "Chemistry", "country": "Austria", "gender": "male", "link": "https://en.wikipedia.org/wiki/Richard_Adolf_Zsigmondy", "name": "Richard Adolf Zsigmondy", "year": 1925}
+{"award_age": 54, "born_in": null, "category": "Chemistry", "country": "Austria", "gender": "male", "link": "https://en.wikipedia.org/wiki/Fritz_Pregl", "name": "Fritz Pregl", "year": 1923}
+...
+
+Compressed with gzip ("gzip=true" or the "Accept-Encoding: gzip" header),
+the response has "Vary: Accept-Encoding" for the caches; another format than ndjson or json is 400 (Bad request):
+$ curl --compressed http://localhost:8000/winners/export
 
 Open to get by ID
 http://localhost:8000/winners/54/
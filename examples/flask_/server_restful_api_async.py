@@ -0,0 +1,136 @@
+"""
+The winners REST API of server_restful_api_with_methodview.py as an ASGI application:
+the same single-row routes /winners/ and /winners/<id>/ (not the /winners/batch routes),
+the same Winner model and the same WinnerSchema,
+but the views are coroutines and the database is accessed through an async engine with a connection pool.
+A worker awaits the database instead of blocking a thread per request,
+so one worker serves many concurrent slow clients.
+
+This example is based on:
+- https://quart.palletsprojects.com/en/latest/;
+- https://docs.sqlalchemy.org/en/20/orm/extensions/asyncio.html;
+- https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#module-sqlalchemy.dialects.sqlite.aiosqlite.
+
+Install:
+$ pip install quart aiosqlite hypercorn
+"""
+import os
+
+from marshmallow import ValidationError
+from quart import Quart, request, jsonify, abort
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+# The model and the schemas without the Flask app of server_restful_api_with_methodview.py
+from winners_model import Winner, winner_schema, winners_schema
+
+
+app = Quart(__name__)
+engine = create_async_engine(
+    'sqlite+aiosqlite:///' + os.path.abspath('../sqlite-databases/nobel_winners.db'),
+    pool_size=10,  # connections kept open
+    max_overflow=20,  # additional connections under load
+)
+Session = async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def read_json_object() -> dict:
+    """
+    The JSON object of the request body, 400 (Bad request) for a body that is not a JSON object
+    """
+    data = await request.get_json(force=True, silent=True)
+    if not isinstance(data, dict):
+        abort(400)
+    return data
+
+
+@app.get("/winners/")
+async def get_winners():
+    fields = ('year', 'category', 'gender', 'country', 'name', 'born_in', 'award_age')
+    filters = request.args.to_dict()
+    kwargs = {key: value for key, value in filters.items() if key in fields}
+    app.logger.info(f"Filtering with the fields: {kwargs}")
+    async with Session() as session:
+        winners = (await session.scalars(select(Winner).filter_by(**kwargs))).all()
+    return jsonify(winners_schema.dump(winners))
+
+
+@app.post("/winners/")
+async def add_winner():
+    fields = winner_schema.fields
+    kwargs = {key: value for key, value in (await read_json_object()).items() if key in fields}
+    try:
+        # As load_fields of server_restful_api_with_methodview.py, before anything is written
+        kwargs = winner_schema.load(kwargs, partial=True)
+    except ValidationError as error:
+        return jsonify({'errors': error.messages}), 422
+    app.logger.info(f"Creating a winner with the fields: {kwargs}")
+    new_winner = Winner(**kwargs)
+    async with Session() as session:
+        session.add(new_winner)
+        await session.commit()
+    return jsonify(winner_schema.dump(new_winner))
+
+
+@app.get("/winners/<int:winner_id>/")
+async def get_winner(winner_id: int):
+    async with Session() as session:
+        winner = await session.get(Winner, winner_id)
+    if winner is None:
+        abort(404)
+    return jsonify(winner_schema.dump(winner))
+
+
+@app.patch("/winners/<int:winner_id>/")
+async def update_winner(winner_id: int):
+    fields = winner_schema.fields
+    kwargs = {key: value for key, value in (await read_json_object()).items() if key in fields}
+    try:
+        kwargs = winner_schema.load(kwargs, partial=True)
+    except ValidationError as error:
+        return jsonify({'errors': error.messages}), 422
+    app.logger.info(f"Updating the winner with the fields: {kwargs}")
+    async with Session() as session:
+        winner_to_update = await session.get(Winner, winner_id)
+        if winner_to_update is None:
+            abort(404)
+        for key, value in kwargs.items():
+            setattr(winner_to_update, key, value)
+        await session.commit()
+    return jsonify(winner_schema.dump(winner_to_update))
+
+
+@app.delete("/winners/<int:winner_id>/")
+async def delete_winner(winner_id: int):
+    async with Session() as session:
+        winner_to_delete = await session.get(Winner, winner_id)
+        if winner_to_delete is None:
+            abort(404)
+        app.logger.info(f"Deleting the winner with id={winner_id}")
+        await session.delete(winner_to_delete)
+        await session.commit()
+    return '', 204
+
+
+@app.after_serving
+async def dispose_engine():
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    app.run(port=8000, debug=True)
+
+"""
+Run with an ASGI server:
+$ hypercorn server_restful_api_async:app --bind localhost:8000
+or
+$ uvicorn server_restful_api_async:app --port 8000
+
+The single-row routes and their responses are the same as in server_restful_api_with_methodview.py,
+e.g. 422 with the errors for {"award_age":"abc"}:
+$ curl -d category=Physics -d born_in=Germany --get http://localhost:8000/winners/
+$ curl http://localhost:8000/winners/54/
+$ curl http://localhost:8000/winners/ -X POST -H "Content-Type: application/json" -d '{"category":"Computer Science","year":2024,"name":"Alexander Vasiliev","country":"Germany"}'
+$ curl http://localhost:8000/winners/975/ -X PATCH -H "Content-Type: application/json" -d '{"award_age":"38"}'
+$ curl http://localhost:8000/winners/975/ -X DELETE
+"""
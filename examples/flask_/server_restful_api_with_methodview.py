@@ -5,80 +5,77 @@ This Flask example is based on:
 - https://flask-marshmallow.readthedocs.io/en/latest/;
 - https://marshmallow-sqlalchemy.readthedocs.io/en/latest/.
 """
+import json
 import os
-from flask import Flask, request
+from flask import Flask, request, abort, jsonify, make_response
 from flask.views import MethodView
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
-from flask_marshmallow import Marshmallow
+from marshmallow import ValidationError
+from sqlalchemy import delete, func, insert, select, update
+
+import profiling
+from response_cache import ResponseCache
+from winners_cube import WinnersCube
+from winners_indexes import ensure_indexes, check_query_plans
+# Winner and WinnerSchema are shared with server_restful_api_async.py
+from winners_model import Winner, winner_schema, winners_schema
 
 
 app = Flask(__name__)
 CORS(app)  # Allow requests from any domain to access the data server
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.abspath('../sqlite-databases/nobel_winners.db')
+app.config.from_prefixed_env()  # e.g. FLASK_SQLALCHEMY_DATABASE_URI=sqlite:////tmp/winners.db
 db = SQLAlchemy(app)
-ma = Marshmallow(app)
 
+# In-process LRU cache by default; pass RedisCacheBackend(...) to share it between the workers
+response_cache = ResponseCache()
 
-class Winner(db.Model):
-    """
-    Object-relational mapping (ORM):
-    This class will correspond to the table, the instances
-    of this class will correspond to the rows of the table,
-    and the class attributes correspond to the columns of the table.
-    """
-    __tablename__ = 'winners_cleaned'
-    index = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String)
-    link = db.Column(db.String)
-    year = db.Column(db.Integer)
-    category = db.Column(db.String)
-    country = db.Column(db.String)
-    text = db.Column(db.Text)
-    wikidata_code = db.Column(db.String)
-    date_of_birth = db.Column(db.String)  # string form dates
-    date_of_death = db.Column(db.String)  # string form dates
-    place_of_birth = db.Column(db.String)
-    place_of_death = db.Column(db.String)
-    gender = db.Column(db.String)
-    born_in = db.Column(db.String)
-    award_age = db.Column(db.Integer)
-
-    def __repr__(self):
-        return f"<Winner(name='{self.name}', category='{self.category}', year={self.year})>"
-
-
-class WinnerSchema(ma.Schema):
-    """
-    Serializing from the SQLite database into JSON-compliant data
-    """
-    class Meta:
-        model = Winner
-        fields = ('name', 'link', 'year', 'category', 'gender', 'country', 'born_in', 'award_age')
+# Server-Timing headers and /metrics if FLASK_PROFILING=true
+profiling.init_app(app, db, schemas=(winner_schema, winners_schema))
+
+# Counts by (year, category, gender, country) for /winners/stats/, kept up to date by the write handlers
+winners_cube = WinnersCube()
 
+with app.app_context():
+    ensure_indexes(db.engine, Winner.__table__)
+    check_query_plans(db.engine, Winner, app.logger)
+    cube_columns = [getattr(Winner, dimension) for dimension in winners_cube.dimensions]
+    winners_cube.load(db.session.execute(select(*cube_columns, func.count()).group_by(*cube_columns)))
 
-winner_schema = WinnerSchema()  # one record
-winners_schema = WinnerSchema(many=True)  # multiple records
+
+def load_fields(kwargs: dict) -> dict:
+    """
+    Check and convert the values before anything is written, e.g. "38" -> 38; 422 for e.g. {"year": "abc"}
+    """
+    try:
+        return winner_schema.load(kwargs, partial=True)
+    except ValidationError as error:
+        abort(make_response(jsonify({'errors': error.messages}), 422))
 
 
 class WinnersView(MethodView):
+    @response_cache.cached
     def get(self):
         fields = ('year', 'category', 'gender', 'country', 'name', 'born_in', 'award_age')
         filters = request.args.to_dict()
         kwargs = {key: value for key, value in filters.items() if key in fields}
         app.logger.info(f"Filtering with the fields: {kwargs}")
-        winners = Winner.query.filter_by(**kwargs)
-        result = winners_schema.jsonify(winners)
+        winners = db.session.scalars(select(Winner).filter_by(**kwargs))
+        result = jsonify(winners_schema.dump(winners))
         return result
 
     def post(self):
         fields = winner_schema.fields
-        kwargs = {key: value for key, value in request.json.items() if key in fields}
+        kwargs = load_fields({key: value for key, value in request.json.items() if key in fields})
         app.logger.info(f"Creating a winner with the fields: {kwargs}")
         new_winner = Winner(**kwargs)
+        new_cell = winners_cube.cell(new_winner)
         db.session.add(new_winner)
         db.session.commit()
-        result = winner_schema.jsonify(new_winner)
+        response_cache.bump()
+        winners_cube.add(new_cell)
+        result = jsonify(winner_schema.dump(new_winner))
         return result
 
 
@@ -86,32 +83,182 @@ app.add_url_rule("/winners/", view_func=WinnersView.as_view("winners_view"))
 
 
 class WinnerView(MethodView):
+    @response_cache.cached
     def get(self, winner_id: str):
-        winner = Winner.query.get_or_404(winner_id)
-        result = winner_schema.jsonify(winner)
+        winner = db.get_or_404(Winner, winner_id)
+        result = jsonify(winner_schema.dump(winner))
         return result
 
     def patch(self, winner_id):
-        winner_to_update = Winner.query.get_or_404(winner_id)
+        winner_to_update = db.get_or_404(Winner, winner_id)
         fields = winner_schema.fields
-        kwargs = {key: value for key, value in request.json.items() if key in fields}
+        kwargs = load_fields({key: value for key, value in request.json.items() if key in fields})
         app.logger.info(f"Updating the winner with the fields: {kwargs}")
+        old_cell = winners_cube.cell(winner_to_update)
         for key, value in kwargs.items():
             setattr(winner_to_update, key, value)
+        new_cell = winners_cube.cell(winner_to_update)
         db.session.commit()
-        result = winner_schema.jsonify(winner_to_update)
+        response_cache.bump()
+        winners_cube.remove(old_cell)
+        winners_cube.add(new_cell)
+        result = jsonify(winner_schema.dump(winner_to_update))
         return result
 
     def delete(self, winner_id):
-        winner_to_delete = Winner.query.get_or_404(winner_id)
+        winner_to_delete = db.get_or_404(Winner, winner_id)
         app.logger.info(f"Deleting the winner with id={winner_id}")
+        old_cell = winners_cube.cell(winner_to_delete)
         db.session.delete(winner_to_delete)
         db.session.commit()
+        response_cache.bump()
+        winners_cube.remove(old_cell)
         return '', 204
 
 
 app.add_url_rule("/winners/<winner_id>/", view_func=WinnerView.as_view("winner_view"))
 
+
+def read_batch() -> list:
+    """
+    Read a JSON array or NDJSON (one JSON object per line) from the request body
+    """
+    if request.mimetype == 'application/x-ndjson':
+        try:
+            return [json.loads(line) for line in request.get_data(as_text=True).splitlines() if line.strip()]
+        except ValueError:
+            abort(400)  # Bad request
+    items = request.get_json()
+    if not isinstance(items, list):
+        abort(400)
+    return items
+
+
+def read_ids(items: list, errors: dict) -> list:
+    ids = []
+    for i, item in enumerate(items):
+        winner_id = item.get('index') if isinstance(item, dict) else item
+        if isinstance(winner_id, int) and not isinstance(winner_id, bool):
+            ids.append(winner_id)
+        else:
+            errors.setdefault(i, {})['index'] = ['Missing or not an integer.']
+    return ids
+
+
+def check_ids_exist(items: list, ids: list, errors: dict):
+    existing = set(db.session.scalars(select(Winner.index).where(Winner.index.in_(ids))))
+    for i, item in enumerate(items):
+        if i not in errors and (item.get('index') if isinstance(item, dict) else item) not in existing:
+            errors[i] = {'index': ['Winner not found.']}
+
+
+def select_cube_cells(ids: list) -> dict:
+    cube_columns = [getattr(Winner, dimension) for dimension in winners_cube.dimensions]
+    rows = db.session.execute(select(Winner.index, *cube_columns).where(Winner.index.in_(ids))).mappings()
+    return {row['index']: dict(row) for row in rows}
+
+
+def batch_result(errors: dict, removed_cells=(), added_cells=(), **counts):
+    """
+    All or nothing: if any item is invalid, nothing is written and every error is reported by the item position
+    """
+    if errors:
+        db.session.rollback()
+        return jsonify({'errors': {str(i): messages for i, messages in sorted(errors.items())}}), 422
+    db.session.commit()
+    response_cache.bump()
+    for cell in removed_cells:
+        winners_cube.remove(cell)
+    for cell in added_cells:
+        winners_cube.add(cell)
+    return jsonify(counts)
+
+
+class WinnersBatchView(MethodView):
+    """
+    Many winners in one request and one transaction:
+    the rows go to the database with executemany instead of one INSERT/UPDATE/DELETE
+    and one commit (i.e. fsync) per winner.
+    """
+    def post(self):
+        items = read_batch()
+        errors = {i: {'_schema': ['Not an object.']} for i, item in enumerate(items) if not isinstance(item, dict)}
+        errors.update(winners_schema.validate([item if isinstance(item, dict) else {} for item in items]))
+        app.logger.info(f"Creating {len(items)} winners")
+        if not errors and items:
+            items = winners_schema.load(items)  # e.g. "38" -> 38
+            db.session.execute(insert(Winner), items)
+        added_cells = [winners_cube.cell(item) for item in items] if not errors else []
+        return batch_result(errors, added_cells=added_cells, inserted=len(items))
+
+    def patch(self):
+        items = read_batch()
+        errors = {}
+        ids = read_ids(items, errors)
+        updates = [
+            {key: value for key, value in item.items() if key != 'index'} if isinstance(item, dict) else {}
+            for item in items
+        ]
+        for i, messages in winners_schema.validate(updates, partial=True).items():
+            errors.setdefault(i, {}).update(messages)
+        check_ids_exist(items, ids, errors)
+        app.logger.info(f"Updating {len(items)} winners")
+        removed_cells, added_cells = [], []
+        if not errors and items:
+            items = [
+                {'index': item['index'], **values}
+                for item, values in zip(items, winners_schema.load(updates, partial=True))
+            ]
+            old_winners = select_cube_cells(ids)
+            # An id given twice is one winner: its cell moves once, to the values after all its updates
+            new_winners = {winner_id: dict(winner) for winner_id, winner in old_winners.items()}
+            for item in items:
+                new_winners[item['index']].update(item)
+            removed_cells = [winners_cube.cell(winner) for winner in old_winners.values()]
+            added_cells = [winners_cube.cell(winner) for winner in new_winners.values()]
+            # Bulk UPDATE by primary key: the "index" of every dictionary goes to the WHERE clause
+            db.session.execute(update(Winner), items)
+        return batch_result(errors, removed_cells, added_cells, updated=len(set(ids)))
+
+    def delete(self):
+        items = read_batch()
+        errors = {}
+        ids = read_ids(items, errors)
+        check_ids_exist(items, ids, errors)
+        app.logger.info(f"Deleting {len(ids)} winners")
+        removed_cells = []
+        deleted = 0
+        if not errors and ids:
+            removed_cells = [winners_cube.cell(winner) for winner in select_cube_cells(ids).values()]
+            # The deleted rows, not the ids: an id can be given twice
+            deleted = db.session.execute(delete(Winner).where(Winner.index.in_(ids))).rowcount
+        return batch_result(errors, removed_cells, deleted=deleted)
+
+
+app.add_url_rule("/winners/batch", view_func=WinnersBatchView.as_view("winners_batch_view"))
+
+
+class WinnersStatsView(MethodView):
+    """
+    Counts of the winners grouped by any of the cube dimensions, e.g.:
+    ?by=category,gender - df.groupby(['category', 'gender']).size()
+    ?by=year,gender - df.groupby(['year', 'gender']).size()
+    ?by=country&category=Physics - df[df.category == 'Physics'].groupby('country').size()
+    """
+    def get(self):
+        by = tuple(dimension for dimension in request.args.get('by', '').split(',') if dimension)
+        filters = {key: value for key, value in request.args.items() if key in winners_cube.dimensions}
+        if any(dimension not in winners_cube.dimensions for dimension in by):
+            abort(400)  # Bad request
+        try:
+            stats = winners_cube.query(by, filters)
+        except ValueError:
+            abort(400)  # e.g. year=abc
+        return jsonify({'by': by, 'filters': filters, 'stats': stats})
+
+
+app.add_url_rule("/winners/stats/", view_func=WinnersStatsView.as_view("winners_stats_view"))
+
 if __name__ == "__main__":
     app.run(
         port=8000,  # localhost port the server will run on
@@ -183,4 +330,66 @@ http://localhost:8000/winners/975/
 
 Not Found
 The requested URL was not found on the server. If you entered the URL manually please check your spelling and try again.
+
+The GET responses are cached until the next POST, PATCH or DELETE and carry an ETag:
+$ curl -i http://localhost:8000/winners/?category=Physics
+
+HTTP/1.1 200 OK
+ETag: "5c1e9e6b0f8d..."
+Cache-Control: no-cache
+...
+
+Revalidate with the ETag:
+$ curl -i http://localhost:8000/winners/?category=Physics -H 'If-None-Match: "5c1e9e6b0f8d..."'
+
+HTTP/1.1 304 NOT MODIFIED
+
+Add many winners at once (a JSON array or NDJSON with "Content-Type: application/x-ndjson"):
+$ curl http://localhost:8000/winners/batch -X POST -H "Content-Type: application/json" -d '[{"category":"Computer Science","year":2024,"name":"Alexander Vasiliev"},{"category":"Computer Science","year":2024,"name":"John Doe"}]'
+
+{
+  "inserted": 2
+}
+
+Update many winners by their "index":
+$ curl http://localhost:8000/winners/batch -X PATCH -H "Content-Type: application/x-ndjson" --data-binary $'{"index":975,"award_age":38}\n{"index":976,"country":"Germany"}\n'
+
+{
+  "updated": 2
+}
+
+If any item is invalid, nothing is written:
+$ curl http://localhost:8000/winners/batch -X DELETE -H "Content-Type: application/json" -d '[975, 976, 100000]'
+
+{
+  "errors": {
+    "2": {
+      "index": [
+        "Winner not found."
+      ]
+    }
+  }
+}
+
+Counts of the winners from the precomputed cube:
+$ curl "http://localhost:8000/winners/stats/?by=category,gender"
+
+{
+  "by": [
+    "category",
+    "gender"
+  ],
+  "filters": {},
+  "stats": [
+    {
+      "category": "Chemistry",
+      "count": ...,
+      "gender": "female"
+    },
+    ...
+  ]
+}
+
+$ curl "http://localhost:8000/winners/stats/?by=year,gender"
+$ curl "http://localhost:8000/winners/stats/?by=country&category=Physics"
 """
\ No newline at end of file
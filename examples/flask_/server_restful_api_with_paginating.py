@@ -5,19 +5,28 @@ This Flask example is based on:
 - https://flask-marshmallow.readthedocs.io/en/latest/;
 - https://marshmallow-sqlalchemy.readthedocs.io/en/latest/.
 """
+import base64
+import json
+import math
 import os
 
 import urllib.parse
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, abort
 from flask.views import MethodView
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from flask_marshmallow import Marshmallow
+from sqlalchemy import and_, func, or_, select, tuple_
+
+import profiling
+from response_cache import ResponseCache
+from winners_indexes import winner_indexes, ensure_indexes, check_query_plans
 
 
 app = Flask(__name__)
 CORS(app)  # Allow requests from any domain to access the data server
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.abspath('../sqlite-databases/nobel_winners.db')
+app.config.from_prefixed_env()  # e.g. FLASK_SQLALCHEMY_DATABASE_URI=sqlite:////tmp/winners.db
 db = SQLAlchemy(app)
 ma = Marshmallow(app)
 
@@ -46,6 +55,9 @@ class Winner(db.Model):
     born_in = db.Column(db.String)
     award_age = db.Column(db.Integer)
 
+    # Indexes for the filters and for the key (year, index) of the keyset pagination
+    __table_args__ = winner_indexes()
+
     def __repr__(self):
         return f"<Winner(name='{self.name}', category='{self.category}', year={self.year})>"
 
@@ -63,11 +75,65 @@ winner_schema = WinnerSchema()  # one record
 winners_schema = WinnerSchema(many=True)  # multiple records
 
 
+def compile_serializer(schema_cls, model) -> tuple:
+    """
+    Generate a fast path for dumping many rows with the fields of schema_cls.Meta.fields:
+    the returned columns are selected with SQLAlchemy Core as plain tuples (no ORM objects),
+    and the generated function turns the tuples into dictionaries with a dict literal
+    instead of running marshmallow field by field.
+    The dictionaries are equal to schema.dump(...), so jsonify(...) gives the same bytes.
+    """
+    fields = tuple(schema_cls.Meta.fields)
+    columns = tuple(getattr(model, field) for field in fields)
+    items = ', '.join(f'{field!r}: row[{i}]' for i, field in enumerate(fields))
+    source = f"def serialize(rows):\n    return [{{{items}}} for row in rows]\n"
+    namespace = {}
+    exec(compile(source, f'<{schema_cls.__name__} serializer>', 'exec'), namespace)
+    return columns, namespace['serialize']
+
+
+winner_columns, serialize_winners = compile_serializer(WinnerSchema, Winner)
+
+# In-process LRU cache by default; pass RedisCacheBackend(...) to share it between the workers
+response_cache = ResponseCache()
+
+# Server-Timing headers and /metrics if FLASK_PROFILING=true
+serialize_winners, = profiling.init_app(
+    app, db, schemas=(winner_schema, winners_schema), serializers=(serialize_winners,)
+)
+
+with app.app_context():
+    ensure_indexes(db.engine, Winner.__table__)
+    check_query_plans(db.engine, Winner, app.logger)
+
+
+def encode_cursor(row) -> str:
+    """
+    Make an opaque cursor from the keyset (year, index) of a winner row
+    """
+    key = json.dumps([row._mapping['year'], row._mapping['index']]).encode()
+    return base64.urlsafe_b64encode(key).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        year, index = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not (year is None or isinstance(year, int)) or not isinstance(index, int):
+            raise TypeError(cursor)
+    except (ValueError, TypeError):
+        abort(400)  # Bad request
+    return year, index
+
+
 def make_pagination(url: str, results: dict):
     pagination = results['pagination']
     # Format a filter dict into a URL query
     query_str: str = urllib.parse.urlencode(results['filters'])
 
+    if 'next_cursor' in pagination:
+        make_keyset_pagination(url, query_str, pagination)
+        return
+
     page: int = pagination['page']
     per_page: int = pagination['per_page']
     num_pages: int = pagination["num_pages"]
@@ -85,34 +151,159 @@ def make_pagination(url: str, results: dict):
     pagination['next_page'] = next_page
 
 
+def make_keyset_pagination(url: str, query_str: str, pagination: dict):
+    per_page: int = pagination['per_page']
+    next_cursor: str = pagination['next_cursor']
+    prev_cursor: str = pagination['prev_cursor']
+    # The cursors are URL-safe base64, but the "=" padding must be escaped in a query
+    if prev_cursor:
+        prev_page = url + f'?before={urllib.parse.quote(prev_cursor)}&per_page={per_page}&{query_str}'
+    else:
+        prev_page = ''
+
+    if next_cursor:
+        next_page = url + f'?after={urllib.parse.quote(next_cursor)}&per_page={per_page}&{query_str}'
+    else:
+        next_page = ''
+
+    pagination['prev_page'] = prev_page
+    pagination['next_page'] = next_page
+
+
+def seek_condition(cursor: tuple, after: bool):
+    """
+    The rows after (or before) the key (year, index) in the order of the pages:
+    the winners without a year come first, like NULL in an ascending order of SQLite,
+    because a row-value comparison with NULL is NULL and would skip them.
+    """
+    year, index = cursor
+    key = tuple_(Winner.year, Winner.index)
+    if year is None:
+        if after:
+            return or_(and_(Winner.year.is_(None), Winner.index > index), Winner.year.is_not(None))
+        return and_(Winner.year.is_(None), Winner.index < index)
+    if after:
+        return key > (year, index)
+    return or_(Winner.year.is_(None), key < (year, index))
+
+
+def seek_winners(kwargs: dict, per_page: int, after: str = None, before: str = None) -> dict:
+    """
+    Keyset (seek) pagination:
+    instead of "OFFSET n" that scans and throws away n rows,
+    the page starts right after the last seen key (year, index),
+    which is found with the index ix_winners_cleaned_year_index.
+    The time per page does not depend on how deep the page is.
+    """
+    query = select(*winner_columns, Winner.index).filter_by(**kwargs)
+    if before:
+        # Walk backwards from the cursor and restore the ascending order afterwards
+        query = query.filter(seek_condition(decode_cursor(before), after=False)).order_by(
+            Winner.year.desc().nulls_last(), Winner.index.desc()
+        )
+    else:
+        if after:
+            query = query.filter(seek_condition(decode_cursor(after), after=True))
+        query = query.order_by(Winner.year.asc().nulls_first(), Winner.index)
+    # Fetch one extra row to know whether there is one more page in the walking direction
+    winners = db.session.execute(query.limit(per_page + 1)).all()
+    has_more = len(winners) > per_page
+    winners = winners[:per_page]
+    if before:
+        winners.reverse()
+
+    first, last = (winners[0], winners[-1]) if winners else (None, None)
+    if before:
+        has_prev, has_next = has_more, True
+    else:
+        has_prev, has_next = bool(after), has_more
+    return {
+        "winners": winners,
+        "prev_cursor": encode_cursor(first) if has_prev and first else '',
+        "next_cursor": encode_cursor(last) if has_next and last else '',
+    }
+
+
+def paginate_winners(kwargs: dict, page: int, per_page: int) -> dict:
+    """
+    The same as Winner.query.filter_by(**kwargs).paginate(page=page, per_page=per_page),
+    but the page is selected as tuples of winner_columns
+    """
+    if page < 1 or per_page < 1:
+        abort(404)
+    query = select(*winner_columns).filter_by(**kwargs)
+    rows = db.session.execute(query.limit(per_page).offset((page - 1) * per_page)).all()
+    if not rows and page != 1:
+        abort(404)
+    total = db.session.scalar(select(func.count()).select_from(query.subquery()))
+    return {
+        "winners": rows,
+        "total": total,
+        "pages": math.ceil(total / per_page),
+    }
+
+
 class WinnersView(MethodView):
+    @response_cache.cached
     def get(self):
         fields = ('year', 'category', 'gender', 'country', 'name', 'born_in', 'award_age')
         filters = request.args.to_dict()
         kwargs = {key: value for key, value in filters.items() if key in fields}
         app.logger.info(f"Filtering with the fields: {kwargs}")
 
+        if "after" in request.args or "before" in request.args:
+            return self.get_keyset_page(kwargs)
+
         page = request.args.get("page", 1, type=int)
         per_page = request.args.get("per_page", 20, type=int)
 
-        winners = Winner.query.filter_by(**kwargs).paginate(page=page, per_page=per_page)
-        winners_dumped = winners_schema.dump(winners.items)
+        winners = paginate_winners(kwargs, page=page, per_page=per_page)
+        winners_dumped = serialize_winners(winners["winners"])
 
         results = {
             "winners": winners_dumped,
             "filters": kwargs,
             "pagination":
                 {
-                    "count": winners.total,
+                    "count": winners["total"],
                     "page": page,
                     "per_page": per_page,
-                    "num_pages": winners.pages,
+                    "num_pages": winners["pages"],
                 },
         }
 
         make_pagination('winners/', results)
         return jsonify(results)
 
+    def get_keyset_page(self, kwargs: dict):
+        per_page = request.args.get("per_page", 20, type=int)
+        if per_page < 1:
+            abort(404)  # The same as paginate(...) does
+        page = seek_winners(
+            kwargs,
+            per_page,
+            after=request.args.get("after"),
+            before=request.args.get("before"),
+        )
+
+        results = {
+            "winners": serialize_winners(page["winners"]),
+            "filters": kwargs,
+            "pagination":
+                {
+                    "per_page": per_page,
+                    "prev_cursor": page["prev_cursor"],
+                    "next_cursor": page["next_cursor"],
+                },
+        }
+        # COUNT(*) is as expensive as a full scan, so it is optional
+        if request.args.get("with_count", False, type=lambda value: value.lower() in ('1', 'true', 'yes')):
+            count_query = select(func.count()).select_from(Winner).filter_by(**kwargs)
+            results["pagination"]["count"] = db.session.scalar(count_query)
+
+        make_pagination('winners/', results)
+        return jsonify(results)
+
     def post(self):
         fields = winner_schema.fields
         kwargs = {key: value for key, value in request.json.items() if key in fields}
@@ -120,6 +311,7 @@ class WinnersView(MethodView):
         new_winner = Winner(**kwargs)
         db.session.add(new_winner)
         db.session.commit()
+        response_cache.bump()
         result = winner_schema.jsonify(new_winner)
         return result
 
@@ -128,6 +320,7 @@ app.add_url_rule("/winners/", view_func=WinnersView.as_view("winners_view"))
 
 
 class WinnerView(MethodView):
+    @response_cache.cached
     def get(self, winner_id: str):
         winner = Winner.query.get_or_404(winner_id)
         result = winner_schema.jsonify(winner)
@@ -141,6 +334,7 @@ class WinnerView(MethodView):
         for key, value in kwargs.items():
             setattr(winner_to_update, key, value)
         db.session.commit()
+        response_cache.bump()
         result = winner_schema.jsonify(winner_to_update)
         return result
 
@@ -149,6 +343,7 @@ class WinnerView(MethodView):
         app.logger.info(f"Deleting the winner with id={winner_id}")
         db.session.delete(winner_to_delete)
         db.session.commit()
+        response_cache.bump()
         return '', 204
 
 
@@ -206,4 +401,30 @@ $ curl -d category=Physics --get http://localhost:8000/winners/?page=2
 Or open in the browser:
 http://localhost:8000/winners/?category=Physics
 http://localhost:8000/winners/?category=Physics&page=2
+
+Keyset (seek) pagination: pass "after" (empty for the first page) instead of "page".
+The pages are ordered by (year, index) and the total count is skipped unless "with_count=true" is given.
+$ curl -d category=Physics -d after= --get http://localhost:8000/winners/
+
+{
+  "filters": {
+    "category": "Physics"
+  },
+  "pagination": {
+    "next_cursor": "WzE5MTEsIDgxNl0=",
+    "next_page": "winners/?after=WzE5MTEsIDgxNl0%3D&per_page=20&category=Physics",
+    "per_page": 20,
+    "prev_cursor": "",
+    "prev_page": ""
+  },
+  "winners": [
+    ...
+  ]
+}
+
+Get the next page:
+$ curl "http://localhost:8000/winners/?after=WzE5MTEsIDgxNl0%3D&per_page=20&category=Physics"
+
+Get the previous page with the "prev_cursor" of the current page:
+$ curl "http://localhost:8000/winners/?before=WzE5MTIsIDkwMV0%3D&per_page=20&category=Physics"
 """
\ No newline at end of file
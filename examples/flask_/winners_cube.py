@@ -0,0 +1,80 @@
+"""
+A cube of winner counts over (year, category, gender, country) for the statistics endpoints.
+The counts of every subset of the dimensions (2^4 = 16 group-bys, e.g. ('category', 'gender') or ('country',))
+are precomputed when the app starts and updated incrementally by the write handlers,
+so an aggregate query reads one precomputed group-by instead of scanning the table.
+
+The group-bys are the ones of pandas_3--data-exploring.py:
+df.groupby(['category', 'gender']).size(), df.groupby(['year', 'gender']).size(), df.groupby('country').size()
+
+The cube lives in the process: with several worker processes, every worker has its own cube
+and only sees the writes it has handled itself.
+"""
+import itertools
+import threading
+from collections import Counter
+
+DIMENSIONS = ('year', 'category', 'gender', 'country')
+
+
+class WinnersCube:
+    int_dimensions = ('year',)
+
+    def __init__(self, dimensions: tuple = DIMENSIONS):
+        self.dimensions = dimensions
+        # grouping (a tuple of dimensions in the order of self.dimensions) -> Counter of the keys
+        self._groupings = {
+            grouping: Counter()
+            for size in range(len(dimensions) + 1)
+            for grouping in itertools.combinations(dimensions, size)
+        }
+        self._lock = threading.Lock()
+
+    def cell(self, winner) -> tuple:
+        """
+        The cube coordinates of a winner given as a mapping or an object
+        """
+        values = []
+        for dimension in self.dimensions:
+            value = winner.get(dimension) if isinstance(winner, dict) else getattr(winner, dimension)
+            if value is not None and dimension in self.int_dimensions:
+                value = int(value)
+            values.append(value)
+        return tuple(values)
+
+    def add(self, cell: tuple, count: int = 1):
+        with self._lock:
+            for grouping, counter in self._groupings.items():
+                key = tuple(value for dimension, value in zip(self.dimensions, cell) if dimension in grouping)
+                counter[key] += count
+                if counter[key] == 0:
+                    del counter[key]
+
+    def remove(self, cell: tuple, count: int = 1):
+        self.add(cell, -count)
+
+    def load(self, rows):
+        """
+        rows: (year, category, gender, country, count) of "SELECT ..., COUNT(*) ... GROUP BY ..."
+        """
+        for *cell, count in rows:
+            self.add(self.cell(dict(zip(self.dimensions, cell))), count)
+
+    def query(self, by: tuple, filters: dict) -> list:
+        """
+        Counts grouped by the "by" dimensions of the winners matching the filters {dimension: value}.
+        The group-by of by + filters is read, so the cost depends on the size of this group-by, not of the table.
+        """
+        filters = {
+            dimension: int(value) if dimension in self.int_dimensions else value
+            for dimension, value in filters.items()
+        }
+        grouping = tuple(dimension for dimension in self.dimensions if dimension in by or dimension in filters)
+        with self._lock:
+            items = list(self._groupings[grouping].items())
+        stats = []
+        for key, count in items:
+            cell = dict(zip(grouping, key))
+            if all(cell[dimension] == value for dimension, value in filters.items()):
+                stats.append({**{dimension: cell[dimension] for dimension in by}, 'count': count})
+        return sorted(stats, key=lambda item: tuple((item[dimension] is None, item[dimension]) for dimension in by))
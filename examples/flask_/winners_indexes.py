@@ -0,0 +1,74 @@
+"""
+Secondary indexes of the winners_cleaned table for the filters of the winners REST examples
+and a startup check of the query plans of these filters with "EXPLAIN QUERY PLAN".
+
+SQLite uses one index per table in a simple query,
+so every filter field leads at least one index, and the most frequent combinations
+(category and year, country and category, gender and category) have composite indexes.
+Then any combination of filters is a SEARCH on an index instead of a SCAN of the whole table.
+
+This example is based on:
+- https://www.sqlite.org/queryplanner.html;
+- https://www.sqlite.org/eqp.html;
+- https://docs.sqlalchemy.org/en/20/core/constraints.html#indexes.
+"""
+import itertools
+
+from sqlalchemy import Index, Integer, select
+
+FILTER_FIELDS = ('year', 'category', 'gender', 'country', 'name', 'born_in', 'award_age')
+
+
+def winner_indexes() -> tuple:
+    """
+    Use as __table_args__ of the Winner model.
+    Every call makes new Index objects because an index belongs to one table.
+    """
+    return (
+        Index('ix_winners_cleaned_year_index', 'year', 'index'),  # also the key of the keyset pagination
+        Index('ix_winners_cleaned_category_year', 'category', 'year'),
+        Index('ix_winners_cleaned_country_category', 'country', 'category'),
+        Index('ix_winners_cleaned_gender_category', 'gender', 'category'),
+        Index('ix_winners_cleaned_name', 'name'),
+        Index('ix_winners_cleaned_born_in', 'born_in'),
+        Index('ix_winners_cleaned_award_age', 'award_age'),
+    )
+
+
+def ensure_indexes(engine, table):
+    # create_all() skips existing tables, so create the missing indexes explicitly
+    for table_index in table.indexes:
+        table_index.create(engine, checkfirst=True)
+
+
+def explain_query_plan(connection, query) -> list:
+    compiled = query.compile(dialect=connection.dialect)
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)
+    # The rows are (id, parent, notused, detail)
+    return [row[3] for row in rows]
+
+
+def check_query_plans(engine, model, logger, fields: tuple = FILTER_FIELDS) -> list:
+    """
+    Explain filter_by(...) with every combination of the fields
+    and warn about the ones that fall back to a full table scan.
+    Return the scanned combinations.
+    """
+    if engine.dialect.name != 'sqlite':
+        logger.info(f"Query plans are only checked for SQLite, not {engine.dialect.name}")
+        return []
+    scanned = []
+    with engine.connect() as connection:
+        for size in range(1, len(fields) + 1):
+            for combination in itertools.combinations(fields, size):
+                kwargs = {
+                    field: 0 if isinstance(model.__table__.c[field].type, Integer) else ''
+                    for field in combination
+                }
+                plan = explain_query_plan(connection, select(model).filter_by(**kwargs))
+                if any(detail.startswith('SCAN') for detail in plan):
+                    scanned.append(combination)
+                    logger.warning(f"Filtering by {combination} scans the table: {plan}")
+    logger.info(f"Checked the query plans of {2 ** len(fields) - 1} filter combinations, {len(scanned)} scan the table")
+    return scanned
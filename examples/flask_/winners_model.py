@@ -0,0 +1,72 @@
+"""
+The Winner model and WinnerSchema of the winners REST examples without an app:
+importing this module creates no app, opens no database and runs no query,
+so server_restful_api_with_methodview.py (Flask) and server_restful_api_async.py (Quart) share them.
+
+This example is based on:
+- https://docs.sqlalchemy.org/en/20/orm/declarative_tables.html;
+- https://flask-sqlalchemy.palletsprojects.com/en/3.1.x/models/#initializing-the-base-class;
+- https://marshmallow.readthedocs.io/en/stable/quickstart.html#declaring-schemas.
+"""
+from marshmallow import Schema, fields
+from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy.orm import DeclarativeBase
+
+from winners_indexes import winner_indexes
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Winner(Base):
+    """
+    Object-relational mapping (ORM):
+    This class will correspond to the table, the instances
+    of this class will correspond to the rows of the table,
+    and the class attributes correspond to the columns of the table.
+    """
+    __tablename__ = 'winners_cleaned'
+    index = Column(Integer, primary_key=True)
+    name = Column(String)
+    link = Column(String)
+    year = Column(Integer)
+    category = Column(String)
+    country = Column(String)
+    text = Column(Text)
+    wikidata_code = Column(String)
+    date_of_birth = Column(String)  # string form dates
+    date_of_death = Column(String)  # string form dates
+    place_of_birth = Column(String)
+    place_of_death = Column(String)
+    gender = Column(String)
+    born_in = Column(String)
+    award_age = Column(Integer)
+
+    # Indexes for the filters, see winners_indexes.py
+    __table_args__ = winner_indexes()
+
+    def __repr__(self):
+        return f"<Winner(name='{self.name}', category='{self.category}', year={self.year})>"
+
+
+class WinnerSchema(Schema):
+    """
+    Serializing from the SQLite database into JSON-compliant data.
+    The fields are declared with their types, so validate(...) and load(...) check and convert the values.
+    """
+    name = fields.Str(allow_none=True)
+    link = fields.Str(allow_none=True)
+    year = fields.Int(allow_none=True)
+    category = fields.Str(allow_none=True)
+    gender = fields.Str(allow_none=True)
+    country = fields.Str(allow_none=True)
+    born_in = fields.Str(allow_none=True)
+    award_age = fields.Int(allow_none=True)
+
+    class Meta:
+        fields = ('name', 'link', 'year', 'category', 'gender', 'country', 'born_in', 'award_age')
+
+
+winner_schema = WinnerSchema()  # one record
+winners_schema = WinnerSchema(many=True)  # multiple records
@@ -253,6 +253,45 @@ df_physics = pd.read_sql("select * from nobel_winners where category='Physics'",
 # 0   1  Physics  Albert Einstein  German and Swiss   male  1921
 # 1   2  Physics       Paul Dirac           British   male  1933
 
+# read_sql fetches all the rows at once as Python objects.
+# For large tables, read chunks of rows with a server-side cursor, with the dtypes of the column types
+# and the enumerations as categoricals (see read_sql_chunks in winners_sql.py)
+from winners_sql import read_sql_chunks, sql_to_parquet
+
+winner_dtypes = {
+    'category': pd.CategoricalDtype(
+        ['Chemistry', 'Economics', 'Literature', 'Peace', 'Physics', 'Physiology or Medicine']
+    ),
+    'gender': pd.CategoricalDtype(['female', 'male']),
+}
+df_physics = pd.concat(read_sql_chunks(
+    sql_engine,
+    "select * from nobel_winners where category='Physics'",
+    chunksize=50_000,
+    dtypes=winner_dtypes
+), ignore_index=True)
+#    id category             name       nationality gender  year
+# 0   1  Physics  Albert Einstein  German and Swiss   male  1921
+# 1   2  Physics       Paul Dirac           British   male  1933
+df_physics.dtypes
+# id                int64
+# category       category
+# name             object
+# nationality      object
+# gender         category
+# year              int64
+# dtype: object
+
+# Or write the chunks into a Parquet file one by one, without the whole table in memory
+sql_to_parquet(
+    sql_engine,
+    'winners_cleaned',
+    'parquet-files/nobel_winners_cleaned_from_sql.parquet',
+    chunksize=50_000,
+    dtypes=winner_dtypes
+)
+# 974
+
 df_physics[["name", "nationality", "gender", "year"]].to_sql(
     'nobel_winners_in_physics',
     sql_engine,
@@ -562,6 +562,9 @@ df = df.reindex(np.random.permutation(df.index))
 df = df.drop_duplicates(['name', 'year'])
 # Sort the index
 df = df.sort_index()
+# The permutation makes the kept duplicate random and copies the data twice.
+# deduplicate of winners_cleaning.py keeps the first, the last or the most complete duplicate in one pass:
+# df = deduplicate(df, ('name', 'year'), keep='first')
 df.count()
 # link              974
 # name              974
@@ -702,6 +705,26 @@ for i, row in df.iterrows():
 # date_of_birth: 1949-01-01 00:00:00; name: Michael Houghton; index: 549
 # ...
 
+# Instead of a pd.to_datetime call per row, parse the whole column with an ordered list of formats
+# and see which format every date matched (see parse_dates in winners_cleaning.py)
+from winners_cleaning import parse_dates
+
+dates = parse_dates(df.date_of_birth)
+dates.format.value_counts()
+# format
+# day month year    968
+# year                6
+# Name: count, dtype: int64
+
+dates[dates.format == 'year'].join(df.name)
+#            date format                      name
+# 538  1952-01-01   year  Venkatraman Ramakrishnan
+# 549  1949-01-01   year          Michael Houghton
+# 651  1898-01-01   year             Albert Lutuli
+# 860  1993-01-01   year               Nadia Murad
+# 1117 1857-01-01   year     Karl Adolph Gjellerup
+# 1151 1956-01-01   year                David Card
+
 df.date_of_birth = pd.to_datetime(df.date_of_birth, errors='coerce')
 df.loc[df.name == 'Michael Houghton', 'date_of_birth']
 # 549   NaT
@@ -955,12 +978,72 @@ df.loc['Lê Đức Thọ']
 # award_age                                                        62
 # Name: Lê Đức Thọ, dtype: object
 
+# Every df.loc[df.name == ...] fix of clean_data_v5 compares the whole column.
+# Instead, express the fixes as a rules table and apply them with hash joins (see winners_cleaning.py).
+from winners_cleaning import CLEANING_RULES, clean_winners
+
+df_raw = pd.read_json('scrapy-projects/nobel_winners/Nobel_winners_by_request_chains.json')
+df_cleaned, rule_counts = clean_winners(df_raw, CLEANING_RULES)
+# How many rows every rule matched
+rule_counts[['action', 'name', 'year', 'column', 'matched']]
+#    action                      name  year         column  matched
+# 0    drop                      None  1809           None        3
+# 1    drop               Marie Curie  <NA>           None        2
+# 2     set    Marie Skłodowska-Curie  1911        country        1
+# 3    drop             Sidney Altman  1990           None        0
+# 4     set             Róbert Bárány  <NA>       category        2
+# 5     set  Venkatraman Ramakrishnan  <NA>  date_of_birth        2
+# 6     set               Nadia Murad  <NA>  date_of_birth        1
+# 7     set     Karl Adolph Gjellerup  <NA>  date_of_birth        1
+# 8     set                David Card  <NA>  date_of_birth        2
+# 9     set          Michael Houghton  <NA>  date_of_birth        1
+# 10    set             Albert Lutuli  <NA>  date_of_birth        1
+
+# pd.read_json parses the whole file into Python objects before the cleaning starts.
+# Instead, read the JSON Lines feed in chunks and clean every chunk as it is read.
+from winners_cleaning import clean_winners_chunks, read_winners
+
+chunks = read_winners('scrapy-projects/nobel_winners/Nobel_winners_by_request_chains.jl', chunksize=500)
+df_cleaned, rule_counts = clean_winners_chunks(chunks, CLEANING_RULES)
+df_cleaned.count()
+# link              974
+# year              974
+# category          974
+# country           974
+# text              974
+# wikidata_code     974
+# date_of_birth     974
+# date_of_death     667
+# place_of_birth    974
+# place_of_death    665
+# gender            974
+# born_in           136
+# award_age         974
+# dtype: int64
+
+# clean_winners_chunks still keeps the cleaned records of all the chunks.
+# For a crawl too large for memory, stream the cleaned chunks: the feed is read twice,
+# first for the surviving record of every (name, year) and the "born_in" records, then to clean the chunks again
+from winners_cleaning import stream_clean_winners
+
+cleaned_chunks, rule_counts = stream_clean_winners(
+    'scrapy-projects/nobel_winners/Nobel_winners_by_request_chains.jl', CLEANING_RULES, chunksize=500
+)
+sum(len(chunk) for chunk in cleaned_chunks)
+# 974
+
 df.to_json('json-files/nobel_winners_cleaned.json', orient='records', date_format='iso')
 
 import sqlalchemy
 engine = sqlalchemy.create_engine('sqlite:///sqlite-databases/nobel_winners_for_pandas.db')
-df.to_sql('winners_cleaned', engine, if_exists='replace')
-# 974
+# Instead of df.to_sql('winners_cleaned', engine, if_exists='replace'), which rewrites the whole table,
+# write only the rows that differ from the table by (name, year, category) (see upsert in winners_sql.py)
+from winners_sql import upsert
+
+upsert(engine, 'winners_cleaned', df, keys=('name', 'year', 'category'))
+# {'inserted': ..., 'updated': ..., 'deleted': ..., 'unchanged': ...}
+upsert(engine, 'winners_cleaned', df, keys=('name', 'year', 'category'))
+# {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 974}
 
 df_from_sql = pd.read_sql('winners_cleaned', engine)
 df_from_sql.count()
@@ -1005,3 +1088,58 @@ df.info()
 # dtypes: datetime64[ns](2), int64(2), object(9)
 # memory usage: 106.5+ KB
 
+
+# The text columns are Python objects and the integers int64.
+# Make them compact before storing: categories for the columns with few distinct values,
+# Arrow-backed strings for the other text, the smallest integers (see compact_dtypes in winners_cleaning.py)
+from winners_cleaning import compact_dtypes
+
+df, memory = compact_dtypes(df)
+memory
+#                   dtype_before      dtype_after  bytes_before  bytes_after
+# Index                      NaN              NaN        105963       105963
+# link                    object  string[pyarrow]        100686        52960
+# year                     int64            int16          7792         1948
+# category                object         category         66481         1550
+# country                 object         category         65875         7169
+# text                    object  string[pyarrow]        103167        48274
+# wikidata_code           object  string[pyarrow]         62071        14345
+# date_of_birth   datetime64[ns]   datetime64[ns]          7792         7792
+# date_of_death   datetime64[ns]   datetime64[ns]          7792         7792
+# place_of_birth          object  string[pyarrow]         66864        16463
+# place_of_death          object  string[pyarrow]         53221        14103
+# gender                  object         category         59544         1206
+# born_in                 object         category         29178         4917
+# award_age                int64             int8          7792          974
+
+memory[['bytes_before', 'bytes_after']].sum()
+# bytes_before    744218
+# bytes_after     285456
+# dtype: int64
+
+# Parquet keeps the categories and the small integers
+df.to_parquet('parquet-files/nobel_winners_cleaned_compact.parquet')
+# The Arrow-backed strings are read back as Arrow-backed strings only with this option
+with pd.option_context('mode.string_storage', 'pyarrow'):
+    df = pd.read_parquet('parquet-files/nobel_winners_cleaned_compact.parquet')
+df.info()
+# <class 'pandas.core.frame.DataFrame'>
+# Index: 974 entries, Richard Adolf Zsigmondy to John Carew Eccles
+# Data columns (total 13 columns):
+#  #   Column          Non-Null Count  Dtype
+# ---  ------          --------------  -----
+#  0   link            974 non-null    string
+#  1   year            974 non-null    int16
+#  2   category        974 non-null    category
+#  3   country         974 non-null    category
+#  4   text            974 non-null    string
+#  5   wikidata_code   974 non-null    string
+#  6   date_of_birth   974 non-null    datetime64[ns]
+#  7   date_of_death   667 non-null    datetime64[ns]
+#  8   place_of_birth  974 non-null    string
+#  9   place_of_death  665 non-null    string
+#  10  gender          974 non-null    category
+#  11  born_in         136 non-null    category
+#  12  award_age       974 non-null    int8
+# dtypes: category(4), datetime64[ns](2), int16(1), int8(1), string(5)
+# memory usage: 176.5+ KB
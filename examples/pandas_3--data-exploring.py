@@ -59,6 +59,22 @@ df.info()
 # dtypes: datetime64[ns](2), int64(2), object(9)
 # memory usage: 106.5+ KB
 
+# The compact schema written by pandas_2--data-cleaning.py has categorical text columns,
+# Arrow-backed strings, int16 years and int8 ages
+with pd.option_context('mode.string_storage', 'pyarrow'):
+    df_compact = pd.read_parquet('parquet-files/nobel_winners_cleaned_compact.parquet')
+df.memory_usage(deep=True).sum()
+# 705430
+df_compact.memory_usage(deep=True).sum()
+# 252392
+
+# Group a categorical column with observed=True to get only the categories found, as with an object column
+df_compact.groupby('gender', observed=True).size()
+# gender
+# female     65
+# male      909
+# dtype: int64
+
 df.groupby('gender').size()  # type: pd.Series
 # gender
 # female     65
@@ -240,4 +240,31 @@ mongo_coll_to_dicts(client, DB_NOBEL_PRIZE, COLL_WINNERS)
 #   'gender': 'female',
 #   'year': 1911}]
 
+# mongo_coll_to_dicts fetches all the documents and deletes '_id' in Python.
+# Instead, leave '_id' out with a projection on the server and fetch the documents in batches,
+# streamed or into a DataFrame; index the fields of the filters
+# (see pymongo_batches.py, which also runs with mongomock instead of a local mongod)
+from pymongo_batches import documents_to_frame, ensure_indexes, insert_documents, iter_documents
+
+ensure_indexes(coll, ('category', 'year', 'gender'))
+# ['category_1', 'year_1', 'gender_1']
+
+for winner in iter_documents(coll, {'year': {'$gt': 1930}}, batch_size=1000):
+    print(winner)
+# {'category': 'Physics', 'name': 'Paul Dirac', 'nationality': 'British', 'gender': 'male', 'year': 1933}
+
+documents_to_frame(
+    coll,
+    {'$or': [{'year': {'$gt': 1930}}, {'gender': 'female'}]},
+    fields=['name', 'year'],
+    batch_size=1000
+)
+#           name  year
+# 0   Paul Dirac  1933
+# 1  Marie Curie  1911
+
+# Load in batches with insert_many(ordered=False), the other documents are inserted if one fails
+insert_documents(client[DB_NOBEL_PRIZE]['winners_copy'], mongo_coll_to_dicts(client, DB_NOBEL_PRIZE, COLL_WINNERS))
+# 3
+
 client.drop_database(DB_NOBEL_PRIZE)
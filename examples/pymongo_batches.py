@@ -0,0 +1,136 @@
+"""
+Reading and loading the winners in MongoDB in batches, instead of mongo_coll_to_dicts of pymongo_.py.
+
+mongo_coll_to_dicts fetches all the documents into a list and deletes "_id" from every dictionary in Python.
+Here
+- a projection leaves "_id" and the unneeded fields out on the server;
+- the cursor fetches batch_size documents per round trip and the documents are streamed
+or built into a DataFrame directly;
+- indexes on category, year and gender serve filters like {'year': {'$gt': 1930}}
+and {'$or': [{'year': {'$gt': 1930}}, {'gender': 'female'}]}, each branch of $or can use its own index;
+- the loads are insert_many(ordered=False) of batches: the server does not stop at the first failed document.
+
+The collection can be of MongoClient() with a local mongod or of mongomock.MongoClient() in-process:
+$ python pymongo_batches.py --mock
+
+This example is based on:
+- https://pymongo.readthedocs.io/en/stable/api/pymongo/collection.html#pymongo.collection.Collection.find;
+- https://www.mongodb.com/docs/manual/tutorial/project-fields-from-query-results/;
+- https://www.mongodb.com/docs/manual/core/index-single/;
+- https://www.mongodb.com/docs/manual/reference/operator/query/or/#-or-clauses-and-indexes;
+- https://github.com/mongomock/mongomock.
+"""
+import argparse
+from itertools import islice
+
+import pandas as pd
+from pymongo import ASCENDING, MongoClient
+from pymongo.errors import BulkWriteError
+
+WINNER_INDEXES = ('category', 'year', 'gender')
+
+
+def ensure_indexes(coll, fields=WINNER_INDEXES) -> list:
+    """
+    Create an ascending index on every field, if it does not exist yet. Return the index names.
+    """
+    return [coll.create_index([(field, ASCENDING)]) for field in fields]
+
+
+def projection(fields=None, delete_id=True):
+    """
+    The projection of find: the fields, all by default, without "_id" if delete_id is true
+    """
+    if fields is None:
+        return {'_id': 0} if delete_id else None
+    return {**{field: 1 for field in fields}, **({'_id': 0} if delete_id else {})}
+
+
+def iter_documents(coll, query=None, fields=None, delete_id=True, batch_size=1000):
+    """
+    Yield the documents of the query, fetched batch_size documents at a time
+    """
+    yield from coll.find(query or {}, projection(fields, delete_id), batch_size=batch_size)
+
+
+def documents_to_frame(coll, query=None, fields=None, delete_id=True, batch_size=1000) -> pd.DataFrame:
+    """
+    A DataFrame of the documents of the query, built from the cursor without a list of all the documents
+    """
+    return pd.DataFrame.from_records(iter_documents(coll, query, fields, delete_id, batch_size), columns=fields)
+
+
+def iter_batches(documents, batch_size=10_000):
+    """
+    Yield lists of at most batch_size dictionaries of a DataFrame or an iterable of dictionaries,
+    the rows of a DataFrame are converted one batch at a time
+    """
+    if isinstance(documents, pd.DataFrame):
+        for start in range(0, len(documents), batch_size):
+            yield documents.iloc[start:start + batch_size].to_dict(orient='records')
+        return
+    documents = iter(documents)
+    while batch := list(islice(documents, batch_size)):
+        yield batch
+
+
+def insert_documents(coll, documents, batch_size=10_000) -> int:
+    """
+    Insert a DataFrame or an iterable of dictionaries with insert_many(ordered=False) of batch_size documents.
+    Return the number of inserted documents, BulkWriteError is raised after all the batches if some failed,
+    the "index" of its write errors is the position of the failed document among all the documents.
+    Note: insert_many adds "_id" to the inserted dictionaries.
+    """
+    inserted = 0
+    errors = []
+    offset = 0
+    for batch in iter_batches(documents, batch_size):
+        try:
+            inserted += len(coll.insert_many(batch, ordered=False).inserted_ids)
+        except BulkWriteError as error:
+            inserted += error.details['nInserted']
+            # The index of a write error is the position in its batch
+            errors.extend({**write_error, 'index': write_error['index'] + offset}
+                          for write_error in error.details['writeErrors'])
+        offset += len(batch)
+    if errors:
+        raise BulkWriteError({'nInserted': inserted, 'writeErrors': errors})
+    return inserted
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mock', action='store_true', help='use mongomock instead of a local mongod')
+    args = parser.parse_args()
+
+    if args.mock:
+        import mongomock  # precondition: mongomock installed
+
+        client = mongomock.MongoClient()
+    else:
+        client = MongoClient()  # default: host='localhost', port=27017
+    coll = client.nobel_prize_batches.winners
+    coll.drop()
+
+    nobel_winners = [
+        {'category': 'Physics', 'name': 'Albert Einstein', 'nationality': 'German and Swiss', 'gender': 'male',
+         'year': 1921},
+        {'category': 'Physics', 'name': 'Paul Dirac', 'nationality': 'British', 'gender': 'male', 'year': 1933},
+        {'category': 'Chemistry', 'name': 'Marie Curie', 'nationality': 'Polish', 'gender': 'female', 'year': 1911},
+    ]
+    print(insert_documents(coll, nobel_winners, batch_size=2))
+    print(ensure_indexes(coll))
+    print(list(iter_documents(coll, {'year': {'$gt': 1930}}, batch_size=2)))
+    print(documents_to_frame(coll, {'$or': [{'year': {'$gt': 1930}}, {'gender': 'female'}]},
+                             fields=['name', 'year'], batch_size=2))
+    client.drop_database('nobel_prize_batches')
+
+"""
+Run from the examples directory, with a local mongod or with --mock:
+$ python pymongo_batches.py --mock
+3
+['category_1', 'year_1', 'gender_1']
+[{'category': 'Physics', 'name': 'Paul Dirac', 'nationality': 'British', 'gender': 'male', 'year': 1933}]
+          name  year
+0   Paul Dirac  1933
+1  Marie Curie  1911
+"""
@@ -0,0 +1,1206 @@
+{"link": "https://en.wikipedia.org/wiki/Richard_Adolf_Zsigmondy", "name": "Richard Adolf Zsigmondy", "year": 1925, "category": "Chemistry", "country": "Austria", "born_in": null, "text": "Richard Adolf Zsigmondy , Chemistry, 1925", "wikidata_code": "Q78481", "date_of_birth": "1 April 1865", "date_of_death": "23 September 1929", "place_of_birth": "Vienna", "place_of_death": "Göttingen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fritz_Pregl", "name": "Fritz Pregl", "year": 1923, "category": "Chemistry", "country": "Austria", "born_in": null, "text": "Fritz Pregl ,  born in Austria-Hungary, now Slovenia , Chemistry, 1923", "wikidata_code": "Q78482", "date_of_birth": "3 September 1869", "date_of_death": "13 December 1930", "place_of_birth": "Ljubljana", "place_of_death": "Graz", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/R%C3%B3bert_B%C3%A1r%C3%A1ny", "name": "Róbert Bárány", "year": 1914, "category": "Physiology or Medicine", "country": "Austria", "born_in": null, "text": "Róbert Bárány , Physiology or Medicine, 1914", "wikidata_code": "Q78478", "date_of_birth": "22 April 1876", "date_of_death": "8 April 1936", "place_of_birth": "Vienna", "place_of_death": "Uppsala Cathedral Assembly", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carl_Ferdinand_Cori", "name": "Carl Ferdinand Cori", "year": 1947, "category": "Physiology or Medicine", "country": "Austria", "born_in": null, "text": "Carl Ferdinand Cori ,  born in Austria , Physiology or Medicine, 1947", "wikidata_code": "Q78501", "date_of_birth": "5 December 1896", "date_of_death": "20 October 1984", "place_of_birth": "Prague", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gerty_Cori", "name": "Gerty Cori", "year": 1947, "category": "Physiology or Medicine", "country": "Austria", "born_in": null, "text": "Gerty Cori ,  born in Austria , Physiology or Medicine, 1947", "wikidata_code": "Q204733", "date_of_birth": "15 August 1896", "date_of_death": "26 October 1957", "place_of_birth": "Prague", "place_of_death": "Glendale", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Wolfgang_Pauli", "name": "Wolfgang Pauli", "year": 1945, "category": "Physics", "country": "Austria", "born_in": null, "text": "Wolfgang Pauli , Physics, 1945", "wikidata_code": "Q65989", "date_of_birth": "25 April 1900", "date_of_death": "15 December 1958", "place_of_birth": "Vienna", "place_of_death": "Zürich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Friedrich_Hayek", "name": "Friedrich Hayek", "year": 1974, "category": "Economics", "country": "Austria", "born_in": null, "text": "Friedrich Hayek , Economics, 1974", "wikidata_code": "Q1325", "date_of_birth": "8 May 1899", "date_of_death": "23 March 1992", "place_of_birth": "Vienna", "place_of_death": "Freiburg im Breisgau", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Michael_Levitt", "name": "Michael Levitt", "year": 2013, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Michael Levitt ,  born in South Africa , Chemistry, 2013", "wikidata_code": "Q6832227", "date_of_birth": "9 May 1947", "place_of_birth": "Pretoria", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Peter_Higgs", "name": "Peter Higgs", "year": 2013, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Peter Higgs , Physics, 2013", "wikidata_code": "Q192112", "date_of_birth": "29 May 1929", "place_of_birth": "Newcastle upon Tyne", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Gurdon", "name": "John B. Gurdon", "year": 2012, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "John B. Gurdon , Physiology or Medicine, 2012", "wikidata_code": "Q81218", "date_of_birth": "2 October 1933", "place_of_birth": "Dippenhall", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Christopher_A._Pissarides", "name": "Christopher A. Pissarides", "year": 2010, "category": "Economics", "country": "United Kingdom", "born_in": null, "text": "Christopher A. Pissarides ,  born in Cyprus , Economics, 2010", "wikidata_code": "Q109582", "date_of_birth": "20 February 1948", "place_of_birth": "Nicosia", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Syukuro_Manabe", "name": "Syukuro Manabe", "year": 2021, "category": "Physics", "country": "United States", "born_in": null, "text": "Syukuro Manabe ,  born in Japan , Physics, 2021", "wikidata_code": "Q3675789", "date_of_birth": "21 September 1931", "place_of_birth": "Shinritsu", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_MacMillan", "name": "David MacMillan", "year": 2021, "category": "Chemistry", "country": "United States", "born_in": null, "text": "David MacMillan ,  born in United Kingdom , Chemistry, 2021", "wikidata_code": "Q5237001", "date_of_birth": "16 March 1968", "place_of_birth": "Bellshill", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_Julius", "name": "David Julius", "year": 2021, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "David Julius , Physiology or Medicine, 2021", "wikidata_code": "Q1174906", "date_of_birth": "4 November 1955", "place_of_birth": "Brighton Beach", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ardem_Patapoutian", "name": "Ardem Patapoutian", "year": 2021, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Ardem Patapoutian ,  born in Lebanon , Physiology or Medicine, 2021", "wikidata_code": "Q60322501", "date_of_birth": "2 October 1967", "place_of_birth": "Beirut", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Thomas_Schelling", "name": "Thomas Schelling", "year": 2005, "category": "Economics", "country": "United States", "born_in": null, "text": "Thomas Schelling , Economics, 2005", "wikidata_code": "Q206460", "date_of_birth": "14 April 1921", "date_of_death": "13 December 2016", "place_of_birth": "Oakland", "place_of_death": "Bethesda", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_L._Hall", "name": "John L. Hall", "year": 2005, "category": "Physics", "country": "United States", "born_in": null, "text": "John L. Hall , Physics, 2005", "wikidata_code": "Q206390", "date_of_birth": "21 August 1934", "place_of_birth": "Denver", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Roy_J._Glauber", "name": "Roy J. Glauber", "year": 2005, "category": "Physics", "country": "United States", "born_in": null, "text": "Roy J. Glauber , Physics, 2005", "wikidata_code": "Q64188", "date_of_birth": "1 September 1925", "date_of_death": "26 December 2018", "place_of_birth": "New York City", "place_of_death": "Newton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Horst_Ludwig_St%C3%B6rmer", "name": "Horst Ludwig Störmer", "year": 1998, "category": "Physics", "country": "United States", "born_in": null, "text": "Horst Ludwig Störmer ,  born in Germany , Physics, 1998", "wikidata_code": "Q71015", "date_of_birth": "6 April 1949", "place_of_birth": "Frankfurt", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_B._Laughlin", "name": "Robert B. Laughlin", "year": 1998, "category": "Physics", "country": "United States", "born_in": null, "text": "Robert B. Laughlin , Physics, 1998", "wikidata_code": "Q189997", "date_of_birth": "1 November 1950", "place_of_birth": "Visalia", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Daniel_C._Tsui", "name": "Daniel C. Tsui", "year": 1998, "category": "Physics", "country": "United States", "born_in": null, "text": "Daniel C. Tsui ,  born in China , Physics, 1998", "wikidata_code": "Q202138", "date_of_birth": "28 February 1939", "place_of_birth": "Baofeng County", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_F._Furchgott", "name": "Robert F. Furchgott", "year": 1998, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Robert F. Furchgott , Physiology or Medicine, 1998", "wikidata_code": "Q108880", "date_of_birth": "4 June 1916", "date_of_death": "19 May 2009", "place_of_birth": "Charleston", "place_of_death": "Seattle", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Louis_J._Ignarro", "name": "Louis J. Ignarro", "year": 1998, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Louis J. Ignarro , Physiology or Medicine, 1998", "wikidata_code": "Q309820", "date_of_birth": "31 May 1941", "place_of_birth": "Brooklyn", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Steven_Weinberg", "name": "Steven Weinberg", "year": 1979, "category": "Physics", "country": "United States", "born_in": null, "text": "Steven Weinberg , Physics, 1979", "wikidata_code": "Q179282", "date_of_birth": "3 May 1933", "date_of_death": "23 July 2021", "place_of_birth": "New York City", "place_of_death": "Austin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Sheldon_Glashow", "name": "Sheldon Glashow", "year": 1979, "category": "Physics", "country": "United States", "born_in": null, "text": "Sheldon Glashow , Physics, 1979", "wikidata_code": "Q107420", "date_of_birth": "5 December 1932", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Allan_McLeod_Cormack", "name": "Allan M. Cormack", "year": 1979, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Allan M. Cormack ,  born in South Africa , Physiology or Medicine, 1979", "wikidata_code": "Q223542", "date_of_birth": "23 February 1924", "date_of_death": "7 May 1998", "place_of_birth": "Johannesburg", "place_of_death": "Winchester", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ferid_Murad", "name": "Ferid Murad", "year": 1998, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Ferid Murad , Physiology or Medicine, 1998", "wikidata_code": "Q295999", "date_of_birth": "14 September 1936", "date_of_death": "4 September 2023", "place_of_birth": "Whiting", "place_of_death": "Menlo Park", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Woodrow_Wilson", "name": "Woodrow Wilson", "year": 1919, "category": "Peace", "country": "United States", "born_in": null, "text": "Woodrow Wilson , Peace, 1919", "wikidata_code": "Q34296", "date_of_birth": "28 December 1856", "date_of_death": "3 February 1924", "place_of_birth": "Woodrow Wilson Birthplace", "place_of_death": "Woodrow Wilson House", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Theodore_W._Richards", "name": "Theodore W. Richards", "year": 1914, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Theodore W. Richards , Chemistry, 1914", "wikidata_code": "Q189465", "date_of_birth": "31 January 1868", "date_of_death": "2 April 1928", "place_of_birth": "Germantown", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_D._Boyer", "name": "Paul D. Boyer", "year": 1997, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Paul D. Boyer , Chemistry, 1997", "wikidata_code": "Q102395", "date_of_birth": "31 July 1918", "date_of_death": "2 June 2018", "place_of_birth": "Provo", "place_of_death": "Los Angeles", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_C._Merton", "name": "Robert C. Merton", "year": 1997, "category": "Economics", "country": "United States", "born_in": null, "text": "Robert C. Merton , Economics, 1997", "wikidata_code": "Q287542", "date_of_birth": "31 July 1944", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Myron_Scholes", "name": "Myron Scholes", "year": 1997, "category": "Economics", "country": "United States", "born_in": null, "text": "Myron Scholes ,  born in Canada , Economics, 1997", "wikidata_code": "Q295647", "date_of_birth": "1 July 1941", "place_of_birth": "Timmins", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tawakkol_Karman", "name": "Tawakkol Karman", "year": 2011, "category": "Peace", "country": "Yemen", "born_in": null, "text": "Tawakkol Karman , Peace, 2011", "wikidata_code": "Q104622", "date_of_birth": "7 February 1979", "place_of_birth": "Ta'izz", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Ivo_Andri%C4%87", "name": "Ivo Andrić", "year": 1961, "category": "Literature", "country": "Yugoslavia", "born_in": null, "text": "Ivo Andrić ,  born in the  Condominium of Bosnia and Herzegovina ,  Austria-Hungary  (now  Bosnia and Herzegovina ) , Literature, 1961", "wikidata_code": "Q47561", "date_of_birth": "9 October 1892", "date_of_death": "13 March 1975", "place_of_birth": "Dolac", "place_of_death": "Belgrade", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Vladimir_Prelog", "name": "Vladimir Prelog", "year": 1975, "category": "Chemistry", "country": "Yugoslavia", "born_in": null, "text": "Vladimir Prelog ,  born in the  Condominium of Bosnia and Herzegovina ,  Austria-Hungary  (now  Bosnia and Herzegovina ) , Chemistry, 1975", "wikidata_code": "Q83501", "date_of_birth": "23 July 1906", "date_of_death": "7 January 1998", "place_of_birth": "Sarajevo", "place_of_death": "Zürich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Leopold_Ru%C5%BEi%C4%8Dka", "name": "Leopold Ružička", "year": 1939, "category": "Chemistry", "country": null, "born_in": "Yugoslavia", "text": "Leopold Ružička *,  born in the  Kingdom of Croatia-Slavonia  part of  Kingdom of Hungary  in  Austro-Hungarian Empire  (now  Croatia ) , Chemistry, 1939", "wikidata_code": "Q122996", "date_of_birth": "13 September 1887", "date_of_death": "26 September 1976", "place_of_birth": "Vukovar", "place_of_death": "Mammern", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_G._Dawes", "name": "Charles G. Dawes", "year": 1925, "category": "Peace", "country": "United States", "born_in": null, "text": "Charles G. Dawes , Peace, 1925", "wikidata_code": "Q184565", "date_of_birth": "27 August 1865", "date_of_death": "23 April 1951", "place_of_birth": "Marietta", "place_of_death": "Evanston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_A._Millikan", "name": "Robert A. Millikan", "year": 1923, "category": "Physics", "country": "United States", "born_in": null, "text": "Robert A. Millikan , Physics, 1923", "wikidata_code": "Q130975", "date_of_birth": "22 March 1868", "date_of_death": "19 December 1953", "place_of_birth": "Morrison", "place_of_death": "San Marino", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Elihu_Root", "name": "Elihu Root", "year": 1912, "category": "Peace", "country": "United States", "born_in": null, "text": "Elihu Root , Peace, 1912", "wikidata_code": "Q220619", "date_of_birth": "15 February 1845", "date_of_death": "7 February 1937", "place_of_birth": "Clinton", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Albert_A._Michelson", "name": "Albert A. Michelson", "year": 1907, "category": "Physics", "country": "United States", "born_in": null, "text": "Albert A. Michelson ,  born in then Germany, now Poland , Physics, 1907", "wikidata_code": "Q127234", "date_of_birth": "19 December 1852", "date_of_death": "9 May 1931", "place_of_birth": "Strzelno", "place_of_death": "Pasadena", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Theodore_Roosevelt", "name": "Theodore Roosevelt", "year": 1906, "category": "Peace", "country": "United States", "born_in": null, "text": "Theodore Roosevelt , Peace, 1906", "wikidata_code": "Q33866", "date_of_birth": "27 October 1858", "date_of_death": "6 January 1919", "place_of_birth": "New York City", "place_of_death": "Sagamore Hill", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Arthur_H._Compton", "name": "Arthur H. Compton", "year": 1927, "category": "Physics", "country": "United States", "born_in": null, "text": "Arthur H. Compton , Physics, 1927", "wikidata_code": "Q127944", "date_of_birth": "10 September 1892", "date_of_death": "15 March 1962", "place_of_birth": "Wooster", "place_of_death": "Berkeley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Baruj_Benacerraf", "name": "Baruj Benacerraf", "year": 1980, "category": "Physiology or Medicine", "country": null, "born_in": "Venezuela", "text": "Baruj Benacerraf *, Physiology or Medicine, 1980", "wikidata_code": "Q234701", "date_of_birth": "29 October 1920", "date_of_death": "2 August 2011", "place_of_birth": "Caracas", "place_of_death": "Boston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/L%C3%AA_%C4%90%E1%BB%A9c_Th%E1%BB%8D", "name": "Lê Đức Thọ", "year": 1973, "category": "Peace", "country": "Vietnam", "born_in": null, "text": "Lê Đức Thọ ,  born in French Indochina , Peace, 1973 (declined)", "wikidata_code": "Q233969", "date_of_birth": "14 October 1911", "date_of_death": "13 October 1990", "place_of_birth": "Hà Nam", "place_of_death": "Hanoi", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Sinclair_Lewis", "name": "Sinclair Lewis", "year": 1930, "category": "Literature", "country": "United States", "born_in": null, "text": "Sinclair Lewis , Literature, 1930", "wikidata_code": "Q123469", "date_of_birth": "7 February 1885", "date_of_death": "10 January 1951", "place_of_birth": "Sauk Centre", "place_of_death": "Rome", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Frank_B._Kellogg", "name": "Frank B. Kellogg", "year": 1929, "category": "Peace", "country": "United States", "born_in": null, "text": "Frank B. Kellogg , Peace, 1929", "wikidata_code": "Q193009", "date_of_birth": "22 December 1856", "date_of_death": "21 December 1937", "place_of_birth": "Potsdam", "place_of_death": "Saint Paul", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ernest_Lawrence", "name": "Ernest Lawrence", "year": 1939, "category": "Physics", "country": "United States", "born_in": null, "text": "Ernest Lawrence , Physics, 1939", "wikidata_code": "Q169577", "date_of_birth": "8 August 1901", "date_of_death": "27 August 1958", "place_of_birth": "Canton", "place_of_death": "Palo Alto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Pearl_S._Buck", "name": "Pearl S. Buck", "year": 1938, "category": "Literature", "country": "United States", "born_in": null, "text": "Pearl S. Buck , Literature, 1938", "wikidata_code": "Q80900", "date_of_birth": "26 June 1892", "date_of_death": "6 March 1973", "place_of_birth": "Hillsboro", "place_of_death": "Danby", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Clinton_Davisson", "name": "Clinton Davisson", "year": 1937, "category": "Physics", "country": "United States", "born_in": null, "text": "Clinton Davisson , Physics, 1937", "wikidata_code": "Q133222", "date_of_birth": "22 October 1881", "date_of_death": "1 February 1958", "place_of_birth": "Bloomington", "place_of_death": "Charlottesville", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Eugene_O%27Neill", "name": "Eugene O'Neill", "year": 1936, "category": "Literature", "country": "United States", "born_in": null, "text": "Eugene O'Neill , Literature, 1936", "wikidata_code": "Q93157", "date_of_birth": "16 October 1888", "date_of_death": "27 November 1953", "place_of_birth": "New York City", "place_of_death": "Boston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carl_David_Anderson", "name": "Carl Anderson", "year": 1936, "category": "Physics", "country": "United States", "born_in": null, "text": "Carl Anderson , Physics, 1936", "wikidata_code": "Q169366", "date_of_birth": "3 September 1905", "date_of_death": "11 January 1991", "place_of_birth": "New York City", "place_of_death": "San Marino", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Harold_C._Urey", "name": "Harold C. Urey", "year": 1934, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Harold C. Urey , Chemistry, 1934", "wikidata_code": "Q179777", "date_of_birth": "29 April 1893", "date_of_death": "5 January 1981", "place_of_birth": "Walkerton", "place_of_death": "La Jolla", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Joseph_Erlanger", "name": "Joseph Erlanger", "year": 1944, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Joseph Erlanger , Physiology or Medicine, 1944", "wikidata_code": "Q243532", "date_of_birth": "5 January 1874", "date_of_death": "5 December 1965", "place_of_birth": "San Francisco", "place_of_death": "St. Louis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Herbert_S._Gasser", "name": "Herbert S. Gasser", "year": 1944, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Herbert S. Gasser , Physiology or Medicine, 1944", "wikidata_code": "Q273201", "date_of_birth": "5 July 1888", "date_of_death": "11 May 1963", "place_of_birth": "Platteville", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Otto_Stern", "name": "Otto Stern", "year": 1943, "category": "Physics", "country": "United States", "born_in": null, "text": "Otto Stern ,  born in then Germany, now Poland , Physics, 1943", "wikidata_code": "Q57072", "date_of_birth": "17 February 1888", "date_of_death": "17 August 1969", "place_of_birth": "Żory", "place_of_death": "Berkeley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Edward_A._Doisy", "name": "Edward A. Doisy", "year": 1943, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Edward A. Doisy , Physiology or Medicine, 1943", "wikidata_code": "Q230612", "date_of_birth": "13 November 1893", "date_of_death": "23 October 1986", "place_of_birth": "Hume", "place_of_death": "St. Louis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_R._Minot", "name": "George R. Minot", "year": 1934, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "George R. Minot , Physiology or Medicine, 1934", "wikidata_code": "Q245000", "date_of_birth": "2 December 1885", "date_of_death": "25 February 1950", "place_of_birth": "Boston", "place_of_death": "Boston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_P._Murphy", "name": "William P. Murphy", "year": 1934, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "William P. Murphy , Physiology or Medicine, 1934", "wikidata_code": "Q80323", "date_of_birth": "6 February 1892", "date_of_death": "9 October 1987", "place_of_birth": "Dane County", "place_of_death": "Brookline", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_H._Whipple", "name": "George H. Whipple", "year": 1934, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "George H. Whipple , Physiology or Medicine, 1934", "wikidata_code": "Q273238", "date_of_birth": "28 August 1878", "date_of_death": "1 February 1976", "place_of_birth": "Ashland", "place_of_death": "Rochester", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Thomas_H._Morgan", "name": "Thomas H. Morgan", "year": 1933, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Thomas H. Morgan , Physiology or Medicine, 1933", "wikidata_code": "Q177681", "date_of_birth": "25 September 1866", "date_of_death": "4 December 1945", "place_of_birth": "Lexington", "place_of_death": "Italy", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Irving_Langmuir", "name": "Irving Langmuir", "year": 1932, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Irving Langmuir , Chemistry, 1932", "wikidata_code": "Q184286", "date_of_birth": "31 January 1881", "date_of_death": "16 August 1957", "place_of_birth": "Brooklyn", "place_of_death": "Woods Hole", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jane_Addams", "name": "Jane Addams", "year": 1931, "category": "Peace", "country": "United States", "born_in": null, "text": "Jane Addams , Peace, 1931", "wikidata_code": "Q180989", "date_of_birth": "6 September 1860", "date_of_death": "21 June 1935", "place_of_birth": "Cedarville", "place_of_death": "Chicago", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Nicholas_M._Butler", "name": "Nicholas M. Butler", "year": 1931, "category": "Peace", "country": "United States", "born_in": null, "text": "Nicholas M. Butler , Peace, 1931", "wikidata_code": "Q271517", "date_of_birth": "2 April 1862", "date_of_death": "7 December 1947", "place_of_birth": "Elizabeth", "place_of_death": "Manhattan", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Cordell_Hull", "name": "Cordell Hull", "year": 1945, "category": "Peace", "country": "United States", "born_in": null, "text": "Cordell Hull , Peace, 1945", "wikidata_code": "Q202979", "date_of_birth": "2 October 1871", "date_of_death": "23 July 1955", "place_of_birth": "Olympus", "place_of_death": "Bethesda", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Isidor_Isaac_Rabi", "name": "Isidor Isaac Rabi", "year": 1944, "category": "Physics", "country": "United States", "born_in": null, "text": "Isidor Isaac Rabi ,  born in Austria , Physics, 1944", "wikidata_code": "Q165969", "date_of_birth": "29 July 1898", "date_of_death": "11 January 1988", "place_of_birth": "Rymanów", "place_of_death": "Manhattan", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carl_Ferdinand_Cori", "name": "Carl Ferdinand Cori", "year": 1947, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Carl Ferdinand Cori ,  born in Austria , Physiology or Medicine, 1947", "wikidata_code": "Q78501", "date_of_birth": "5 December 1896", "date_of_death": "20 October 1984", "place_of_birth": "Prague", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gerty_Cori", "name": "Gerty Cori", "year": 1947, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Gerty Cori ,  born in Austria , Physiology or Medicine, 1947", "wikidata_code": "Q204733", "date_of_birth": "15 August 1896", "date_of_death": "26 October 1957", "place_of_birth": "Prague", "place_of_death": "Glendale", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Wendell_M._Stanley", "name": "Wendell M. Stanley", "year": 1946, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Wendell M. Stanley , Chemistry, 1946", "wikidata_code": "Q105937", "date_of_birth": "16 August 1904", "date_of_death": "15 June 1971", "place_of_birth": "Ridgeville", "place_of_death": "Salamanca", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_B._Sumner", "name": "James B. Sumner", "year": 1946, "category": "Chemistry", "country": "United States", "born_in": null, "text": "James B. Sumner , Chemistry, 1946", "wikidata_code": "Q106756", "date_of_birth": "19 November 1887", "date_of_death": "12 August 1955", "place_of_birth": "Canton", "place_of_death": "Buffalo", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_H._Northrop", "name": "John H. Northrop", "year": 1946, "category": "Chemistry", "country": "United States", "born_in": null, "text": "John H. Northrop , Chemistry, 1946", "wikidata_code": "Q106399", "date_of_birth": "5 July 1891", "date_of_death": "27 May 1987", "place_of_birth": "Yonkers", "place_of_death": "Wickenburg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Selman_A._Waksman", "name": "Selman A. Waksman", "year": 1952, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Selman A. Waksman ,  born in then Russian Empire, now Ukraine , Physiology or Medicine, 1952", "wikidata_code": "Q232308", "date_of_birth": "22 July 1888", "date_of_death": "16 August 1973", "place_of_birth": "Nova Pryluka", "place_of_death": "Woods Hole", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Edwin_M._McMillan", "name": "Edwin M. McMillan", "year": 1951, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Edwin M. McMillan , Chemistry, 1951", "wikidata_code": "Q19009", "date_of_birth": "18 September 1907", "date_of_death": "7 September 1991", "place_of_birth": "Redondo Beach", "place_of_death": "El Cerrito", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Glenn_Theodore_Seaborg", "name": "Glenn Theodore Seaborg", "year": 1951, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Glenn Theodore Seaborg , Chemistry, 1951", "wikidata_code": "Q48973", "date_of_birth": "19 April 1912", "date_of_death": "25 February 1999", "place_of_birth": "Ishpeming", "place_of_death": "Lafayette", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ralph_Bunche", "name": "Ralph J. Bunche", "year": 1950, "category": "Peace", "country": "United States", "born_in": null, "text": "Ralph J. Bunche , Peace, 1950", "wikidata_code": "Q213500", "date_of_birth": "7 August 1904", "date_of_death": "10 December 1971", "place_of_birth": "Detroit", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Philip_S._Hench", "name": "Philip S. Hench", "year": 1950, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Philip S. Hench , Physiology or Medicine, 1950", "wikidata_code": "Q235651", "date_of_birth": "28 February 1896", "date_of_death": "30 March 1965", "place_of_birth": "Pittsburgh", "place_of_death": "Ocho Rios", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Edward_C._Kendall", "name": "Edward C. Kendall", "year": 1950, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Edward C. Kendall , Physiology or Medicine, 1950", "wikidata_code": "Q110101", "date_of_birth": "8 March 1886", "date_of_death": "4 May 1972", "place_of_birth": "South Norwalk", "place_of_death": "Princeton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Giauque", "name": "William Giauque", "year": 1949, "category": "Chemistry", "country": "United States", "born_in": null, "text": "William Giauque ,  born in Canada , Chemistry, 1949", "wikidata_code": "Q110073", "date_of_birth": "12 May 1895", "date_of_death": "28 March 1982", "place_of_birth": "Niagara Falls", "place_of_death": "Berkeley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Faulkner", "name": "William Faulkner", "year": 1949, "category": "Literature", "country": "United States", "born_in": null, "text": "William Faulkner , Literature, 1949", "wikidata_code": "Q38392", "date_of_birth": "25 September 1897", "date_of_death": "6 July 1962", "place_of_birth": "New Albany", "place_of_death": "Byhalia", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/T._S._Eliot", "name": "T. S. Eliot", "year": 1948, "category": "Literature", "country": null, "born_in": "United States", "text": "T. S. Eliot *, Literature, 1948", "wikidata_code": "Q37767", "date_of_birth": "26 September 1888", "date_of_death": "4 January 1965", "place_of_birth": "St. Louis", "place_of_death": "Kensington", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Emily_Greene_Balch", "name": "Emily G. Balch", "year": 1946, "category": "Peace", "country": "United States", "born_in": null, "text": "Emily G. Balch , Peace, 1946", "wikidata_code": "Q215139", "date_of_birth": "8 January 1867", "date_of_death": "9 January 1961", "place_of_birth": "Jamaica Plain", "place_of_death": "Cambridge", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/John_Mott", "name": "John R. Mott", "year": 1946, "category": "Peace", "country": "United States", "born_in": null, "text": "John R. Mott , Peace, 1946", "wikidata_code": "Q159726", "date_of_birth": "25 May 1865", "date_of_death": "31 January 1955", "place_of_birth": "New York City", "place_of_death": "Orlando", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Percy_W._Bridgman", "name": "Percy W. Bridgman", "year": 1946, "category": "Physics", "country": "United States", "born_in": null, "text": "Percy W. Bridgman , Physics, 1946", "wikidata_code": "Q172118", "date_of_birth": "21 April 1882", "date_of_death": "20 August 1961", "place_of_birth": "Cambridge", "place_of_death": "Randolph", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hermann_J._Muller", "name": "Hermann J. Muller", "year": 1946, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Hermann J. Muller , Physiology or Medicine, 1946", "wikidata_code": "Q83598", "date_of_birth": "21 December 1890", "date_of_death": "5 April 1967", "place_of_birth": "New York City", "place_of_death": "Indianapolis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_Marshall", "name": "George C. Marshall", "year": 1953, "category": "Peace", "country": "United States", "born_in": null, "text": "George C. Marshall , Peace, 1953", "wikidata_code": "Q151414", "date_of_birth": "31 December 1880", "date_of_death": "16 October 1959", "place_of_birth": "Uniontown", "place_of_death": "Washington, D.C.", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fritz_Albert_Lipmann", "name": "Fritz Albert Lipmann", "year": 1953, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Fritz Albert Lipmann ,  born in then Germany, now Russia , Physiology or Medicine, 1953", "wikidata_code": "Q77104", "date_of_birth": "12 June 1899", "date_of_death": "24 July 1986", "place_of_birth": "Königsberg", "place_of_death": "Poughkeepsie", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/E._M._Purcell", "name": "E. M. Purcell", "year": 1952, "category": "Physics", "country": "United States", "born_in": null, "text": "E. M. Purcell , Physics, 1952", "wikidata_code": "Q183270", "date_of_birth": "30 August 1912", "date_of_death": "7 March 1997", "place_of_birth": "Taylorville", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Felix_Bloch", "name": "Felix Bloch", "year": 1952, "category": "Physics", "country": "United States", "born_in": null, "text": "Felix Bloch ,  born in Switzerland , Physics, 1952", "wikidata_code": "Q123022", "date_of_birth": "23 October 1905", "date_of_death": "10 September 1983", "place_of_birth": "Zürich", "place_of_death": "Zürich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Polykarp_Kusch", "name": "Polykarp Kusch", "year": 1955, "category": "Physics", "country": "United States", "born_in": null, "text": "Polykarp Kusch ,  born in Germany , Physics, 1955", "wikidata_code": "Q184571", "date_of_birth": "26 January 1911", "date_of_death": "20 March 1993", "place_of_birth": "Blankenburg", "place_of_death": "Dallas", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Linus_Pauling", "name": "Linus C. Pauling", "year": 1954, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Linus C. Pauling , Chemistry, 1954", "wikidata_code": "Q48983", "date_of_birth": "28 February 1901", "date_of_death": "18 August 1994", "place_of_birth": "Portland", "place_of_death": "Big Sur", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ernest_Hemingway", "name": "Ernest Hemingway", "year": 1954, "category": "Literature", "country": "United States", "born_in": null, "text": "Ernest Hemingway , Literature, 1954", "wikidata_code": "Q23434", "date_of_birth": "21 July 1899", "date_of_death": "2 July 1961", "place_of_birth": "Oak Park", "place_of_death": "Ketchum", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_B._Shockley", "name": "William B. Shockley", "year": 1956, "category": "Physics", "country": "United States", "born_in": null, "text": "William B. Shockley , Physics, 1956", "wikidata_code": "Q163415", "date_of_birth": "13 February 1910", "date_of_death": "12 August 1989", "place_of_birth": "London", "place_of_death": "Stanford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Bardeen", "name": "John Bardeen", "year": 1956, "category": "Physics", "country": "United States", "born_in": null, "text": "John Bardeen , Physics, 1956", "wikidata_code": "Q949", "date_of_birth": "23 May 1908", "date_of_death": "30 January 1991", "place_of_birth": "Madison", "place_of_death": "Boston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Walter_H._Brattain", "name": "Walter H. Brattain", "year": 1956, "category": "Physics", "country": "United States", "born_in": null, "text": "Walter H. Brattain ,  born in China , Physics, 1956", "wikidata_code": "Q184577", "date_of_birth": "10 February 1902", "date_of_death": "13 October 1987", "place_of_birth": "Xiamen", "place_of_death": "Seattle", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Dickinson_W._Richards", "name": "Dickinson W. Richards", "year": 1956, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Dickinson W. Richards , Physiology or Medicine, 1956", "wikidata_code": "Q312963", "date_of_birth": "30 October 1895", "date_of_death": "23 February 1973", "place_of_birth": "Orange", "place_of_death": "Lakeville", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Andr%C3%A9_F._Cournand", "name": "André F. Cournand", "year": 1956, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "André F. Cournand ,  France , Physiology or Medicine, 1956", "wikidata_code": "Q271757", "date_of_birth": "24 September 1895", "date_of_death": "19 February 1988", "place_of_birth": "Paris", "place_of_death": "Great Barrington", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Vincent_du_Vigneaud", "name": "Vincent du Vigneaud", "year": 1955, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Vincent du Vigneaud , Chemistry, 1955", "wikidata_code": "Q33128", "date_of_birth": "18 May 1901", "date_of_death": "11 December 1978", "place_of_birth": "Chicago", "place_of_death": "White Plains", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Willis_E._Lamb", "name": "Willis E. Lamb", "year": 1955, "category": "Physics", "country": "United States", "born_in": null, "text": "Willis E. Lamb , Physics, 1955", "wikidata_code": "Q186497", "date_of_birth": "12 July 1913", "date_of_death": "15 May 2008", "place_of_birth": "Los Angeles", "place_of_death": "Tucson", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_F._Enders", "name": "John F. Enders", "year": 1954, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "John F. Enders , Physiology or Medicine, 1954", "wikidata_code": "Q312961", "date_of_birth": "10 February 1897", "date_of_death": "8 September 1985", "place_of_birth": "West Hartford", "place_of_death": "Waterford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Frederick_C._Robbins", "name": "Frederick C. Robbins", "year": 1954, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Frederick C. Robbins , Physiology or Medicine, 1954", "wikidata_code": "Q309885", "date_of_birth": "25 August 1916", "date_of_death": "4 August 2003", "place_of_birth": "Auburn", "place_of_death": "Cleveland", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Thomas_H._Weller", "name": "Thomas H. Weller", "year": 1954, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Thomas H. Weller , Physiology or Medicine, 1954", "wikidata_code": "Q310131", "date_of_birth": "15 June 1915", "date_of_death": "23 August 2008", "place_of_birth": "Ann Arbor", "place_of_death": "Needham", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Severo_Ochoa", "name": "Severo Ochoa", "year": 1959, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Severo Ochoa ,  born in Spain , Physiology or Medicine, 1959", "wikidata_code": "Q233957", "date_of_birth": "24 September 1905", "date_of_death": "1 November 1993", "place_of_birth": "Ḷḷuarca", "place_of_death": "Madrid", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_Wells_Beadle", "name": "George Beadle", "year": 1958, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "George Beadle , Physiology or Medicine, 1958", "wikidata_code": "Q238739", "date_of_birth": "22 October 1903", "date_of_death": "9 June 1989", "place_of_birth": "Wahoo", "place_of_death": "Pomona", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Joshua_Lederberg", "name": "Joshua Lederberg", "year": 1958, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Joshua Lederberg , Physiology or Medicine, 1958", "wikidata_code": "Q218823", "date_of_birth": "23 May 1925", "date_of_death": "2 February 2008", "place_of_birth": "Montclair", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Edward_Lawrie_Tatum", "name": "Edward Tatum", "year": 1958, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Edward Tatum , Physiology or Medicine, 1958", "wikidata_code": "Q237499", "date_of_birth": "14 December 1909", "date_of_death": "5 November 1975", "place_of_birth": "Boulder", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Chen_Ning_Yang", "name": "Chen Ning Yang", "year": 1957, "category": "Physics", "country": "United States", "born_in": null, "text": "Chen Ning Yang ,  born in China , Physics, 1957", "wikidata_code": "Q181369", "date_of_birth": "1 October 1922", "place_of_birth": "Hefei County", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Linus_Pauling", "name": "Linus C. Pauling", "year": 1962, "category": "Peace", "country": "United States", "born_in": null, "text": "Linus C. Pauling , Peace, 1962", "wikidata_code": "Q48983", "date_of_birth": "28 February 1901", "date_of_death": "18 August 1994", "place_of_birth": "Portland", "place_of_death": "Big Sur", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_D._Watson", "name": "James D. Watson", "year": 1962, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "James D. Watson , Physiology or Medicine, 1962", "wikidata_code": "Q83333", "date_of_birth": "6 April 1928", "place_of_birth": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Melvin_Calvin", "name": "Melvin Calvin", "year": 1961, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Melvin Calvin , Chemistry, 1961", "wikidata_code": "Q49347", "date_of_birth": "8 April 1911", "date_of_death": "8 January 1997", "place_of_birth": "Saint Paul", "place_of_death": "Berkeley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_Hofstadter", "name": "Robert Hofstadter", "year": 1961, "category": "Physics", "country": "United States", "born_in": null, "text": "Robert Hofstadter , Physics, 1961", "wikidata_code": "Q130113", "date_of_birth": "5 February 1915", "date_of_death": "17 November 1990", "place_of_birth": "New York City", "place_of_death": "Stanford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Georg_von_B%C3%A9k%C3%A9sy", "name": "Georg von Békésy", "year": 1961, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Georg von Békésy ,  born in Hungary , Physiology or Medicine, 1961", "wikidata_code": "Q238716", "date_of_birth": "3 June 1899", "date_of_death": "13 June 1972", "place_of_birth": "Budapest", "place_of_death": "Honolulu", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Willard_F._Libby", "name": "Willard F. Libby", "year": 1960, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Willard F. Libby , Chemistry, 1960", "wikidata_code": "Q190486", "date_of_birth": "17 December 1908", "date_of_death": "8 September 1980", "place_of_birth": "Grand Valley", "place_of_death": "Los Angeles", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Donald_A._Glaser", "name": "Donald A. Glaser", "year": 1960, "category": "Physics", "country": "United States", "born_in": null, "text": "Donald A. Glaser , Physics, 1960", "wikidata_code": "Q80905", "date_of_birth": "21 September 1926", "date_of_death": "28 February 2013", "place_of_birth": "Cleveland", "place_of_death": "Berkeley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Owen_Chamberlain", "name": "Owen Chamberlain", "year": 1959, "category": "Physics", "country": "United States", "born_in": null, "text": "Owen Chamberlain , Physics, 1959", "wikidata_code": "Q183655", "date_of_birth": "10 July 1920", "date_of_death": "28 February 2006", "place_of_birth": "San Francisco", "place_of_death": "Berkeley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Emilio_Segr%C3%A8", "name": "Emilio Segrè", "year": 1959, "category": "Physics", "country": "United States", "born_in": null, "text": "Emilio Segrè ,  born in Italy , Physics, 1959", "wikidata_code": "Q173028", "date_of_birth": "1 February 1905", "date_of_death": "22 April 1989", "place_of_birth": "Tivoli", "place_of_death": "Lafayette", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Arthur_Kornberg", "name": "Arthur Kornberg", "year": 1959, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Arthur Kornberg , Physiology or Medicine, 1959", "wikidata_code": "Q295678", "date_of_birth": "3 March 1918", "date_of_death": "26 October 2007", "place_of_birth": "Brooklyn", "place_of_death": "Stanford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tsung-Dao_Lee", "name": "Tsung-Dao Lee", "year": 1957, "category": "Physics", "country": "United States", "born_in": null, "text": "Tsung-Dao Lee ,  born in China , Physics, 1957", "wikidata_code": "Q183679", "date_of_birth": "24 November 1926", "place_of_birth": "Shanghai County", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Martin_Luther_King_Jr.", "name": "Martin Luther King Jr.", "year": 1964, "category": "Peace", "country": "United States", "born_in": null, "text": "Martin Luther King Jr. , Peace, 1964", "wikidata_code": "Q8027", "date_of_birth": "15 January 1929", "date_of_death": "4 April 1968", "place_of_birth": "Atlanta", "place_of_death": "Memphis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_H._Townes", "name": "Charles H. Townes", "year": 1964, "category": "Physics", "country": "United States", "born_in": null, "text": "Charles H. Townes , Physics, 1964", "wikidata_code": "Q184566", "date_of_birth": "28 July 1915", "date_of_death": "27 January 2015", "place_of_birth": "Greenville", "place_of_death": "Oakland", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Konrad_Bloch", "name": "Konrad Bloch", "year": 1964, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Konrad Bloch ,  born in then Germany, now Poland , Physiology or Medicine, 1964", "wikidata_code": "Q35698", "date_of_birth": "21 January 1912", "date_of_death": "15 October 2000", "place_of_birth": "Nysa", "place_of_death": "Lexington", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Maria_Goeppert-Mayer", "name": "Maria Goeppert-Mayer", "year": 1963, "category": "Physics", "country": "United States", "born_in": null, "text": "Maria Goeppert-Mayer ,  born in then Germany, now Poland , Physics, 1963", "wikidata_code": "Q57100", "date_of_birth": "28 June 1906", "date_of_death": "20 February 1972", "place_of_birth": "Katowice", "place_of_death": "San Diego", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Eugene_Wigner", "name": "Eugene Wigner", "year": 1963, "category": "Physics", "country": "United States", "born_in": null, "text": "Eugene Wigner ,  born in Hungary , Physics, 1963", "wikidata_code": "Q155790", "date_of_birth": "17 November 1902", "date_of_death": "1 January 1995", "place_of_birth": "Budapest", "place_of_death": "Princeton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_S._Mulliken", "name": "Robert S. Mulliken", "year": 1966, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Robert S. Mulliken , Chemistry, 1966", "wikidata_code": "Q233355", "date_of_birth": "7 June 1896", "date_of_death": "31 October 1986", "place_of_birth": "Newburyport", "place_of_death": "Arlington County", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_B._Huggins", "name": "Charles B. Huggins", "year": 1966, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Charles B. Huggins ,  born in Canada , Physiology or Medicine, 1966", "wikidata_code": "Q155371", "date_of_birth": "22 September 1901", "date_of_death": "12 January 1997", "place_of_birth": "Halifax", "place_of_death": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Francis_Peyton_Rous", "name": "Francis Peyton Rous", "year": 1966, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Francis Peyton Rous , Physiology or Medicine, 1966", "wikidata_code": "Q298707", "date_of_birth": "5 October 1879", "date_of_death": "16 February 1970", "place_of_birth": "Baltimore", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_B._Woodward", "name": "Robert B. Woodward", "year": 1965, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Robert B. Woodward , Chemistry, 1965", "wikidata_code": "Q232316", "date_of_birth": "10 April 1917", "date_of_death": "8 July 1979", "place_of_birth": "Boston", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_P._Feynman", "name": "Richard P. Feynman", "year": 1965, "category": "Physics", "country": "United States", "born_in": null, "text": "Richard P. Feynman , Physics, 1965", "wikidata_code": "Q39246", "date_of_birth": "11 May 1918", "date_of_death": "15 February 1988", "place_of_birth": "Queens", "place_of_death": "Los Angeles", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Julian_Schwinger", "name": "Julian Schwinger", "year": 1965, "category": "Physics", "country": "United States", "born_in": null, "text": "Julian Schwinger , Physics, 1965", "wikidata_code": "Q186465", "date_of_birth": "12 February 1918", "date_of_death": "16 July 1994", "place_of_birth": "New York City", "place_of_death": "Los Angeles", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Steinbeck", "name": "John Steinbeck", "year": 1962, "category": "Literature", "country": "United States", "born_in": null, "text": "John Steinbeck , Literature, 1962", "wikidata_code": "Q39212", "date_of_birth": "27 February 1902", "date_of_death": "20 December 1968", "place_of_birth": "Salinas", "place_of_death": "Harlem", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_Wald", "name": "George Wald", "year": 1967, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "George Wald , Physiology or Medicine, 1967", "wikidata_code": "Q295724", "date_of_birth": "18 November 1906", "date_of_death": "12 April 1997", "place_of_birth": "New York City", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Har_Gobind_Khorana", "name": "Har Gobind Khorana", "year": 1968, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Har Gobind Khorana ,  born in India , Physiology or Medicine, 1968", "wikidata_code": "Q107462", "date_of_birth": "9 January 1922", "date_of_death": "9 November 2011", "place_of_birth": "Raipur", "place_of_death": "Concord", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Marshall_Warren_Nirenberg", "name": "Marshall Warren Nirenberg", "year": 1968, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Marshall Warren Nirenberg , Physiology or Medicine, 1968", "wikidata_code": "Q110060", "date_of_birth": "10 April 1927", "date_of_death": "15 January 2010", "place_of_birth": "Brooklyn", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hans_Bethe", "name": "Hans Bethe", "year": 1967, "category": "Physics", "country": "United States", "born_in": null, "text": "Hans Bethe ,  born in then Germany, now France , Physics, 1967", "wikidata_code": "Q155794", "date_of_birth": "2 July 1906", "date_of_death": "6 March 2005", "place_of_birth": "Strasbourg", "place_of_death": "Ithaca", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Haldan_Keffer_Hartline", "name": "Haldan Keffer Hartline", "year": 1967, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Haldan Keffer Hartline , Physiology or Medicine, 1967", "wikidata_code": "Q309879", "date_of_birth": "22 December 1903", "date_of_death": "17 March 1983", "place_of_birth": "Bloomsburg", "place_of_death": "Fallston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alfred_Hershey", "name": "Alfred Hershey", "year": 1969, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Alfred Hershey , Physiology or Medicine, 1969", "wikidata_code": "Q271703", "date_of_birth": "4 December 1908", "date_of_death": "22 May 1997", "place_of_birth": "Owosso", "place_of_death": "Syosset", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Salvador_Luria", "name": "Salvador Luria", "year": 1969, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Salvador Luria ,  born in Italy , Physiology or Medicine, 1969", "wikidata_code": "Q205667", "date_of_birth": "13 August 1912", "date_of_death": "6 February 1991", "place_of_birth": "Turin", "place_of_death": "Lexington", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Earl_Wilbur_Sutherland_Jr.", "name": "Earl W. Sutherland Jr.", "year": 1971, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Earl W. Sutherland Jr. , Physiology or Medicine, 1971", "wikidata_code": "Q68118", "date_of_birth": "19 November 1915", "date_of_death": "9 March 1974", "place_of_birth": "Burlingame", "place_of_death": "Miami", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_A._Samuelson", "name": "Paul A. Samuelson", "year": 1970, "category": "Economics", "country": "United States", "born_in": null, "text": "Paul A. Samuelson , Economics, 1970", "wikidata_code": "Q102454", "date_of_birth": "15 May 1915", "date_of_death": "13 December 2009", "place_of_birth": "Gary", "place_of_death": "Belmont", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Norman_Borlaug", "name": "Norman Borlaug", "year": 1970, "category": "Peace", "country": "United States", "born_in": null, "text": "Norman Borlaug , Peace, 1970", "wikidata_code": "Q154824", "date_of_birth": "25 March 1914", "date_of_death": "12 September 2009", "place_of_birth": "Cresco", "place_of_death": "Dallas", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Julius_Axelrod", "name": "Julius Axelrod", "year": 1970, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Julius Axelrod , Physiology or Medicine, 1970", "wikidata_code": "Q110106", "date_of_birth": "30 May 1912", "date_of_death": "29 December 2004", "place_of_birth": "New York City", "place_of_death": "Bethesda", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Murray_Gell-Mann", "name": "Murray Gell-Mann", "year": 1969, "category": "Physics", "country": "United States", "born_in": null, "text": "Murray Gell-Mann , Physics, 1969", "wikidata_code": "Q172840", "date_of_birth": "15 September 1929", "date_of_death": "24 May 2019", "place_of_birth": "Lower Manhattan", "place_of_death": "Santa Fe", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Max_Delbr%C3%BCck", "name": "Max Delbrück", "year": 1969, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Max Delbrück ,  born in Germany , Physiology or Medicine, 1969", "wikidata_code": "Q76807", "date_of_birth": "4 September 1906", "date_of_death": "10 March 1981", "place_of_birth": "Berlin", "place_of_death": "Pasadena", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Lars_Onsager", "name": "Lars Onsager", "year": 1968, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Lars Onsager ,  born in Norway , Chemistry, 1968", "wikidata_code": "Q107405", "date_of_birth": "27 November 1903", "date_of_death": "5 October 1976", "place_of_birth": "Christiania", "place_of_death": "Coral Gables", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Luis_Walter_Alvarez", "name": "Luis Alvarez", "year": 1968, "category": "Physics", "country": "United States", "born_in": null, "text": "Luis Alvarez , Physics, 1968", "wikidata_code": "Q178344", "date_of_birth": "13 June 1911", "date_of_death": "1 September 1988", "place_of_birth": "San Francisco", "place_of_death": "Berkeley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_W._Holley", "name": "Robert W. Holley", "year": 1968, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Robert W. Holley , Physiology or Medicine, 1968", "wikidata_code": "Q108891", "date_of_birth": "28 January 1922", "date_of_death": "11 February 1993", "place_of_birth": "Urbana", "place_of_death": "Los Gatos", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_Emil_Palade", "name": "George E. Palade", "year": 1974, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "George E. Palade ,  born in Romania , Physiology or Medicine, 1974", "wikidata_code": "Q219718", "date_of_birth": "19 November 1912", "date_of_death": "7 October 2008", "place_of_birth": "Iași", "place_of_death": "Del Mar", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Wassily_Leontief", "name": "Wassily Leontief", "year": 1973, "category": "Economics", "country": "United States", "born_in": null, "text": "Wassily Leontief ,  born in Germany , Economics, 1973", "wikidata_code": "Q44061", "date_of_birth": "5 August 1906", "date_of_death": "5 February 1999", "place_of_birth": "Saint Petersburg", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henry_Kissinger", "name": "Henry Kissinger", "year": 1973, "category": "Peace", "country": "United States", "born_in": null, "text": "Henry Kissinger ,  born in Germany , Peace, 1973", "wikidata_code": "Q66107", "date_of_birth": "27 May 1923", "place_of_birth": "Fürth", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ivar_Giaever", "name": "Ivar Giaever", "year": 1973, "category": "Physics", "country": "United States", "born_in": null, "text": "Ivar Giaever ,  Norway , Physics, 1973", "wikidata_code": "Q192688", "date_of_birth": "5 April 1929", "place_of_birth": "Bergen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Christian_Anfinsen", "name": "Christian Anfinsen", "year": 1972, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Christian Anfinsen , Chemistry, 1972", "wikidata_code": "Q102278", "date_of_birth": "26 March 1916", "date_of_death": "14 May 1995", "place_of_birth": "Monessen", "place_of_death": "Randallstown", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Stanford_Moore", "name": "Stanford Moore", "year": 1972, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Stanford Moore , Chemistry, 1972", "wikidata_code": "Q110952", "date_of_birth": "4 September 1913", "date_of_death": "23 August 1982", "place_of_birth": "Chicago", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_H._Stein", "name": "William H. Stein", "year": 1972, "category": "Chemistry", "country": "United States", "born_in": null, "text": "William H. Stein , Chemistry, 1972", "wikidata_code": "Q156492", "date_of_birth": "25 June 1911", "date_of_death": "2 February 1980", "place_of_birth": "New York City", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kenneth_J._Arrow", "name": "Kenneth J. Arrow", "year": 1972, "category": "Economics", "country": "United States", "born_in": null, "text": "Kenneth J. Arrow , Economics, 1972", "wikidata_code": "Q192592", "date_of_birth": "23 August 1921", "date_of_death": "21 February 2017", "place_of_birth": "New York City", "place_of_death": "Palo Alto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Daniel_Carleton_Gajdusek", "name": "Daniel Carleton Gajdusek", "year": 1976, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Daniel Carleton Gajdusek , Physiology or Medicine, 1976", "wikidata_code": "Q108576", "date_of_birth": "9 September 1923", "date_of_death": "12 December 2008", "place_of_birth": "Yonkers", "place_of_death": "Tromsø Municipality", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tjalling_C._Koopmans", "name": "Tjalling C. Koopmans", "year": 1975, "category": "Economics", "country": "United States", "born_in": null, "text": "Tjalling C. Koopmans ,  born in the Netherlands , Economics, 1975", "wikidata_code": "Q110968", "date_of_birth": "28 August 1910", "date_of_death": "26 February 1985", "place_of_birth": "'s-Graveland", "place_of_death": "New Haven", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ben_Roy_Mottelson", "name": "Ben Roy Mottelson", "year": 1975, "category": "Physics", "country": null, "born_in": "United States", "text": "Ben Roy Mottelson *, Physics, 1975", "wikidata_code": "Q107423", "date_of_birth": "9 July 1926", "date_of_death": "13 May 2022", "place_of_birth": "Chicago", "place_of_death": "Copenhagen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_Rainwater", "name": "James Rainwater", "year": 1975, "category": "Physics", "country": "United States", "born_in": null, "text": "James Rainwater , Physics, 1975", "wikidata_code": "Q190745", "date_of_birth": "9 December 1917", "date_of_death": "31 May 1986", "place_of_birth": "Council", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_Baltimore", "name": "David Baltimore", "year": 1975, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "David Baltimore , Physiology or Medicine, 1975", "wikidata_code": "Q234949", "date_of_birth": "7 March 1938", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Renato_Dulbecco", "name": "Renato Dulbecco", "year": 1975, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Renato Dulbecco ,  born in Italy , Physiology or Medicine, 1975", "wikidata_code": "Q109553", "date_of_birth": "22 February 1914", "date_of_death": "19 February 2012", "place_of_birth": "Catanzaro", "place_of_death": "La Jolla", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Howard_Martin_Temin", "name": "Howard Martin Temin", "year": 1975, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Howard Martin Temin , Physiology or Medicine, 1975", "wikidata_code": "Q243536", "date_of_birth": "10 December 1934", "date_of_death": "9 February 1994", "place_of_birth": "Philadelphia", "place_of_death": "Madison", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_J._Flory", "name": "Paul J. Flory", "year": 1974, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Paul J. Flory , Chemistry, 1974", "wikidata_code": "Q176351", "date_of_birth": "19 June 1910", "date_of_death": "9 September 1985", "place_of_birth": "Sterling", "place_of_death": "Big Sur", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Bardeen", "name": "John Bardeen", "year": 1972, "category": "Physics", "country": "United States", "born_in": null, "text": "John Bardeen , Physics, 1972", "wikidata_code": "Q949", "date_of_birth": "23 May 1908", "date_of_death": "30 January 1991", "place_of_birth": "Madison", "place_of_death": "Boston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Leon_N._Cooper", "name": "Leon N. Cooper", "year": 1972, "category": "Physics", "country": "United States", "born_in": null, "text": "Leon N. Cooper , Physics, 1972", "wikidata_code": "Q82563", "date_of_birth": "28 February 1930", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_Schrieffer", "name": "Robert Schrieffer", "year": 1972, "category": "Physics", "country": "United States", "born_in": null, "text": "Robert Schrieffer , Physics, 1972", "wikidata_code": "Q153201", "date_of_birth": "31 May 1931", "date_of_death": "27 July 2019", "place_of_birth": "Oak Park", "place_of_death": "Tallahassee", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gerald_Edelman", "name": "Gerald Edelman", "year": 1972, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Gerald Edelman , Physiology or Medicine, 1972", "wikidata_code": "Q271766", "date_of_birth": "1 July 1929", "date_of_death": "17 May 2014", "place_of_birth": "Queens", "place_of_death": "La Jolla", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Simon_Kuznets", "name": "Simon Kuznets", "year": 1971, "category": "Economics", "country": "United States", "born_in": null, "text": "Simon Kuznets ,  born in then Russia, now Belarus , Economics, 1971", "wikidata_code": "Q192577", "date_of_birth": "30 April 1901", "date_of_death": "8 July 1985", "place_of_birth": "Pinsk", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Saul_Bellow", "name": "Saul Bellow", "year": 1976, "category": "Literature", "country": "United States", "born_in": null, "text": "Saul Bellow ,  born in Canada , Literature, 1976", "wikidata_code": "Q83059", "date_of_birth": "10 June 1915", "date_of_death": "5 April 2005", "place_of_birth": "Lachine", "place_of_death": "Brookline", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Burton_Richter", "name": "Burton Richter", "year": 1976, "category": "Physics", "country": "United States", "born_in": null, "text": "Burton Richter , Physics, 1976", "wikidata_code": "Q192106", "date_of_birth": "22 March 1931", "date_of_death": "18 July 2018", "place_of_birth": "New York City", "place_of_death": "Palo Alto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Samuel_C._C._Ting", "name": "Samuel C. C. Ting", "year": 1976, "category": "Physics", "country": "United States", "born_in": null, "text": "Samuel C. C. Ting , Physics, 1976", "wikidata_code": "Q192715", "date_of_birth": "27 January 1936", "place_of_birth": "Ann Arbor", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Roger_Guillemin", "name": "Roger Guillemin", "year": 1977, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Roger Guillemin ,  born in France , Physiology or Medicine, 1977", "wikidata_code": "Q242169", "date_of_birth": "11 January 1924", "place_of_birth": "Dijon", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Andrew_Schally", "name": "Andrew Schally", "year": 1977, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Andrew Schally ,  born in then Poland, now Lithuania , Physiology or Medicine, 1977", "wikidata_code": "Q141147", "date_of_birth": "30 November 1926", "place_of_birth": "Vilnius", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rosalyn_Sussman_Yalow", "name": "Rosalyn Yalow", "year": 1977, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Rosalyn Yalow , Physiology or Medicine, 1977", "wikidata_code": "Q107402", "date_of_birth": "19 July 1921", "date_of_death": "30 May 2011", "place_of_birth": "New York City", "place_of_death": "The Bronx", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/William_Lipscomb", "name": "William Lipscomb", "year": 1976, "category": "Chemistry", "country": "United States", "born_in": null, "text": "William Lipscomb , Chemistry, 1976", "wikidata_code": "Q110935", "date_of_birth": "9 December 1919", "date_of_death": "14 April 2011", "place_of_birth": "Cleveland", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Milton_Friedman", "name": "Milton Friedman", "year": 1976, "category": "Economics", "country": "United States", "born_in": null, "text": "Milton Friedman , Economics, 1976", "wikidata_code": "Q47426", "date_of_birth": "31 July 1912", "date_of_death": "16 November 2006", "place_of_birth": "Brooklyn", "place_of_death": "San Francisco", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Herbert_A._Simon", "name": "Herbert A. Simon", "year": 1978, "category": "Economics", "country": "United States", "born_in": null, "text": "Herbert A. Simon , Economics, 1978", "wikidata_code": "Q181529", "date_of_birth": "15 June 1916", "date_of_death": "9 February 2001", "place_of_birth": "Milwaukee", "place_of_death": "Pittsburgh", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Isaac_Bashevis_Singer", "name": "Isaac Bashevis Singer", "year": 1978, "category": "Literature", "country": "United States", "born_in": null, "text": "Isaac Bashevis Singer ,  born in then Russian Empire, now Poland , Literature, 1978", "wikidata_code": "Q75612", "date_of_birth": "21 November 1902", "date_of_death": "24 July 1991", "place_of_birth": "Leoncin", "place_of_death": "Surfside", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_Woodrow_Wilson", "name": "Robert Woodrow Wilson", "year": 1978, "category": "Physics", "country": "United States", "born_in": null, "text": "Robert Woodrow Wilson , Physics, 1978", "wikidata_code": "Q171034", "date_of_birth": "10 January 1936", "place_of_birth": "Houston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Arno_Penzias", "name": "Arno Penzias", "year": 1978, "category": "Physics", "country": "United States", "born_in": null, "text": "Arno Penzias ,  born in Germany , Physics, 1978", "wikidata_code": "Q172877", "date_of_birth": "26 April 1933", "place_of_birth": "Munich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hamilton_O._Smith", "name": "Hamilton O. Smith", "year": 1978, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Hamilton O. Smith , Physiology or Medicine, 1978", "wikidata_code": "Q108896", "date_of_birth": "23 August 1931", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Daniel_Nathans", "name": "Daniel Nathans", "year": 1978, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Daniel Nathans , Physiology or Medicine, 1978", "wikidata_code": "Q295706", "date_of_birth": "30 October 1928", "date_of_death": "16 November 1999", "place_of_birth": "Wilmington", "place_of_death": "Baltimore", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Philip_Warren_Anderson", "name": "Philip Anderson", "year": 1977, "category": "Physics", "country": "United States", "born_in": null, "text": "Philip Anderson , Physics, 1977", "wikidata_code": "Q190770", "date_of_birth": "13 December 1923", "date_of_death": "29 March 2020", "place_of_birth": "Indianapolis", "place_of_death": "Princeton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_H._van_Vleck", "name": "John H. van Vleck", "year": 1977, "category": "Physics", "country": "United States", "born_in": null, "text": "John H. van Vleck , Physics, 1977", "wikidata_code": "Q193655", "date_of_birth": "13 March 1899", "date_of_death": "27 October 1980", "place_of_birth": "Middletown", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Baruch_S._Blumberg", "name": "Baruch S. Blumberg", "year": 1976, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Baruch S. Blumberg , Physiology or Medicine, 1976", "wikidata_code": "Q105830", "date_of_birth": "28 July 1925", "date_of_death": "5 April 2011", "place_of_birth": "Brooklyn", "place_of_death": "Mountain View", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Roger_Wolcott_Sperry", "name": "Roger W. Sperry", "year": 1981, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Roger W. Sperry , Physiology or Medicine, 1981", "wikidata_code": "Q232305", "date_of_birth": "20 August 1913", "date_of_death": "17 April 1994", "place_of_birth": "Hartford", "place_of_death": "Pasadena", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Walter_Gilbert", "name": "Walter Gilbert", "year": 1980, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Walter Gilbert , Chemistry, 1980", "wikidata_code": "Q217486", "date_of_birth": "21 March 1932", "place_of_birth": "Boston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_Berg", "name": "Paul Berg", "year": 1980, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Paul Berg , Chemistry, 1980", "wikidata_code": "Q102379", "date_of_birth": "30 June 1926", "date_of_death": "15 February 2023", "place_of_birth": "Brooklyn", "place_of_death": "Stanford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Lawrence_R._Klein", "name": "Lawrence R. Klein", "year": 1980, "category": "Economics", "country": "United States", "born_in": null, "text": "Lawrence R. Klein , Economics, 1980", "wikidata_code": "Q295761", "date_of_birth": "14 September 1920", "date_of_death": "20 October 2013", "place_of_birth": "Omaha", "place_of_death": "Gladwyne", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Czes%C5%82aw_Mi%C5%82osz", "name": "Czesław Miłosz", "year": 1980, "category": "Literature", "country": "United States", "born_in": null, "text": "Czesław Miłosz ,  born in then Russian Empire, now Lithuania , Literature, 1980", "wikidata_code": "Q45970", "date_of_birth": "30 June 1911", "date_of_death": "14 August 2004", "place_of_birth": "Šeteniai", "place_of_death": "Kraków", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_Cronin", "name": "James Cronin", "year": 1980, "category": "Physics", "country": "United States", "born_in": null, "text": "James Cronin , Physics, 1980", "wikidata_code": "Q193496", "date_of_birth": "29 September 1931", "date_of_death": "25 August 2016", "place_of_birth": "Chicago", "place_of_death": "Saint Paul", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Val_Fitch", "name": "Val Fitch", "year": 1980, "category": "Physics", "country": "United States", "born_in": null, "text": "Val Fitch , Physics, 1980", "wikidata_code": "Q206499", "date_of_birth": "10 March 1923", "date_of_death": "5 February 2015", "place_of_birth": "Merriman", "place_of_death": "Princeton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Baruj_Benacerraf", "name": "Baruj Benacerraf", "year": 1980, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Baruj Benacerraf ,  born in Venezuela , Physiology or Medicine, 1980", "wikidata_code": "Q234701", "date_of_birth": "29 October 1920", "date_of_death": "2 August 2011", "place_of_birth": "Caracas", "place_of_death": "Boston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_J._Stigler", "name": "George J. Stigler", "year": 1982, "category": "Economics", "country": "United States", "born_in": null, "text": "George J. Stigler , Economics, 1982", "wikidata_code": "Q243534", "date_of_birth": "17 January 1911", "date_of_death": "1 December 1991", "place_of_birth": "Seattle", "place_of_death": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kenneth_G._Wilson", "name": "Kenneth G. Wilson", "year": 1982, "category": "Physics", "country": "United States", "born_in": null, "text": "Kenneth G. Wilson , Physics, 1982", "wikidata_code": "Q193503", "date_of_birth": "8 June 1936", "date_of_death": "15 June 2013", "place_of_birth": "Waltham", "place_of_death": "Saco", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Roald_Hoffmann", "name": "Roald Hoffmann", "year": 1981, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Roald Hoffmann ,  born in then Poland, now Ukraine , Chemistry, 1981", "wikidata_code": "Q273279", "date_of_birth": "18 July 1937", "place_of_birth": "Zolochiv", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_Tobin", "name": "James Tobin", "year": 1981, "category": "Economics", "country": "United States", "born_in": null, "text": "James Tobin , Economics, 1981", "wikidata_code": "Q211776", "date_of_birth": "5 March 1918", "date_of_death": "11 March 2002", "place_of_birth": "Champaign", "place_of_death": "New Haven", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Nicolaas_Bloembergen", "name": "Nicolaas Bloembergen", "year": 1981, "category": "Physics", "country": "United States", "born_in": null, "text": "Nicolaas Bloembergen ,  born in the Netherlands , Physics, 1981", "wikidata_code": "Q189987", "date_of_birth": "11 March 1920", "date_of_death": "5 September 2017", "place_of_birth": "Dordrecht", "place_of_death": "Tucson", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Arthur_L._Schawlow", "name": "Arthur L. Schawlow", "year": 1981, "category": "Physics", "country": "United States", "born_in": null, "text": "Arthur L. Schawlow , Physics, 1981", "wikidata_code": "Q190503", "date_of_birth": "5 May 1921", "date_of_death": "28 April 1999", "place_of_birth": "Mount Vernon", "place_of_death": "Palo Alto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_H._Hubel", "name": "David H. Hubel", "year": 1981, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "David H. Hubel ,  born in Canada , Physiology or Medicine, 1981", "wikidata_code": "Q295644", "date_of_birth": "27 February 1926", "date_of_death": "22 September 2013", "place_of_birth": "Windsor", "place_of_death": "Lincoln", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_Davis_Snell", "name": "George D. Snell", "year": 1980, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "George D. Snell , Physiology or Medicine, 1980", "wikidata_code": "Q295666", "date_of_birth": "19 December 1903", "date_of_death": "6 June 1996", "place_of_birth": "Bradford", "place_of_death": "Bar Harbor", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Herbert_C._Brown", "name": "Herbert C. Brown", "year": 1979, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Herbert C. Brown ,  born in the United Kingdom , Chemistry, 1979", "wikidata_code": "Q102406", "date_of_birth": "22 May 1912", "date_of_death": "19 December 2004", "place_of_birth": "London", "place_of_death": "West Lafayette", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Theodore_Schultz", "name": "Theodore Schultz", "year": 1979, "category": "Economics", "country": "United States", "born_in": null, "text": "Theodore Schultz , Economics, 1979", "wikidata_code": "Q233947", "date_of_birth": "30 April 1902", "date_of_death": "26 February 1998", "place_of_birth": "Arlington", "place_of_death": "Evanston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Subrahmanyan_Chandrasekhar", "name": "Subrahmanyan Chandrasekhar", "year": 1983, "category": "Physics", "country": "United States", "born_in": null, "text": "Subrahmanyan Chandrasekhar ,  born in India , Physics, 1983", "wikidata_code": "Q148109", "date_of_birth": "19 October 1910", "date_of_death": "21 August 1995", "place_of_birth": "Lahore", "place_of_death": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Barbara_McClintock", "name": "Barbara McClintock", "year": 1983, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Barbara McClintock , Physiology or Medicine, 1983", "wikidata_code": "Q199654", "date_of_birth": "16 June 1902", "date_of_death": "2 September 1992", "place_of_birth": "Hartford", "place_of_death": "Huntington", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Jerome_Karle", "name": "Jerome Karle", "year": 1985, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Jerome Karle , Chemistry, 1985", "wikidata_code": "Q106733", "date_of_birth": "18 June 1918", "date_of_death": "6 June 2013", "place_of_birth": "New York City", "place_of_death": "Annandale", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Herbert_A._Hauptman", "name": "Herbert A. Hauptman", "year": 1985, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Herbert A. Hauptman , Chemistry, 1985", "wikidata_code": "Q107422", "date_of_birth": "14 February 1917", "date_of_death": "23 October 2011", "place_of_birth": "New York City", "place_of_death": "Buffalo", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Franco_Modigliani", "name": "Franco Modigliani", "year": 1985, "category": "Economics", "country": "United States", "born_in": null, "text": "Franco Modigliani ,  born in Italy , Economics, 1985", "wikidata_code": "Q205850", "date_of_birth": "18 June 1918", "date_of_death": "25 September 2003", "place_of_birth": "Rome", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Michael_S._Brown", "name": "Michael S. Brown", "year": 1985, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Michael S. Brown , Physiology or Medicine, 1985", "wikidata_code": "Q295684", "date_of_birth": "13 April 1941", "place_of_birth": "Brooklyn", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Joseph_L._Goldstein", "name": "Joseph L. Goldstein", "year": 1985, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Joseph L. Goldstein , Physiology or Medicine, 1985", "wikidata_code": "Q271424", "date_of_birth": "18 April 1940", "place_of_birth": "Kingstree", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Stanley_Cohen_(doctor)", "name": "Stanley Cohen", "year": 1986, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Stanley Cohen , Physiology or Medicine, 1986", "wikidata_code": "Q232299", "date_of_birth": "17 November 1922", "date_of_death": "5 February 2020", "place_of_birth": "Brooklyn", "place_of_death": "Nashville", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rita_Levi-Montalcini", "name": "Rita Levi-Montalcini", "year": 1986, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Rita Levi-Montalcini ,  born in Italy , Physiology or Medicine, 1986", "wikidata_code": "Q185007", "date_of_birth": "22 April 1909", "date_of_death": "30 December 2012", "place_of_birth": "Turin", "place_of_death": "Nomentano", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Bruce_Merrifield", "name": "Bruce Merrifield", "year": 1984, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Bruce Merrifield , Chemistry, 1984", "wikidata_code": "Q224153", "date_of_birth": "15 July 1921", "date_of_death": "14 May 2006", "place_of_birth": "Fort Worth", "place_of_death": "Cresskill", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henry_Taube", "name": "Henry Taube", "year": 1983, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Henry Taube ,  born in Canada , Chemistry, 1983", "wikidata_code": "Q235983", "date_of_birth": "30 November 1915", "date_of_death": "16 November 2005", "place_of_birth": "Neudorf", "place_of_death": "Palo Alto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/G%C3%A9rard_Debreu", "name": "Gérard Debreu", "year": 1983, "category": "Economics", "country": "United States", "born_in": null, "text": "Gérard Debreu ,  born in France , Economics, 1983", "wikidata_code": "Q210960", "date_of_birth": "4 July 1921", "date_of_death": "31 December 2004", "place_of_birth": "Calais", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Dudley_R._Herschbach", "name": "Dudley R. Herschbach", "year": 1986, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Dudley R. Herschbach , Chemistry, 1986", "wikidata_code": "Q243196", "date_of_birth": "18 June 1932", "place_of_birth": "San Jose", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Yuan_T._Lee", "name": "Yuan T. Lee", "year": 1986, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Yuan T. Lee ,  born in Taiwan , Chemistry, 1986", "wikidata_code": "Q243190", "date_of_birth": "19 November 1936", "place_of_birth": "Shinchiku City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_M._Buchanan", "name": "James M. Buchanan", "year": 1986, "category": "Economics", "country": "United States", "born_in": null, "text": "James M. Buchanan , Economics, 1986", "wikidata_code": "Q205353", "date_of_birth": "3 October 1919", "date_of_death": "9 January 2013", "place_of_birth": "Murfreesboro", "place_of_death": "Blacksburg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Elie_Wiesel", "name": "Elie Wiesel", "year": 1986, "category": "Peace", "country": "United States", "born_in": null, "text": "Elie Wiesel ,  born in Romania , Peace, 1986", "wikidata_code": "Q18391", "date_of_birth": "30 September 1928", "date_of_death": "2 July 2016", "place_of_birth": "Sighetu Marmației", "place_of_death": "Manhattan", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_A._Fowler", "name": "William A. Fowler", "year": 1983, "category": "Physics", "country": "United States", "born_in": null, "text": "William A. Fowler , Physics, 1983", "wikidata_code": "Q46120", "date_of_birth": "9 August 1911", "date_of_death": "14 March 1995", "place_of_birth": "Pittsburgh", "place_of_death": "Pasadena", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_B._Wilson", "name": "Robert B. Wilson", "year": 2020, "category": "Economics", "country": "United States", "born_in": null, "text": "Robert B. Wilson , Economics, 2020", "wikidata_code": "Q377265", "date_of_birth": "16 May 1937", "place_of_birth": "Geneva", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_R._Milgrom", "name": "Paul R. Milgrom", "year": 2020, "category": "Economics", "country": "United States", "born_in": null, "text": "Paul R. Milgrom , Economics, 2020", "wikidata_code": "Q1359990", "date_of_birth": "20 April 1948", "place_of_birth": "Detroit", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_M._Solow", "name": "Robert M. Solow", "year": 1987, "category": "Economics", "country": "United States", "born_in": null, "text": "Robert M. Solow , Economics, 1987", "wikidata_code": "Q157268", "date_of_birth": "23 August 1924", "place_of_birth": "Brooklyn", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Joseph_Brodsky", "name": "Joseph Brodsky", "year": 1987, "category": "Literature", "country": "United States", "born_in": null, "text": "Joseph Brodsky ,  born in Russia , Literature, 1987", "wikidata_code": "Q862", "date_of_birth": "24 May 1940", "date_of_death": "28 January 1996", "place_of_birth": "Saint Petersburg", "place_of_death": "Brooklyn", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Leon_M._Lederman", "name": "Leon M. Lederman", "year": 1988, "category": "Physics", "country": "United States", "born_in": null, "text": "Leon M. Lederman , Physics, 1988", "wikidata_code": "Q192695", "date_of_birth": "15 July 1922", "date_of_death": "3 October 2018", "place_of_birth": "Buffalo", "place_of_death": "Rexburg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Melvin_Schwartz", "name": "Melvin Schwartz", "year": 1988, "category": "Physics", "country": "United States", "born_in": null, "text": "Melvin Schwartz , Physics, 1988", "wikidata_code": "Q189741", "date_of_birth": "2 November 1932", "date_of_death": "28 August 2006", "place_of_birth": "New York City", "place_of_death": "Twin Falls", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jack_Steinberger", "name": "Jack Steinberger", "year": 1988, "category": "Physics", "country": "United States", "born_in": null, "text": "Jack Steinberger ,  born in Germany , Physics, 1988", "wikidata_code": "Q153210", "date_of_birth": "25 May 1921", "date_of_death": "12 December 2020", "place_of_birth": "Bad Kissingen", "place_of_death": "Geneva", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gertrude_B._Elion", "name": "Gertrude B. Elion", "year": 1988, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Gertrude B. Elion , Physiology or Medicine, 1988", "wikidata_code": "Q35703", "date_of_birth": "23 January 1918", "date_of_death": "21 February 1999", "place_of_birth": "New York City", "place_of_death": "Chapel Hill", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/George_H._Hitchings", "name": "George H. Hitchings", "year": 1988, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "George H. Hitchings , Physiology or Medicine, 1988", "wikidata_code": "Q310487", "date_of_birth": "18 April 1905", "date_of_death": "27 February 1998", "place_of_birth": "Hoquiam", "place_of_death": "Chapel Hill", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_J._Pedersen", "name": "Charles J. Pedersen", "year": 1987, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Charles J. Pedersen ,  born in Korea , Chemistry, 1987", "wikidata_code": "Q244998", "date_of_birth": "3 October 1904", "date_of_death": "26 October 1989", "place_of_birth": "Busan", "place_of_death": "Salem", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Donald_J._Cram", "name": "Donald J. Cram", "year": 1987, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Donald J. Cram , Chemistry, 1987", "wikidata_code": "Q135151", "date_of_birth": "22 April 1919", "date_of_death": "17 June 2001", "place_of_birth": "Chester", "place_of_death": "Palm Desert", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Sidney_Altman", "name": "Sidney Altman", "year": 1989, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Sidney Altman ,  born in Canada , Chemistry, 1989", "wikidata_code": "Q102266", "date_of_birth": "7 May 1939", "date_of_death": "5 April 2022", "place_of_birth": "Montreal", "place_of_death": "Rockleigh", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Thomas_R._Cech", "name": "Thomas R. Cech", "year": 1989, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Thomas R. Cech , Chemistry, 1989", "wikidata_code": "Q135180", "date_of_birth": "8 December 1947", "place_of_birth": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hans_G._Dehmelt", "name": "Hans G. Dehmelt", "year": 1989, "category": "Physics", "country": "United States", "born_in": null, "text": "Hans G. Dehmelt ,  born in Germany , Physics, 1989", "wikidata_code": "Q70532", "date_of_birth": "9 September 1922", "date_of_death": "7 March 2017", "place_of_birth": "Görlitz", "place_of_death": "Seattle", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Norman_F._Ramsey", "name": "Norman F. Ramsey", "year": 1989, "category": "Physics", "country": "United States", "born_in": null, "text": "Norman F. Ramsey , Physics, 1989", "wikidata_code": "Q107419", "date_of_birth": "27 August 1915", "date_of_death": "4 November 2011", "place_of_birth": "Washington, D.C.", "place_of_death": "Middlesex County", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/J._Michael_Bishop", "name": "J. Michael Bishop", "year": 1989, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "J. Michael Bishop , Physiology or Medicine, 1989", "wikidata_code": "Q311358", "date_of_birth": "22 February 1936", "place_of_birth": "York", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Harold_E._Varmus", "name": "Harold E. Varmus", "year": 1989, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Harold E. Varmus , Physiology or Medicine, 1989", "wikidata_code": "Q295691", "date_of_birth": "18 December 1939", "place_of_birth": "Oceanside", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/E._Donnall_Thomas", "name": "E. Donnall Thomas", "year": 1990, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "E. Donnall Thomas , Physiology or Medicine, 1990", "wikidata_code": "Q310485", "date_of_birth": "15 March 1920", "date_of_death": "20 October 2012", "place_of_birth": "Mart", "place_of_death": "Seattle", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rudolph_A._Marcus", "name": "Rudolph A. Marcus", "year": 1992, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Rudolph A. Marcus ,  born in Canada , Chemistry, 1992", "wikidata_code": "Q239067", "date_of_birth": "21 July 1923", "place_of_birth": "Montreal", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gary_S._Becker", "name": "Gary S. Becker", "year": 1992, "category": "Economics", "country": "United States", "born_in": null, "text": "Gary S. Becker , Economics, 1992", "wikidata_code": "Q191020", "date_of_birth": "2 December 1930", "date_of_death": "3 May 2014", "place_of_birth": "Pottsville", "place_of_death": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Edmond_H._Fischer", "name": "Edmond H. Fischer", "year": 1992, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Edmond H. Fischer ,  born in China , Physiology or Medicine, 1992", "wikidata_code": "Q109726", "date_of_birth": "6 April 1920", "date_of_death": "27 August 2021", "place_of_birth": "Shanghai French Concession", "place_of_death": "Seattle", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Edwin_G._Krebs", "name": "Edwin G. Krebs", "year": 1992, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Edwin G. Krebs , Physiology or Medicine, 1992", "wikidata_code": "Q109731", "date_of_birth": "6 June 1918", "date_of_death": "21 December 2009", "place_of_birth": "Lansing", "place_of_death": "Seattle", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ronald_Coase", "name": "Ronald Coase", "year": 1991, "category": "Economics", "country": "United States", "born_in": null, "text": "Ronald Coase ,  born in the United Kingdom , Economics, 1991", "wikidata_code": "Q188113", "date_of_birth": "29 December 1910", "date_of_death": "2 September 2013", "place_of_birth": "London", "place_of_death": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Elias_James_Corey", "name": "Elias James Corey", "year": 1990, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Elias James Corey , Chemistry, 1990", "wikidata_code": "Q135171", "date_of_birth": "12 July 1928", "place_of_birth": "Methuen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Merton_H._Miller", "name": "Merton H. Miller", "year": 1990, "category": "Economics", "country": "United States", "born_in": null, "text": "Merton H. Miller , Economics, 1990", "wikidata_code": "Q157255", "date_of_birth": "16 May 1923", "date_of_death": "3 June 2000", "place_of_birth": "Boston", "place_of_death": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Martin_Rodbell", "name": "Martin Rodbell", "year": 1994, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Martin Rodbell , Physiology or Medicine, 1994", "wikidata_code": "Q60031", "date_of_birth": "1 December 1925", "date_of_death": "7 December 1998", "place_of_birth": "Baltimore", "place_of_death": "Chapel Hill", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kary_B._Mullis", "name": "Kary B. Mullis", "year": 1993, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Kary B. Mullis , Chemistry, 1993", "wikidata_code": "Q157224", "date_of_birth": "28 December 1944", "date_of_death": "7 August 2019", "place_of_birth": "Lenoir", "place_of_death": "Newport Beach", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_W._Fogel", "name": "Robert W. Fogel", "year": 1993, "category": "Economics", "country": "United States", "born_in": null, "text": "Robert W. Fogel , Economics, 1993", "wikidata_code": "Q237821", "date_of_birth": "1 July 1926", "date_of_death": "11 June 2013", "place_of_birth": "New York City", "place_of_death": "Oak Lawn", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Douglass_C._North", "name": "Douglass C. North", "year": 1993, "category": "Economics", "country": "United States", "born_in": null, "text": "Douglass C. North , Economics, 1993", "wikidata_code": "Q243193", "date_of_birth": "5 November 1920", "date_of_death": "23 November 2015", "place_of_birth": "Cambridge", "place_of_death": "Benzonia", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Toni_Morrison", "name": "Toni Morrison", "year": 1993, "category": "Literature", "country": "United States", "born_in": null, "text": "Toni Morrison , Literature, 1993", "wikidata_code": "Q72334", "date_of_birth": "18 February 1931", "date_of_death": "5 August 2019", "place_of_birth": "Lorain", "place_of_death": "The Bronx", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Russell_A._Hulse", "name": "Russell A. Hulse", "year": 1993, "category": "Physics", "country": "United States", "born_in": null, "text": "Russell A. Hulse , Physics, 1993", "wikidata_code": "Q156286", "date_of_birth": "28 November 1950", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Joseph_H._Taylor_Jr.", "name": "Joseph H. Taylor Jr.", "year": 1993, "category": "Physics", "country": "United States", "born_in": null, "text": "Joseph H. Taylor Jr. , Physics, 1993", "wikidata_code": "Q192685", "date_of_birth": "29 March 1941", "place_of_birth": "Philadelphia", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Phillip_Allen_Sharp", "name": "Phillip A. Sharp", "year": 1993, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Phillip A. Sharp , Physiology or Medicine, 1993", "wikidata_code": "Q312977", "date_of_birth": "6 June 1944", "place_of_birth": "Falmouth", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_F._Sharpe", "name": "William F. Sharpe", "year": 1990, "category": "Economics", "country": "United States", "born_in": null, "text": "William F. Sharpe , Economics, 1990", "wikidata_code": "Q274111", "date_of_birth": "16 June 1934", "place_of_birth": "Boston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Harry_M._Markowitz", "name": "Harry M. Markowitz", "year": 1990, "category": "Economics", "country": "United States", "born_in": null, "text": "Harry M. Markowitz , Economics, 1990", "wikidata_code": "Q272508", "date_of_birth": "24 August 1927", "date_of_death": "22 June 2023", "place_of_birth": "Chicago", "place_of_death": "San Diego", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jerome_I._Friedman", "name": "Jerome I. Friedman", "year": 1990, "category": "Physics", "country": "United States", "born_in": null, "text": "Jerome I. Friedman , Physics, 1990", "wikidata_code": "Q187822", "date_of_birth": "28 March 1930", "place_of_birth": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henry_W._Kendall", "name": "Henry W. Kendall", "year": 1990, "category": "Physics", "country": "United States", "born_in": null, "text": "Henry W. Kendall , Physics, 1990", "wikidata_code": "Q190495", "date_of_birth": "9 December 1926", "date_of_death": "15 February 1999", "place_of_birth": "Boston", "place_of_death": "Wakulla County", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Joseph_Murray", "name": "Joseph E. Murray", "year": 1990, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Joseph E. Murray , Physiology or Medicine, 1990", "wikidata_code": "Q192282", "date_of_birth": "1 April 1919", "date_of_death": "26 November 2012", "place_of_birth": "Milford", "place_of_death": "Boston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alfred_G._Gilman", "name": "Alfred G. Gilman", "year": 1994, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Alfred G. Gilman , Physiology or Medicine, 1994", "wikidata_code": "Q296423", "date_of_birth": "1 July 1941", "date_of_death": "23 December 2015", "place_of_birth": "New Haven", "place_of_death": "Dallas", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mario_J._Molina", "name": "Mario J. Molina", "year": 1995, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Mario J. Molina ,  born in Mexico , Chemistry, 1995", "wikidata_code": "Q19045", "date_of_birth": "19 March 1943", "date_of_death": "7 October 2020", "place_of_birth": "Mexico City", "place_of_death": "Mexico City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/F._Sherwood_Rowland", "name": "F. Sherwood Rowland", "year": 1995, "category": "Chemistry", "country": "United States", "born_in": null, "text": "F. Sherwood Rowland , Chemistry, 1995", "wikidata_code": "Q111190", "date_of_birth": "28 June 1927", "date_of_death": "10 March 2012", "place_of_birth": "Delaware", "place_of_death": "Newport Beach", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_Lucas_Jr.", "name": "Robert Lucas Jr.", "year": 1995, "category": "Economics", "country": "United States", "born_in": null, "text": "Robert Lucas Jr. , Economics, 1995", "wikidata_code": "Q107264", "date_of_birth": "15 September 1937", "date_of_death": "15 May 2023", "place_of_birth": "Yakima", "place_of_death": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Martin_L._Perl", "name": "Martin L. Perl", "year": 1995, "category": "Physics", "country": "United States", "born_in": null, "text": "Martin L. Perl , Physics, 1995", "wikidata_code": "Q107416", "date_of_birth": "24 June 1927", "date_of_death": "30 September 2014", "place_of_birth": "Manhattan", "place_of_death": "Palo Alto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Frederick_Reines", "name": "Frederick Reines", "year": 1995, "category": "Physics", "country": "United States", "born_in": null, "text": "Frederick Reines , Physics, 1995", "wikidata_code": "Q191922", "date_of_birth": "16 March 1918", "date_of_death": "26 August 1998", "place_of_birth": "Paterson", "place_of_death": "Orange", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Edward_B._Lewis", "name": "Edward B. Lewis", "year": 1995, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Edward B. Lewis , Physiology or Medicine, 1995", "wikidata_code": "Q274123", "date_of_birth": "20 May 1918", "date_of_death": "21 July 2004", "place_of_birth": "Wilkes-Barre", "place_of_death": "Pasadena", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Eric_F._Wieschaus", "name": "Eric F. Wieschaus", "year": 1995, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Eric F. Wieschaus , Physiology or Medicine, 1995", "wikidata_code": "Q301438", "date_of_birth": "8 June 1947", "place_of_birth": "South Bend", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_E._Smalley", "name": "Richard E. Smalley", "year": 1996, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Richard E. Smalley , Chemistry, 1996", "wikidata_code": "Q106746", "date_of_birth": "6 June 1943", "date_of_death": "28 October 2005", "place_of_birth": "Akron", "place_of_death": "Houston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_F._Curl_Jr.", "name": "Robert F. Curl Jr.", "year": 1996, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Robert F. Curl Jr. , Chemistry, 1996", "wikidata_code": "Q110930", "date_of_birth": "23 August 1933", "date_of_death": "3 July 2022", "place_of_birth": "Alice", "place_of_death": "Houston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Vickrey", "name": "William Vickrey", "year": 1996, "category": "Economics", "country": "United States", "born_in": null, "text": "William Vickrey ,  born in Canada , Economics, 1996", "wikidata_code": "Q295673", "date_of_birth": "21 June 1914", "date_of_death": "11 October 1996", "place_of_birth": "Victoria", "place_of_death": "Harrison", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_M._Lee", "name": "David M. Lee", "year": 1996, "category": "Physics", "country": "United States", "born_in": null, "text": "David M. Lee , Physics, 1996", "wikidata_code": "Q201853", "date_of_birth": "20 January 1931", "place_of_birth": "Rye", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ahmed_H._Zewail", "name": "Ahmed H. Zewail", "year": 1999, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Ahmed H. Zewail ,  born in Egypt , Chemistry, 1999", "wikidata_code": "Q106624", "date_of_birth": "26 February 1946", "date_of_death": "2 August 2016", "place_of_birth": "Damanhur", "place_of_death": "Pasadena", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/G%C3%BCnter_Blobel", "name": "Günter Blobel", "year": 1999, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Günter Blobel ,  born in then Germany, now Poland , Physiology or Medicine, 1999", "wikidata_code": "Q60108", "date_of_birth": "21 May 1936", "date_of_death": "18 February 2018", "place_of_birth": "Niegosławice, Lubusz Voivodeship", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Walter_Kohn", "name": "Walter Kohn", "year": 1998, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Walter Kohn ,  born in Austria , Chemistry, 1998", "wikidata_code": "Q78510", "date_of_birth": "9 March 1923", "date_of_death": "19 April 2016", "place_of_birth": "Vienna", "place_of_death": "Santa Barbara", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jody_Williams", "name": "Jody Williams", "year": 1997, "category": "Peace", "country": "United States", "born_in": null, "text": "Jody Williams , Peace, 1997", "wikidata_code": "Q211239", "date_of_birth": "9 October 1950", "place_of_birth": "Brattleboro", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Steven_Chu", "name": "Steven Chu", "year": 1997, "category": "Physics", "country": "United States", "born_in": null, "text": "Steven Chu , Physics, 1997", "wikidata_code": "Q172466", "date_of_birth": "28 February 1948", "place_of_birth": "St. Louis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Daniel_Phillips", "name": "William D. Phillips", "year": 1997, "category": "Physics", "country": "United States", "born_in": null, "text": "William D. Phillips , Physics, 1997", "wikidata_code": "Q190756", "date_of_birth": "5 November 1948", "place_of_birth": "Wilkes-Barre", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Stanley_B._Prusiner", "name": "Stanley B. Prusiner", "year": 1997, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Stanley B. Prusiner , Physiology or Medicine, 1997", "wikidata_code": "Q155380", "date_of_birth": "28 May 1942", "place_of_birth": "Des Moines", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Douglas_D._Osheroff", "name": "Douglas D. Osheroff", "year": 1996, "category": "Physics", "country": "United States", "born_in": null, "text": "Douglas D. Osheroff , Physics, 1996", "wikidata_code": "Q206405", "date_of_birth": "1 August 1945", "place_of_birth": "Aberdeen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_Coleman_Richardson", "name": "Robert C. Richardson", "year": 1996, "category": "Physics", "country": "United States", "born_in": null, "text": "Robert C. Richardson , Physics, 1996", "wikidata_code": "Q192708", "date_of_birth": "26 June 1937", "date_of_death": "19 February 2013", "place_of_birth": "Washington, D.C.", "place_of_death": "Ithaca", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_Andrew_Olah", "name": "George Andrew Olah", "year": 1994, "category": "Chemistry", "country": "United States", "born_in": null, "text": "George Andrew Olah ,  born in Hungary , Chemistry, 1994", "wikidata_code": "Q192603", "date_of_birth": "22 May 1927", "date_of_death": "8 March 2017", "place_of_birth": "Budapest", "place_of_death": "Beverly Hills", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Harsanyi", "name": "John Harsanyi", "year": 1994, "category": "Economics", "country": "United States", "born_in": null, "text": "John Harsanyi ,  born in Hungary , Economics, 1994", "wikidata_code": "Q272510", "date_of_birth": "29 May 1920", "date_of_death": "9 August 2000", "place_of_birth": "Budapest", "place_of_death": "Berkeley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Forbes_Nash", "name": "John Forbes Nash", "year": 1994, "category": "Economics", "country": "United States", "born_in": null, "text": "John Forbes Nash , Economics, 1994", "wikidata_code": "Q128736", "date_of_birth": "13 June 1928", "date_of_death": "23 May 2015", "place_of_birth": "Bluefield", "place_of_death": "Monroe Township", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Clifford_Shull", "name": "Clifford G. Shull", "year": 1994, "category": "Physics", "country": "United States", "born_in": null, "text": "Clifford G. Shull , Physics, 1994", "wikidata_code": "Q201506", "date_of_birth": "23 September 1915", "date_of_death": "31 March 2001", "place_of_birth": "Pittsburgh", "place_of_death": "Medford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alan_Heeger", "name": "Alan Heeger", "year": 2000, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Alan Heeger , Chemistry, 2000", "wikidata_code": "Q106751", "date_of_birth": "22 January 1936", "place_of_birth": "Sioux City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alan_MacDiarmid", "name": "Alan MacDiarmid", "year": 2000, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Alan MacDiarmid ,  born in New Zealand , Chemistry, 2000", "wikidata_code": "Q110942", "date_of_birth": "14 April 1927", "date_of_death": "7 February 2007", "place_of_birth": "Masterton", "place_of_death": "Drexel Hill", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_J._Heckman", "name": "James J. Heckman", "year": 2000, "category": "Economics", "country": "United States", "born_in": null, "text": "James J. Heckman , Economics, 2000", "wikidata_code": "Q312561", "date_of_birth": "19 April 1944", "place_of_birth": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Daniel_L._McFadden", "name": "Daniel L. McFadden", "year": 2000, "category": "Economics", "country": "United States", "born_in": null, "text": "Daniel L. McFadden , Economics, 2000", "wikidata_code": "Q312560", "date_of_birth": "29 July 1937", "place_of_birth": "Raleigh", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jack_Kilby", "name": "Jack Kilby", "year": 2000, "category": "Physics", "country": "United States", "born_in": null, "text": "Jack Kilby , Physics, 2000", "wikidata_code": "Q182031", "date_of_birth": "8 November 1923", "date_of_death": "20 June 2005", "place_of_birth": "Jefferson City", "place_of_death": "Dallas", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_Greengard", "name": "Paul Greengard", "year": 2000, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Paul Greengard , Physiology or Medicine, 2000", "wikidata_code": "Q309979", "date_of_birth": "11 December 1925", "date_of_death": "13 April 2019", "place_of_birth": "New York City", "place_of_death": "Manhattan", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Bennett_Fenn", "name": "John Bennett Fenn", "year": 2002, "category": "Chemistry", "country": "United States", "born_in": null, "text": "John Bennett Fenn , Chemistry, 2002", "wikidata_code": "Q106738", "date_of_birth": "15 June 1917", "date_of_death": "10 December 2010", "place_of_birth": "New York City", "place_of_death": "Richmond", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Raymond_Davis_Jr.", "name": "Raymond Davis Jr.", "year": 2002, "category": "Physics", "country": "United States", "born_in": null, "text": "Raymond Davis Jr. , Physics, 2002", "wikidata_code": "Q175519", "date_of_birth": "14 October 1914", "date_of_death": "31 May 2006", "place_of_birth": "Washington, D.C.", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Riccardo_Giacconi", "name": "Riccardo Giacconi", "year": 2002, "category": "Physics", "country": "United States", "born_in": null, "text": "Riccardo Giacconi ,  born in Italy , Physics, 2002", "wikidata_code": "Q186481", "date_of_birth": "6 October 1931", "date_of_death": "9 December 2018", "place_of_birth": "Genoa", "place_of_death": "San Diego", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Sydney_Brenner", "name": "Sydney Brenner", "year": 2002, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Sydney Brenner ,  born in South Africa , Physiology or Medicine, 2002", "wikidata_code": "Q234463", "date_of_birth": "13 January 1927", "date_of_death": "5 April 2019", "place_of_birth": "Germiston", "place_of_death": "Singapore", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/H._Robert_Horvitz", "name": "H. Robert Horvitz", "year": 2002, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "H. Robert Horvitz , Physiology or Medicine, 2002", "wikidata_code": "Q295659", "date_of_birth": "8 May 1947", "place_of_birth": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_S._Knowles", "name": "William S. Knowles", "year": 2001, "category": "Chemistry", "country": "United States", "born_in": null, "text": "William S. Knowles , Chemistry, 2001", "wikidata_code": "Q110947", "date_of_birth": "1 June 1917", "date_of_death": "13 June 2012", "place_of_birth": "Taunton", "place_of_death": "Chesterfield", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/K._Barry_Sharpless", "name": "K. Barry Sharpless", "year": 2001, "category": "Chemistry", "country": "United States", "born_in": null, "text": "K. Barry Sharpless , Chemistry, 2001", "wikidata_code": "Q110925", "date_of_birth": "28 April 1941", "place_of_birth": "Philadelphia", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Joseph_E._Stiglitz", "name": "Joseph E. Stiglitz", "year": 2001, "category": "Economics", "country": "United States", "born_in": null, "text": "Joseph E. Stiglitz , Economics, 2001", "wikidata_code": "Q18430", "date_of_birth": "9 February 1943", "place_of_birth": "Gary", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_A._Akerlof", "name": "George A. Akerlof", "year": 2001, "category": "Economics", "country": "United States", "born_in": null, "text": "George A. Akerlof , Economics, 2001", "wikidata_code": "Q222541", "date_of_birth": "17 June 1940", "place_of_birth": "New Haven", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/A._Michael_Spence", "name": "A. Michael Spence", "year": 2001, "category": "Economics", "country": "United States", "born_in": null, "text": "A. Michael Spence , Economics, 2001", "wikidata_code": "Q157245", "date_of_birth": "7 November 1943", "place_of_birth": "Montclair", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Eric_Allin_Cornell", "name": "Eric A. Cornell", "year": 2001, "category": "Physics", "country": "United States", "born_in": null, "text": "Eric A. Cornell , Physics, 2001", "wikidata_code": "Q205954", "date_of_birth": "19 December 1961", "place_of_birth": "Palo Alto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carl_Wieman", "name": "Carl E. Wieman", "year": 2001, "category": "Physics", "country": "United States", "born_in": null, "text": "Carl E. Wieman , Physics, 2001", "wikidata_code": "Q206379", "date_of_birth": "26 March 1951", "place_of_birth": "Corvallis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Leland_H._Hartwell", "name": "Leland H. Hartwell", "year": 2001, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Leland H. Hartwell , Physiology or Medicine, 2001", "wikidata_code": "Q295869", "date_of_birth": "30 October 1939", "place_of_birth": "Los Angeles", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Eric_Kandel", "name": "Eric Kandel", "year": 2000, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Eric Kandel ,  born in Austria , Physiology or Medicine, 2000", "wikidata_code": "Q155529", "date_of_birth": "7 November 1929", "place_of_birth": "Vienna", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jimmy_Carter", "name": "Jimmy Carter", "year": 2002, "category": "Peace", "country": "United States", "born_in": null, "text": "Jimmy Carter , Peace, 2002", "wikidata_code": "Q23685", "date_of_birth": "1 October 1924", "place_of_birth": "Plains", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Frank_Wilczek", "name": "Frank Wilczek", "year": 2004, "category": "Physics", "country": "United States", "born_in": null, "text": "Frank Wilczek , Physics, 2004", "wikidata_code": "Q107450", "date_of_birth": "15 May 1951", "place_of_birth": "Mineola", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_Axel", "name": "Richard Axel", "year": 2004, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Richard Axel , Physiology or Medicine, 2004", "wikidata_code": "Q211940", "date_of_birth": "2 July 1946", "place_of_birth": "Brooklyn", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Linda_B._Buck", "name": "Linda B. Buck", "year": 2004, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Linda B. Buck , Physiology or Medicine, 2004", "wikidata_code": "Q200136", "date_of_birth": "29 January 1947", "place_of_birth": "Seattle", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Peter_Agre", "name": "Peter Agre", "year": 2003, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Peter Agre , Chemistry, 2003", "wikidata_code": "Q102250", "date_of_birth": "30 January 1949", "place_of_birth": "Northfield", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Roderick_MacKinnon", "name": "Roderick MacKinnon", "year": 2003, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Roderick MacKinnon , Chemistry, 2003", "wikidata_code": "Q211482", "date_of_birth": "19 February 1956", "place_of_birth": "Burlington", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_F._Engle", "name": "Robert F. Engle", "year": 2003, "category": "Economics", "country": "United States", "born_in": null, "text": "Robert F. Engle , Economics, 2003", "wikidata_code": "Q295653", "date_of_birth": "10 November 1942", "place_of_birth": "Syracuse", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Edmund_S._Phelps", "name": "Edmund S. Phelps", "year": 2006, "category": "Economics", "country": "United States", "born_in": null, "text": "Edmund S. Phelps , Economics, 2006", "wikidata_code": "Q192566", "date_of_birth": "26 July 1933", "place_of_birth": "Evanston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_F._Smoot", "name": "George F. Smoot", "year": 2006, "category": "Physics", "country": "United States", "born_in": null, "text": "George F. Smoot , Physics, 2006", "wikidata_code": "Q179572", "date_of_birth": "20 February 1945", "place_of_birth": "Yukon", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Andrew_Z._Fire", "name": "Andrew Z. Fire", "year": 2006, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Andrew Z. Fire , Physiology or Medicine, 2006", "wikidata_code": "Q202152", "date_of_birth": "27 April 1959", "place_of_birth": "Palo Alto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Craig_C._Mello", "name": "Craig C. Mello", "year": 2006, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Craig C. Mello , Physiology or Medicine, 2006", "wikidata_code": "Q206455", "date_of_birth": "18 October 1960", "place_of_birth": "New Haven", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_Aumann", "name": "Robert Aumann", "year": 2005, "category": "Economics", "country": null, "born_in": "United States", "text": "Robert Aumann *,  as an  Israeli  citizen , Economics, 2005", "wikidata_code": "Q157235", "date_of_birth": "8 June 1930", "place_of_birth": "Frankfurt", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_H._Grubbs", "name": "Robert H. Grubbs", "year": 2005, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Robert H. Grubbs , Chemistry, 2005", "wikidata_code": "Q202140", "date_of_birth": "27 February 1942", "date_of_death": "19 December 2021", "place_of_birth": "Possum Trot", "place_of_death": "Duarte", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_R._Schrock", "name": "Richard R. Schrock", "year": 2005, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Richard R. Schrock , Chemistry, 2005", "wikidata_code": "Q202159", "date_of_birth": "4 January 1945", "place_of_birth": "Berne", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Irwin_Rose", "name": "Irwin Rose", "year": 2004, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Irwin Rose , Chemistry, 2004", "wikidata_code": "Q230652", "date_of_birth": "16 July 1926", "date_of_death": "2 June 2015", "place_of_birth": "Brooklyn", "place_of_death": "Deerfield", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Edward_C._Prescott", "name": "Edward C. Prescott", "year": 2004, "category": "Economics", "country": "United States", "born_in": null, "text": "Edward C. Prescott , Economics, 2004", "wikidata_code": "Q312585", "date_of_birth": "26 December 1940", "date_of_death": "6 November 2022", "place_of_birth": "Glens Falls", "place_of_death": "Paradise Valley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_J._Gross", "name": "David J. Gross", "year": 2004, "category": "Physics", "country": "United States", "born_in": null, "text": "David J. Gross , Physics, 2004", "wikidata_code": "Q40262", "date_of_birth": "19 February 1941", "place_of_birth": "Washington, D.C.", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/H._David_Politzer", "name": "H. David Politzer", "year": 2004, "category": "Physics", "country": "United States", "born_in": null, "text": "H. David Politzer , Physics, 2004", "wikidata_code": "Q107407", "date_of_birth": "31 August 1949", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Anthony_J._Leggett", "name": "Anthony J. Leggett", "year": 2003, "category": "Physics", "country": "United States", "born_in": null, "text": "Anthony J. Leggett ,  born in United Kingdom , Physics, 2003", "wikidata_code": "Q192718", "date_of_birth": "26 March 1938", "place_of_birth": "Camberwell", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_Lauterbur", "name": "Paul C. Lauterbur", "year": 2003, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Paul C. Lauterbur , Physiology or Medicine, 2003", "wikidata_code": "Q106547", "date_of_birth": "6 May 1929", "date_of_death": "27 March 2007", "place_of_birth": "Sidney", "place_of_death": "Urbana", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alexei_Alexeyevich_Abrikosov", "name": "Alexei Alexeyevich Abrikosov", "year": 2003, "category": "Physics", "country": "United States", "born_in": null, "text": "Alexei Alexeyevich Abrikosov ,  born in Russia , Physics, 2003", "wikidata_code": "Q188128", "date_of_birth": "25 June 1928", "date_of_death": "29 March 2017", "place_of_birth": "Moscow", "place_of_death": "Palo Alto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Daniel_Kahneman", "name": "Daniel Kahneman", "year": 2002, "category": "Economics", "country": "United States", "born_in": null, "text": "Daniel Kahneman ,  born in  Israel , Economics, 2002", "wikidata_code": "Q233950", "date_of_birth": "5 March 1934", "place_of_birth": "Tel Aviv", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Vernon_L._Smith", "name": "Vernon L. Smith", "year": 2002, "category": "Economics", "country": "United States", "born_in": null, "text": "Vernon L. Smith , Economics, 2002", "wikidata_code": "Q295717", "date_of_birth": "1 January 1927", "place_of_birth": "Wichita", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Roger_B._Myerson", "name": "Roger B. Myerson", "year": 2007, "category": "Economics", "country": "United States", "born_in": null, "text": "Roger B. Myerson , Economics, 2007", "wikidata_code": "Q232949", "date_of_birth": "29 March 1951", "place_of_birth": "Boston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Al_Gore", "name": "Al Gore", "year": 2007, "category": "Peace", "country": "United States", "born_in": null, "text": "Al Gore , Peace, 2007", "wikidata_code": "Q19673", "date_of_birth": "31 March 1948", "place_of_birth": "Washington, D.C.", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mario_R._Capecchi", "name": "Mario R. Capecchi", "year": 2007, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Mario R. Capecchi ,  born in Italy , Physiology or Medicine, 2007", "wikidata_code": "Q215574", "date_of_birth": "6 October 1937", "place_of_birth": "Verona", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Oliver_Smithies", "name": "Oliver Smithies", "year": 2007, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Oliver Smithies ,  born in United Kingdom , Physiology or Medicine, 2007", "wikidata_code": "Q216318", "date_of_birth": "23 June 1925", "date_of_death": "10 January 2017", "place_of_birth": "Halifax", "place_of_death": "Chapel Hill", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Roger_D._Kornberg", "name": "Roger D. Kornberg", "year": 2006, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Roger D. Kornberg , Chemistry, 2006", "wikidata_code": "Q170676", "date_of_birth": "24 April 1947", "place_of_birth": "St. Louis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_C._Mather", "name": "John C. Mather", "year": 2006, "category": "Physics", "country": "United States", "born_in": null, "text": "John C. Mather , Physics, 2006", "wikidata_code": "Q104651", "date_of_birth": "7 August 1946", "place_of_birth": "Roanoke", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_Krugman", "name": "Paul Krugman", "year": 2008, "category": "Economics", "country": "United States", "born_in": null, "text": "Paul Krugman , Economics, 2008", "wikidata_code": "Q131112", "date_of_birth": "28 February 1953", "place_of_birth": "Albany", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Roger_Yonchien_Tsien", "name": "Roger Yonchien Tsien", "year": 2008, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Roger Yonchien Tsien , Chemistry, 2008", "wikidata_code": "Q200470", "date_of_birth": "1 February 1952", "date_of_death": "24 August 2016", "place_of_birth": "New York City", "place_of_death": "Eugene", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Martin_Chalfie", "name": "Martin Chalfie", "year": 2008, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Martin Chalfie , Chemistry, 2008", "wikidata_code": "Q106699", "date_of_birth": "15 January 1947", "place_of_birth": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Osamu_Shimomura", "name": "Osamu Shimomura", "year": 2008, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Osamu Shimomura ,  Japanese citizenship  , Chemistry, 2008", "wikidata_code": "Q205345", "date_of_birth": "27 August 1928", "date_of_death": "19 October 2018", "place_of_birth": "Fukuchiyama", "place_of_death": "Nagasaki", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Yoichiro_Nambu", "name": "Yoichiro Nambu", "year": 2008, "category": "Physics", "country": "United States", "born_in": null, "text": "Yoichiro Nambu ,  born in Japan , Physics, 2008", "wikidata_code": "Q188120", "date_of_birth": "18 January 1921", "date_of_death": "5 July 2015", "place_of_birth": "Tokyo", "place_of_death": "Toyonaka", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Leonid_Hurwicz", "name": "Leonid Hurwicz", "year": 2007, "category": "Economics", "country": "United States", "born_in": null, "text": "Leonid Hurwicz ,  born in Russia , Economics, 2007", "wikidata_code": "Q157262", "date_of_birth": "21 August 1917", "date_of_death": "24 June 2008", "place_of_birth": "Moscow", "place_of_death": "Minneapolis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Eric_S._Maskin", "name": "Eric S. Maskin", "year": 2007, "category": "Economics", "country": "United States", "born_in": null, "text": "Eric S. Maskin , Economics, 2007", "wikidata_code": "Q233051", "date_of_birth": "12 December 1950", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jack_W._Szostak", "name": "Jack W. Szostak", "year": 2009, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Jack W. Szostak ,  born in United Kingdom , Physiology or Medicine, 2009", "wikidata_code": "Q104600", "date_of_birth": "9 November 1952", "place_of_birth": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carol_W._Greider", "name": "Carol W. Greider", "year": 2009, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Carol W. Greider , Physiology or Medicine, 2009", "wikidata_code": "Q26322", "date_of_birth": "15 April 1961", "place_of_birth": "San Diego", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Venkatraman_Ramakrishnan", "name": "Venkatraman Ramakrishnan", "year": 2009, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Venkatraman Ramakrishnan ,  born in India , Chemistry, 2009", "wikidata_code": "Q60061", "date_of_birth": "1952", "place_of_birth": "Chidambaram", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Thomas_A._Steitz", "name": "Thomas A. Steitz", "year": 2009, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Thomas A. Steitz , Chemistry, 2009", "wikidata_code": "Q109559", "date_of_birth": "23 August 1940", "date_of_death": "9 October 2018", "place_of_birth": "Milwaukee", "place_of_death": "Branford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Willard_S._Boyle", "name": "Willard S. Boyle", "year": 2009, "category": "Physics", "country": "United States", "born_in": null, "text": "Willard S. Boyle ,  born in Canada , Physics, 2009", "wikidata_code": "Q73058", "date_of_birth": "19 August 1924", "date_of_death": "7 May 2011", "place_of_birth": "Amherst", "place_of_death": "Wallace", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_K._Kao", "name": "Charles K. Kao", "year": 2009, "category": "Physics", "country": "United States", "born_in": null, "text": "Charles K. Kao ,  born in China , Physics, 2009", "wikidata_code": "Q16389", "date_of_birth": "4 November 1933", "date_of_death": "23 September 2018", "place_of_birth": "People's Republic of China", "place_of_death": "Bradbury Hospice", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_E._Smith", "name": "George E. Smith", "year": 2009, "category": "Physics", "country": "United States", "born_in": null, "text": "George E. Smith , Physics, 2009", "wikidata_code": "Q76373", "date_of_birth": "10 May 1930", "place_of_birth": "White Plains", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Elizabeth_Blackburn", "name": "Elizabeth Blackburn", "year": 2009, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Elizabeth Blackburn ,  born in Australia , Physiology or Medicine, 2009", "wikidata_code": "Q26321", "date_of_birth": "26 November 1948", "place_of_birth": "Hobart", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Elinor_Ostrom", "name": "Elinor Ostrom", "year": 2009, "category": "Economics", "country": "United States", "born_in": null, "text": "Elinor Ostrom , Economics, 2009", "wikidata_code": "Q153761", "date_of_birth": "7 August 1933", "date_of_death": "12 June 2012", "place_of_birth": "Los Angeles", "place_of_death": "Bloomington", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Oliver_Eaton_Williamson", "name": "Oliver Eaton Williamson", "year": 2009, "category": "Economics", "country": "United States", "born_in": null, "text": "Oliver Eaton Williamson , Economics, 2009", "wikidata_code": "Q232062", "date_of_birth": "27 September 1932", "date_of_death": "21 May 2020", "place_of_birth": "Superior", "place_of_death": "Berkeley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Barack_H._Obama", "name": "Barack H. Obama", "year": 2009, "category": "Peace", "country": "United States", "born_in": null, "text": "Barack H. Obama , Peace, 2009", "wikidata_code": "Q76", "date_of_birth": "4 August 1961", "place_of_birth": "Kapiolani Medical Center for Women and Children", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_F._Heck", "name": "Richard F. Heck", "year": 2010, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Richard F. Heck , Chemistry, 2010", "wikidata_code": "Q106471", "date_of_birth": "15 August 1931", "date_of_death": "10 October 2015", "place_of_birth": "Springfield", "place_of_death": "Manila", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ei-ichi_Negishi", "name": "Ei-ichi Negishi", "year": 2010, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Ei-ichi Negishi ,  Japanese citizenship , Chemistry, 2010", "wikidata_code": "Q105927", "date_of_birth": "14 July 1935", "date_of_death": "6 June 2021", "place_of_birth": "Hsinking", "place_of_death": "Indianapolis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Thomas_J._Sargent", "name": "Thomas J. Sargent", "year": 2011, "category": "Economics", "country": "United States", "born_in": null, "text": "Thomas J. Sargent , Economics, 2011", "wikidata_code": "Q107964", "date_of_birth": "19 July 1943", "place_of_birth": "Pasadena", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Saul_Perlmutter", "name": "Saul Perlmutter", "year": 2011, "category": "Physics", "country": "United States", "born_in": null, "text": "Saul Perlmutter , Physics, 2011", "wikidata_code": "Q106949", "date_of_birth": "22 September 1959", "place_of_birth": "Champaign", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Brian_P._Schmidt", "name": "Brian P. Schmidt", "year": 2011, "category": "Physics", "country": "United States", "born_in": null, "text": "Brian P. Schmidt , Physics, 2011", "wikidata_code": "Q201452", "date_of_birth": "24 February 1967", "place_of_birth": "Missoula", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Adam_G._Riess", "name": "Adam G. Riess", "year": 2011, "category": "Physics", "country": "United States", "born_in": null, "text": "Adam G. Riess , Physics, 2011", "wikidata_code": "Q106454", "date_of_birth": "16 December 1969", "place_of_birth": "Washington, D.C.", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ralph_M._Steinman", "name": "Ralph M. Steinman", "year": 2011, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Ralph M. Steinman ,  born in Canada , Physiology or Medicine, 2011", "wikidata_code": "Q105494", "date_of_birth": "14 January 1943", "date_of_death": "30 September 2011", "place_of_birth": "Montreal", "place_of_death": "Manhattan", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Bruce_Beutler", "name": "Bruce Beutler", "year": 2011, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Bruce Beutler , Physiology or Medicine, 2011", "wikidata_code": "Q104592", "date_of_birth": "29 December 1957", "place_of_birth": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Peter_A._Diamond", "name": "Peter A. Diamond", "year": 2010, "category": "Economics", "country": "United States", "born_in": null, "text": "Peter A. Diamond , Economics, 2010", "wikidata_code": "Q109570", "date_of_birth": "29 April 1940", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Arieh_Warshel", "name": "Arieh Warshel", "year": 2013, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Arieh Warshel ,  born in  Israel , Chemistry, 2013", "wikidata_code": "Q4790366", "date_of_birth": "20 November 1940", "place_of_birth": "Sde Nahum", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Michael_Levitt", "name": "Michael Levitt", "year": 2013, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Michael Levitt ,  born in South Africa , Chemistry, 2013", "wikidata_code": "Q6832227", "date_of_birth": "9 May 1947", "place_of_birth": "Pretoria", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Martin_Karplus", "name": "Martin Karplus", "year": 2013, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Martin Karplus ,  born in Austria , Chemistry, 2013", "wikidata_code": "Q903471", "date_of_birth": "15 March 1930", "place_of_birth": "Vienna", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Randy_Schekman", "name": "Randy Schekman", "year": 2013, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Randy Schekman , Physiology or Medicine, 2013", "wikidata_code": "Q740638", "date_of_birth": "30 December 1948", "place_of_birth": "Saint Paul", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Thomas_C._S%C3%BCdhof", "name": "Thomas C. Südhof", "year": 2013, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Thomas C. Südhof ,  born in Germany , Physiology or Medicine, 2013", "wikidata_code": "Q97270", "date_of_birth": "22 December 1955", "place_of_birth": "Göttingen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_Rothman", "name": "James Rothman", "year": 2013, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "James Rothman , Physiology or Medicine, 2013", "wikidata_code": "Q444270", "date_of_birth": "3 November 1950", "place_of_birth": "Haverhill", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alvin_E._Roth", "name": "Alvin E. Roth", "year": 2012, "category": "Economics", "country": "United States", "born_in": null, "text": "Alvin E. Roth , Economics, 2012", "wikidata_code": "Q28542", "date_of_birth": "18 December 1951", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Lloyd_S._Shapley", "name": "Lloyd S. Shapley", "year": 2012, "category": "Economics", "country": "United States", "born_in": null, "text": "Lloyd S. Shapley , Economics, 2012", "wikidata_code": "Q244739", "date_of_birth": "2 June 1923", "date_of_death": "12 March 2016", "place_of_birth": "Cambridge", "place_of_death": "Tucson", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Brian_Kobilka", "name": "Brian K. Kobilka", "year": 2012, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Brian K. Kobilka , Chemistry, 2012", "wikidata_code": "Q80907", "date_of_birth": "30 May 1955", "place_of_birth": "Little Falls", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_J._Lefkowitz", "name": "Robert J. Lefkowitz", "year": 2012, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Robert J. Lefkowitz , Chemistry, 2012", "wikidata_code": "Q80910", "date_of_birth": "15 April 1943", "place_of_birth": "The Bronx", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_J._Wineland", "name": "David J. Wineland", "year": 2012, "category": "Physics", "country": "United States", "born_in": null, "text": "David J. Wineland , Physics, 2012", "wikidata_code": "Q61045", "date_of_birth": "24 February 1944", "place_of_birth": "Milwaukee", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Christopher_A._Sims", "name": "Christopher A. Sims", "year": 2011, "category": "Economics", "country": "United States", "born_in": null, "text": "Christopher A. Sims , Economics, 2011", "wikidata_code": "Q109737", "date_of_birth": "21 October 1942", "place_of_birth": "Washington, D.C.", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Dale_T._Mortensen", "name": "Dale T. Mortensen", "year": 2010, "category": "Economics", "country": "United States", "born_in": null, "text": "Dale T. Mortensen , Economics, 2010", "wikidata_code": "Q109721", "date_of_birth": "2 February 1939", "date_of_death": "9 January 2014", "place_of_birth": "Enterprise", "place_of_death": "Wilmette", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_J._Shiller", "name": "Robert J. Shiller", "year": 2013, "category": "Economics", "country": "United States", "born_in": null, "text": "Robert J. Shiller , Economics, 2013", "wikidata_code": "Q338151", "date_of_birth": "29 March 1946", "place_of_birth": "Detroit", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Lars_Peter_Hansen", "name": "Lars Peter Hansen", "year": 2013, "category": "Economics", "country": "United States", "born_in": null, "text": "Lars Peter Hansen , Economics, 2013", "wikidata_code": "Q1386049", "date_of_birth": "26 October 1952", "place_of_birth": "Urbana", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Eugene_F._Fama", "name": "Eugene F. Fama", "year": 2013, "category": "Economics", "country": "United States", "born_in": null, "text": "Eugene F. Fama , Economics, 2013", "wikidata_code": "Q359317", "date_of_birth": "14 February 1939", "place_of_birth": "Boston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Bob_Dylan", "name": "Bob Dylan", "year": 2016, "category": "Literature", "country": "United States", "born_in": null, "text": "Bob Dylan , Literature, 2016", "wikidata_code": "Q392", "date_of_birth": "24 May 1941", "place_of_birth": "Duluth", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Oliver_Hart_(economist)", "name": "Oliver Hart", "year": 2016, "category": "Economics", "country": "United States", "born_in": null, "text": "Oliver Hart ,  born in United Kingdom , Economics, 2016", "wikidata_code": "Q432890", "date_of_birth": "9 October 1948", "place_of_birth": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fraser_Stoddart", "name": "Fraser Stoddart", "year": 2016, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Fraser Stoddart ,  born in United Kingdom , Chemistry, 2016", "wikidata_code": "Q376243", "date_of_birth": "24 May 1942", "place_of_birth": "Edinburgh", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/F._Duncan_M._Haldane", "name": "F. Duncan M. Haldane", "year": 2016, "category": "Physics", "country": "United States", "born_in": null, "text": "F. Duncan M. Haldane ,  born in United Kingdom , Physics, 2016", "wikidata_code": "Q1002250", "date_of_birth": "14 September 1951", "place_of_birth": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_M._Kosterlitz", "name": "John M. Kosterlitz", "year": 2016, "category": "Physics", "country": "United States", "born_in": null, "text": "John M. Kosterlitz ,  born in United Kingdom , Physics, 2016", "wikidata_code": "Q1700920", "date_of_birth": "22 June 1943", "place_of_birth": "Aberdeen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Angus_Deaton", "name": "Angus Deaton", "year": 2015, "category": "Economics", "country": "United States", "born_in": null, "text": "Angus Deaton ,  born in United Kingdom , Economics, 2015", "wikidata_code": "Q204078", "date_of_birth": "19 October 1945", "place_of_birth": "Edinburgh", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_L._Modrich", "name": "Paul L. Modrich", "year": 2015, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Paul L. Modrich , Chemistry, 2015", "wikidata_code": "Q7151888", "date_of_birth": "13 June 1946", "place_of_birth": "Raton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Michael_W._Young", "name": "Michael W. Young", "year": 2017, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Michael W. Young , Physiology or Medicine, 2017", "wikidata_code": "Q1929672", "date_of_birth": "28 March 1949", "place_of_birth": "Miami", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Michael_Rosbash", "name": "Michael Rosbash", "year": 2017, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Michael Rosbash , Physiology or Medicine, 2017", "wikidata_code": "Q1297741", "date_of_birth": "7 March 1944", "place_of_birth": "Kansas City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jeffrey_C._Hall", "name": "Jeffrey C. Hall", "year": 2017, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Jeffrey C. Hall , Physiology or Medicine, 2017", "wikidata_code": "Q1686435", "date_of_birth": "3 May 1945", "place_of_birth": "Brooklyn", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Aziz_Sancar", "name": "Aziz Sancar", "year": 2015, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Aziz Sancar ,  born in Turkey , Chemistry, 2015", "wikidata_code": "Q15118973", "date_of_birth": "8 September 1946", "place_of_birth": "Savur", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_C._Campbell_(scientist)", "name": "William C. Campbell", "year": 2015, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "William C. Campbell ,  born in Ireland , Physiology or Medicine, 2015", "wikidata_code": "Q21061212", "date_of_birth": "28 June 1930", "place_of_birth": "Ramelton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/W._E._Moerner", "name": "William E. Moerner", "year": 2014, "category": "Chemistry", "country": "United States", "born_in": null, "text": "William E. Moerner , Chemistry, 2014", "wikidata_code": "Q1387059", "date_of_birth": "24 June 1953", "place_of_birth": "Pleasanton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Eric_Betzig", "name": "Eric Betzig", "year": 2014, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Eric Betzig , Chemistry, 2014", "wikidata_code": "Q1351105", "date_of_birth": "13 January 1960", "place_of_birth": "Ann Arbor", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Shuji_Nakamura", "name": "Shuji Nakamura", "year": 2014, "category": "Physics", "country": "United States", "born_in": null, "text": "Shuji Nakamura ,  born in Japan , Physics, 2014", "wikidata_code": "Q730065", "date_of_birth": "22 May 1954", "place_of_birth": "Ikata", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_O%27Keefe_(neuroscientist)", "name": "John O'Keefe", "year": 2014, "category": "Physiology or Medicine", "country": null, "born_in": "United States", "text": "John O'Keefe *, Physiology or Medicine, 2014", "wikidata_code": "Q1701279", "date_of_birth": "18 November 1939", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Kaelin_Jr.", "name": "William Kaelin Jr.", "year": 2019, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "William Kaelin Jr. , Physiology or Medicine, 2019", "wikidata_code": "Q1603351", "date_of_birth": "23 November 1957", "place_of_birth": "Jamaica", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gregg_L._Semenza", "name": "Gregg L. Semenza", "year": 2019, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Gregg L. Semenza , Physiology or Medicine, 2019", "wikidata_code": "Q1545025", "date_of_birth": "12 July 1956", "place_of_birth": "Flushing", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_Romer", "name": "Paul Romer", "year": 2018, "category": "Economics", "country": "United States", "born_in": null, "text": "Paul Romer , Economics, 2018", "wikidata_code": "Q509262", "date_of_birth": "6 November 1955", "place_of_birth": "Denver", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Nordhaus", "name": "William Nordhaus", "year": 2018, "category": "Economics", "country": "United States", "born_in": null, "text": "William Nordhaus , Economics, 2018", "wikidata_code": "Q562481", "date_of_birth": "31 May 1941", "place_of_birth": "Albuquerque", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_P._Smith_(chemist)", "name": "George P. Smith", "year": 2018, "category": "Chemistry", "country": "United States", "born_in": null, "text": "George P. Smith , Chemistry, 2018", "wikidata_code": "Q56868017", "date_of_birth": "10 March 1941", "place_of_birth": "Norwalk", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Frances_Arnold", "name": "Frances Arnold", "year": 2018, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Frances Arnold , Chemistry, 2018", "wikidata_code": "Q4273363", "date_of_birth": "27 July 1956", "place_of_birth": "Pittsburgh", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Arthur_Ashkin", "name": "Arthur Ashkin", "year": 2018, "category": "Physics", "country": "United States", "born_in": null, "text": "Arthur Ashkin , Physics, 2018", "wikidata_code": "Q708472", "date_of_birth": "2 September 1922", "date_of_death": "21 September 2020", "place_of_birth": "Brooklyn", "place_of_death": "Rumson", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_P._Allison", "name": "James Allison", "year": 2018, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "James Allison , Physiology or Medicine, 2018", "wikidata_code": "Q6140731", "date_of_birth": "7 August 1948", "place_of_birth": "Alice", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_H._Thaler", "name": "Richard H. Thaler", "year": 2017, "category": "Economics", "country": "United States", "born_in": null, "text": "Richard H. Thaler , Economics, 2017", "wikidata_code": "Q371212", "date_of_birth": "12 September 1945", "place_of_birth": "East Orange", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Joachim_Frank", "name": "Joachim Frank", "year": 2017, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Joachim Frank ,  born in Germany , Chemistry, 2017", "wikidata_code": "Q28833112", "date_of_birth": "12 September 1940", "place_of_birth": "Siegen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rainer_Weiss", "name": "Rainer Weiss", "year": 2017, "category": "Physics", "country": "United States", "born_in": null, "text": "Rainer Weiss ,  born in Germany , Physics, 2017", "wikidata_code": "Q2128461", "date_of_birth": "29 September 1932", "place_of_birth": "Berlin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kip_Thorne", "name": "Kip Thorne", "year": 2017, "category": "Physics", "country": "United States", "born_in": null, "text": "Kip Thorne , Physics, 2017", "wikidata_code": "Q323320", "date_of_birth": "1 June 1940", "place_of_birth": "Logan", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Harvey_J._Alter", "name": "Harvey J. Alter", "year": 2020, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Harvey J. Alter , Physiology or Medicine, 2020", "wikidata_code": "Q5677307", "date_of_birth": "12 September 1935", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_M._Rice", "name": "Charles M. Rice", "year": 2020, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Charles M. Rice , Physiology or Medicine, 2020", "wikidata_code": "Q22669757", "date_of_birth": "25 August 1952", "place_of_birth": "Sacramento", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Abhijit_Banerjee", "name": "Abhijit Banerjee", "year": 2019, "category": "Economics", "country": "United States", "born_in": null, "text": "Abhijit Banerjee ,  born in India , Economics, 2019", "wikidata_code": "Q320578", "date_of_birth": "21 February 1961", "place_of_birth": "Mumbai", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Esther_Duflo", "name": "Esther Duflo", "year": 2019, "category": "Economics", "country": "United States", "born_in": null, "text": "Esther Duflo ,  born in France , Economics, 2019", "wikidata_code": "Q434509", "date_of_birth": "25 October 1972", "place_of_birth": "Paris", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Michael_Kremer", "name": "Michael Kremer", "year": 2019, "category": "Economics", "country": "United States", "born_in": null, "text": "Michael Kremer , Economics, 2019", "wikidata_code": "Q1635006", "date_of_birth": "12 November 1964", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_B._Goodenough", "name": "John B. Goodenough", "year": 2019, "category": "Chemistry", "country": "United States", "born_in": null, "text": "John B. Goodenough ,  born in Germany , Chemistry, 2019", "wikidata_code": "Q906529", "date_of_birth": "25 July 1922", "date_of_death": "25 June 2023", "place_of_birth": "Jena", "place_of_death": "Austin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/M._Stanley_Whittingham", "name": "M. Stanley Whittingham", "year": 2019, "category": "Chemistry", "country": "United States", "born_in": null, "text": "M. Stanley Whittingham ,  born in United Kingdom , Chemistry, 2019", "wikidata_code": "Q285062", "date_of_birth": "22 December 1941", "place_of_birth": "Nottingham", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jim_Peebles", "name": "Jim Peebles", "year": 2019, "category": "Physics", "country": "United States", "born_in": null, "text": "Jim Peebles ,  born in Canada , Physics, 2019", "wikidata_code": "Q728331", "date_of_birth": "25 April 1935", "place_of_birth": "Winnipeg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Barry_Barish", "name": "Barry Barish", "year": 2017, "category": "Physics", "country": "United States", "born_in": null, "text": "Barry Barish , Physics, 2017", "wikidata_code": "Q15900993", "date_of_birth": "27 January 1936", "place_of_birth": "Omaha", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_Card", "name": "David Card", "year": 2021, "category": "Economics", "country": "United States", "born_in": null, "text": "David Card ,  born in Canada , Economics, 2021", "wikidata_code": "Q1173928", "date_of_birth": "1956", "place_of_birth": "Guelph", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Joshua_Angrist", "name": "Joshua Angrist", "year": 2021, "category": "Economics", "country": "United States", "born_in": null, "text": "Joshua Angrist , Economics, 2021", "wikidata_code": "Q921499", "date_of_birth": "18 September 1960", "place_of_birth": "Columbus", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Guido_Imbens", "name": "Guido Imbens", "year": 2021, "category": "Economics", "country": "United States", "born_in": null, "text": "Guido Imbens ,  born in Netherlands , Economics, 2021", "wikidata_code": "Q16730042", "date_of_birth": "3 September 1963", "place_of_birth": "Geldrop", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Maria_Ressa", "name": "Maria Ressa", "year": 2021, "category": "Peace", "country": "United States", "born_in": null, "text": "Maria Ressa ,  born in Philippines , Peace, 2021", "wikidata_code": "Q6761526", "date_of_birth": "2 October 1963", "place_of_birth": "Manila", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Louise_Gl%C3%BCck", "name": "Louise Glück", "year": 2020, "category": "Literature", "country": "United States", "born_in": null, "text": "Louise Glück , Literature, 2020", "wikidata_code": "Q2344210", "date_of_birth": "22 April 1943", "date_of_death": "13 October 2023", "place_of_birth": "New York City", "place_of_death": "Cambridge", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Jennifer_Doudna", "name": "Jennifer Doudna", "year": 2020, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Jennifer Doudna , Chemistry, 2020", "wikidata_code": "Q56068", "date_of_birth": "19 February 1964", "place_of_birth": "Washington, D.C.", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Andrea_M._Ghez", "name": "Andrea Ghez", "year": 2020, "category": "Physics", "country": "United States", "born_in": null, "text": "Andrea Ghez , Physics, 2020", "wikidata_code": "Q493956", "date_of_birth": "16 June 1965", "place_of_birth": "New York City", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Alexei_Ekimov", "name": "Alexei Ekimov", "year": 2023, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Alexei Ekimov ,  born in former USSR , Chemistry, 2023", "wikidata_code": "Q1547368", "date_of_birth": "28 February 1945", "place_of_birth": "Saint Petersburg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Pierre_Agostini", "name": "Pierre Agostini", "year": 2023, "category": "Physics", "country": "United States", "born_in": null, "text": "Pierre Agostini ,  born in France , Physics, 2023", "wikidata_code": "Q57020342", "date_of_birth": "23 July 1941", "place_of_birth": "Tunis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Drew_Weissman", "name": "Drew Weissman", "year": 2023, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Drew Weissman , Physiology or Medicine, 2023", "wikidata_code": "Q88608402", "date_of_birth": "7 September 1959", "place_of_birth": "Lexington", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Katalin_Karik%C3%B3", "name": "Katalin Karikó", "year": 2023, "category": "Physiology or Medicine", "country": "United States", "born_in": null, "text": "Katalin Karikó ,  born in Hungary , Physiology or Medicine, 2023", "wikidata_code": "Q88608397", "date_of_birth": "17 January 1955", "place_of_birth": "Szolnok", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Ben_Bernanke", "name": "Ben Bernanke", "year": 2022, "category": "Economics", "country": "United States", "born_in": null, "text": "Ben Bernanke , Economics, 2022", "wikidata_code": "Q201795", "date_of_birth": "13 December 1953", "place_of_birth": "Augusta", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Douglas_Diamond", "name": "Douglas Diamond", "year": 2022, "category": "Economics", "country": "United States", "born_in": null, "text": "Douglas Diamond , Economics, 2022", "wikidata_code": "Q185871", "date_of_birth": "25 October 1953", "place_of_birth": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Philip_H._Dybvig", "name": "Philip H. Dybvig", "year": 2022, "category": "Economics", "country": "United States", "born_in": null, "text": "Philip H. Dybvig , Economics, 2022", "wikidata_code": "Q24565948", "date_of_birth": "22 May 1955", "place_of_birth": "Gainesville", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carolyn_R._Bertozzi", "name": "Carolyn R. Bertozzi", "year": 2022, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Carolyn R. Bertozzi , Chemistry, 2022", "wikidata_code": "Q7442", "date_of_birth": "10 October 1966", "place_of_birth": "Boston", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/K._Barry_Sharpless", "name": "K. Barry Sharpless", "year": 2022, "category": "Chemistry", "country": "United States", "born_in": null, "text": "K. Barry Sharpless , Chemistry, 2022", "wikidata_code": "Q110925", "date_of_birth": "28 April 1941", "place_of_birth": "Philadelphia", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Clauser", "name": "John Clauser", "year": 2022, "category": "Physics", "country": "United States", "born_in": null, "text": "John Clauser , Physics, 2022", "wikidata_code": "Q1365270", "date_of_birth": "1 December 1942", "place_of_birth": "Pasadena", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rudyard_Kipling", "name": "Rudyard Kipling", "year": 1907, "category": "Literature", "country": "United Kingdom", "born_in": null, "text": "Rudyard Kipling ,  born in India , Literature, 1907", "wikidata_code": "Q34743", "date_of_birth": "30 December 1865", "date_of_death": "18 January 1936", "place_of_birth": "Mumbai", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/J._J._Thomson", "name": "J. J. Thomson", "year": 1906, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "J. J. Thomson , Physics, 1906", "wikidata_code": "Q47285", "date_of_birth": "18 December 1856", "date_of_death": "30 August 1940", "place_of_birth": "Cheetham Hill", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_William_Strutt,_3rd_Baron_Rayleigh", "name": "John Strutt", "year": 1904, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "John Strutt, 3rd Baron Rayleigh , Physics, 1904", "wikidata_code": "Q83297", "date_of_birth": "12 November 1842", "date_of_death": "30 June 1919", "place_of_birth": "Maldon", "place_of_death": "Witham", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_Bernard_Shaw", "name": "George Bernard Shaw", "year": 1925, "category": "Literature", "country": "United Kingdom", "born_in": null, "text": "George Bernard Shaw ,  born in Ireland (Then part of the  United Kingdom of Great Britain and Ireland ) , Literature, 1925", "wikidata_code": "Q19185", "date_of_birth": "26 July 1856", "date_of_death": "2 November 1950", "place_of_birth": "Dublin", "place_of_death": "Ayot St Lawrence", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Macleod_(physiologist)", "name": "John Macleod", "year": 1923, "category": "Physiology or Medicine", "country": null, "born_in": "United Kingdom", "text": "John Macleod *, Physiology or Medicine, 1923", "wikidata_code": "Q232024", "date_of_birth": "6 September 1876", "date_of_death": "16 March 1935", "place_of_birth": "Clunie", "place_of_death": "Aberdeen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Archibald_Vivian_Hill", "name": "Archibald Vivian Hill", "year": 1922, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Archibald Vivian Hill , Physiology or Medicine, 1922", "wikidata_code": "Q155375", "date_of_birth": "26 September 1886", "date_of_death": "3 June 1977", "place_of_birth": "Bristol", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Francis_William_Aston", "name": "Francis William Aston", "year": 1922, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Francis William Aston , Chemistry, 1922", "wikidata_code": "Q102291", "date_of_birth": "1 September 1877", "date_of_death": "20 November 1945", "place_of_birth": "Harborne", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Frederick_Soddy", "name": "Frederick Soddy", "year": 1921, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Frederick Soddy , Chemistry, 1921", "wikidata_code": "Q102830", "date_of_birth": "2 September 1877", "date_of_death": "22 September 1956", "place_of_birth": "Eastbourne", "place_of_death": "Brighton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_Glover_Barkla", "name": "Charles Glover Barkla", "year": 1917, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Charles Glover Barkla , Physics, 1917", "wikidata_code": "Q160522", "date_of_birth": "7 June 1877", "date_of_death": "23 October 1944", "place_of_birth": "Widnes", "place_of_death": "Edinburgh", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Henry_Bragg", "name": "William Henry Bragg", "year": 1915, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "William Henry Bragg , Physics, 1915", "wikidata_code": "Q133747", "date_of_birth": "2 July 1862", "date_of_death": "12 March 1942", "place_of_birth": "Westward", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Lawrence_Bragg", "name": "William Lawrence Bragg", "year": 1915, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "William Lawrence Bragg ,  born in Australia , Physics, 1915", "wikidata_code": "Q131729", "date_of_birth": "31 March 1890", "date_of_death": "1 July 1971", "place_of_birth": "Adelaide", "place_of_death": "Ipswich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ernest_Rutherford,_1st_Baron_Rutherford_of_Nelson", "name": "Ernest Rutherford", "year": 1908, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Ernest Rutherford ,  born in New Zealand , Chemistry, 1908", "wikidata_code": "Q9123", "date_of_birth": "30 August 1871", "date_of_death": "19 October 1937", "place_of_birth": "Nelson", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Ramsay", "name": "William Ramsay", "year": 1904, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "William Ramsay , Chemistry, 1904", "wikidata_code": "Q950726", "date_of_birth": "2 October 1852", "date_of_death": "23 July 1916", "place_of_birth": "Glasgow", "place_of_death": "High Wycombe", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Randal_Cremer", "name": "William Randal Cremer", "year": 1903, "category": "Peace", "country": "United Kingdom", "born_in": null, "text": "William Randal Cremer , Peace, 1903", "wikidata_code": "Q189841", "date_of_birth": "18 March 1828", "date_of_death": "22 July 1908", "place_of_birth": "Fareham", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ronald_Ross", "name": "Ronald Ross", "year": 1902, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Ronald Ross ,  born in India , Physiology or Medicine, 1902", "wikidata_code": "Q102034", "date_of_birth": "13 May 1857", "date_of_death": "16 September 1932", "place_of_birth": "Almora", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Claudia_Goldin", "name": "Claudia Goldin", "year": 2023, "category": "Economics", "country": "United States", "born_in": null, "text": "Claudia Goldin , Economics, 2023", "wikidata_code": "Q1097475", "date_of_birth": "14 May 1946", "place_of_birth": "New York City", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Louis_Brus", "name": "Louis Brus", "year": 2023, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Louis Brus , Chemistry, 2023", "wikidata_code": "Q194646", "date_of_birth": "10 August 1943", "place_of_birth": "Cleveland", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Moungi_Bawendi", "name": "Moungi Bawendi", "year": 2023, "category": "Chemistry", "country": "United States", "born_in": null, "text": "Moungi Bawendi ,  born in France , Chemistry, 2023", "wikidata_code": "Q15433043", "date_of_birth": "15 March 1961", "place_of_birth": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_Chadwick", "name": "James Chadwick", "year": 1935, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "James Chadwick , Physics, 1935", "wikidata_code": "Q80884", "date_of_birth": "20 October 1891", "date_of_death": "24 July 1974", "place_of_birth": "Bollington", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Arthur_Henderson", "name": "Arthur Henderson", "year": 1934, "category": "Peace", "country": "United Kingdom", "born_in": null, "text": "Arthur Henderson , Peace, 1934", "wikidata_code": "Q208665", "date_of_birth": "13 September 1863", "date_of_death": "20 October 1935", "place_of_birth": "Glasgow", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Norman_Angell", "name": "Norman Angell", "year": 1933, "category": "Peace", "country": "United Kingdom", "born_in": null, "text": "Norman Angell , Peace, 1933", "wikidata_code": "Q272224", "date_of_birth": "26 December 1872", "date_of_death": "7 October 1967", "place_of_birth": "Holbeach", "place_of_death": "Croydon", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_Dirac", "name": "Paul Dirac", "year": 1933, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Paul Dirac , Physics, 1933", "wikidata_code": "Q47480", "date_of_birth": "8 August 1902", "date_of_death": "20 October 1984", "place_of_birth": "Bristol", "place_of_death": "Tallahassee", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_Scott_Sherrington", "name": "Charles Scott Sherrington", "year": 1932, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Charles Scott Sherrington , Physiology or Medicine, 1932", "wikidata_code": "Q213504", "date_of_birth": "27 November 1857", "date_of_death": "4 March 1952", "place_of_birth": "Islington", "place_of_death": "Eastbourne", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Galsworthy", "name": "John Galsworthy", "year": 1932, "category": "Literature", "country": "United Kingdom", "born_in": null, "text": "John Galsworthy , Literature, 1932", "wikidata_code": "Q82248", "date_of_birth": "14 August 1867", "date_of_death": "31 January 1933", "place_of_birth": "Kingston upon Thames", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_Robinson_(organic_chemist)", "name": "Robert Robinson", "year": 1947, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Robert Robinson , Chemistry, 1947", "wikidata_code": "Q49351", "date_of_birth": "13 September 1886", "date_of_death": "8 February 1975", "place_of_birth": "Chesterfield", "place_of_death": "Great Missenden", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ernst_Boris_Chain", "name": "Ernst Boris Chain", "year": 1945, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Ernst Boris Chain ,  born in Germany , Physiology or Medicine, 1945", "wikidata_code": "Q58054", "date_of_birth": "19 June 1906", "date_of_death": "12 August 1979", "place_of_birth": "Berlin", "place_of_death": "Castlebar", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alexander_Fleming", "name": "Alexander Fleming", "year": 1945, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Alexander Fleming , Physiology or Medicine, 1945", "wikidata_code": "Q37064", "date_of_birth": "6 August 1881", "date_of_death": "11 March 1955", "place_of_birth": "Lochfield", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_Paget_Thomson", "name": "George Paget Thomson", "year": 1937, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "George Paget Thomson , Physics, 1937", "wikidata_code": "Q133846", "date_of_birth": "3 May 1892", "date_of_death": "10 September 1975", "place_of_birth": "Cambridge", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_Cecil,_1st_Viscount_Cecil_of_Chelwood", "name": "Robert Cecil", "year": 1937, "category": "Peace", "country": "United Kingdom", "born_in": null, "text": "Robert Cecil, 1st Viscount Cecil of Chelwood , Peace, 1937", "wikidata_code": "Q12702", "date_of_birth": "14 September 1864", "date_of_death": "24 November 1958", "place_of_birth": "Cavendish Square", "place_of_death": "Royal Tunbridge Wells", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Norman_Haworth", "name": "Norman Haworth", "year": 1937, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Norman Haworth , Chemistry, 1937", "wikidata_code": "Q204600", "date_of_birth": "19 March 1883", "date_of_death": "19 March 1950", "place_of_birth": "Chorley", "place_of_death": "Barnt Green", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henry_Hallett_Dale", "name": "Henry Hallett Dale", "year": 1936, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Henry Hallett Dale , Physiology or Medicine, 1936", "wikidata_code": "Q72194", "date_of_birth": "9 June 1875", "date_of_death": "23 July 1968", "place_of_birth": "London", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Edgar_Adrian,_1st_Baron_Adrian", "name": "Edgar Adrian", "year": 1932, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Edgar Adrian, 1st Baron Adrian , Physiology or Medicine, 1932", "wikidata_code": "Q231292", "date_of_birth": "30 November 1889", "date_of_death": "4 August 1977", "place_of_birth": "Hampstead", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Arthur_Harden", "name": "Arthur Harden", "year": 1929, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Arthur Harden , Chemistry, 1929", "wikidata_code": "Q189803", "date_of_birth": "12 October 1865", "date_of_death": "17 June 1940", "place_of_birth": "Manchester", "place_of_death": "Bourne End", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Frederick_Hopkins", "name": "Frederick Hopkins", "year": 1929, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Frederick Hopkins , Physiology or Medicine, 1929", "wikidata_code": "Q233976", "date_of_birth": "20 June 1861", "date_of_death": "16 May 1947", "place_of_birth": "Eastbourne", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Owen_Willans_Richardson", "name": "Owen Willans Richardson", "year": 1928, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Owen Willans Richardson , Physics, 1928", "wikidata_code": "Q169330", "date_of_birth": "26 April 1879", "date_of_death": "15 February 1959", "place_of_birth": "Dewsbury", "place_of_death": "Alton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_Thomson_Rees_Wilson", "name": "Charles Thomson Rees Wilson", "year": 1927, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Charles Thomson Rees Wilson , Physics, 1927", "wikidata_code": "Q162900", "date_of_birth": "14 February 1869", "date_of_death": "15 November 1959", "place_of_birth": "Glencorse", "place_of_death": "Carlops", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Austen_Chamberlain", "name": "Austen Chamberlain", "year": 1925, "category": "Peace", "country": "United Kingdom", "born_in": null, "text": "Austen Chamberlain , Peace, 1925", "wikidata_code": "Q188999", "date_of_birth": "16 October 1863", "date_of_death": "17 March 1937", "place_of_birth": "Birmingham", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Edward_Victor_Appleton", "name": "Edward Victor Appleton", "year": 1947, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Edward Victor Appleton , Physics, 1947", "wikidata_code": "Q153194", "date_of_birth": "6 September 1892", "date_of_death": "21 April 1965", "place_of_birth": "Bradford", "place_of_death": "Edinburgh", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Winston_Churchill", "name": "Winston Churchill", "year": 1953, "category": "Literature", "country": "United Kingdom", "born_in": null, "text": "Winston Churchill , Literature, 1953", "wikidata_code": "Q8016", "date_of_birth": "30 November 1874", "date_of_death": "24 January 1965", "place_of_birth": "Blenheim Palace", "place_of_death": "Hyde Park Gate", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hans_Adolf_Krebs", "name": "Hans Adolf Krebs", "year": 1953, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Hans Adolf Krebs ,  born in Germany , Physiology or Medicine, 1953", "wikidata_code": "Q57191", "date_of_birth": "25 August 1900", "date_of_death": "22 November 1981", "place_of_birth": "Hildesheim", "place_of_death": "Oxford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Archer_John_Porter_Martin", "name": "Archer John Porter Martin", "year": 1952, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Archer John Porter Martin , Chemistry, 1952", "wikidata_code": "Q48977", "date_of_birth": "1 March 1910", "date_of_death": "28 July 2002", "place_of_birth": "London", "place_of_death": "Llangarron", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_Laurence_Millington_Synge", "name": "Richard Laurence Millington Synge", "year": 1952, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Richard Laurence Millington Synge , Chemistry, 1952", "wikidata_code": "Q48979", "date_of_birth": "28 October 1914", "date_of_death": "18 August 1994", "place_of_birth": "Liverpool", "place_of_death": "Norwich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Cockcroft", "name": "John Cockcroft", "year": 1951, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "John Cockcroft , Physics, 1951", "wikidata_code": "Q62897", "date_of_birth": "27 May 1897", "date_of_death": "18 September 1967", "place_of_birth": "Todmorden", "place_of_death": "Churchill College", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Bertrand_Russell", "name": "Bertrand Russell", "year": 1950, "category": "Literature", "country": "United Kingdom", "born_in": null, "text": "Bertrand Russell , Literature, 1950", "wikidata_code": "Q33760", "date_of_birth": "18 May 1872", "date_of_death": "2 February 1970", "place_of_birth": "Trellech", "place_of_death": "Plas Penrhyn", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Max_Born", "name": "Max Born", "year": 1954, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Max Born ,  born in then Germany, now Poland , Physics, 1954", "wikidata_code": "Q58978", "date_of_birth": "11 December 1882", "date_of_death": "5 January 1970", "place_of_birth": "Wrocław", "place_of_death": "Göttingen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Cecil_Frank_Powell", "name": "Cecil Frank Powell", "year": 1950, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Cecil Frank Powell , Physics, 1950", "wikidata_code": "Q178103", "date_of_birth": "5 December 1903", "date_of_death": "9 August 1969", "place_of_birth": "Tonbridge", "place_of_death": "Lake Como", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Boyd_Orr", "name": "John Boyd Orr", "year": 1949, "category": "Peace", "country": "United Kingdom", "born_in": null, "text": "John Boyd Orr , Peace, 1949", "wikidata_code": "Q315143", "date_of_birth": "23 September 1880", "date_of_death": "25 June 1971", "place_of_birth": "Kilmaurs", "place_of_death": "Brechin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/T._S._Eliot", "name": "T. S. Eliot", "year": 1948, "category": "Literature", "country": "United Kingdom", "born_in": null, "text": "T. S. Eliot ,  born in the United States , Literature, 1948", "wikidata_code": "Q37767", "date_of_birth": "26 September 1888", "date_of_death": "4 January 1965", "place_of_birth": "St. Louis", "place_of_death": "Kensington", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Patrick_Blackett,_Baron_Blackett", "name": "Patrick Blackett", "year": 1948, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Patrick Blackett, Baron Blackett , Physics, 1948", "wikidata_code": "Q184499", "date_of_birth": "18 November 1897", "date_of_death": "13 July 1974", "place_of_birth": "London", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alan_Lloyd_Hodgkin", "name": "Alan Lloyd Hodgkin", "year": 1963, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Alan Lloyd Hodgkin , Physiology or Medicine, 1963", "wikidata_code": "Q193650", "date_of_birth": "5 February 1914", "date_of_death": "20 December 1998", "place_of_birth": "Banbury", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Kendrew", "name": "John Kendrew", "year": 1962, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "John Kendrew , Chemistry, 1962", "wikidata_code": "Q232295", "date_of_birth": "24 March 1917", "date_of_death": "23 August 1997", "place_of_birth": "Oxford", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Max_Perutz", "name": "Max Perutz", "year": 1962, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Max Perutz ,  born in Austria , Chemistry, 1962", "wikidata_code": "Q78480", "date_of_birth": "19 May 1914", "date_of_death": "6 February 2002", "place_of_birth": "Vienna", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Francis_Crick", "name": "Francis Crick", "year": 1962, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Francis Crick , Physiology or Medicine, 1962", "wikidata_code": "Q123280", "date_of_birth": "8 June 1916", "date_of_death": "28 July 2004", "place_of_birth": "Northampton", "place_of_death": "La Jolla", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Maurice_Wilkins", "name": "Maurice Wilkins", "year": 1962, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Maurice Wilkins ,  born in New Zealand , Physiology or Medicine, 1962", "wikidata_code": "Q184659", "date_of_birth": "15 December 1916", "date_of_death": "5 October 2004", "place_of_birth": "Pongaroa", "place_of_death": "Blackheath", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Peter_Medawar", "name": "Peter Medawar", "year": 1960, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Peter Medawar ,  born in Brazil , Physiology or Medicine, 1960", "wikidata_code": "Q214209", "date_of_birth": "28 February 1915", "date_of_death": "2 October 1987", "place_of_birth": "Rio de Janeiro", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Nikolaas_Tinbergen", "name": "Nikolaas Tinbergen", "year": 1973, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Nikolaas Tinbergen ,  born in the Netherlands , Physiology or Medicine, 1973", "wikidata_code": "Q153890", "date_of_birth": "15 April 1907", "date_of_death": "21 December 1988", "place_of_birth": "The Hague", "place_of_death": "Oxford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rodney_Robert_Porter", "name": "Rodney Robert Porter", "year": 1972, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Rodney Robert Porter , Physiology or Medicine, 1972", "wikidata_code": "Q295700", "date_of_birth": "8 October 1917", "date_of_death": "6 September 1985", "place_of_birth": "Newton-le-Willows", "place_of_death": "Winchester", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Hicks", "name": "John Hicks", "year": 1972, "category": "Economics", "country": "United Kingdom", "born_in": null, "text": "John Hicks , Economics, 1972", "wikidata_code": "Q184862", "date_of_birth": "8 April 1904", "date_of_death": "20 May 1989", "place_of_birth": "Warwick", "place_of_death": "Blockley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Dennis_Gabor", "name": "Dennis Gabor", "year": 1971, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Dennis Gabor ,  born in Hungary , Physics, 1971", "wikidata_code": "Q155786", "date_of_birth": "5 June 1900", "date_of_death": "9 February 1979", "place_of_birth": "Budapest", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Bernard_Katz", "name": "Bernard Katz", "year": 1970, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Bernard Katz ,  born in Germany , Physiology or Medicine, 1970", "wikidata_code": "Q4517", "date_of_birth": "26 March 1911", "date_of_death": "20 April 2003", "place_of_birth": "Leipzig", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Derek_Harold_Richard_Barton", "name": "Derek Harold Richard Barton", "year": 1969, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Derek Harold Richard Barton , Chemistry, 1969", "wikidata_code": "Q102419", "date_of_birth": "8 September 1918", "date_of_death": "16 March 1998", "place_of_birth": "Gravesend", "place_of_death": "College Station", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ronald_George_Wreyford_Norrish", "name": "Ronald George Wreyford Norrish", "year": 1967, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Ronald George Wreyford Norrish , Chemistry, 1967", "wikidata_code": "Q235834", "date_of_birth": "9 November 1897", "date_of_death": "7 June 1978", "place_of_birth": "Cambridge", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_Porter", "name": "George Porter", "year": 1967, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "George Porter , Chemistry, 1967", "wikidata_code": "Q106762", "date_of_birth": "6 December 1920", "date_of_death": "31 August 2002", "place_of_birth": "Stainforth", "place_of_death": "Canterbury", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Dorothy_Crowfoot_Hodgkin", "name": "Dorothy Crowfoot Hodgkin", "year": 1964, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Dorothy Crowfoot Hodgkin , Chemistry, 1964", "wikidata_code": "Q7487", "date_of_birth": "12 May 1910", "date_of_death": "29 July 1994", "place_of_birth": "Cairo", "place_of_death": "Ilmington", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Andrew_Huxley", "name": "Andrew Huxley", "year": 1963, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Andrew Huxley , Physiology or Medicine, 1963", "wikidata_code": "Q104607", "date_of_birth": "22 November 1917", "date_of_death": "30 May 2012", "place_of_birth": "Hampstead", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Philip_Noel-Baker,_Baron_Noel-Baker", "name": "Philip Noel-Baker", "year": 1959, "category": "Peace", "country": "United Kingdom", "born_in": null, "text": "Philip Noel-Baker , Peace, 1959", "wikidata_code": "Q211856", "date_of_birth": "1 November 1889", "date_of_death": "8 October 1982", "place_of_birth": "Hendon", "place_of_death": "City of Westminster", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Frederick_Sanger", "name": "Frederick Sanger", "year": 1958, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Frederick Sanger , Chemistry, 1958", "wikidata_code": "Q151564", "date_of_birth": "13 August 1918", "date_of_death": "19 November 2013", "place_of_birth": "Rendcomb", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alexander_R._Todd,_Baron_Todd", "name": "Alexander R. Todd", "year": 1957, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Alexander R. Todd, Baron Todd , Chemistry, 1957", "wikidata_code": "Q157242", "date_of_birth": "2 October 1907", "date_of_death": "10 January 1997", "place_of_birth": "Glasgow", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Cyril_Norman_Hinshelwood", "name": "Cyril Norman Hinshelwood", "year": 1956, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Cyril Norman Hinshelwood , Chemistry, 1956", "wikidata_code": "Q48986", "date_of_birth": "19 June 1897", "date_of_death": "9 October 1967", "place_of_birth": "London", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Geoffrey_Wilkinson", "name": "Geoffrey Wilkinson", "year": 1973, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Geoffrey Wilkinson , Chemistry, 1973", "wikidata_code": "Q274128", "date_of_birth": "14 July 1921", "date_of_death": "26 September 1996", "place_of_birth": "Todmorden", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Brian_David_Josephson", "name": "Brian David Josephson", "year": 1973, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Brian David Josephson , Physics, 1973", "wikidata_code": "Q181363", "date_of_birth": "4 January 1940", "place_of_birth": "Cardiff", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Cornforth", "name": "John Cornforth", "year": 1975, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "John Cornforth ,  born in Australia , Chemistry, 1975", "wikidata_code": "Q135154", "date_of_birth": "7 September 1917", "date_of_death": "8 December 2013", "place_of_birth": "Sydney", "place_of_death": "Brighton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Christian_de_Duve", "name": "Christian de Duve", "year": 1974, "category": "Physiology or Medicine", "country": null, "born_in": "United Kingdom", "text": "Christian de Duve *, Physiology or Medicine, 1974", "wikidata_code": "Q234590", "date_of_birth": "2 October 1917", "date_of_death": "4 May 2013", "place_of_birth": "Thames Ditton", "place_of_death": "Nethen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Friedrich_Hayek", "name": "Friedrich Hayek", "year": 1974, "category": "Economics", "country": "United Kingdom", "born_in": null, "text": "Friedrich Hayek ,  born in Austria , Economics, 1974", "wikidata_code": "Q1325", "date_of_birth": "8 May 1899", "date_of_death": "23 March 1992", "place_of_birth": "Vienna", "place_of_death": "Freiburg im Breisgau", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Martin_Ryle", "name": "Martin Ryle", "year": 1974, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Martin Ryle , Physics, 1974", "wikidata_code": "Q190766", "date_of_birth": "27 September 1918", "date_of_death": "14 October 1984", "place_of_birth": "Brighton", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mairead_Maguire", "name": "Mairead Corrigan", "year": 1976, "category": "Peace", "country": "United Kingdom", "born_in": null, "text": "Mairead Corrigan , Peace, 1976", "wikidata_code": "Q157655", "date_of_birth": "27 January 1944", "place_of_birth": "Belfast", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/W._Arthur_Lewis", "name": "W. Arthur Lewis", "year": 1979, "category": "Economics", "country": "United Kingdom", "born_in": null, "text": "W. Arthur Lewis ,  born on St. Lucia , Economics, 1979", "wikidata_code": "Q272519", "date_of_birth": "23 January 1915", "date_of_death": "15 June 1991", "place_of_birth": "Castries", "place_of_death": "Bridgetown", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Godfrey_Hounsfield", "name": "Godfrey Hounsfield", "year": 1979, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Godfrey Hounsfield , Physiology or Medicine, 1979", "wikidata_code": "Q273769", "date_of_birth": "28 August 1919", "date_of_death": "12 August 2004", "place_of_birth": "Sutton on Trent", "place_of_death": "Kingston upon Thames", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Peter_D._Mitchell", "name": "Peter D. Mitchell", "year": 1978, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Peter D. Mitchell , Chemistry, 1978", "wikidata_code": "Q207992", "date_of_birth": "29 September 1920", "date_of_death": "10 April 1992", "place_of_birth": "Surrey", "place_of_death": "Bodmin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_Meade", "name": "James Meade", "year": 1977, "category": "Economics", "country": "United Kingdom", "born_in": null, "text": "James Meade , Economics, 1977", "wikidata_code": "Q235843", "date_of_birth": "23 June 1907", "date_of_death": "22 December 1995", "place_of_birth": "Swanage", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Nevill_Francis_Mott", "name": "Nevill Francis Mott", "year": 1977, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Nevill Francis Mott , Physics, 1977", "wikidata_code": "Q189485", "date_of_birth": "30 September 1905", "date_of_death": "8 August 1996", "place_of_birth": "Leeds", "place_of_death": "Milton Keynes", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Frederick_Sanger", "name": "Frederick Sanger", "year": 1980, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Frederick Sanger , Chemistry, 1980", "wikidata_code": "Q151564", "date_of_birth": "13 August 1918", "date_of_death": "19 November 2013", "place_of_birth": "Rendcomb", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Betty_Williams_(Nobel_laureate)", "name": "Betty Williams", "year": 1976, "category": "Peace", "country": "United Kingdom", "born_in": null, "text": "Betty Williams , Peace, 1976", "wikidata_code": "Q157690", "date_of_birth": "22 May 1943", "date_of_death": "17 March 2020", "place_of_birth": "Belfast", "place_of_death": "Belfast", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Antony_Hewish", "name": "Antony Hewish", "year": 1974, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Antony Hewish , Physics, 1974", "wikidata_code": "Q189990", "date_of_birth": "11 May 1924", "date_of_death": "13 September 2021", "place_of_birth": "Fowey", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Patrick_White", "name": "Patrick White", "year": 1973, "category": "Literature", "country": null, "born_in": "United Kingdom", "text": "Patrick White *, Literature, 1973", "wikidata_code": "Q129187", "date_of_birth": "28 May 1912", "date_of_death": "30 September 1990", "place_of_birth": "London", "place_of_death": "Sydney", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Golding", "name": "William Golding", "year": 1983, "category": "Literature", "country": "United Kingdom", "born_in": null, "text": "William Golding , Literature, 1983", "wikidata_code": "Q44183", "date_of_birth": "19 September 1911", "date_of_death": "19 June 1993", "place_of_birth": "Newquay", "place_of_death": "Perranarworthal", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Aaron_Klug", "name": "Aaron Klug", "year": 1982, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Aaron Klug ,  born in Lithuania , Chemistry, 1982", "wikidata_code": "Q190626", "date_of_birth": "11 August 1926", "date_of_death": "20 November 2018", "place_of_birth": "Želva", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Robert_Vane", "name": "John Robert Vane", "year": 1982, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "John Robert Vane , Physiology or Medicine, 1982", "wikidata_code": "Q309971", "date_of_birth": "29 March 1927", "date_of_death": "19 November 2004", "place_of_birth": "Wythall", "place_of_death": "London Borough of Bromley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Elias_Canetti", "name": "Elias Canetti", "year": 1981, "category": "Literature", "country": "United Kingdom", "born_in": null, "text": "Elias Canetti ,  born in Bulgaria , Literature, 1981", "wikidata_code": "Q80064", "date_of_birth": "25 July 1905", "date_of_death": "14 August 1994", "place_of_birth": "Ruse", "place_of_death": "Zürich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_Trimble", "name": "David Trimble", "year": 1998, "category": "Peace", "country": "United Kingdom", "born_in": null, "text": "David Trimble , Peace, 1998", "wikidata_code": "Q192556", "date_of_birth": "15 October 1944", "date_of_death": "25 July 2022", "place_of_birth": "Belfast", "place_of_death": "Belfast", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Pople", "name": "John Pople", "year": 1998, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "John Pople , Chemistry, 1998", "wikidata_code": "Q233973", "date_of_birth": "31 October 1925", "date_of_death": "15 March 2004", "place_of_birth": "Burnham-on-Sea", "place_of_death": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_E._Walker", "name": "John E. Walker", "year": 1997, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "John E. Walker , Chemistry, 1997", "wikidata_code": "Q235184", "date_of_birth": "7 January 1941", "place_of_birth": "Halifax", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Harold_Kroto", "name": "Harold Kroto", "year": 1996, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Harold Kroto , Chemistry, 1996", "wikidata_code": "Q157250", "date_of_birth": "7 October 1939", "date_of_death": "30 April 2016", "place_of_birth": "Wisbech", "place_of_death": "Lewes", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_A._Mirrlees", "name": "James A. Mirrlees", "year": 1996, "category": "Economics", "country": "United Kingdom", "born_in": null, "text": "James A. Mirrlees , Economics, 1996", "wikidata_code": "Q176643", "date_of_birth": "5 July 1936", "date_of_death": "29 August 2018", "place_of_birth": "Minnigaff", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Joseph_Rotblat", "name": "Joseph Rotblat", "year": 1995, "category": "Peace", "country": "United Kingdom", "born_in": null, "text": "Joseph Rotblat ,  born in then Russian Empire, now Poland , Peace, 1995", "wikidata_code": "Q219982", "date_of_birth": "4 November 1908", "date_of_death": "31 August 2005", "place_of_birth": "Warsaw", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/V._S._Naipaul", "name": "V. S. Naipaul", "year": 2001, "category": "Literature", "country": "United Kingdom", "born_in": null, "text": "V. S. Naipaul ,  born in Trinidad , Literature, 2001", "wikidata_code": "Q44593", "date_of_birth": "17 August 1932", "date_of_death": "11 August 2018", "place_of_birth": "Chaguanas", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_J._Roberts", "name": "Richard J. Roberts", "year": 1993, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Richard J. Roberts , Physiology or Medicine, 1993", "wikidata_code": "Q309816", "date_of_birth": "6 September 1943", "place_of_birth": "Derby", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Michael_Smith_(chemist)", "name": "Michael Smith", "year": 1993, "category": "Chemistry", "country": null, "born_in": "United Kingdom", "text": "Michael Smith *, Chemistry, 1993", "wikidata_code": "Q232289", "date_of_birth": "26 April 1932", "date_of_death": "4 October 2000", "place_of_birth": "Blackpool", "place_of_death": "Vancouver", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ronald_Coase", "name": "Ronald Coase", "year": 1991, "category": "Economics", "country": "United Kingdom", "born_in": null, "text": "Ronald Coase ,  based in the United States , Economics, 1991", "wikidata_code": "Q188113", "date_of_birth": "29 December 1910", "date_of_death": "2 September 2013", "place_of_birth": "London", "place_of_death": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_W._Black", "name": "James W. Black", "year": 1988, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "James W. Black , Physiology or Medicine, 1988", "wikidata_code": "Q110974", "date_of_birth": "14 June 1924", "date_of_death": "22 March 2010", "place_of_birth": "Uddingston", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/C%C3%A9sar_Milstein", "name": "César Milstein", "year": 1984, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "César Milstein ,  born in Argentina , Physiology or Medicine, 1984", "wikidata_code": "Q155525", "date_of_birth": "8 October 1927", "date_of_death": "24 March 2002", "place_of_birth": "Bahía Blanca", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_Stone", "name": "Richard Stone", "year": 1984, "category": "Economics", "country": "United Kingdom", "born_in": null, "text": "Richard Stone , Economics, 1984", "wikidata_code": "Q219733", "date_of_birth": "30 August 1913", "date_of_death": "6 December 1991", "place_of_birth": "London", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Harold_Pinter", "name": "Harold Pinter", "year": 2005, "category": "Literature", "country": "United Kingdom", "born_in": null, "text": "Harold Pinter , Literature, 2005", "wikidata_code": "Q41042", "date_of_birth": "10 October 1930", "date_of_death": "24 December 2008", "place_of_birth": "London", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Clive_W._J._Granger", "name": "Clive W. J. Granger", "year": 2003, "category": "Economics", "country": "United Kingdom", "born_in": null, "text": "Clive W. J. Granger , Economics, 2003", "wikidata_code": "Q312575", "date_of_birth": "4 September 1934", "date_of_death": "27 May 2009", "place_of_birth": "Swansea", "place_of_death": "La Jolla", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Anthony_J._Leggett", "name": "Anthony J. Leggett", "year": 2003, "category": "Physics", "country": null, "born_in": "United Kingdom", "text": "Anthony J. Leggett *, Physics, 2003", "wikidata_code": "Q192718", "date_of_birth": "26 March 1938", "place_of_birth": "Camberwell", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Peter_Mansfield", "name": "Peter Mansfield", "year": 2003, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Peter Mansfield , Physiology or Medicine, 2003", "wikidata_code": "Q243601", "date_of_birth": "9 October 1933", "date_of_death": "8 February 2017", "place_of_birth": "Lambeth", "place_of_death": "Nottingham", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Sydney_Brenner", "name": "Sydney Brenner", "year": 2002, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Sydney Brenner ,  born in South Africa , Physiology or Medicine, 2002", "wikidata_code": "Q234463", "date_of_birth": "13 January 1927", "date_of_death": "5 April 2019", "place_of_birth": "Germiston", "place_of_death": "Singapore", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tomas_Lindahl", "name": "Tomas Lindahl", "year": 2015, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Tomas Lindahl ,  born in Sweden , Chemistry, 2015", "wikidata_code": "Q1886068", "date_of_birth": "28 January 1938", "place_of_birth": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_O%27Keefe_(neuroscientist)", "name": "John O'Keefe", "year": 2014, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "John O'Keefe ,  born in the United States , Physiology or Medicine, 2014", "wikidata_code": "Q1701279", "date_of_birth": "18 November 1939", "place_of_birth": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Konstantin_Novoselov", "name": "Konstantin Novoselov", "year": 2010, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Konstantin Novoselov ,  born in Russia , Physics, 2010", "wikidata_code": "Q106494", "date_of_birth": "23 August 1974", "place_of_birth": "Nizhny Tagil", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_G._Edwards", "name": "Robert G. Edwards", "year": 2010, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Robert G. Edwards , Physiology or Medicine, 2010", "wikidata_code": "Q104913", "date_of_birth": "27 September 1925", "date_of_death": "10 April 2013", "place_of_birth": "Batley", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_K._Kao", "name": "Charles K. Kao", "year": 2009, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Charles K. Kao , Physics, 2009", "wikidata_code": "Q16389", "date_of_birth": "4 November 1933", "date_of_death": "23 September 2018", "place_of_birth": "People's Republic of China", "place_of_death": "Bradbury Hospice", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Venkatraman_Ramakrishnan", "name": "Venkatraman Ramakrishnan", "year": 2009, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Venkatraman Ramakrishnan ,  born in India , Chemistry, 2009", "wikidata_code": "Q60061", "date_of_birth": "1952", "place_of_birth": "Chidambaram", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jack_W._Szostak", "name": "Jack W. Szostak", "year": 2009, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Jack W. Szostak ,  born in United Kingdom , Physiology or Medicine, 2009", "wikidata_code": "Q104600", "date_of_birth": "9 November 1952", "place_of_birth": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Doris_Lessing", "name": "Doris Lessing", "year": 2007, "category": "Literature", "country": "United Kingdom", "born_in": null, "text": "Doris Lessing ,  born in Iran , Literature, 2007", "wikidata_code": "Q40874", "date_of_birth": "22 October 1919", "date_of_death": "17 November 2013", "place_of_birth": "Kermanshah", "place_of_death": "London", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Martin_Evans", "name": "Sir Martin J. Evans", "year": 2007, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Sir Martin J. Evans , Physiology or Medicine, 2007", "wikidata_code": "Q207719", "date_of_birth": "1 January 1941", "place_of_birth": "Stroud", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Oliver_Smithies", "name": "Oliver Smithies", "year": 2007, "category": "Physiology or Medicine", "country": null, "born_in": "United Kingdom", "text": "Oliver Smithies *, Physiology or Medicine, 2007", "wikidata_code": "Q216318", "date_of_birth": "23 June 1925", "date_of_death": "10 January 2017", "place_of_birth": "Halifax", "place_of_death": "Chapel Hill", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_E._Sulston", "name": "John E. Sulston", "year": 2002, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "John E. Sulston , Physiology or Medicine, 2002", "wikidata_code": "Q271532", "date_of_birth": "27 March 1942", "date_of_death": "6 March 2018", "place_of_birth": "Fulmer", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tim_Hunt", "name": "Tim Hunt", "year": 2001, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Tim Hunt , Physiology or Medicine, 2001", "wikidata_code": "Q309977", "date_of_birth": "19 February 1943", "place_of_birth": "Neston", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_Nurse", "name": "Paul Nurse", "year": 2001, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Paul Nurse , Physiology or Medicine, 2001", "wikidata_code": "Q219716", "date_of_birth": "25 January 1949", "place_of_birth": "Norwich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Abdulrazak_Gurnah", "name": "Abdulrazak Gurnah", "year": 2021, "category": "Literature", "country": "United Kingdom", "born_in": null, "text": "Abdulrazak Gurnah ,  born in Tanzania , Literature, 2021", "wikidata_code": "Q317877", "date_of_birth": "20 December 1948", "place_of_birth": "Zanzibar City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_MacMillan", "name": "David MacMillan", "year": 2021, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "David MacMillan , Chemistry, 2021", "wikidata_code": "Q5237001", "date_of_birth": "16 March 1968", "place_of_birth": "Bellshill", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Roger_Penrose", "name": "Roger Penrose", "year": 2020, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "Roger Penrose , Physics, 2020", "wikidata_code": "Q193803", "date_of_birth": "8 August 1931", "place_of_birth": "Colchester", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Michael_Houghton_(virologist)", "name": "Michael Houghton", "year": 2020, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Michael Houghton , Physiology or Medicine, 2020", "wikidata_code": "Q1927895", "date_of_birth": "1949", "place_of_birth": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Peter_J._Ratcliffe", "name": "Peter J. Ratcliffe", "year": 2019, "category": "Physiology or Medicine", "country": "United Kingdom", "born_in": null, "text": "Peter J. Ratcliffe , Physiology or Medicine, 2019", "wikidata_code": "Q2075967", "date_of_birth": "14 May 1954", "place_of_birth": "Morecambe", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/M._Stanley_Whittingham", "name": "M. Stanley Whittingham", "year": 2019, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "M. Stanley Whittingham , Chemistry, 2019", "wikidata_code": "Q285062", "date_of_birth": "22 December 1941", "place_of_birth": "Nottingham", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Greg_Winter", "name": "Greg Winter", "year": 2018, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Greg Winter , Chemistry, 2018", "wikidata_code": "Q1545000", "date_of_birth": "14 April 1951", "place_of_birth": "Leicester", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kazuo_Ishiguro", "name": "Kazuo Ishiguro", "year": 2017, "category": "Literature", "country": "United Kingdom", "born_in": null, "text": "Kazuo Ishiguro ,  born in Japan , Literature, 2017", "wikidata_code": "Q272855", "date_of_birth": "8 November 1954", "place_of_birth": "Nagasaki", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_Henderson_(biologist)", "name": "Richard Henderson", "year": 2017, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Richard Henderson , Chemistry, 2017", "wikidata_code": "Q1678456", "date_of_birth": "19 July 1945", "place_of_birth": "Edinburgh", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Aziz_Sancar", "name": "Aziz Sancar", "year": 2015, "category": "Chemistry", "country": "Turkey", "born_in": null, "text": "Aziz Sancar , Chemistry, 2015", "wikidata_code": "Q15118973", "date_of_birth": "8 September 1946", "place_of_birth": "Savur", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Orhan_Pamuk", "name": "Orhan Pamuk", "year": 2006, "category": "Literature", "country": "Turkey", "born_in": null, "text": "Orhan Pamuk , Literature, 2006", "wikidata_code": "Q241248", "date_of_birth": "7 June 1952", "place_of_birth": "Istanbul", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Giorgos_Seferis", "name": "Giorgos Seferis", "year": 1963, "category": "Literature", "country": null, "born_in": "Turkey", "text": "Giorgos Seferis *, (born in then Ottoman Empire, now Turkey), Literature, 1963", "wikidata_code": "Q165823", "date_of_birth": "13 March 1900", "date_of_death": "20 September 1971", "place_of_birth": "Urla", "place_of_death": "Athens", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Svetlana_Alexievich", "name": "Svetlana Alexievich", "year": 2015, "category": "Literature", "country": null, "born_in": "Ukraine", "text": "Svetlana Alexievich *,  born in Ukraine , Literature, 2015", "wikidata_code": "Q274334", "date_of_birth": "31 May 1948", "place_of_birth": "Ivano-Frankivsk", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Selman_Waksman", "name": "Selman Waksman", "year": 1952, "category": "Physiology or Medicine", "country": null, "born_in": "Ukraine", "text": "Selman Waksman *,  born in Ukraine , Physiology or Medicine, 1952", "wikidata_code": "Q232308", "date_of_birth": "22 July 1888", "date_of_death": "16 August 1973", "place_of_birth": "Nova Pryluka", "place_of_death": "Woods Hole", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ilya_Ilyich_Mechnikov", "name": "Ilya Ilyich Mechnikov", "year": 1908, "category": "Physiology or Medicine", "country": "Ukraine", "born_in": null, "text": "Ilya Ilyich Mechnikov , Physiology or Medicine, 1908", "wikidata_code": "Q172254", "date_of_birth": "3 May 1845", "date_of_death": "2 July 1916", "place_of_birth": "Ivanivka", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Oliver_Hart_(economist)", "name": "Oliver Hart", "year": 2016, "category": "Economics", "country": "United Kingdom", "born_in": null, "text": "Oliver Hart , Economics, 2016", "wikidata_code": "Q432890", "date_of_birth": "9 October 1948", "place_of_birth": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fraser_Stoddart", "name": "Fraser Stoddart", "year": 2016, "category": "Chemistry", "country": "United Kingdom", "born_in": null, "text": "Fraser Stoddart , Chemistry, 2016", "wikidata_code": "Q376243", "date_of_birth": "24 May 1942", "place_of_birth": "Edinburgh", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_J._Thouless", "name": "David J. Thouless", "year": 2016, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "David J. Thouless , Physics, 2016", "wikidata_code": "Q726394", "date_of_birth": "21 September 1934", "date_of_death": "6 April 2019", "place_of_birth": "Bearsden", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/F._Duncan_M._Haldane", "name": "F. Duncan M. Haldane", "year": 2016, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "F. Duncan M. Haldane , Physics, 2016", "wikidata_code": "Q1002250", "date_of_birth": "14 September 1951", "place_of_birth": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_M._Kosterlitz", "name": "John M. Kosterlitz", "year": 2016, "category": "Physics", "country": "United Kingdom", "born_in": null, "text": "John M. Kosterlitz , Physics, 2016", "wikidata_code": "Q1700920", "date_of_birth": "22 June 1943", "place_of_birth": "Aberdeen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Angus_Deaton", "name": "Angus Deaton", "year": 2015, "category": "Economics", "country": "United Kingdom", "born_in": null, "text": "Angus Deaton , Economics, 2015", "wikidata_code": "Q204078", "date_of_birth": "19 October 1945", "place_of_birth": "Edinburgh", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Yuan_T._Lee", "name": "Yuan T. Lee", "year": 1986, "category": "Chemistry", "country": null, "born_in": "Taiwan (Republic of China)", "text": "Yuan T. Lee , Chemistry, 1986*", "wikidata_code": "Q243190", "date_of_birth": "19 November 1936", "place_of_birth": "Shinchiku City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Samuel_C._C._Ting", "name": "Samuel C. C. Ting", "year": 1976, "category": "Physics", "country": null, "born_in": "Taiwan (Republic of China)", "text": "Samuel C. C. Ting , Physics 1976*", "wikidata_code": "Q192715", "date_of_birth": "27 January 1936", "place_of_birth": "Ann Arbor", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Yang_Chen-Ning", "name": "Chen-Ning Yang", "year": 1957, "category": "Physics", "country": null, "born_in": "Taiwan (Republic of China)", "text": "Chen-Ning Yang , Physics, 1957*", "wikidata_code": "Q181369", "date_of_birth": "1 October 1922", "place_of_birth": "Hefei County", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tsung-Dao_Lee", "name": "Tsung-Dao Lee", "year": 1957, "category": "Physics", "country": null, "born_in": "Taiwan (Republic of China)", "text": "Tsung-Dao Lee , Physics, 1957*", "wikidata_code": "Q183679", "date_of_birth": "24 November 1926", "place_of_birth": "Shanghai County", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Abdulrazak_Gurnah", "name": "Abdulrazak Gurnah", "year": 2021, "category": "Literature", "country": null, "born_in": "Tanzania", "text": "Abdulrazak Gurnah *, Literature, 2021", "wikidata_code": "Q317877", "date_of_birth": "20 December 1948", "place_of_birth": "Zanzibar City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/14th_Dalai_Lama", "name": "14th Dalai Lama", "year": 1989, "category": "Peace", "country": "Tibet", "born_in": null, "text": "14th Dalai Lama , Peace, 1989", "wikidata_code": "Q17293", "date_of_birth": "6 July 1935", "place_of_birth": "Taktser", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Albert_Einstein", "name": "Albert Einstein", "year": 1921, "category": "Physics", "country": "Switzerland", "born_in": null, "text": "Albert Einstein ,  born in Germany , Physics, 1921", "wikidata_code": "Q937", "date_of_birth": "14 March 1879", "date_of_death": "18 April 1955", "place_of_birth": "Ulm", "place_of_death": "Princeton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_%C3%89douard_Guillaume", "name": "Charles Édouard Guillaume", "year": 1920, "category": "Physics", "country": "Switzerland", "born_in": null, "text": "Charles Édouard Guillaume , Physics, 1920", "wikidata_code": "Q123026", "date_of_birth": "15 February 1861", "date_of_death": "13 June 1938", "place_of_birth": "Fleurier", "place_of_death": "Sèvres", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carl_Spitteler", "name": "Carl Spitteler", "year": 1919, "category": "Literature", "country": "Switzerland", "born_in": null, "text": "Carl Spitteler , Literature, 1919", "wikidata_code": "Q226525", "date_of_birth": "24 April 1845", "date_of_death": "29 December 1924", "place_of_birth": "Liestal", "place_of_death": "Lucerne", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alfred_Werner", "name": "Alfred Werner", "year": 1913, "category": "Chemistry", "country": "Switzerland", "born_in": null, "text": "Alfred Werner , Chemistry, 1913", "wikidata_code": "Q123014", "date_of_birth": "12 December 1866", "date_of_death": "15 November 1919", "place_of_birth": "Mulhouse", "place_of_death": "Zürich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Emil_Theodor_Kocher", "name": "Theodor Kocher", "year": 1909, "category": "Physiology or Medicine", "country": "Switzerland", "born_in": null, "text": "Theodor Kocher , Physiology or Medicine, 1909", "wikidata_code": "Q115478", "date_of_birth": "25 August 1841", "date_of_death": "27 July 1917", "place_of_birth": "Bern", "place_of_death": "Bern", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/%C3%89lie_Ducommun", "name": "Élie Ducommun", "year": 1902, "category": "Peace", "country": "Switzerland", "born_in": null, "text": "Élie Ducommun , Peace, 1902", "wikidata_code": "Q122368", "date_of_birth": "19 February 1833", "date_of_death": "7 December 1906", "place_of_birth": "Geneva", "place_of_death": "Bern", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_Albert_Gobat", "name": "Charles Albert Gobat", "year": 1902, "category": "Peace", "country": "Switzerland", "born_in": null, "text": "Charles Albert Gobat , Peace, 1902", "wikidata_code": "Q179458", "date_of_birth": "21 May 1843", "date_of_death": "16 March 1914", "place_of_birth": "Tramelan", "place_of_death": "Bern", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henry_Dunant", "name": "Henry Dunant", "year": 1901, "category": "Peace", "country": "Switzerland", "born_in": null, "text": "Henry Dunant , Peace, 1901", "wikidata_code": "Q12091", "date_of_birth": "8 May 1828", "date_of_death": "30 October 1910", "place_of_birth": "Geneva", "place_of_death": "Heiden", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/V._S._Naipaul", "name": "V. S. Naipaul", "year": 2001, "category": "Literature", "country": null, "born_in": "Trinidad and Tobago", "text": "V. S. Naipaul *, Literature, 2001", "wikidata_code": "Q44593", "date_of_birth": "17 August 1932", "date_of_death": "11 August 2018", "place_of_birth": "Chaguanas", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Pierre_Agostini", "name": "Pierre Agostini", "year": 2023, "category": "Physics", "country": "Tunisia", "born_in": null, "text": "Pierre Agostini ,  born in Tunisia , Physics, 2023", "wikidata_code": "Q57020342", "date_of_birth": "23 July 1941", "place_of_birth": "Tunis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Konrad_Lorenz", "name": "Konrad Lorenz", "year": 1973, "category": "Physiology or Medicine", "country": "Austria", "born_in": null, "text": "Konrad Lorenz , Physiology or Medicine, 1973", "wikidata_code": "Q78496", "date_of_birth": "7 November 1903", "date_of_death": "27 February 1989", "place_of_birth": "Vienna", "place_of_death": "Vienna", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Karl_von_Frisch", "name": "Karl von Frisch", "year": 1973, "category": "Physiology or Medicine", "country": null, "born_in": "Austria", "text": "Karl von Frisch *, Physiology or Medicine, 1973", "wikidata_code": "Q60060", "date_of_birth": "20 November 1886", "date_of_death": "12 June 1982", "place_of_birth": "Vienna", "place_of_death": "Munich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Max_Perutz", "name": "Max Perutz", "year": 1962, "category": "Chemistry", "country": "Austria", "born_in": null, "text": "Max Perutz , Chemistry, 1962", "wikidata_code": "Q78480", "date_of_birth": "19 May 1914", "date_of_death": "6 February 2002", "place_of_birth": "Vienna", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hermann_Hesse", "name": "Hermann Hesse", "year": 1946, "category": "Literature", "country": "Switzerland", "born_in": null, "text": "Hermann Hesse ,  born in Germany , Literature, 1946", "wikidata_code": "Q25973", "date_of_birth": "2 July 1877", "date_of_death": "9 August 1962", "place_of_birth": "Calw", "place_of_death": "Montagnola", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_Karrer", "name": "Paul Karrer", "year": 1937, "category": "Chemistry", "country": "Switzerland", "born_in": null, "text": "Paul Karrer , Chemistry, 1937", "wikidata_code": "Q73093", "date_of_birth": "21 April 1889", "date_of_death": "18 June 1971", "place_of_birth": "Moscow", "place_of_death": "Zürich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Svante_Arrhenius", "name": "Svante Arrhenius", "year": 1903, "category": "Chemistry", "country": "Sweden", "born_in": null, "text": "Svante Arrhenius , Chemistry, 1903", "wikidata_code": "Q80956", "date_of_birth": "19 February 1859", "date_of_death": "2 October 1927", "place_of_birth": "Balingsta parish", "place_of_death": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Michel_Mayor", "name": "Michel Mayor", "year": 2019, "category": "Physics", "country": "Switzerland", "born_in": null, "text": "Michel Mayor , Physics, 2019", "wikidata_code": "Q123975", "date_of_birth": "12 January 1942", "place_of_birth": "Lausanne", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Didier_Queloz", "name": "Didier Queloz", "year": 2019, "category": "Physics", "country": "Switzerland", "born_in": null, "text": "Didier Queloz , Physics, 2019", "wikidata_code": "Q124013", "date_of_birth": "23 February 1966", "place_of_birth": "Lausanne", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jacques_Dubochet", "name": "Jacques Dubochet", "year": 2017, "category": "Chemistry", "country": "Switzerland", "born_in": null, "text": "Jacques Dubochet , Chemistry, 2017", "wikidata_code": "Q41585344", "date_of_birth": "8 June 1942", "place_of_birth": "Aigle", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kurt_W%C3%BCthrich", "name": "Kurt Wüthrich", "year": 2002, "category": "Chemistry", "country": "Switzerland", "born_in": null, "text": "Kurt Wüthrich , Chemistry, 2002", "wikidata_code": "Q110957", "date_of_birth": "4 October 1938", "place_of_birth": "Aarberg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rolf_M._Zinkernagel", "name": "Rolf M. Zinkernagel", "year": 1996, "category": "Physiology or Medicine", "country": "Switzerland", "born_in": null, "text": "Rolf M. Zinkernagel , Physiology or Medicine, 1996", "wikidata_code": "Q116064", "date_of_birth": "6 January 1944", "place_of_birth": "Riehen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Edmond_H._Fischer", "name": "Edmond H. Fischer", "year": 1992, "category": "Physiology or Medicine", "country": "Switzerland", "born_in": null, "text": "Edmond H. Fischer , Physiology or Medicine,1992", "wikidata_code": "Q109726", "date_of_birth": "6 April 1920", "date_of_death": "27 August 2021", "place_of_birth": "Shanghai French Concession", "place_of_death": "Seattle", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carl_Gustaf_Verner_von_Heidenstam", "name": "Carl Gustaf Verner von Heidenstam", "year": 1916, "category": "Literature", "country": "Sweden", "born_in": null, "text": "Carl Gustaf Verner von Heidenstam , Literature, 1916", "wikidata_code": "Q129173", "date_of_birth": "6 July 1859", "date_of_death": "20 May 1940", "place_of_birth": "Olshammar", "place_of_death": "Övralid", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gustaf_Dal%C3%A9n", "name": "Gustaf Dalén", "year": 1912, "category": "Physics", "country": "Sweden", "born_in": null, "text": "Gustaf Dalén , Physics, 1912", "wikidata_code": "Q160518", "date_of_birth": "30 November 1869", "date_of_death": "9 December 1937", "place_of_birth": "Q10679290", "place_of_death": "Lidingö församling", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Allvar_Gullstrand", "name": "Allvar Gullstrand", "year": 1911, "category": "Physiology or Medicine", "country": "Sweden", "born_in": null, "text": "Allvar Gullstrand , Physiology or Medicine, 1911", "wikidata_code": "Q192651", "date_of_birth": "5 June 1862", "date_of_death": "28 July 1930", "place_of_birth": "Landskrona", "place_of_death": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Selma_Lagerl%C3%B6f", "name": "Selma Lagerlöf", "year": 1909, "category": "Literature", "country": "Sweden", "born_in": null, "text": "Selma Lagerlöf , Literature, 1909", "wikidata_code": "Q44519", "date_of_birth": "20 November 1858", "date_of_death": "16 March 1940", "place_of_birth": "Östra Ämtervik church parish", "place_of_death": "Östra Ämtervik church parish", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Klas_Pontus_Arnoldson", "name": "Klas Pontus Arnoldson", "year": 1908, "category": "Peace", "country": "Sweden", "born_in": null, "text": "Klas Pontus Arnoldson , Peace, 1908", "wikidata_code": "Q192618", "date_of_birth": "27 October 1844", "date_of_death": "20 February 1916", "place_of_birth": "Göteborg City", "place_of_death": "Stockholm City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_R._Ernst", "name": "Richard R. Ernst", "year": 1991, "category": "Chemistry", "country": "Switzerland", "born_in": null, "text": "Richard R. Ernst , Chemistry, 1991", "wikidata_code": "Q122272", "date_of_birth": "14 August 1933", "date_of_death": "4 June 2021", "place_of_birth": "Winterthur", "place_of_death": "Winterthur", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Karl_Alexander_M%C3%BCller", "name": "Karl Alexander Müller", "year": 1987, "category": "Physics", "country": "Switzerland", "born_in": null, "text": "Karl Alexander Müller , Physics, 1987", "wikidata_code": "Q122298", "date_of_birth": "20 April 1927", "date_of_death": "9 January 2023", "place_of_birth": "Basel", "place_of_death": "Zürich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Heinrich_Rohrer", "name": "Heinrich Rohrer", "year": 1986, "category": "Physics", "country": "Switzerland", "born_in": null, "text": "Heinrich Rohrer , Physics, 1986", "wikidata_code": "Q123029", "date_of_birth": "6 June 1933", "date_of_death": "16 May 2013", "place_of_birth": "Buchs", "place_of_death": "Wollerau", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Werner_Arber", "name": "Werner Arber", "year": 1978, "category": "Physiology or Medicine", "country": "Switzerland", "born_in": null, "text": "Werner Arber , Physiology or Medicine, 1978", "wikidata_code": "Q115495", "date_of_birth": "3 June 1929", "place_of_birth": "Gränichen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Daniel_Bovet", "name": "Daniel Bovet", "year": 1957, "category": "Physiology or Medicine", "country": "Switzerland", "born_in": null, "text": "Daniel Bovet , Physiology or Medicine, 1957", "wikidata_code": "Q115448", "date_of_birth": "23 March 1907", "date_of_death": "8 April 1992", "place_of_birth": "Fleurier", "place_of_death": "Rome", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Felix_Bloch", "name": "Felix Bloch", "year": 1952, "category": "Physics", "country": "Switzerland", "born_in": null, "text": "Felix Bloch , Physics, 1952", "wikidata_code": "Q123022", "date_of_birth": "23 October 1905", "date_of_death": "10 September 1983", "place_of_birth": "Zürich", "place_of_death": "Zürich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tadeusz_Reichstein", "name": "Tadeusz Reichstein", "year": 1950, "category": "Physiology or Medicine", "country": "Switzerland", "born_in": null, "text": "Tadeusz Reichstein , Physiology or Medicine, 1950", "wikidata_code": "Q115490", "date_of_birth": "20 July 1897", "date_of_death": "1 August 1996", "place_of_birth": "Włocławek", "place_of_death": "Basel", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Walter_Rudolf_Hess", "name": "Walter Rudolf Hess", "year": 1949, "category": "Physiology or Medicine", "country": "Switzerland", "born_in": null, "text": "Walter Rudolf Hess , Physiology or Medicine, 1949", "wikidata_code": "Q115470", "date_of_birth": "17 March 1881", "date_of_death": "12 August 1973", "place_of_birth": "Frauenfeld", "place_of_death": "Muralto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_Hermann_M%C3%BCller", "name": "Paul Hermann Müller", "year": 1948, "category": "Physiology or Medicine", "country": "Switzerland", "born_in": null, "text": "Paul Hermann Müller , Physiology or Medicine, 1948", "wikidata_code": "Q115475", "date_of_birth": "12 January 1899", "date_of_death": "12 October 1965", "place_of_birth": "Olten", "place_of_death": "Basel", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Arne_Tiselius", "name": "Arne Tiselius", "year": 1948, "category": "Chemistry", "country": "Sweden", "born_in": null, "text": "Arne Tiselius , Chemistry, 1948", "wikidata_code": "Q233026", "date_of_birth": "10 August 1902", "date_of_death": "29 October 1971", "place_of_birth": "Stockholm", "place_of_death": "Uppsala", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Erik_Axel_Karlfeldt", "name": "Erik Axel Karlfeldt", "year": 1931, "category": "Literature", "country": "Sweden", "born_in": null, "text": "Erik Axel Karlfeldt , Literature, 1931 (posthumously)", "wikidata_code": "Q134641", "date_of_birth": "20 July 1864", "date_of_death": "8 April 1931", "place_of_birth": "Folkärna", "place_of_death": "Engelbrekt church parish", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Nathan_S%C3%B6derblom", "name": "Nathan Söderblom", "year": 1930, "category": "Peace", "country": "Sweden", "born_in": null, "text": "Nathan Söderblom , Peace, 1930", "wikidata_code": "Q159723", "date_of_birth": "15 January 1866", "date_of_death": "12 July 1931", "place_of_birth": "Trönö", "place_of_death": "Uppsala", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hans_von_Euler-Chelpin", "name": "Hans von Euler-Chelpin", "year": 1929, "category": "Chemistry", "country": "Sweden", "born_in": null, "text": "Hans von Euler-Chelpin ,  born in Germany , Chemistry, 1929", "wikidata_code": "Q76613", "date_of_birth": "15 February 1873", "date_of_death": "6 November 1964", "place_of_birth": "Augsburg", "place_of_death": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Theodor_Svedberg", "name": "Theodor Svedberg", "year": 1926, "category": "Chemistry", "country": "Sweden", "born_in": null, "text": "Theodor Svedberg , Chemistry, 1926", "wikidata_code": "Q186391", "date_of_birth": "30 August 1884", "date_of_death": "25 February 1971", "place_of_birth": "Valbo", "place_of_death": "Örebro", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Sune_Bergstr%C3%B6m", "name": "Sune Bergström", "year": 1982, "category": "Physiology or Medicine", "country": "Sweden", "born_in": null, "text": "Sune Bergström , Physiology or Medicine, 1982", "wikidata_code": "Q295696", "date_of_birth": "10 January 1916", "date_of_death": "15 August 2004", "place_of_birth": "Stockholm", "place_of_death": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Bengt_I._Samuelsson", "name": "Bengt I. Samuelsson", "year": 1982, "category": "Physiology or Medicine", "country": "Sweden", "born_in": null, "text": "Bengt I. Samuelsson , Physiology or Medicine, 1982", "wikidata_code": "Q295768", "date_of_birth": "21 May 1934", "place_of_birth": "Halmstad", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kai_Siegbahn", "name": "Kai Siegbahn", "year": 1981, "category": "Physics", "country": "Sweden", "born_in": null, "text": "Kai Siegbahn , Physics, 1981", "wikidata_code": "Q192712", "date_of_birth": "20 April 1918", "date_of_death": "20 July 2007", "place_of_birth": "Lund", "place_of_death": "Ängelholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Torsten_Wiesel", "name": "Torsten Wiesel", "year": 1981, "category": "Physiology or Medicine", "country": "Sweden", "born_in": null, "text": "Torsten Wiesel , Physiology or Medicine, 1981", "wikidata_code": "Q271421", "date_of_birth": "3 June 1924", "place_of_birth": "Uppsala", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Bertil_Ohlin", "name": "Bertil Ohlin", "year": 1977, "category": "Economics", "country": "Sweden", "born_in": null, "text": "Bertil Ohlin , Economics, 1977", "wikidata_code": "Q179493", "date_of_birth": "23 April 1899", "date_of_death": "3 August 1979", "place_of_birth": "Parish of Klippan", "place_of_death": "Parish of Undersåker", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Eyvind_Johnson", "name": "Eyvind Johnson", "year": 1974, "category": "Literature", "country": "Sweden", "born_in": null, "text": "Eyvind Johnson , Literature, 1974", "wikidata_code": "Q131326", "date_of_birth": "29 July 1900", "date_of_death": "25 August 1976", "place_of_birth": "Boden", "place_of_death": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Harry_Martinson", "name": "Harry Martinson", "year": 1974, "category": "Literature", "country": "Sweden", "born_in": null, "text": "Harry Martinson , Literature, 1974", "wikidata_code": "Q132695", "date_of_birth": "6 May 1904", "date_of_death": "11 February 1978", "place_of_birth": "Blekinge", "place_of_death": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gunnar_Myrdal", "name": "Gunnar Myrdal", "year": 1974, "category": "Economics", "country": "Sweden", "born_in": null, "text": "Gunnar Myrdal , Economics, 1974", "wikidata_code": "Q152452", "date_of_birth": "6 December 1898", "date_of_death": "17 May 1987", "place_of_birth": "Skattunge Parish", "place_of_death": "Danderyd", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ulf_von_Euler", "name": "Ulf von Euler", "year": 1970, "category": "Physiology or Medicine", "country": "Sweden", "born_in": null, "text": "Ulf von Euler , Physiology or Medicine, 1970", "wikidata_code": "Q237142", "date_of_birth": "7 February 1905", "date_of_death": "9 March 1983", "place_of_birth": "Stockholm", "place_of_death": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hannes_Alfv%C3%A9n", "name": "Hannes Alfvén", "year": 1970, "category": "Physics", "country": "Sweden", "born_in": null, "text": "Hannes Alfvén , Physics, 1970", "wikidata_code": "Q54945", "date_of_birth": "30 May 1908", "date_of_death": "2 April 1995", "place_of_birth": "Norrköping", "place_of_death": "Danderyd", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ragnar_Granit", "name": "Ragnar Granit", "year": 1967, "category": "Physiology or Medicine", "country": "Sweden", "born_in": null, "text": "Ragnar Granit ,  born in the Grand Duchy of Finland, then a part of Russia , Physiology or Medicine, 1967", "wikidata_code": "Q217722", "date_of_birth": "30 October 1900", "date_of_death": "12 March 1991", "place_of_birth": "Riihimäki", "place_of_death": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Nelly_Sachs", "name": "Nelly Sachs", "year": 1966, "category": "Literature", "country": "Sweden", "born_in": null, "text": "Nelly Sachs ,  born in Germany , Literature, 1966", "wikidata_code": "Q57074", "date_of_birth": "10 December 1891", "date_of_death": "12 May 1970", "place_of_birth": "Schöneberg", "place_of_death": "Stockholm", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Dag_Hammarskj%C3%B6ld", "name": "Dag Hammarskjöld", "year": 1961, "category": "Peace", "country": "Sweden", "born_in": null, "text": "Dag Hammarskjöld , Peace, 1961 (posthumously)", "wikidata_code": "Q1267", "date_of_birth": "29 July 1905", "date_of_death": "18 September 1961", "place_of_birth": "Jönköping", "place_of_death": "Ndola", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hugo_Theorell", "name": "Hugo Theorell", "year": 1955, "category": "Physiology or Medicine", "country": "Sweden", "born_in": null, "text": "Hugo Theorell , Physiology or Medicine, 1955", "wikidata_code": "Q156480", "date_of_birth": "6 July 1903", "date_of_death": "15 August 1982", "place_of_birth": "Linköping", "place_of_death": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/P%C3%A4r_Lagerkvist", "name": "Pär Lagerkvist", "year": 1951, "category": "Literature", "country": "Sweden", "born_in": null, "text": "Pär Lagerkvist , Literature, 1951", "wikidata_code": "Q93137", "date_of_birth": "23 May 1891", "date_of_death": "11 July 1974", "place_of_birth": "Växjö", "place_of_death": "Danderyd", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Karl_Manne_Siegbahn", "name": "Karl Manne Siegbahn", "year": 1924, "category": "Physics", "country": "Sweden", "born_in": null, "text": "Karl Manne Siegbahn , Physics, 1924", "wikidata_code": "Q170741", "date_of_birth": "3 December 1886", "date_of_death": "26 September 1978", "place_of_birth": "Örebro", "place_of_death": "Engelbrekt church parish", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hjalmar_Branting", "name": "Hjalmar Branting", "year": 1921, "category": "Peace", "country": "Sweden", "born_in": null, "text": "Hjalmar Branting , Peace, 1921", "wikidata_code": "Q53620", "date_of_birth": "23 November 1860", "date_of_death": "24 February 1925", "place_of_birth": "Klara Church Parish", "place_of_death": "Stockholm City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_Kuhn", "name": "Richard Kuhn", "year": 1938, "category": "Chemistry", "country": null, "born_in": "Austria", "text": "Richard Kuhn *, Chemistry, 1938", "wikidata_code": "Q78483", "date_of_birth": "3 December 1900", "date_of_death": "31 July 1967", "place_of_birth": "Vienna", "place_of_death": "Heidelberg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Otto_Loewi", "name": "Otto Loewi", "year": 1936, "category": "Physiology or Medicine", "country": "Austria", "born_in": null, "text": "Otto Loewi ,  born in Germany , Physiology or Medicine, 1936", "wikidata_code": "Q77173", "date_of_birth": "3 June 1873", "date_of_death": "25 December 1961", "place_of_birth": "Frankfurt", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Victor_Francis_Hess", "name": "Victor Francis Hess", "year": 1936, "category": "Physics", "country": "Austria", "born_in": null, "text": "Victor Francis Hess , Physics, 1936", "wikidata_code": "Q78520", "date_of_birth": "24 June 1883", "date_of_death": "17 December 1964", "place_of_birth": "Schloss Waldstein", "place_of_death": "Mount Vernon", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Erwin_Schr%C3%B6dinger", "name": "Erwin Schrödinger", "year": 1933, "category": "Physics", "country": "Austria", "born_in": null, "text": "Erwin Schrödinger , Physics, 1933", "wikidata_code": "Q9130", "date_of_birth": "12 August 1887", "date_of_death": "4 January 1961", "place_of_birth": "Vienna", "place_of_death": "Vienna", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Karl_Landsteiner", "name": "Karl Landsteiner", "year": 1930, "category": "Physiology or Medicine", "country": "Austria", "born_in": null, "text": "Karl Landsteiner , Physiology or Medicine, 1930", "wikidata_code": "Q84405", "date_of_birth": "14 June 1868", "date_of_death": "26 June 1943", "place_of_birth": "Vienna", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Julius_Wagner-Jauregg", "name": "Julius Wagner-Jauregg", "year": 1927, "category": "Physiology or Medicine", "country": "Austria", "born_in": null, "text": "Julius Wagner-Jauregg , Physiology or Medicine, 1927", "wikidata_code": "Q78479", "date_of_birth": "7 March 1857", "date_of_death": "27 September 1940", "place_of_birth": "Wels", "place_of_death": "Vienna", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Svante_P%C3%A4%C3%A4bo", "name": "Svante Pääbo", "year": 2022, "category": "Physiology or Medicine", "country": "Sweden", "born_in": null, "text": "Svante Pääbo , Physiology or Medicine, 2022", "wikidata_code": "Q170342", "date_of_birth": "20 April 1955", "place_of_birth": "Oscar Parish", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tomas_Lindahl", "name": "Tomas Lindahl", "year": 2015, "category": "Chemistry", "country": "Sweden", "born_in": null, "text": "Tomas Lindahl , Chemistry, 2015", "wikidata_code": "Q1886068", "date_of_birth": "28 January 1938", "place_of_birth": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tomas_Transtr%C3%B6mer", "name": "Tomas Tranströmer", "year": 2011, "category": "Literature", "country": "Sweden", "born_in": null, "text": "Tomas Tranströmer , Literature, 2011", "wikidata_code": "Q42122", "date_of_birth": "15 April 1931", "date_of_death": "26 March 2015", "place_of_birth": "Stockholm", "place_of_death": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Arvid_Carlsson", "name": "Arvid Carlsson", "year": 2000, "category": "Physiology or Medicine", "country": "Sweden", "born_in": null, "text": "Arvid Carlsson , Physiology or Medicine, 2000", "wikidata_code": "Q298045", "date_of_birth": "25 January 1923", "date_of_death": "29 June 2018", "place_of_birth": "Uppsala", "place_of_death": "Gothenburg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alva_Myrdal", "name": "Alva Myrdal", "year": 1982, "category": "Peace", "country": "Sweden", "born_in": null, "text": "Alva Myrdal , Peace, 1982", "wikidata_code": "Q152437", "date_of_birth": "31 January 1902", "date_of_death": "1 February 1986", "place_of_birth": "Uppsala Cathedral Assembly", "place_of_death": "Danderyd", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Max_Theiler", "name": "Max Theiler", "year": 1951, "category": "Physiology or Medicine", "country": "South Africa", "born_in": null, "text": "Max Theiler , Physiology or Medicine, 1951", "wikidata_code": "Q46928", "date_of_birth": "30 January 1899", "date_of_death": "11 August 1972", "place_of_birth": "Pretoria", "place_of_death": "New Haven", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kim_Dae-jung", "name": "Kim Dae-jung", "year": 2000, "category": "Peace", "country": "South Korea", "born_in": null, "text": "Kim Dae-jung , Peace, 2000", "wikidata_code": "Q45785", "date_of_birth": "6 January 1924", "date_of_death": "18 August 2009", "place_of_birth": "Hauido", "place_of_death": "Severance Hospital", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mario_Vargas_Llosa", "name": "Mario Vargas Llosa", "year": 2010, "category": "Literature", "country": "Spain", "born_in": null, "text": "Mario Vargas Llosa ,  born in Peru , Literature, 2010", "wikidata_code": "Q39803", "date_of_birth": "28 March 1936", "place_of_birth": "Arequipa", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Camilo_Jos%C3%A9_Cela", "name": "Camilo José Cela", "year": 1989, "category": "Literature", "country": "Spain", "born_in": null, "text": "Camilo José Cela , Literature, 1989", "wikidata_code": "Q132589", "date_of_birth": "11 May 1916", "date_of_death": "17 January 2002", "place_of_birth": "Iria Flavia", "place_of_death": "Madrid", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Nelson_Mandela", "name": "Nelson Mandela", "year": 1993, "category": "Peace", "country": "South Africa", "born_in": null, "text": "Nelson Mandela , Peace, 1993", "wikidata_code": "Q8023", "date_of_birth": "18 July 1918", "date_of_death": "5 December 2013", "place_of_birth": "Mvezo", "place_of_death": "Houghton Estate", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Nadine_Gordimer", "name": "Nadine Gordimer", "year": 1991, "category": "Literature", "country": "South Africa", "born_in": null, "text": "Nadine Gordimer , Literature, 1991", "wikidata_code": "Q47619", "date_of_birth": "20 November 1923", "date_of_death": "13 July 2014", "place_of_birth": "Springs", "place_of_death": "Johannesburg", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Desmond_Tutu", "name": "Desmond Tutu", "year": 1984, "category": "Peace", "country": "South Africa", "born_in": null, "text": "Desmond Tutu , Peace, 1984", "wikidata_code": "Q43033", "date_of_birth": "7 October 1931", "date_of_death": "26 December 2021", "place_of_birth": "Klerksdorp", "place_of_death": "Cape Town", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Aaron_Klug", "name": "Aaron Klug", "year": 1982, "category": "Chemistry", "country": null, "born_in": "South Africa", "text": "Aaron Klug *, Chemistry, 1982", "wikidata_code": "Q190626", "date_of_birth": "11 August 1926", "date_of_death": "20 November 2018", "place_of_birth": "Želva", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Allan_McLeod_Cormack", "name": "Allan M. Cormack", "year": 1979, "category": "Physiology or Medicine", "country": null, "born_in": "South Africa", "text": "Allan M. Cormack *, Physiology or Medicine, 1979", "wikidata_code": "Q223542", "date_of_birth": "23 February 1924", "date_of_death": "7 May 1998", "place_of_birth": "Johannesburg", "place_of_death": "Winchester", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Albert_Lutuli", "name": "Albert Lutuli", "year": 1960, "category": "Peace", "country": "South Africa", "born_in": null, "text": "Albert Lutuli ,  born in then Rhodesia, now Zimbabwe , Peace, 1960", "wikidata_code": "Q212955", "date_of_birth": "1898", "date_of_death": "21 July 1967", "place_of_birth": "Bulawayo", "place_of_death": "KwaDukuza", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Vicente_Aleixandre", "name": "Vicente Aleixandre", "year": 1977, "category": "Literature", "country": "Spain", "born_in": null, "text": "Vicente Aleixandre , Literature, 1977", "wikidata_code": "Q134644", "date_of_birth": "26 April 1898", "date_of_death": "14 December 1984", "place_of_birth": "Seville", "place_of_death": "Madrid", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Severo_Ochoa", "name": "Severo Ochoa", "year": 1959, "category": "Physiology or Medicine", "country": null, "born_in": "Spain", "text": "Severo Ochoa *, Physiology or Medicine, 1959", "wikidata_code": "Q233957", "date_of_birth": "24 September 1905", "date_of_death": "1 November 1993", "place_of_birth": "Ḷḷuarca", "place_of_death": "Madrid", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Juan_Ram%C3%B3n_Jim%C3%A9nez", "name": "Juan Ramón Jiménez", "year": 1956, "category": "Literature", "country": "Spain", "born_in": null, "text": "Juan Ramón Jiménez , Literature, 1956", "wikidata_code": "Q131318", "date_of_birth": "23 December 1881", "date_of_death": "29 May 1958", "place_of_birth": "Moguer", "place_of_death": "San Juan", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jacinto_Benavente", "name": "Jacinto Benavente", "year": 1922, "category": "Literature", "country": "Spain", "born_in": null, "text": "Jacinto Benavente , Literature, 1922", "wikidata_code": "Q83184", "date_of_birth": "12 August 1866", "date_of_death": "14 July 1954", "place_of_birth": "Madrid", "place_of_death": "Málaga", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Santiago_Ram%C3%B3n_y_Cajal", "name": "Santiago Ramón y Cajal", "year": 1906, "category": "Physiology or Medicine", "country": "Spain", "born_in": null, "text": "Santiago Ramón y Cajal , Physiology or Medicine, 1906", "wikidata_code": "Q150526", "date_of_birth": "1 May 1852", "date_of_death": "17 October 1934", "place_of_birth": "Petilla de Aragón", "place_of_death": "Madrid", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jos%C3%A9_Echegaray", "name": "José Echegaray", "year": 1904, "category": "Literature", "country": "Spain", "born_in": null, "text": "José Echegaray , Literature, 1904", "wikidata_code": "Q127349", "date_of_birth": "19 April 1832", "date_of_death": "14 September 1916", "place_of_birth": "Madrid", "place_of_death": "Madrid", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Anne_L%27Huillier", "name": "Anne L'Huillier", "year": 2023, "category": "Physics", "country": "Sweden", "born_in": null, "text": "Anne L'Huillier ,  born in France , Physics, 2023", "wikidata_code": "Q565544", "date_of_birth": "16 August 1958", "place_of_birth": "Paris", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/F._W._de_Klerk", "name": "F. W. de Klerk", "year": 1993, "category": "Peace", "country": "South Africa", "born_in": null, "text": "F. W. de Klerk , Peace, 1993", "wikidata_code": "Q151813", "date_of_birth": "18 March 1936", "date_of_death": "11 November 2021", "place_of_birth": "Johannesburg", "place_of_death": "Cape Town", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ivan_Bunin", "name": "Ivan Bunin", "year": 1933, "category": "Literature", "country": null, "born_in": "Russia and Soviet Union", "text": "Ivan Bunin *, Literature, 1933", "wikidata_code": "Q46602", "date_of_birth": "22 October 1870", "date_of_death": "8 November 1953", "place_of_birth": "Voronezh", "place_of_death": "16th arrondissement of Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/%C3%89lie_Metchnikoff", "name": "Élie Metchnikoff", "year": 1908, "category": "Physiology or Medicine", "country": "Russia and Soviet Union", "born_in": null, "text": "Élie Metchnikoff ,  born in now Ukraine , Physiology or Medicine, 1908", "wikidata_code": "Q172254", "date_of_birth": "3 May 1845", "date_of_death": "2 July 1916", "place_of_birth": "Ivanivka", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ivan_Pavlov", "name": "Ivan Pavlov", "year": 1904, "category": "Physiology or Medicine", "country": "Russia and Soviet Union", "born_in": null, "text": "Ivan Pavlov , Physiology or Medicine, 1904", "wikidata_code": "Q42985", "date_of_birth": "14 September 1849", "date_of_death": "27 February 1936", "place_of_birth": "Ryazan", "place_of_death": "Leningrad", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Aleksandr_Solzhenitsyn", "name": "Aleksandr Solzhenitsyn", "year": 1970, "category": "Literature", "country": "Russia and Soviet Union", "born_in": null, "text": "Aleksandr Solzhenitsyn , Literature, 1970", "wikidata_code": "Q34474", "date_of_birth": "11 December 1918", "date_of_death": "3 August 2008", "place_of_birth": "Kislovodsk", "place_of_death": "Moscow", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mikhail_Sholokhov", "name": "Mikhail Sholokhov", "year": 1965, "category": "Literature", "country": "Russia and Soviet Union", "born_in": null, "text": "Mikhail Sholokhov , Literature, 1965", "wikidata_code": "Q42398", "date_of_birth": "11 May 1905", "date_of_death": "21 February 1984", "place_of_birth": "Kruzhilin", "place_of_death": "Vyoshenskaya", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Nikolay_Basov", "name": "Nikolay Basov", "year": 1964, "category": "Physics", "country": "Russia and Soviet Union", "born_in": null, "text": "Nikolay Basov , Physics, 1964", "wikidata_code": "Q83557", "date_of_birth": "14 December 1922", "date_of_death": "1 July 2001", "place_of_birth": "Usman", "place_of_death": "Moscow", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alexander_Prokhorov", "name": "Alexander Prokhorov", "year": 1964, "category": "Physics", "country": "Russia and Soviet Union", "born_in": null, "text": "Alexander Prokhorov ,  born in Australia , Physics, 1964", "wikidata_code": "Q83552", "date_of_birth": "11 July 1916", "date_of_death": "8 January 2002", "place_of_birth": "Atherton", "place_of_death": "Moscow", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Lev_Landau", "name": "Lev Landau", "year": 1962, "category": "Physics", "country": "Russia and Soviet Union", "born_in": null, "text": "Lev Landau ,  born in then Russian Empire, now Azerbaijan, laureate when citizen of the Soviet Union , Physics, 1962", "wikidata_code": "Q133267", "date_of_birth": "22 January 1908", "date_of_death": "1 April 1968", "place_of_birth": "Baku", "place_of_death": "Moscow", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Boris_Pasternak", "name": "Boris Pasternak", "year": 1958, "category": "Literature", "country": "Russia and Soviet Union", "born_in": null, "text": "Boris Pasternak , Literature, 1958 (forced to decline)", "wikidata_code": "Q41223", "date_of_birth": "10 February 1890", "date_of_death": "30 May 1960", "place_of_birth": "Moscow", "place_of_death": "Peredelkino", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Pavel_Cherenkov", "name": "Pavel Cherenkov", "year": 1958, "category": "Physics", "country": "Russia and Soviet Union", "born_in": null, "text": "Pavel Cherenkov , Physics, 1958", "wikidata_code": "Q76970", "date_of_birth": "28 July 1904", "date_of_death": "6 January 1990", "place_of_birth": "Novaya Chigla", "place_of_death": "Moscow", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Igor_Tamm", "name": "Igor Tamm", "year": 1958, "category": "Physics", "country": "Russia and Soviet Union", "born_in": null, "text": "Igor Tamm , Physics, 1958", "wikidata_code": "Q155759", "date_of_birth": "8 July 1895", "date_of_death": "12 April 1971", "place_of_birth": "Vladivostok", "place_of_death": "Moscow", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ilya_Frank", "name": "Ilya Mikhailovich Frank", "year": 1958, "category": "Physics", "country": "Russia and Soviet Union", "born_in": null, "text": "Ilya Mikhailovich Frank , Physics, 1958", "wikidata_code": "Q192703", "date_of_birth": "10 October 1908", "date_of_death": "22 June 1990", "place_of_birth": "Saint Petersburg", "place_of_death": "Moscow", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Nikolay_Semyonov", "name": "Nikolay Semyonov", "year": 1956, "category": "Chemistry", "country": "Russia and Soviet Union", "born_in": null, "text": "Nikolay Semyonov , Chemistry, 1956", "wikidata_code": "Q48990", "date_of_birth": "3 April 1896", "date_of_death": "25 September 1986", "place_of_birth": "Saratov", "place_of_death": "Moscow", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Derek_Walcott", "name": "Derek Walcott", "year": 1992, "category": "Literature", "country": "Saint Lucia", "born_in": null, "text": "Derek Walcott , Literature, 1992", "wikidata_code": "Q132701", "date_of_birth": "23 January 1930", "date_of_death": "17 March 2017", "place_of_birth": "Castries", "place_of_death": "Cap Estate", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/W._Arthur_Lewis", "name": "W. Arthur Lewis", "year": 1979, "category": "Economics", "country": null, "born_in": "Saint Lucia", "text": "W. Arthur Lewis *, Economics, 1979", "wikidata_code": "Q272519", "date_of_birth": "23 January 1915", "date_of_death": "15 June 1991", "place_of_birth": "Castries", "place_of_death": "Bridgetown", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fritz_Pregl", "name": "Friderik Pregl", "year": 1923, "category": "Chemistry", "country": null, "born_in": "Slovenia", "text": "Friderik Pregl *,  born in  Austria-Hungary , now  Slovenia , Chemistry, 1923", "wikidata_code": "Q78482", "date_of_birth": "3 September 1869", "date_of_death": "13 December 1930", "place_of_birth": "Ljubljana", "place_of_death": "Graz", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Michael_Levitt", "name": "Michael Levitt", "year": 2013, "category": "Chemistry", "country": null, "born_in": "South Africa", "text": "Michael Levitt *, Chemistry, 2013", "wikidata_code": "Q6832227", "date_of_birth": "9 May 1947", "place_of_birth": "Pretoria", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/J._M._Coetzee", "name": "J. M. Coetzee", "year": 2003, "category": "Literature", "country": "South Africa", "born_in": null, "text": "J. M. Coetzee , Literature, 2003", "wikidata_code": "Q43293", "date_of_birth": "9 February 1940", "place_of_birth": "Cape Town", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Sydney_Brenner", "name": "Sydney Brenner", "year": 2002, "category": "Physiology or Medicine", "country": null, "born_in": "South Africa", "text": "Sydney Brenner *, Physiology or Medicine, 2002", "wikidata_code": "Q234463", "date_of_birth": "13 January 1927", "date_of_death": "5 April 2019", "place_of_birth": "Germiston", "place_of_death": "Singapore", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alfred_Hermann_Fried", "name": "Alfred Hermann Fried", "year": 1911, "category": "Peace", "country": "Austria", "born_in": null, "text": "Alfred Hermann Fried , Peace, 1911", "wikidata_code": "Q78488", "date_of_birth": "11 November 1864", "date_of_death": "5 May 1921", "place_of_birth": "Vienna", "place_of_death": "Vienna", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Bertha_von_Suttner", "name": "Bertha von Suttner", "year": 1905, "category": "Peace", "country": "Austria", "born_in": null, "text": "Bertha von Suttner ,  born in the Austrian Empire, now Czech Republic , Peace, 1905", "wikidata_code": "Q18456", "date_of_birth": "9 June 1843", "date_of_death": "21 June 1914", "place_of_birth": "Prague", "place_of_death": "Vienna", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Menachem_Begin", "name": "Menachem Begin", "year": 1978, "category": "Peace", "country": null, "born_in": "Russia and Soviet Union", "text": "Menachem Begin *,  as an  Israeli  citizen , Peace, 1978", "wikidata_code": "Q130873", "date_of_birth": "16 August 1913", "date_of_death": "9 March 1992", "place_of_birth": "Brest", "place_of_death": "Tel Aviv", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ilya_Prigogine", "name": "Ilya Prigogine", "year": 1977, "category": "Chemistry", "country": null, "born_in": "Russia and Soviet Union", "text": "Ilya Prigogine *, Chemistry, 1977", "wikidata_code": "Q183509", "date_of_birth": "12 January 1917", "date_of_death": "28 May 2003", "place_of_birth": "Moscow", "place_of_death": "Brussels metropolitan area", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Andrei_Sakharov", "name": "Andrei Sakharov", "year": 1975, "category": "Peace", "country": "Russia and Soviet Union", "born_in": null, "text": "Andrei Sakharov , Peace, 1975", "wikidata_code": "Q997", "date_of_birth": "21 May 1921", "date_of_death": "14 December 1989", "place_of_birth": "Moscow", "place_of_death": "Moscow", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Joseph_Brodsky", "name": "Joseph Brodsky", "year": 1987, "category": "Literature", "country": "Russia and Soviet Union", "born_in": null, "text": "Joseph Brodsky , born in Russia, Literature, 1987", "wikidata_code": "Q862", "date_of_birth": "24 May 1940", "date_of_death": "28 January 1996", "place_of_birth": "Saint Petersburg", "place_of_death": "Brooklyn", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alexei_Alexeyevich_Abrikosov", "name": "Alexei Alexeyevich Abrikosov", "year": 2003, "category": "Physics", "country": null, "born_in": "Russia and Soviet Union", "text": "Alexei Alexeyevich Abrikosov *, Physics, 2003", "wikidata_code": "Q188128", "date_of_birth": "25 June 1928", "date_of_death": "29 March 2017", "place_of_birth": "Moscow", "place_of_death": "Palo Alto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Vitaly_Ginzburg", "name": "Vitaly Ginzburg", "year": 2003, "category": "Physics", "country": "Russia and Soviet Union", "born_in": null, "text": "Vitaly Ginzburg , Physics, 2003", "wikidata_code": "Q104668", "date_of_birth": "21 September 1916", "date_of_death": "8 November 2009", "place_of_birth": "Moscow", "place_of_death": "Moscow", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Zhores_Alferov", "name": "Zhores Alferov", "year": 2000, "category": "Physics", "country": "Russia and Soviet Union", "born_in": null, "text": "Zhores Alferov ,  born in then Soviet Union, now Belarus , Physics, 2000", "wikidata_code": "Q183279", "date_of_birth": "15 March 1930", "date_of_death": "1 March 2019", "place_of_birth": "Vitebsk", "place_of_death": "Saint Petersburg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mikhail_Gorbachev", "name": "Mikhail Gorbachev", "year": 1990, "category": "Peace", "country": "Russia and Soviet Union", "born_in": null, "text": "Mikhail Gorbachev , Peace, 1990", "wikidata_code": "Q30487", "date_of_birth": "2 March 1931", "date_of_death": "30 August 2022", "place_of_birth": "Privolnoye", "place_of_death": "Central Clinical Hospital", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Pyotr_Kapitsa", "name": "Pyotr Kapitsa", "year": 1978, "category": "Physics", "country": "Russia and Soviet Union", "born_in": null, "text": "Pyotr Kapitsa , Physics, 1978", "wikidata_code": "Q172844", "date_of_birth": "26 June 1894", "date_of_death": "8 April 1984", "place_of_birth": "Kronstadt", "place_of_death": "Moscow", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Leonid_Kantorovich", "name": "Leonid Kantorovich", "year": 1975, "category": "Economics", "country": "Russia and Soviet Union", "born_in": null, "text": "Leonid Kantorovich , Economics, 1975", "wikidata_code": "Q107441", "date_of_birth": "19 January 1912", "date_of_death": "7 April 1986", "place_of_birth": "Saint Petersburg", "place_of_death": "Moscow", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Simon_Kuznets", "name": "Simon Kuznets", "year": 1971, "category": "Economics", "country": "Russia and Soviet Union", "born_in": null, "text": "Simon Kuznets , now Belarus, Economics, 1971", "wikidata_code": "Q192577", "date_of_birth": "30 April 1901", "date_of_death": "8 July 1985", "place_of_birth": "Pinsk", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Muhammad_Yunus", "name": "Muhammad Yunus", "year": 2006, "category": "Peace", "country": "Bangladesh", "born_in": null, "text": "Muhammad Yunus , Peace, 2006", "wikidata_code": "Q43969", "date_of_birth": "28 June 1940", "place_of_birth": "Chittagong", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Stefan_Hell", "name": "Stefan Hell", "year": 2014, "category": "Chemistry", "country": null, "born_in": "Romania", "text": "Stefan Hell *, Chemistry, 2014", "wikidata_code": "Q91410", "date_of_birth": "23 December 1962", "place_of_birth": "Arad", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Herta_M%C3%BCller", "name": "Herta Müller", "year": 2009, "category": "Literature", "country": null, "born_in": "Romania", "text": "Herta Müller *, Literature, 2009", "wikidata_code": "Q38049", "date_of_birth": "17 August 1953", "place_of_birth": "Nițchidorf", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Elie_Wiesel", "name": "Elie Wiesel", "year": 1986, "category": "Peace", "country": null, "born_in": "Romania", "text": "Elie Wiesel *, Peace, 1986", "wikidata_code": "Q18391", "date_of_birth": "30 September 1928", "date_of_death": "2 July 2016", "place_of_birth": "Sighetu Marmației", "place_of_death": "Manhattan", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_Emil_Palade", "name": "George E. Palade", "year": 1974, "category": "Physiology or Medicine", "country": null, "born_in": "Romania", "text": "George E. Palade *, Physiology or Medicine, 1974", "wikidata_code": "Q219718", "date_of_birth": "19 November 1912", "date_of_death": "7 October 2008", "place_of_birth": "Iași", "place_of_death": "Del Mar", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alexey_Ekimov", "name": "Alexei Ekimov", "year": 2023, "category": "Chemistry", "country": "Russia and Soviet Union", "born_in": null, "text": "Alexei Ekimov , Chemistry, 2023", "wikidata_code": "Q1547368", "date_of_birth": "28 February 1945", "place_of_birth": "Saint Petersburg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Isidor_Isaac_Rabi", "name": "Isidor Isaac Rabi", "year": 1944, "category": "Physics", "country": null, "born_in": "Poland", "text": "Isidor Isaac Rabi *,  born in  Rymanów ,  Austria-Hungary  (now in Poland) , Physics, 1944", "wikidata_code": "Q165969", "date_of_birth": "29 July 1898", "date_of_death": "11 January 1988", "place_of_birth": "Rymanów", "place_of_death": "Manhattan", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/W%C5%82adys%C5%82aw_Reymont", "name": "Władysław Reymont", "year": 1924, "category": "Literature", "country": "Poland", "born_in": null, "text": "Władysław Reymont ,  born in Congress Poland (Russian Empire) , Literature, 1924", "wikidata_code": "Q121180", "date_of_birth": "7 May 1867", "date_of_death": "5 December 1925", "place_of_birth": "Kobiele Wielkie", "place_of_death": "Warsaw", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Marie_Curie", "name": "Marie Skłodowska-Curie", "year": 1911, "category": "Chemistry", "country": "Poland", "born_in": null, "text": "Marie Skłodowska-Curie ,  born in Congress Poland (Russian Empire) , Chemistry,  1911", "wikidata_code": "Q7186", "date_of_birth": "7 November 1867", "date_of_death": "4 July 1934", "place_of_birth": "Warsaw", "place_of_death": "Sancellemoz", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Albert_A._Michelson", "name": "Albert A. Michelson", "year": 1907, "category": "Physics", "country": null, "born_in": "Poland", "text": "Albert A. Michelson *,  born in  Strelno ,  North German Confederation  (now in Poland) , Physics, 1907", "wikidata_code": "Q127234", "date_of_birth": "19 December 1852", "date_of_death": "9 May 1931", "place_of_birth": "Strzelno", "place_of_death": "Pasadena", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henryk_Sienkiewicz", "name": "Henryk Sienkiewicz", "year": 1905, "category": "Literature", "country": "Poland", "born_in": null, "text": "Henryk Sienkiewicz ,  born in Congress Poland (Russian Empire) , Literature, 1905", "wikidata_code": "Q41502", "date_of_birth": "5 May 1846", "date_of_death": "15 November 1916", "place_of_birth": "Wola Okrzejska", "place_of_death": "Vevey", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Marie_Curie", "name": "Marie Skłodowska-Curie", "year": 1903, "category": "Physics", "country": "Poland", "born_in": null, "text": "Marie Skłodowska-Curie ,  born in Congress Poland (Russian Empire) , Physics,  1903", "wikidata_code": "Q7186", "date_of_birth": "7 November 1867", "date_of_death": "4 July 1934", "place_of_birth": "Warsaw", "place_of_death": "Sancellemoz", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Jos%C3%A9_de_Sousa_Saramago", "name": "José Saramago", "year": 1998, "category": "Literature", "country": "Portugal", "born_in": null, "text": "José Saramago , Literature, 1998", "wikidata_code": "Q37060", "date_of_birth": "16 November 1922", "date_of_death": "18 June 2010", "place_of_birth": "Azinhaga", "place_of_death": "Lanzarote", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ant%C3%B3nio_Caetano_de_Abreu_Freire_Egas_Moniz", "name": "António Egas Moniz", "year": 1949, "category": "Physiology or Medicine", "country": "Portugal", "born_in": null, "text": "António Egas Moniz , Physiology or Medicine, 1949", "wikidata_code": "Q273219", "date_of_birth": "29 November 1874", "date_of_death": "13 December 1955", "place_of_birth": "Avanca", "place_of_death": "Lisbon", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Dmitry_Muratov", "name": "Dmitry Muratov", "year": 2021, "category": "Peace", "country": "Russia and Soviet Union", "born_in": null, "text": "Dmitry Muratov , Peace, 2021", "wikidata_code": "Q1823418", "date_of_birth": "30 October 1961", "place_of_birth": "Samara", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Andre_Geim", "name": "Andre Geim", "year": 2010, "category": "Physics", "country": null, "born_in": "Russia and Soviet Union", "text": "Andre Geim *, Physics, 2010", "wikidata_code": "Q104104", "date_of_birth": "21 October 1958", "place_of_birth": "Sochi", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Konstantin_Novoselov", "name": "Konstantin Novoselov", "year": 2010, "category": "Physics", "country": null, "born_in": "Russia and Soviet Union", "text": "Konstantin Novoselov *, Physics, 2010", "wikidata_code": "Q106494", "date_of_birth": "23 August 1974", "place_of_birth": "Nizhny Tagil", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Leonid_Hurwicz", "name": "Leonid Hurwicz", "year": 2007, "category": "Economics", "country": null, "born_in": "Russia and Soviet Union", "text": "Leonid Hurwicz *, Economics, 2007", "wikidata_code": "Q157262", "date_of_birth": "21 August 1917", "date_of_death": "24 June 2008", "place_of_birth": "Moscow", "place_of_death": "Minneapolis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Menachem_Begin", "name": "Menachem Begin", "year": 1978, "category": "Peace", "country": null, "born_in": "Poland", "text": "Menachem Begin *,  as an  Israeli  citizen, he also had Polish citizenship , Peace, 1978", "wikidata_code": "Q130873", "date_of_birth": "16 August 1913", "date_of_death": "9 March 1992", "place_of_birth": "Brest", "place_of_death": "Tel Aviv", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Andrew_Schally", "name": "Andrew Schally", "year": 1977, "category": "Physiology or Medicine", "country": null, "born_in": "Poland", "text": "Andrew Schally *,  born in Vilnius,  Poland  (now Vilnius, Lithuania) , Physiology or Medicine, 1977", "wikidata_code": "Q141147", "date_of_birth": "30 November 1926", "place_of_birth": "Vilnius", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tadeusz_Reichstein", "name": "Tadeusz Reichstein", "year": 1950, "category": "Physiology or Medicine", "country": null, "born_in": "Poland", "text": "Tadeusz Reichstein *,  born in Congress Poland (Russian Empire) , Physiology or Medicine, 1950", "wikidata_code": "Q115490", "date_of_birth": "20 July 1897", "date_of_death": "1 August 1996", "place_of_birth": "Włocławek", "place_of_death": "Basel", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Lech_Wa%C5%82%C4%99sa", "name": "Lech Wałęsa", "year": 1983, "category": "Peace", "country": "Poland", "born_in": null, "text": "Lech Wałęsa ,  born in  Popowo ,  Reichsgau Danzig-West Prussia ,  Germany  (today   Poland ) , Peace, 1983", "wikidata_code": "Q444", "date_of_birth": "29 September 1943", "place_of_birth": "Popowo", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Roald_Hoffmann", "name": "Roald Hoffmann", "year": 1981, "category": "Chemistry", "country": null, "born_in": "Poland", "text": "Roald Hoffmann *,  born in  Złoczów   Poland  (now in Ukraine) , Chemistry, 1981", "wikidata_code": "Q273279", "date_of_birth": "18 July 1937", "place_of_birth": "Zolochiv", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Czes%C5%82aw_Mi%C5%82osz", "name": "Czesław Miłosz", "year": 1980, "category": "Literature", "country": null, "born_in": "Poland", "text": "Czesław Miłosz *,  born in Russian Empire, now Lithuania , Literature, 1980", "wikidata_code": "Q45970", "date_of_birth": "30 June 1911", "date_of_death": "14 August 2004", "place_of_birth": "Šeteniai", "place_of_death": "Kraków", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Isaac_Bashevis_Singer", "name": "Isaac Bashevis Singer", "year": 1978, "category": "Literature", "country": null, "born_in": "Poland", "text": "Isaac Bashevis Singer *,  born in Congress Poland (Russian Empire) , Literature, 1978", "wikidata_code": "Q75612", "date_of_birth": "21 November 1902", "date_of_death": "24 July 1991", "place_of_birth": "Leoncin", "place_of_death": "Surfside", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Olga_Tokarczuk", "name": "Olga Tokarczuk", "year": 2018, "category": "Literature", "country": "Poland", "born_in": null, "text": "Olga Tokarczuk , Literature, 2018", "wikidata_code": "Q254032", "date_of_birth": "29 January 1962", "place_of_birth": "Sulechów", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Leonid_Hurwicz", "name": "Leonid Hurwicz", "year": 2007, "category": "Economics", "country": null, "born_in": "Poland", "text": "Leonid Hurwicz *,  born in then Russian Republic (now Russia) , Economics, 2007", "wikidata_code": "Q157262", "date_of_birth": "21 August 1917", "date_of_death": "24 June 2008", "place_of_birth": "Moscow", "place_of_death": "Minneapolis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Wis%C5%82awa_Szymborska", "name": "Wisława Szymborska", "year": 1996, "category": "Literature", "country": "Poland", "born_in": null, "text": "Wisława Szymborska , Literature, 1996", "wikidata_code": "Q42552", "date_of_birth": "2 July 1923", "date_of_death": "1 February 2012", "place_of_birth": "Kórnik", "place_of_death": "Kraków", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Joseph_Rotblat", "name": "Joseph Rotblat", "year": 1995, "category": "Peace", "country": null, "born_in": "Poland", "text": "Joseph Rotblat *,  born in Congress Poland (Russian Empire) , Peace, 1995", "wikidata_code": "Q219982", "date_of_birth": "4 November 1908", "date_of_death": "31 August 2005", "place_of_birth": "Warsaw", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Shimon_Peres", "name": "Shimon Peres", "year": 1994, "category": "Peace", "country": null, "born_in": "Poland", "text": "Shimon Peres *,  as an  Israeli  citizen , Peace, 1994", "wikidata_code": "Q57410", "date_of_birth": "1 August 1923", "date_of_death": "28 September 2016", "place_of_birth": "Višnieva", "place_of_death": "Sheba Medical Center", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Georges_Charpak", "name": "Georges Charpak", "year": 1992, "category": "Physics", "country": null, "born_in": "Poland", "text": "Georges Charpak *,  born in  Dąbrowica   Poland  (now in Ukraine) , Physics, 1992", "wikidata_code": "Q153178", "date_of_birth": "1 August 1924", "date_of_death": "29 September 2010", "place_of_birth": "Dubrovytsia", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Yasser_Arafat", "name": "Yasser Arafat", "year": 1994, "category": "Peace", "country": "Palestine", "born_in": null, "text": "Yasser Arafat ,  Born in Cairo, Egypt , Peace, 1994", "wikidata_code": "Q34211", "date_of_birth": "4 August 1929", "date_of_death": "11 November 2004", "place_of_birth": "Amman", "place_of_death": "Clamart", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mario_Vargas_Llosa", "name": "Mario Vargas Llosa", "year": 2010, "category": "Literature", "country": null, "born_in": "Peru", "text": "Mario Vargas Llosa *, Literature, 2010", "wikidata_code": "Q39803", "date_of_birth": "28 March 1936", "place_of_birth": "Arequipa", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Maria_Ressa", "name": "Maria Ressa", "year": 2021, "category": "Peace", "country": "Philippines", "born_in": null, "text": "Maria Ressa , Peace, 2021", "wikidata_code": "Q6761526", "date_of_birth": "2 October 1963", "place_of_birth": "Manila", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Bj%C3%B8rnstjerne_Bj%C3%B8rnson", "name": "Bjørnstjerne Bjørnson", "year": 1903, "category": "Literature", "country": "Norway", "born_in": null, "text": "Bjørnstjerne Bjørnson , Literature, 1903", "wikidata_code": "Q46405", "date_of_birth": "8 December 1832", "date_of_death": "26 April 1910", "place_of_birth": "Kvikne", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Malala_Yousafzai", "name": "Malala Yousafzai", "year": 2014, "category": "Peace", "country": "Pakistan", "born_in": null, "text": "Malala Yousafzai , Peace, 2014", "wikidata_code": "Q32732", "date_of_birth": "12 July 1997", "place_of_birth": "Mingora", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Subramanyan_Chandrasekhar", "name": "Subramanyan Chandrasekhar", "year": 1983, "category": "Physics", "country": null, "born_in": "Pakistan", "text": "Subramanyan Chandrasekhar *,  born in India (now Pakistan) , Physics, 1983", "wikidata_code": "Q148109", "date_of_birth": "19 October 1910", "date_of_death": "21 August 1995", "place_of_birth": "Lahore", "place_of_death": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Knut_Hamsun", "name": "Knut Hamsun", "year": 1920, "category": "Literature", "country": "Norway", "born_in": null, "text": "Knut Hamsun , Literature, 1920", "wikidata_code": "Q40826", "date_of_birth": "4 August 1859", "date_of_death": "19 February 1952", "place_of_birth": "Vågå", "place_of_death": "Grimstad", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Abdus_Salam", "name": "Abdus Salam", "year": 1979, "category": "Physics", "country": "Pakistan", "born_in": null, "text": "Abdus Salam ,  born in India (now Pakistan) , Physics, 1979", "wikidata_code": "Q28189", "date_of_birth": "29 January 1926", "date_of_death": "21 November 1996", "place_of_birth": "Jhang", "place_of_death": "Oxford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Har_Gobind_Khorana", "name": "Har Gobind Khorana", "year": 1968, "category": null, "country": null, "born_in": "Pakistan", "text": "Har Gobind Khorana *, born in India (now Pakistan) , Medicine, 1968", "wikidata_code": "Q107462", "date_of_birth": "9 January 1922", "date_of_death": "9 November 2011", "place_of_birth": "Raipur", "place_of_death": "Concord", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fridtjof_Nansen", "name": "Fridtjof Nansen", "year": 1922, "category": "Peace", "country": "Norway", "born_in": null, "text": "Fridtjof Nansen , Peace, 1922", "wikidata_code": "Q72292", "date_of_birth": "10 October 1861", "date_of_death": "13 May 1930", "place_of_birth": "Vestre Aker", "place_of_death": "Polhøgda", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Christian_Lous_Lange", "name": "Christian Lous Lange", "year": 1921, "category": "Peace", "country": "Norway", "born_in": null, "text": "Christian Lous Lange , Peace, 1921", "wikidata_code": "Q206446", "date_of_birth": "17 September 1869", "date_of_death": "11 December 1938", "place_of_birth": "Stavanger Municipality", "place_of_death": "Oslo", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ales_Bialiatski", "name": "Ales Bialiatski", "year": 2022, "category": "Peace", "country": "Belarus", "born_in": null, "text": "Ales Bialiatski , Peace, 2022", "wikidata_code": "Q118263", "date_of_birth": "25 September 1962", "place_of_birth": "Vyartsilya", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Svetlana_Alexievich", "name": "Svetlana Alexievich", "year": 2015, "category": "Literature", "country": "Belarus", "born_in": null, "text": "Svetlana Alexievich ,  born in Ukraine , Literature, 2015", "wikidata_code": "Q274334", "date_of_birth": "31 May 1948", "place_of_birth": "Ivano-Frankivsk", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Ivar_Giaever", "name": "Ivar Giaever", "year": 1973, "category": "Physics", "country": "Norway", "born_in": null, "text": "Ivar Giaever , Physics, 1973", "wikidata_code": "Q192688", "date_of_birth": "5 April 1929", "place_of_birth": "Bergen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ragnar_Frisch", "name": "Ragnar Frisch", "year": 1969, "category": "Economics", "country": "Norway", "born_in": null, "text": "Ragnar Frisch , Economics, 1969", "wikidata_code": "Q187988", "date_of_birth": "3 March 1895", "date_of_death": "31 January 1973", "place_of_birth": "Christiania", "place_of_death": "Oslo", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Odd_Hassel", "name": "Odd Hassel", "year": 1969, "category": "Chemistry", "country": "Norway", "born_in": null, "text": "Odd Hassel , Chemistry, 1969", "wikidata_code": "Q157212", "date_of_birth": "17 May 1897", "date_of_death": "11 May 1981", "place_of_birth": "Christiania", "place_of_death": "Oslo", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Lars_Onsager", "name": "Lars Onsager", "year": 1968, "category": "Chemistry", "country": "Norway", "born_in": null, "text": "Lars Onsager , Chemistry, 1968", "wikidata_code": "Q107405", "date_of_birth": "27 November 1903", "date_of_death": "5 October 1976", "place_of_birth": "Christiania", "place_of_death": "Coral Gables", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Sigrid_Undset", "name": "Sigrid Undset", "year": 1928, "category": "Literature", "country": "Norway", "born_in": null, "text": "Sigrid Undset , Literature, 1928", "wikidata_code": "Q80889", "date_of_birth": "20 May 1882", "date_of_death": "10 June 1949", "place_of_birth": "Kalundborg", "place_of_death": "Lillehammer Municipality", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Alan_MacDiarmid", "name": "Alan MacDiarmid", "year": 2000, "category": "Chemistry", "country": "New Zealand", "born_in": null, "text": "Alan MacDiarmid , Chemistry, 2000", "wikidata_code": "Q110942", "date_of_birth": "14 April 1927", "date_of_death": "7 February 2007", "place_of_birth": "Masterton", "place_of_death": "Drexel Hill", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Maurice_Wilkins", "name": "Maurice Wilkins", "year": 1962, "category": "Physiology or Medicine", "country": "New Zealand", "born_in": null, "text": "Maurice Wilkins , Physiology or Medicine, 1962", "wikidata_code": "Q184659", "date_of_birth": "15 December 1916", "date_of_death": "5 October 2004", "place_of_birth": "Pongaroa", "place_of_death": "Blackheath", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ernest_Rutherford", "name": "Ernest Rutherford", "year": 1908, "category": "Chemistry", "country": null, "born_in": "New Zealand", "text": "Ernest Rutherford *, Chemistry, 1908", "wikidata_code": "Q9123", "date_of_birth": "30 August 1871", "date_of_death": "19 October 1937", "place_of_birth": "Nelson", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Wole_Soyinka", "name": "Wole Soyinka", "year": 1986, "category": "Literature", "country": "Nigeria", "born_in": null, "text": "Wole Soyinka , Literature, 1986", "wikidata_code": "Q41488", "date_of_birth": "13 July 1934", "place_of_birth": "Ogun State", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mother_Teresa", "name": "Mother Teresa", "year": 1979, "category": "Peace", "country": null, "born_in": "North Macedonia", "text": "Mother Teresa *,  born in then Ottoman Empire, now  North Macedonia , Peace, 1979", "wikidata_code": "Q30547", "date_of_birth": "26 August 1910", "date_of_death": "5 September 1997", "place_of_birth": "Skopje", "place_of_death": "Kolkata", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Jon_Fosse", "name": "Jon Fosse", "year": 2023, "category": "Literature", "country": "Norway", "born_in": null, "text": "Jon Fosse , Literature, 2023", "wikidata_code": "Q443868", "date_of_birth": "29 September 1959", "place_of_birth": "Haugesund Municipality", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/May-Britt_Moser", "name": "May-Britt Moser", "year": 2014, "category": "Physiology or Medicine", "country": "Norway", "born_in": null, "text": "May-Britt Moser , Physiology or Medicine, 2014", "wikidata_code": "Q6796222", "date_of_birth": "4 January 1963", "place_of_birth": "Fosnavåg", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Edvard_Moser", "name": "Edvard Moser", "year": 2014, "category": "Physiology or Medicine", "country": "Norway", "born_in": null, "text": "Edvard Moser , Physiology or Medicine, 2014", "wikidata_code": "Q5341373", "date_of_birth": "27 April 1962", "place_of_birth": "Ålesund Municipality", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Finn_E._Kydland", "name": "Finn E. Kydland", "year": 2004, "category": "Economics", "country": "Norway", "born_in": null, "text": "Finn E. Kydland , Economics, 2004", "wikidata_code": "Q211097", "date_of_birth": "1 December 1943", "place_of_birth": "Ålgård", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Trygve_Haavelmo", "name": "Trygve Haavelmo", "year": 1989, "category": "Economics", "country": "Norway", "born_in": null, "text": "Trygve Haavelmo , Economics, 1989", "wikidata_code": "Q208124", "date_of_birth": "13 December 1911", "date_of_death": "28 July 1999", "place_of_birth": "Skedsmo Municipality", "place_of_death": "Bærum Municipality", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gerard_%27t_Hooft", "name": "Gerard 't Hooft", "year": 1999, "category": "Physics", "country": "Netherlands", "born_in": null, "text": "Gerard 't Hooft , Physics, 1999", "wikidata_code": "Q184592", "date_of_birth": "5 July 1946", "place_of_birth": "Den Helder", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_J._Crutzen", "name": "Paul J. Crutzen", "year": 1995, "category": "Chemistry", "country": "Netherlands", "born_in": null, "text": "Paul J. Crutzen , Chemistry, 1995", "wikidata_code": "Q135139", "date_of_birth": "3 December 1933", "date_of_death": "28 January 2021", "place_of_birth": "Amsterdam", "place_of_death": "Mainz", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Simon_van_der_Meer", "name": "Simon van der Meer", "year": 1984, "category": "Physics", "country": "Netherlands", "born_in": null, "text": "Simon van der Meer , Physics, 1984", "wikidata_code": "Q104779", "date_of_birth": "24 November 1925", "date_of_death": "4 March 2011", "place_of_birth": "The Hague", "place_of_death": "Geneva", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Nicolaas_Bloembergen", "name": "Nicolaas Bloembergen", "year": 1981, "category": "Physics", "country": null, "born_in": "Netherlands", "text": "Nicolaas Bloembergen *, Physics, 1981", "wikidata_code": "Q189987", "date_of_birth": "11 March 1920", "date_of_death": "5 September 2017", "place_of_birth": "Dordrecht", "place_of_death": "Tucson", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tjalling_C._Koopmans", "name": "Tjalling C. Koopmans", "year": 1975, "category": "Economics", "country": "Netherlands", "born_in": null, "text": "Tjalling C. Koopmans , Economics, 1975", "wikidata_code": "Q110968", "date_of_birth": "28 August 1910", "date_of_death": "26 February 1985", "place_of_birth": "'s-Graveland", "place_of_death": "New Haven", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Nikolaas_Tinbergen", "name": "Nikolaas Tinbergen", "year": 1973, "category": "Physiology or Medicine", "country": null, "born_in": "Netherlands", "text": "Nikolaas Tinbergen *, Physiology or Medicine, 1973", "wikidata_code": "Q153890", "date_of_birth": "15 April 1907", "date_of_death": "21 December 1988", "place_of_birth": "The Hague", "place_of_death": "Oxford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jan_Tinbergen", "name": "Jan Tinbergen", "year": 1969, "category": "Economics", "country": "Netherlands", "born_in": null, "text": "Jan Tinbergen , Economics, 1969", "wikidata_code": "Q183181", "date_of_birth": "12 April 1903", "date_of_death": "9 June 1994", "place_of_birth": "The Hague", "place_of_death": "The Hague", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Aung_San_Suu_Kyi", "name": "Aung San Suu Kyi", "year": 1991, "category": "Peace", "country": "Myanmar (Burma)", "born_in": null, "text": "Aung San Suu Kyi , Peace, 1991", "wikidata_code": "Q36740", "date_of_birth": "19 June 1945", "place_of_birth": "Yangon", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Serge_Haroche", "name": "Serge Haroche", "year": 2012, "category": "Physics", "country": null, "born_in": "Morocco", "text": "Serge Haroche *, Physics, 2012; a French citizen as per his Wikipedia page", "wikidata_code": "Q109588", "date_of_birth": "11 September 1944", "place_of_birth": "Casablanca", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Guido_Imbens", "name": "Guido Imbens", "year": 2021, "category": "Economics", "country": "Netherlands", "born_in": null, "text": "Guido Imbens , Economics, 2021", "wikidata_code": "Q16730042", "date_of_birth": "3 September 1963", "place_of_birth": "Geldrop", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ben_Feringa", "name": "Ben Feringa", "year": 2016, "category": "Chemistry", "country": "Netherlands", "born_in": null, "text": "Ben Feringa , Chemistry, 2016", "wikidata_code": "Q3259614", "date_of_birth": "18 May 1951", "place_of_birth": "Barger-Compascuum", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Andre_Geim", "name": "Andre Geim", "year": 2010, "category": "Physics", "country": "Netherlands", "born_in": null, "text": "Andre Geim ,  born in Soviet Union, now Russia , Physics, 2010", "wikidata_code": "Q104104", "date_of_birth": "21 October 1958", "place_of_birth": "Sochi", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Martinus_J._G._Veltman", "name": "Martinus J. G. Veltman", "year": 1999, "category": "Physics", "country": "Netherlands", "born_in": null, "text": "Martinus J. G. Veltman , Physics, 1999", "wikidata_code": "Q202149", "date_of_birth": "27 June 1931", "date_of_death": "4 January 2021", "place_of_birth": "Waalwijk", "place_of_death": "Bilthoven", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Frits_Zernike", "name": "Frits Zernike", "year": 1953, "category": "Physics", "country": "Netherlands", "born_in": null, "text": "Frits Zernike , Physics, 1953", "wikidata_code": "Q188293", "date_of_birth": "16 July 1888", "date_of_death": "10 March 1966", "place_of_birth": "Amsterdam", "place_of_death": "Amersfoort", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Peter_Debye", "name": "Peter Debye", "year": 1936, "category": "Chemistry", "country": "Netherlands", "born_in": null, "text": "Peter Debye , Chemistry, 1936", "wikidata_code": "Q103835", "date_of_birth": "24 March 1884", "date_of_death": "2 November 1966", "place_of_birth": "Maastricht", "place_of_death": "Ithaca", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Christiaan_Eijkman", "name": "Christiaan Eijkman", "year": 1929, "category": "Physiology or Medicine", "country": "Netherlands", "born_in": null, "text": "Christiaan Eijkman , Physiology or Medicine, 1929", "wikidata_code": "Q107609", "date_of_birth": "11 August 1858", "date_of_death": "5 November 1930", "place_of_birth": "Nijkerk", "place_of_death": "Utrecht", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Willem_Einthoven", "name": "Willem Einthoven", "year": 1924, "category": "Physiology or Medicine", "country": "Netherlands", "born_in": null, "text": "Willem Einthoven , Physiology or Medicine, 1924", "wikidata_code": "Q189488", "date_of_birth": "21 May 1860", "date_of_death": "28 September 1927", "place_of_birth": "Semarang City", "place_of_death": "Leiden", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Heike_Kamerlingh_Onnes", "name": "Heike Kamerlingh Onnes", "year": 1913, "category": "Physics", "country": "Netherlands", "born_in": null, "text": "Heike Kamerlingh Onnes , Physics, 1913", "wikidata_code": "Q62891", "date_of_birth": "21 September 1853", "date_of_death": "21 February 1926", "place_of_birth": "Groningen", "place_of_death": "Leiden", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tobias_Asser", "name": "Tobias Asser", "year": 1911, "category": "Peace", "country": "Netherlands", "born_in": null, "text": "Tobias Asser , Peace, 1911", "wikidata_code": "Q216872", "date_of_birth": "28 April 1838", "date_of_death": "29 July 1913", "place_of_birth": "Amsterdam", "place_of_death": "The Hague", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Johannes_Diderik_van_der_Waals", "name": "Johannes Diderik van der Waals", "year": 1910, "category": "Physics", "country": "Netherlands", "born_in": null, "text": "Johannes Diderik van der Waals , Physics, 1910", "wikidata_code": "Q131721", "date_of_birth": "23 November 1837", "date_of_death": "8 March 1923", "place_of_birth": "Leiden", "place_of_death": "Amsterdam", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Pieter_Zeeman", "name": "Pieter Zeeman", "year": 1902, "category": "Physics", "country": "Netherlands", "born_in": null, "text": "Pieter Zeeman , Physics, 1902", "wikidata_code": "Q79000", "date_of_birth": "25 May 1865", "date_of_death": "9 October 1943", "place_of_birth": "Zonnemaire", "place_of_death": "Amsterdam", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hendrik_Lorentz", "name": "Hendrik Lorentz", "year": 1902, "category": "Physics", "country": "Netherlands", "born_in": null, "text": "Hendrik Lorentz , Physics, 1902", "wikidata_code": "Q41688", "date_of_birth": "18 July 1853", "date_of_death": "4 February 1928", "place_of_birth": "Arnhem", "place_of_death": "Haarlem", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jacobus_Henricus_van_%27t_Hoff", "name": "Jacobus Henricus van 't Hoff", "year": 1901, "category": "Chemistry", "country": "Netherlands", "born_in": null, "text": "Jacobus Henricus van 't Hoff , Chemistry, 1901", "wikidata_code": "Q102822", "date_of_birth": "30 August 1852", "date_of_death": "1 March 1911", "place_of_birth": "Rotterdam", "place_of_death": "Steglitz", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Claude_Cohen-Tannoudji", "name": "Claude Cohen-Tannoudji", "year": 1997, "category": "Physics", "country": null, "born_in": "Algeria", "text": "Claude Cohen-Tannoudji *, Physics, 1997", "wikidata_code": "Q190697", "date_of_birth": "1 April 1933", "place_of_birth": "Constantine", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hideki_Yukawa", "name": "Hideki Yukawa", "year": 1949, "category": "Physics", "country": "Japan", "born_in": null, "text": "Hideki Yukawa , Physics, 1949", "wikidata_code": "Q155777", "date_of_birth": "23 January 1907", "date_of_death": "8 September 1981", "place_of_birth": "Azabu", "place_of_death": "Kyoto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Wangari_Maathai", "name": "Wangari Maathai", "year": 2004, "category": "Peace", "country": "Kenya", "born_in": null, "text": "Wangari Maathai , Peace, 2004", "wikidata_code": "Q46795", "date_of_birth": "1 April 1940", "date_of_death": "25 September 2011", "place_of_birth": "Nyeri", "place_of_death": "Nairobi", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Ardem_Patapoutian", "name": "Ardem Patapoutian", "year": 2021, "category": "Physiology or Medicine", "country": null, "born_in": "Lebanon", "text": "Ardem Patapoutian *, Physiology or Medicine, 2021", "wikidata_code": "Q60322501", "date_of_birth": "2 October 1967", "place_of_birth": "Beirut", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Wilhelm_Ostwald", "name": "Wilhelm Ostwald", "year": 1909, "category": "Chemistry", "country": null, "born_in": "Latvia", "text": "Wilhelm Ostwald *, Chemistry, 1909 [7]", "wikidata_code": "Q12658", "date_of_birth": "21 August 1853", "date_of_death": "4 April 1932", "place_of_birth": "Riga", "place_of_death": "Großbothen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ellen_Johnson_Sirleaf", "name": "Ellen Johnson Sirleaf", "year": 2011, "category": "Peace", "country": "Liberia", "born_in": null, "text": "Ellen Johnson Sirleaf , Peace, 2011", "wikidata_code": "Q43179", "date_of_birth": "29 October 1938", "place_of_birth": "Monrovia", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Leymah_Gbowee", "name": "Leymah Gbowee", "year": 2011, "category": "Peace", "country": "Liberia", "born_in": null, "text": "Leymah Gbowee , Peace, 2011", "wikidata_code": "Q107037", "date_of_birth": "1 February 1972", "place_of_birth": "Monrovia", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Aaron_Klug", "name": "Aaron Klug", "year": 1982, "category": "Chemistry", "country": null, "born_in": "Lithuania", "text": "Aaron Klug *, Chemistry, 1982", "wikidata_code": "Q190626", "date_of_birth": "11 August 1926", "date_of_death": "20 November 2018", "place_of_birth": "Želva", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jules_A._Hoffmann", "name": "Jules A. Hoffmann", "year": 2011, "category": "Physiology or Medicine", "country": null, "born_in": "Luxembourg", "text": "Jules A. Hoffmann *, Physiology or Medicine, 2011", "wikidata_code": "Q105605", "date_of_birth": "2 August 1941", "place_of_birth": "Echternach", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Eisaku_Sat%C5%8D", "name": "Eisaku Satō", "year": 1974, "category": "Peace", "country": "Japan", "born_in": null, "text": "Eisaku Satō , Peace, 1974", "wikidata_code": "Q179871", "date_of_birth": "27 March 1901", "date_of_death": "3 June 1975", "place_of_birth": "Tabuse", "place_of_death": "The Jikei University Hospital", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Leo_Esaki", "name": "Leo Esaki", "year": 1973, "category": "Physics", "country": "Japan", "born_in": null, "text": "Leo Esaki , Physics, 1973", "wikidata_code": "Q179852", "date_of_birth": "12 March 1925", "place_of_birth": "Takaida", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Yasunari_Kawabata", "name": "Yasunari Kawabata", "year": 1968, "category": "Literature", "country": "Japan", "born_in": null, "text": "Yasunari Kawabata , Literature, 1968", "wikidata_code": "Q43736", "date_of_birth": "11 June 1899", "date_of_death": "16 April 1972", "place_of_birth": "Osaka", "place_of_death": "Zushi", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Sin-Itiro_Tomonaga", "name": "Sin-Itiro Tomonaga", "year": 1965, "category": "Physics", "country": "Japan", "born_in": null, "text": "Sin-Itiro Tomonaga , Physics, 1965", "wikidata_code": "Q184563", "date_of_birth": "31 March 1906", "date_of_death": "8 July 1979", "place_of_birth": "Tokyo", "place_of_death": "Tokyo", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gabriel_Lippmann", "name": "Gabriel Lippmann", "year": 1908, "category": "Physics", "country": null, "born_in": "Luxembourg", "text": "Gabriel Lippmann *, Physics, 1908", "wikidata_code": "Q133232", "date_of_birth": "16 August 1845", "date_of_death": "13 July 1921", "place_of_birth": "Bonnevoie", "place_of_death": "Atlantic Ocean", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mario_J._Molina", "name": "Mario José Molina Henríquez", "year": 1995, "category": "Chemistry", "country": null, "born_in": "Mexico", "text": "Mario José Molina Henríquez *, Chemistry, 1995", "wikidata_code": "Q19045", "date_of_birth": "19 March 1943", "date_of_death": "7 October 2020", "place_of_birth": "Mexico City", "place_of_death": "Mexico City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Octavio_Paz", "name": "Octavio Paz Lozano", "year": 1990, "category": "Literature", "country": "Mexico", "born_in": null, "text": "Octavio Paz Lozano , Literature, 1990", "wikidata_code": "Q46739", "date_of_birth": "31 March 1914", "date_of_death": "19 April 1998", "place_of_birth": "Mexico City", "place_of_death": "Mexico City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alfonso_Garc%C3%ADa_Robles", "name": "Alfonso García Robles", "year": 1982, "category": "Peace", "country": "Mexico", "born_in": null, "text": "Alfonso García Robles , Peace, 1982", "wikidata_code": "Q203843", "date_of_birth": "20 March 1911", "date_of_death": "2 September 1991", "place_of_birth": "Zamora de Hidalgo", "place_of_death": "Mexico City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Shinya_Yamanaka", "name": "Shinya Yamanaka", "year": 2012, "category": "Physiology or Medicine", "country": "Japan", "born_in": null, "text": "Shinya Yamanaka , Physiology or Medicine, 2012", "wikidata_code": "Q80917", "date_of_birth": "4 September 1962", "place_of_birth": "Hiraoka", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Akira_Suzuki_(chemist)", "name": "Akira Suzuki", "year": 2010, "category": "Chemistry", "country": "Japan", "born_in": null, "text": "Akira Suzuki , Chemistry, 2010", "wikidata_code": "Q105949", "date_of_birth": "12 September 1930", "place_of_birth": "Mukawa", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ei-ichi_Negishi", "name": "Ei-ichi Negishi", "year": 2010, "category": "Chemistry", "country": "Japan", "born_in": null, "text": "Ei-ichi Negishi ,  Born in China , Chemistry, 2010", "wikidata_code": "Q105927", "date_of_birth": "14 July 1935", "date_of_death": "6 June 2021", "place_of_birth": "Hsinking", "place_of_death": "Indianapolis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Osamu_Shimomura", "name": "Osamu Shimomura", "year": 2008, "category": "Chemistry", "country": "Japan", "born_in": null, "text": "Osamu Shimomura , Chemistry, 2008", "wikidata_code": "Q205345", "date_of_birth": "27 August 1928", "date_of_death": "19 October 2018", "place_of_birth": "Fukuchiyama", "place_of_death": "Nagasaki", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Toshihide_Maskawa", "name": "Toshihide Maskawa", "year": 2008, "category": "Physics", "country": "Japan", "born_in": null, "text": "Toshihide Maskawa , Physics, 2008", "wikidata_code": "Q202168", "date_of_birth": "7 February 1940", "date_of_death": "23 July 2021", "place_of_birth": "Nagoya", "place_of_death": "Kyoto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Makoto_Kobayashi_(physicist)", "name": "Makoto Kobayashi", "year": 2008, "category": "Physics", "country": "Japan", "born_in": null, "text": "Makoto Kobayashi , Physics, 2008", "wikidata_code": "Q202164", "date_of_birth": "7 April 1944", "place_of_birth": "Nagoya", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Yoichiro_Nambu", "name": "Yoichiro Nambu", "year": 2008, "category": "Physics", "country": null, "born_in": "Japan", "text": "Yoichiro Nambu *, Physics, 2008", "wikidata_code": "Q188120", "date_of_birth": "18 January 1921", "date_of_death": "5 July 2015", "place_of_birth": "Tokyo", "place_of_death": "Toyonaka", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Koichi_Tanaka", "name": "Koichi Tanaka", "year": 2002, "category": "Chemistry", "country": "Japan", "born_in": null, "text": "Koichi Tanaka , Chemistry, 2002", "wikidata_code": "Q110963", "date_of_birth": "3 August 1959", "place_of_birth": "Toyama", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Masatoshi_Koshiba", "name": "Masatoshi Koshiba", "year": 2002, "category": "Physics", "country": "Japan", "born_in": null, "text": "Masatoshi Koshiba , Physics, 2002", "wikidata_code": "Q155773", "date_of_birth": "19 September 1926", "date_of_death": "12 November 2020", "place_of_birth": "Toyohashi", "place_of_death": "Tokyo", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Syukuro_Manabe", "name": "Syukuro Manabe", "year": 2021, "category": "Physics", "country": null, "born_in": "Japan", "text": "Syukuro Manabe *, Physics, 2021", "wikidata_code": "Q3675789", "date_of_birth": "21 September 1931", "place_of_birth": "Shinritsu", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Akira_Yoshino", "name": "Akira Yoshino", "year": 2019, "category": "Chemistry", "country": "Japan", "born_in": null, "text": "Akira Yoshino , Chemistry, 2019", "wikidata_code": "Q4701206", "date_of_birth": "30 January 1948", "place_of_birth": "Suita", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tasuku_Honjo", "name": "Tasuku Honjo", "year": 2018, "category": "Physiology or Medicine", "country": "Japan", "born_in": null, "text": "Tasuku Honjo , Physiology or Medicine, 2018", "wikidata_code": "Q2395341", "date_of_birth": "27 January 1942", "place_of_birth": "Kyoto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kazuo_Ishiguro", "name": "Kazuo Ishiguro", "year": 2017, "category": "Literature", "country": null, "born_in": "Japan", "text": "Kazuo Ishiguro *, Literature, 2017", "wikidata_code": "Q272855", "date_of_birth": "8 November 1954", "place_of_birth": "Nagasaki", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Yoshinori_Ohsumi", "name": "Yoshinori Ohsumi", "year": 2016, "category": "Physiology or Medicine", "country": "Japan", "born_in": null, "text": "Yoshinori Ohsumi , Physiology or Medicine, 2016", "wikidata_code": "Q8056214", "date_of_birth": "9 February 1945", "place_of_birth": "Fukuoka", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Takaaki_Kajita", "name": "Takaaki Kajita", "year": 2015, "category": "Physics", "country": "Japan", "born_in": null, "text": "Takaaki Kajita , Physics, 2015", "wikidata_code": "Q11538917", "date_of_birth": "9 March 1959", "place_of_birth": "Higashimatsuyama", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Satoshi_%C5%8Cmura", "name": "Satoshi Ōmura", "year": 2015, "category": "Physiology or Medicine", "country": "Japan", "born_in": null, "text": "Satoshi Ōmura , Physiology or Medicine, 2015", "wikidata_code": "Q21061207", "date_of_birth": "12 July 1935", "place_of_birth": "Kamiyama", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Shuji_Nakamura", "name": "Shuji Nakamura", "year": 2014, "category": "Physics", "country": null, "born_in": "Japan", "text": "Shuji Nakamura *, Physics, 2014", "wikidata_code": "Q730065", "date_of_birth": "22 May 1954", "place_of_birth": "Ikata", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hiroshi_Amano", "name": "Hiroshi Amano", "year": 2014, "category": "Physics", "country": "Japan", "born_in": null, "text": "Hiroshi Amano , Physics, 2014", "wikidata_code": "Q11443689", "date_of_birth": "11 September 1960", "place_of_birth": "Hamamatsu", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Isamu_Akasaki", "name": "Isamu Akasaki", "year": 2014, "category": "Physics", "country": "Japan", "born_in": null, "text": "Isamu Akasaki , Physics, 2014", "wikidata_code": "Q1673706", "date_of_birth": "30 January 1929", "date_of_death": "1 April 2021", "place_of_birth": "Chiran", "place_of_death": "Nagoya", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ry%C5%8Dji_Noyori", "name": "Ryōji Noyori", "year": 2001, "category": "Chemistry", "country": "Japan", "born_in": null, "text": "Ryōji Noyori , Chemistry, 2001", "wikidata_code": "Q157210", "date_of_birth": "3 September 1938", "place_of_birth": "Ashiya", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hideki_Shirakawa", "name": "Hideki Shirakawa", "year": 2000, "category": "Chemistry", "country": "Japan", "born_in": null, "text": "Hideki Shirakawa , Chemistry, 2000", "wikidata_code": "Q110916", "date_of_birth": "20 August 1936", "place_of_birth": "Tokyo", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kenzabur%C5%8D_%C5%8Ce", "name": "Kenzaburō Ōe", "year": 1994, "category": "Literature", "country": "Japan", "born_in": null, "text": "Kenzaburō Ōe , Literature, 1994", "wikidata_code": "Q80095", "date_of_birth": "31 January 1935", "date_of_death": "3 March 2023", "place_of_birth": "Ōse", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Susumu_Tonegawa", "name": "Susumu Tonegawa", "year": 1987, "category": "Physiology or Medicine", "country": "Japan", "born_in": null, "text": "Susumu Tonegawa , Physiology or Medicine, 1987", "wikidata_code": "Q108602", "date_of_birth": "6 September 1939", "place_of_birth": "Nagoya", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kenichi_Fukui", "name": "Kenichi Fukui", "year": 1981, "category": "Chemistry", "country": "Japan", "born_in": null, "text": "Kenichi Fukui , Chemistry, 1981", "wikidata_code": "Q217734", "date_of_birth": "4 October 1918", "date_of_death": "9 January 1998", "place_of_birth": "Heijō", "place_of_death": "Kyoto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Grazia_Deledda", "name": "Grazia Deledda", "year": 1926, "category": "Literature", "country": "Italy", "born_in": null, "text": "Grazia Deledda , Literature, 1926", "wikidata_code": "Q7728", "date_of_birth": "27 September 1871", "date_of_death": "15 August 1936", "place_of_birth": "Nuoro", "place_of_death": "Rome", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Guglielmo_Marconi", "name": "Guglielmo Marconi", "year": 1909, "category": "Physics", "country": "Italy", "born_in": null, "text": "Guglielmo Marconi , Physics, 1909", "wikidata_code": "Q36488", "date_of_birth": "25 April 1874", "date_of_death": "20 July 1937", "place_of_birth": "Bologna", "place_of_death": "Rome", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ernesto_Teodoro_Moneta", "name": "Ernesto Teodoro Moneta", "year": 1907, "category": "Peace", "country": "Italy", "born_in": null, "text": "Ernesto Teodoro Moneta , Peace, 1907", "wikidata_code": "Q12086", "date_of_birth": "20 September 1833", "date_of_death": "30 January 1918", "place_of_birth": "Milan", "place_of_death": "Milan", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Camillo_Golgi", "name": "Camillo Golgi", "year": 1906, "category": "Physiology or Medicine", "country": "Italy", "born_in": null, "text": "Camillo Golgi , Physiology or Medicine, 1906", "wikidata_code": "Q150630", "date_of_birth": "7 July 1843", "date_of_death": "21 January 1926", "place_of_birth": "Corteno Golgi", "place_of_death": "Pavia", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Giosu%C3%A8_Carducci", "name": "Giosuè Carducci", "year": 1906, "category": "Literature", "country": "Italy", "born_in": null, "text": "Giosuè Carducci , Literature, 1906", "wikidata_code": "Q43440", "date_of_birth": "27 July 1835", "date_of_death": "8 February 1907", "place_of_birth": "Valdicastello Carducci", "place_of_death": "Bologna", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Salvador_Luria", "name": "Salvador Luria", "year": 1969, "category": "Physiology or Medicine", "country": null, "born_in": "Italy", "text": "Salvador Luria *, Physiology or Medicine, 1969", "wikidata_code": "Q205667", "date_of_birth": "13 August 1912", "date_of_death": "6 February 1991", "place_of_birth": "Turin", "place_of_death": "Lexington", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Giulio_Natta", "name": "Giulio Natta", "year": 1963, "category": "Chemistry", "country": "Italy", "born_in": null, "text": "Giulio Natta , Chemistry, 1963", "wikidata_code": "Q234145", "date_of_birth": "26 February 1903", "date_of_death": "2 May 1979", "place_of_birth": "Porto Maurizio", "place_of_death": "Bergamo", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Emilio_Segr%C3%A8", "name": "Emilio Segrè", "year": 1959, "category": "Physics", "country": null, "born_in": "Italy", "text": "Emilio Segrè *, Physics, 1959", "wikidata_code": "Q173028", "date_of_birth": "1 February 1905", "date_of_death": "22 April 1989", "place_of_birth": "Tivoli", "place_of_death": "Lafayette", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Salvatore_Quasimodo", "name": "Salvatore Quasimodo", "year": 1959, "category": "Literature", "country": "Italy", "born_in": null, "text": "Salvatore Quasimodo , Literature, 1959", "wikidata_code": "Q83038", "date_of_birth": "20 August 1901", "date_of_death": "14 June 1968", "place_of_birth": "Modica", "place_of_death": "Naples", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Daniel_Bovet", "name": "Daniel Bovet", "year": 1957, "category": "Physiology or Medicine", "country": "Italy", "born_in": null, "text": "Daniel Bovet ,  born in Switzerland , Physiology or Medicine, 1957", "wikidata_code": "Q115448", "date_of_birth": "23 March 1907", "date_of_death": "8 April 1992", "place_of_birth": "Fleurier", "place_of_death": "Rome", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Enrico_Fermi", "name": "Enrico Fermi", "year": 1938, "category": "Physics", "country": "Italy", "born_in": null, "text": "Enrico Fermi , Physics, 1938", "wikidata_code": "Q8753", "date_of_birth": "29 September 1901", "date_of_death": "28 November 1954", "place_of_birth": "Rome", "place_of_death": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Luigi_Pirandello", "name": "Luigi Pirandello", "year": 1934, "category": "Literature", "country": "Italy", "born_in": null, "text": "Luigi Pirandello , Literature, 1934", "wikidata_code": "Q1403", "date_of_birth": "28 June 1867", "date_of_death": "10 December 1936", "place_of_birth": "Agrigento", "place_of_death": "Rome", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carlo_Rubbia", "name": "Carlo Rubbia", "year": 1984, "category": "Physics", "country": "Italy", "born_in": null, "text": "Carlo Rubbia , Physics, 1984", "wikidata_code": "Q187199", "date_of_birth": "31 March 1934", "place_of_birth": "Gorizia", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Eugenio_Montale", "name": "Eugenio Montale", "year": 1975, "category": "Literature", "country": "Italy", "born_in": null, "text": "Eugenio Montale , Literature, 1975", "wikidata_code": "Q83174", "date_of_birth": "12 October 1896", "date_of_death": "12 September 1981", "place_of_birth": "Genoa", "place_of_death": "Milan", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Renato_Dulbecco", "name": "Renato Dulbecco", "year": 1975, "category": "Physiology or Medicine", "country": null, "born_in": "Italy", "text": "Renato Dulbecco *, Physiology or Medicine, 1975", "wikidata_code": "Q109553", "date_of_birth": "22 February 1914", "date_of_death": "19 February 2012", "place_of_birth": "Catanzaro", "place_of_death": "La Jolla", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Menachem_Begin", "name": "Menachem Begin", "year": 1978, "category": "Peace", "country": "Israel", "born_in": null, "text": "Menachem Begin ,  born in  Russia , now  Belarus , Peace, 1978", "wikidata_code": "Q130873", "date_of_birth": "16 August 1913", "date_of_death": "9 March 1992", "place_of_birth": "Brest", "place_of_death": "Tel Aviv", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Shmuel_Yosef_Agnon", "name": "Shmuel Yosef Agnon", "year": 1966, "category": "Literature", "country": "Israel", "born_in": null, "text": "Shmuel Yosef Agnon ,  born in  Austria-Hungary , now  Ukraine , Literature, 1966", "wikidata_code": "Q133042", "date_of_birth": "8 August 1887", "date_of_death": "17 February 1970", "place_of_birth": "Buchach", "place_of_death": "Jerusalem", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Giorgio_Parisi", "name": "Giorgio Parisi", "year": 2021, "category": "Physics", "country": "Italy", "born_in": null, "text": "Giorgio Parisi , Physics, 2021", "wikidata_code": "Q1235614", "date_of_birth": "4 August 1948", "place_of_birth": "Rome", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mario_R._Capecchi", "name": "Mario R. Capecchi", "year": 2007, "category": "Physiology or Medicine", "country": null, "born_in": "Italy", "text": "Mario R. Capecchi *, Physiology or Medicine, 2007", "wikidata_code": "Q215574", "date_of_birth": "6 October 1937", "place_of_birth": "Verona", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Riccardo_Giacconi", "name": "Riccardo Giacconi", "year": 2002, "category": "Physics", "country": null, "born_in": "Italy", "text": "Riccardo Giacconi *, Physics, 2002", "wikidata_code": "Q186481", "date_of_birth": "6 October 1931", "date_of_death": "9 December 2018", "place_of_birth": "Genoa", "place_of_death": "San Diego", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Yitzhak_Rabin", "name": "Yitzhak Rabin", "year": 1994, "category": "Peace", "country": "Israel", "born_in": null, "text": "Yitzhak Rabin , Peace, 1994", "wikidata_code": "Q34060", "date_of_birth": "1 March 1922", "date_of_death": "4 November 1995", "place_of_birth": "Jerusalem", "place_of_death": "Tel Aviv", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Shimon_Peres", "name": "Shimon Peres", "year": 1994, "category": "Peace", "country": "Israel", "born_in": null, "text": "Shimon Peres ,  born in  Poland , now  Belarus , Peace, 1994", "wikidata_code": "Q57410", "date_of_birth": "1 August 1923", "date_of_death": "28 September 2016", "place_of_birth": "Višnieva", "place_of_death": "Sheba Medical Center", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Dario_Fo", "name": "Dario Fo", "year": 1997, "category": "Literature", "country": "Italy", "born_in": null, "text": "Dario Fo , Literature, 1997", "wikidata_code": "Q765", "date_of_birth": "24 March 1926", "date_of_death": "13 October 2016", "place_of_birth": "Sangiano", "place_of_death": "Luigi Sacco Hospital", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rita_Levi-Montalcini", "name": "Rita Levi-Montalcini", "year": 1986, "category": "Physiology or Medicine", "country": "Italy", "born_in": null, "text": "Rita Levi-Montalcini , Physiology or Medicine, 1986", "wikidata_code": "Q185007", "date_of_birth": "22 April 1909", "date_of_death": "30 December 2012", "place_of_birth": "Turin", "place_of_death": "Nomentano", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Franco_Modigliani", "name": "Franco Modigliani", "year": 1985, "category": "Economics", "country": null, "born_in": "Italy", "text": "Franco Modigliani *, Economics, 1985", "wikidata_code": "Q205850", "date_of_birth": "18 June 1918", "date_of_death": "25 September 2003", "place_of_birth": "Rome", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Michael_Levitt", "name": "Michael Levitt", "year": 2013, "category": "Chemistry", "country": "Israel", "born_in": null, "text": "Michael Levitt ,  born in South Africa , Chemistry, 2013", "wikidata_code": "Q6832227", "date_of_birth": "9 May 1947", "place_of_birth": "Pretoria", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Dan_Shechtman", "name": "Dan Shechtman", "year": 2011, "category": "Chemistry", "country": "Israel", "born_in": null, "text": "Dan Shechtman , Chemistry, 2011", "wikidata_code": "Q44111", "date_of_birth": "24 January 1941", "place_of_birth": "Tel Aviv", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ada_Yonath", "name": "Ada Yonath", "year": 2009, "category": "Chemistry", "country": "Israel", "born_in": null, "text": "Ada Yonath , Chemistry, 2009", "wikidata_code": "Q7426", "date_of_birth": "22 June 1939", "place_of_birth": "Jerusalem", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Robert_Aumann", "name": "Robert Aumann", "year": 2005, "category": "Economics", "country": "Israel", "born_in": null, "text": "Robert Aumann ,  born in Germany ,  moved to Israel from the United States , Economics, 2005", "wikidata_code": "Q157235", "date_of_birth": "8 June 1930", "place_of_birth": "Frankfurt", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Aaron_Ciechanover", "name": "Aaron Ciechanover", "year": 2004, "category": "Chemistry", "country": "Israel", "born_in": null, "text": "Aaron Ciechanover , Chemistry, 2004", "wikidata_code": "Q233205", "date_of_birth": "1 October 1947", "place_of_birth": "Haifa", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Avram_Hershko", "name": "Avram Hershko", "year": 2004, "category": "Chemistry", "country": "Israel", "born_in": null, "text": "Avram Hershko ,  born in  Hungary , Chemistry, 2004", "wikidata_code": "Q232302", "date_of_birth": "31 December 1937", "place_of_birth": "Karcag", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mairead_Corrigan", "name": "Mairead Corrigan", "year": 1976, "category": "Peace", "country": "Ireland", "born_in": null, "text": "Mairead Corrigan , Peace, 1976", "wikidata_code": "Q157655", "date_of_birth": "27 January 1944", "place_of_birth": "Belfast", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Betty_Williams_(Nobel_laureate)", "name": "Betty Williams", "year": 1976, "category": "Peace", "country": "Ireland", "born_in": null, "text": "Betty Williams , Peace, 1976", "wikidata_code": "Q157690", "date_of_birth": "22 May 1943", "date_of_death": "17 March 2020", "place_of_birth": "Belfast", "place_of_death": "Belfast", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Se%C3%A1n_MacBride", "name": "Seán MacBride", "year": 1974, "category": "Peace", "country": "Ireland", "born_in": null, "text": "Seán MacBride ,  born in France , Peace, 1974", "wikidata_code": "Q244395", "date_of_birth": "26 January 1904", "date_of_death": "15 January 1988", "place_of_birth": "Paris", "place_of_death": "Dublin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Samuel_Beckett", "name": "Samuel Beckett", "year": 1969, "category": "Literature", "country": "Ireland", "born_in": null, "text": "Samuel Beckett , Literature, 1969", "wikidata_code": "Q37327", "date_of_birth": "13 April 1906", "date_of_death": "22 December 1989", "place_of_birth": "Dublin", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ernest_Walton", "name": "Ernest Walton", "year": 1951, "category": "Physics", "country": "Ireland", "born_in": null, "text": "Ernest Walton , Physics, 1951", "wikidata_code": "Q183631", "date_of_birth": "6 October 1903", "date_of_death": "25 June 1995", "place_of_birth": "Abbeyside", "place_of_death": "Belfast", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_Bernard_Shaw", "name": "George Bernard Shaw", "year": 1925, "category": "Literature", "country": null, "born_in": "Ireland", "text": "George Bernard Shaw *, Literature, 1925", "wikidata_code": "Q19185", "date_of_birth": "26 July 1856", "date_of_death": "2 November 1950", "place_of_birth": "Dublin", "place_of_death": "Ayot St Lawrence", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/W._B._Yeats", "name": "W. B. Yeats", "year": 1923, "category": "Literature", "country": "Ireland", "born_in": null, "text": "W. B. Yeats , Literature, 1923", "wikidata_code": "Q40213", "date_of_birth": "13 June 1865", "date_of_death": "28 January 1939", "place_of_birth": "Sandymount", "place_of_death": "Menton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Joshua_Angrist", "name": "Joshua Angrist", "year": 2021, "category": "Economics", "country": "Israel", "born_in": null, "text": "Joshua Angrist ,  born in the United States , Economics, 2021", "wikidata_code": "Q921499", "date_of_birth": "18 September 1960", "place_of_birth": "Columbus", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Arieh_Warshel", "name": "Arieh Warshel", "year": 2013, "category": "Chemistry", "country": "Israel", "born_in": null, "text": "Arieh Warshel , Chemistry, 2013", "wikidata_code": "Q4790366", "date_of_birth": "20 November 1940", "place_of_birth": "Sde Nahum", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Daniel_Kahneman", "name": "Daniel Kahneman", "year": 2002, "category": "Economics", "country": null, "born_in": "Israel", "text": "Daniel Kahneman *, Economics, 2002", "wikidata_code": "Q233950", "date_of_birth": "5 March 1934", "place_of_birth": "Tel Aviv", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rudyard_Kipling", "name": "Rudyard Kipling", "year": 1907, "category": "Literature", "country": null, "born_in": "India", "text": "Rudyard Kipling *, Literature, 1907", "wikidata_code": "Q34743", "date_of_birth": "30 December 1865", "date_of_death": "18 January 1936", "place_of_birth": "Mumbai", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ronald_Ross", "name": "Ronald Ross", "year": 1902, "category": null, "country": null, "born_in": "India", "text": "Ronald Ross *, Medicine, 1902", "wikidata_code": "Q102034", "date_of_birth": "13 May 1857", "date_of_death": "16 September 1932", "place_of_birth": "Almora", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Narges_Mohammadi", "name": "Narges Mohammadi", "year": 2023, "category": "Peace", "country": "Iran", "born_in": null, "text": "Narges Mohammadi , Peace, 2023", "wikidata_code": "Q4967771", "date_of_birth": "21 April 1972", "place_of_birth": "Zanjan", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Shirin_Ebadi", "name": "Shirin Ebadi", "year": 2003, "category": "Peace", "country": "Iran", "born_in": null, "text": "Shirin Ebadi , Peace, 2003", "wikidata_code": "Q131152", "date_of_birth": "21 June 1947", "place_of_birth": "Hamadan", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Nadia_Murad", "name": "Nadia Murad", "year": 2018, "category": "Peace", "country": "Iraq", "born_in": null, "text": "Nadia Murad , Peace, 2018", "wikidata_code": "Q22007112", "date_of_birth": "1993", "place_of_birth": "Kocho", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/William_C._Campbell_(scientist)", "name": "William C. Campbell", "year": 2015, "category": "Physiology or Medicine", "country": "Ireland", "born_in": null, "text": "William C. Campbell , Physiology or Medicine, 2015", "wikidata_code": "Q21061212", "date_of_birth": "28 June 1930", "place_of_birth": "Ramelton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Hume", "name": "John Hume", "year": 1998, "category": "Peace", "country": "Ireland", "born_in": null, "text": "John Hume , Peace, 1998", "wikidata_code": "Q193630", "date_of_birth": "18 January 1937", "date_of_death": "3 August 2020", "place_of_birth": "Derry", "place_of_death": "Derry", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Har_Gobind_Khorana", "name": "Har Gobind Khorana", "year": 1968, "category": null, "country": null, "born_in": "India", "text": "Har Gobind Khorana *, Medicine, 1968", "wikidata_code": "Q107462", "date_of_birth": "9 January 1922", "date_of_death": "9 November 2011", "place_of_birth": "Raipur", "place_of_death": "Concord", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/C._V._Raman", "name": "C. V. Raman", "year": 1930, "category": "Physics", "country": "India", "born_in": null, "text": "C. V. Raman  , Physics, 1930", "wikidata_code": "Q60429", "date_of_birth": "7 November 1888", "date_of_death": "21 November 1970", "place_of_birth": "Tiruchirappalli", "place_of_death": "Bangalore", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rabindranath_Tagore", "name": "Rabindranath Tagore  '", "year": 1913, "category": "Literature", "country": "India", "born_in": null, "text": "Rabindranath Tagore  ', Literature, 1913", "wikidata_code": "Q7241", "date_of_birth": "7 May 1861", "date_of_death": "7 August 1941", "place_of_birth": "Kolkata", "place_of_death": "Kolkata", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_Trimble", "name": "David Trimble", "year": 1998, "category": "Peace", "country": "Ireland", "born_in": null, "text": "David Trimble , Peace, 1998", "wikidata_code": "Q192556", "date_of_birth": "15 October 1944", "date_of_death": "25 July 2022", "place_of_birth": "Belfast", "place_of_death": "Belfast", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Seamus_Heaney", "name": "Séamus Heaney", "year": 1995, "category": "Literature", "country": "Ireland", "born_in": null, "text": "Séamus Heaney , Literature, 1995", "wikidata_code": "Q93356", "date_of_birth": "13 April 1939", "date_of_death": "30 August 2013", "place_of_birth": "Castledawson", "place_of_death": "Dublin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kailash_Satyarthi", "name": "Kailash Satyarthi", "year": 2014, "category": "Peace", "country": "India", "born_in": null, "text": "Kailash Satyarthi , Peace, 2014", "wikidata_code": "Q3442375", "date_of_birth": "11 January 1954", "place_of_birth": "Vidisha", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Venkatraman_Ramakrishnan", "name": "Venkatraman Ramakrishnan", "year": 2009, "category": "Chemistry", "country": null, "born_in": "India", "text": "Venkatraman Ramakrishnan *, Chemistry, 2009", "wikidata_code": "Q60061", "date_of_birth": "1952", "place_of_birth": "Chidambaram", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/V._S._Naipaul", "name": "V. S. Naipaul", "year": 2001, "category": "Literature", "country": null, "born_in": "India", "text": "V. S. Naipaul *, Literature, 2001", "wikidata_code": "Q44593", "date_of_birth": "17 August 1932", "date_of_death": "11 August 2018", "place_of_birth": "Chaguanas", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Amartya_Sen", "name": "Amartya Sen", "year": 1998, "category": "Economics", "country": "India", "born_in": null, "text": "Amartya Sen , Economics, 1998", "wikidata_code": "Q132489", "date_of_birth": "3 November 1933", "place_of_birth": "Santiniketan", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Subramanyan_Chandrasekhar", "name": "Subramanyan Chandrasekhar", "year": 1983, "category": "Physics", "country": null, "born_in": "India", "text": "Subramanyan Chandrasekhar *, Physics, 1983", "wikidata_code": "Q148109", "date_of_birth": "19 October 1910", "date_of_death": "21 August 1995", "place_of_birth": "Lahore", "place_of_death": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Georg_von_B%C3%A9k%C3%A9sy", "name": "Georg von Békésy", "year": 1961, "category": "Physiology or Medicine", "country": "Hungary", "born_in": null, "text": "Georg von Békésy , Physiology or Medicine, 1961", "wikidata_code": "Q238716", "date_of_birth": "3 June 1899", "date_of_death": "13 June 1972", "place_of_birth": "Budapest", "place_of_death": "Honolulu", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_de_Hevesy", "name": "George de Hevesy", "year": 1943, "category": "Chemistry", "country": "Hungary", "born_in": null, "text": "George de Hevesy , Chemistry, 1943", "wikidata_code": "Q76951", "date_of_birth": "1 August 1885", "date_of_death": "5 July 1966", "place_of_birth": "Budapest", "place_of_death": "Freiburg im Breisgau", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Albert_Szent-Gy%C3%B6rgyi", "name": "Albert Szent-Györgyi", "year": 1937, "category": "Physiology or Medicine", "country": "Hungary", "born_in": null, "text": "Albert Szent-Györgyi , Physiology or Medicine, 1937", "wikidata_code": "Q180468", "date_of_birth": "16 September 1893", "date_of_death": "22 October 1986", "place_of_birth": "Budapest", "place_of_death": "Woods Hole", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Harsanyi", "name": "John Harsanyi", "year": 1994, "category": "Economics", "country": "Hungary", "born_in": null, "text": "John Harsanyi , Economics, 1994", "wikidata_code": "Q272510", "date_of_birth": "29 May 1920", "date_of_death": "9 August 2000", "place_of_birth": "Budapest", "place_of_death": "Berkeley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Polanyi", "name": "John Polanyi", "year": 1986, "category": "Chemistry", "country": "Hungary", "born_in": null, "text": "John Polanyi ,  born in Germany , Chemistry, 1986", "wikidata_code": "Q237825", "date_of_birth": "23 January 1929", "place_of_birth": "Berlin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Dennis_Gabor", "name": "Dennis Gabor", "year": 1971, "category": "Physics", "country": "Hungary", "born_in": null, "text": "Dennis Gabor , Physics, 1971", "wikidata_code": "Q155786", "date_of_birth": "5 June 1900", "date_of_death": "9 February 1979", "place_of_birth": "Budapest", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Eugene_Wigner", "name": "Eugene Wigner", "year": 1963, "category": "Physics", "country": "Hungary", "born_in": null, "text": "Eugene Wigner , Physics, 1963", "wikidata_code": "Q155790", "date_of_birth": "17 November 1902", "date_of_death": "1 January 1995", "place_of_birth": "Budapest", "place_of_death": "Princeton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_Adolf_Zsigmondy", "name": "Richard Adolf Zsigmondy", "year": 1925, "category": "Chemistry", "country": "Hungary", "born_in": null, "text": "Richard Adolf Zsigmondy , Chemistry, 1925", "wikidata_code": "Q78481", "date_of_birth": "1 April 1865", "date_of_death": "23 September 1929", "place_of_birth": "Vienna", "place_of_death": "Göttingen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/R%C3%B3bert_B%C3%A1r%C3%A1ny", "name": "Róbert Bárány", "year": 1914, "category": null, "country": "Hungary", "born_in": null, "text": "Róbert Bárány ,  born in Austria , Medicine, 1914", "wikidata_code": "Q78478", "date_of_birth": "22 April 1876", "date_of_death": "8 April 1936", "place_of_birth": "Vienna", "place_of_death": "Uppsala Cathedral Assembly", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Philipp_Lenard", "name": "Philipp Lenard", "year": 1905, "category": "Physics", "country": "Hungary", "born_in": null, "text": "Philipp Lenard , Physics, 1905", "wikidata_code": "Q57063", "date_of_birth": "7 June 1862", "date_of_death": "20 May 1947", "place_of_birth": "Bratislava", "place_of_death": "Messelhausen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Halld%C3%B3r_Laxness", "name": "Halldór Laxness", "year": 1955, "category": "Literature", "country": "Iceland", "born_in": null, "text": "Halldór Laxness , Literature, 1955", "wikidata_code": "Q80321", "date_of_birth": "23 April 1902", "date_of_death": "8 February 1998", "place_of_birth": "Reykjavík", "place_of_death": "Mosfellsbær", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Abhijit_Banerjee", "name": "Abhijit Banerjee", "year": 2019, "category": "Economics", "country": null, "born_in": "India", "text": "Abhijit Banerjee *, Economics, 2019", "wikidata_code": "Q320578", "date_of_birth": "21 February 1961", "place_of_birth": "Mumbai", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mother_Teresa", "name": "Mother Teresa", "year": 1979, "category": "Peace", "country": "India", "born_in": null, "text": "Mother Teresa ,  born in then Ottoman Empire, now  North Macedonia , Peace, 1979", "wikidata_code": "Q30547", "date_of_birth": "26 August 1910", "date_of_death": "5 September 1997", "place_of_birth": "Skopje", "place_of_death": "Kolkata", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Imre_Kert%C3%A9sz", "name": "Imre Kertész", "year": 2002, "category": "Literature", "country": "Hungary", "born_in": null, "text": "Imre Kertész , Literature, 2002", "wikidata_code": "Q47755", "date_of_birth": "9 November 1929", "date_of_death": "31 March 2016", "place_of_birth": "Budapest", "place_of_death": "Budapest", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/George_Andrew_Olah", "name": "George Andrew Olah", "year": 1994, "category": "Chemistry", "country": "Hungary", "born_in": null, "text": "George Andrew Olah , Chemistry, 1994", "wikidata_code": "Q192603", "date_of_birth": "22 May 1927", "date_of_death": "8 March 2017", "place_of_birth": "Budapest", "place_of_death": "Beverly Hills", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kofi_Annan", "name": "Kofi Annan", "year": 2001, "category": "Peace", "country": "Ghana", "born_in": null, "text": "Kofi Annan , Peace, 2001", "wikidata_code": "Q1254", "date_of_birth": "8 April 1938", "date_of_death": "18 August 2018", "place_of_birth": "Kumasi", "place_of_death": "Bern", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Odysseas_Elytis", "name": "Odysseas Elytis", "year": 1979, "category": "Literature", "country": "Greece", "born_in": null, "text": "Odysseas Elytis , Literature, 1979", "wikidata_code": "Q160478", "date_of_birth": "2 November 1911", "date_of_death": "18 March 1996", "place_of_birth": "Heraklion", "place_of_death": "Athens", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Giorgos_Seferis", "name": "Giorgos Seferis", "year": 1963, "category": "Literature", "country": "Greece", "born_in": null, "text": "Giorgos Seferis ,  born in then Ottoman Empire, now Turkey , Literature, 1963", "wikidata_code": "Q165823", "date_of_birth": "13 March 1900", "date_of_death": "20 September 1971", "place_of_birth": "Urla", "place_of_death": "Athens", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rigoberta_Mench%C3%BA", "name": "Rigoberta Menchú", "year": 1992, "category": "Peace", "country": "Guatemala", "born_in": null, "text": "Rigoberta Menchú , Peace, 1992", "wikidata_code": "Q188620", "date_of_birth": "9 January 1959", "place_of_birth": "Laj Chimel", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Miguel_%C3%81ngel_Asturias", "name": "Miguel Ángel Asturias", "year": 1967, "category": "Literature", "country": "Guatemala", "born_in": null, "text": "Miguel Ángel Asturias , Literature, 1967", "wikidata_code": "Q75603", "date_of_birth": "19 October 1899", "date_of_death": "9 June 1974", "place_of_birth": "Guatemala City", "place_of_death": "Madrid", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Philipp_Lenard", "name": "Philipp Lenard", "year": 1905, "category": "Physics", "country": "Germany", "born_in": null, "text": "Philipp Lenard ,  born in  Pressburg ,  Kingdom of Hungary ,  Austrian Empire , now  Slovakia , Physics, 1905", "wikidata_code": "Q57063", "date_of_birth": "7 June 1862", "date_of_death": "20 May 1947", "place_of_birth": "Bratislava", "place_of_death": "Messelhausen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Adolf_von_Baeyer", "name": "Adolf von Baeyer", "year": 1905, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Adolf von Baeyer , Chemistry, 1905", "wikidata_code": "Q57078", "date_of_birth": "31 October 1835", "date_of_death": "20 August 1917", "place_of_birth": "Berlin", "place_of_death": "Starnberg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hermann_Emil_Fischer", "name": "Hermann Emil Fischer", "year": 1902, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Hermann Emil Fischer , Chemistry, 1902", "wikidata_code": "Q70554", "date_of_birth": "9 October 1852", "date_of_death": "15 July 1919", "place_of_birth": "Euskirchen", "place_of_death": "Berlin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Theodor_Mommsen", "name": "Theodor Mommsen", "year": 1902, "category": "Literature", "country": "Germany", "born_in": null, "text": "Theodor Mommsen ,  born in  Duchy of Schleswig , Literature, 1902", "wikidata_code": "Q25351", "date_of_birth": "30 November 1817", "date_of_death": "1 November 1903", "place_of_birth": "Garding", "place_of_death": "Charlottenburg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Emil_Adolf_von_Behring", "name": "Emil Adolf von Behring", "year": 1901, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Emil Adolf von Behring , Physiology or Medicine, 1901", "wikidata_code": "Q76425", "date_of_birth": "15 March 1854", "date_of_death": "31 March 1917", "place_of_birth": "Ławice", "place_of_death": "Marburg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Wilhelm_Conrad_R%C3%B6ntgen", "name": "Wilhelm Conrad Röntgen", "year": 1901, "category": "Physics", "country": "Germany", "born_in": null, "text": "Wilhelm Conrad Röntgen , Physics, 1901", "wikidata_code": "Q35149", "date_of_birth": "27 March 1845", "date_of_death": "10 February 1923", "place_of_birth": "Lennep", "place_of_death": "Munich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_K._Kao", "name": "Charles K. Kao", "year": 2009, "category": "Physics", "country": "Hong Kong", "born_in": null, "text": "Charles K. Kao , Physics, 2009", "wikidata_code": "Q16389", "date_of_birth": "4 November 1933", "date_of_death": "23 September 2018", "place_of_birth": "People's Republic of China", "place_of_death": "Bradbury Hospice", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ferenc_Krausz", "name": "Ferenc Krausz", "year": 2023, "category": "Physics", "country": "Hungary", "born_in": null, "text": "Ferenc Krausz , Physics, 2023", "wikidata_code": "Q86970", "date_of_birth": "17 May 1962", "place_of_birth": "Mór", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Katalin_Karik%C3%B3", "name": "Katalin Karikó", "year": 2023, "category": "Physiology or Medicine", "country": "Hungary", "born_in": null, "text": "Katalin Karikó , Physiology or Medicine, 2023", "wikidata_code": "Q88608397", "date_of_birth": "17 January 1955", "place_of_birth": "Szolnok", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Avram_Hershko", "name": "Avram Hershko", "year": 2004, "category": "Chemistry", "country": null, "born_in": "Hungary", "text": "Avram Hershko *,  as an  Israeli  citizen , Chemistry, 2004", "wikidata_code": "Q232302", "date_of_birth": "31 December 1937", "place_of_birth": "Karcag", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Max_von_Laue", "name": "Max von Laue", "year": 1914, "category": "Physics", "country": "Germany", "born_in": null, "text": "Max von Laue , Physics, 1914", "wikidata_code": "Q57067", "date_of_birth": "9 October 1879", "date_of_death": "24 April 1960", "place_of_birth": "Koblenz", "place_of_death": "West Berlin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gerhart_Hauptmann", "name": "Gerhart Hauptmann", "year": 1912, "category": "Literature", "country": "Germany", "born_in": null, "text": "Gerhart Hauptmann ,  born in  Prussia , now  Poland , Literature, 1912", "wikidata_code": "Q43523", "date_of_birth": "15 November 1862", "date_of_death": "6 June 1946", "place_of_birth": "Szczawno-Zdrój", "place_of_death": "Jagniątków", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Wilhelm_Wien", "name": "Wilhelm Wien", "year": 1911, "category": "Physics", "country": "Germany", "born_in": null, "text": "Wilhelm Wien , Physics, 1911", "wikidata_code": "Q57068", "date_of_birth": "13 January 1864", "date_of_death": "30 August 1928", "place_of_birth": "Parusnoje", "place_of_death": "Munich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Otto_Wallach", "name": "Otto Wallach", "year": 1910, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Otto Wallach , Chemistry, 1910", "wikidata_code": "Q57127", "date_of_birth": "27 March 1847", "date_of_death": "26 February 1931", "place_of_birth": "Königsberg", "place_of_death": "Göttingen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gustav_Ludwig_Hertz", "name": "Gustav Ludwig Hertz", "year": 1925, "category": "Physics", "country": "Germany", "born_in": null, "text": "Gustav Ludwig Hertz , Physics, 1925", "wikidata_code": "Q57070", "date_of_birth": "22 July 1887", "date_of_death": "30 October 1975", "place_of_birth": "Hamburg", "place_of_death": "East Berlin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Otto_Fritz_Meyerhof", "name": "Otto Fritz Meyerhof", "year": 1922, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Otto Fritz Meyerhof , Physiology or Medicine, 1922", "wikidata_code": "Q57132", "date_of_birth": "12 April 1884", "date_of_death": "6 October 1951", "place_of_birth": "Hanover", "place_of_death": "Philadelphia", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/James_Franck", "name": "James Franck", "year": 1925, "category": "Physics", "country": "Germany", "born_in": null, "text": "James Franck , Physics, 1925", "wikidata_code": "Q57066", "date_of_birth": "26 August 1882", "date_of_death": "21 May 1964", "place_of_birth": "Hamburg", "place_of_death": "Göttingen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Albert_Einstein", "name": "Albert Einstein", "year": 1921, "category": "Physics", "country": "Germany", "born_in": null, "text": "Albert Einstein , Physics, 1921", "wikidata_code": "Q937", "date_of_birth": "14 March 1879", "date_of_death": "18 April 1955", "place_of_birth": "Ulm", "place_of_death": "Princeton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Walther_Nernst", "name": "Walther Nernst", "year": 1920, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Walther Nernst , Chemistry, 1920", "wikidata_code": "Q57125", "date_of_birth": "25 June 1864", "date_of_death": "18 November 1941", "place_of_birth": "Wąbrzeźno", "place_of_death": "Niwica, Żary County", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Johannes_Stark", "name": "Johannes Stark", "year": 1919, "category": "Physics", "country": "Germany", "born_in": null, "text": "Johannes Stark , Physics, 1919", "wikidata_code": "Q57092", "date_of_birth": "15 April 1874", "date_of_death": "21 June 1957", "place_of_birth": "Freihung", "place_of_death": "Traunstein", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fritz_Haber", "name": "Fritz Haber", "year": 1918, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Fritz Haber , Chemistry, 1918", "wikidata_code": "Q57075", "date_of_birth": "9 December 1868", "date_of_death": "29 January 1934", "place_of_birth": "Wrocław", "place_of_death": "Basel", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Max_Karl_Ernst_Ludwig_Planck", "name": "Max Karl Ernst Ludwig Planck", "year": 1918, "category": "Physics", "country": "Germany", "born_in": null, "text": "Max Karl Ernst Ludwig Planck , Physics, 1918", "wikidata_code": "Q9021", "date_of_birth": "23 April 1858", "date_of_death": "4 October 1947", "place_of_birth": "Kiel", "place_of_death": "Göttingen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_Willst%C3%A4tter", "name": "Richard Willstätter", "year": 1915, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Richard Willstätter , Chemistry, 1915", "wikidata_code": "Q77072", "date_of_birth": "13 August 1872", "date_of_death": "3 August 1942", "place_of_birth": "Karlsruhe", "place_of_death": "Muralto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Albrecht_Kossel", "name": "Albrecht Kossel", "year": 1910, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Albrecht Kossel , Physiology or Medicine, 1910", "wikidata_code": "Q57128", "date_of_birth": "16 September 1853", "date_of_death": "5 July 1927", "place_of_birth": "Rostock", "place_of_death": "Heidelberg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_Johann_Ludwig_Heyse", "name": "Paul Johann Ludwig Heyse", "year": 1910, "category": "Literature", "country": "Germany", "born_in": null, "text": "Paul Johann Ludwig Heyse , Literature, 1910", "wikidata_code": "Q76487", "date_of_birth": "15 March 1830", "date_of_death": "2 April 1914", "place_of_birth": "Berlin", "place_of_death": "Munich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Karl_Ferdinand_Braun", "name": "Karl Ferdinand Braun", "year": 1909, "category": "Physics", "country": "Germany", "born_in": null, "text": "Karl Ferdinand Braun , Physics, 1909", "wikidata_code": "Q57077", "date_of_birth": "6 June 1850", "date_of_death": "20 April 1918", "place_of_birth": "Fulda", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Wilhelm_Ostwald", "name": "Wilhelm Ostwald", "year": 1909, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Wilhelm Ostwald ,  born in  Russia , now  Latvia , Chemistry, 1909", "wikidata_code": "Q12658", "date_of_birth": "21 August 1853", "date_of_death": "4 April 1932", "place_of_birth": "Riga", "place_of_death": "Großbothen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rudolf_Christoph_Eucken", "name": "Rudolf Christoph Eucken", "year": 1908, "category": "Literature", "country": "Germany", "born_in": null, "text": "Rudolf Christoph Eucken , Literature, 1908", "wikidata_code": "Q47695", "date_of_birth": "5 January 1846", "date_of_death": "15 September 1926", "place_of_birth": "Aurich", "place_of_death": "Jena", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_Ehrlich", "name": "Paul Ehrlich", "year": 1908, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Paul Ehrlich , Physiology or Medicine, 1908", "wikidata_code": "Q57089", "date_of_birth": "14 March 1854", "date_of_death": "20 August 1915", "place_of_birth": "Strzelin", "place_of_death": "Bad Homburg vor der Höhe", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Eduard_Buchner", "name": "Eduard Buchner", "year": 1907, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Eduard Buchner , Chemistry, 1907", "wikidata_code": "Q43917", "date_of_birth": "20 May 1860", "date_of_death": "13 August 1917", "place_of_birth": "Munich", "place_of_death": "Focșani", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_Koch", "name": "Robert Koch", "year": 1905, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Robert Koch , Physiology or Medicine, 1905", "wikidata_code": "Q37193", "date_of_birth": "11 December 1843", "date_of_death": "27 May 1910", "place_of_birth": "Clausthal", "place_of_death": "Baden-Baden", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carl_von_Ossietzky", "name": "Carl von Ossietzky", "year": 1935, "category": "Peace", "country": "Germany", "born_in": null, "text": "Carl von Ossietzky , Peace, 1935", "wikidata_code": "Q76358", "date_of_birth": "3 October 1889", "date_of_death": "4 May 1938", "place_of_birth": "Hamburg", "place_of_death": "Berlin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hans_Spemann", "name": "Hans Spemann", "year": 1935, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Hans Spemann , Physiology or Medicine, 1935", "wikidata_code": "Q57568", "date_of_birth": "27 June 1869", "date_of_death": "9 September 1941", "place_of_birth": "Stuttgart", "place_of_death": "Freiburg im Breisgau", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Werner_Karl_Heisenberg", "name": "Werner Karl Heisenberg", "year": 1932, "category": "Physics", "country": "Germany", "born_in": null, "text": "Werner Karl Heisenberg , Physics, 1932", "wikidata_code": "Q40904", "date_of_birth": "5 December 1901", "date_of_death": "1 February 1976", "place_of_birth": "Würzburg", "place_of_death": "Munich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Otto_Heinrich_Warburg", "name": "Otto Heinrich Warburg", "year": 1931, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Otto Heinrich Warburg , Physiology or Medicine, 1931", "wikidata_code": "Q76464", "date_of_birth": "8 October 1883", "date_of_death": "1 August 1970", "place_of_birth": "Freiburg im Breisgau", "place_of_death": "West Berlin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carl_Bosch", "name": "Carl Bosch", "year": 1931, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Carl Bosch , Chemistry, 1931", "wikidata_code": "Q76606", "date_of_birth": "27 August 1874", "date_of_death": "26 April 1940", "place_of_birth": "Cologne", "place_of_death": "Heidelberg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Friedrich_Bergius", "name": "Friedrich Bergius", "year": 1931, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Friedrich Bergius , Chemistry, 1931", "wikidata_code": "Q76614", "date_of_birth": "11 October 1884", "date_of_death": "30 March 1949", "place_of_birth": "Wrocław", "place_of_death": "Buenos Aires", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Otto_Diels", "name": "Otto Diels", "year": 1950, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Otto Diels , Chemistry, 1950", "wikidata_code": "Q76616", "date_of_birth": "23 January 1876", "date_of_death": "7 March 1954", "place_of_birth": "Hamburg", "place_of_death": "Kiel", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Kurt_Alder", "name": "Kurt Alder", "year": 1950, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Kurt Alder , Chemistry, 1950", "wikidata_code": "Q76595", "date_of_birth": "10 July 1902", "date_of_death": "20 June 1958", "place_of_birth": "Chorzów", "place_of_death": "Cologne", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hermann_Hesse", "name": "Hermann Hesse", "year": 1946, "category": "Literature", "country": null, "born_in": "Germany", "text": "Hermann Hesse *, Literature, 1946", "wikidata_code": "Q25973", "date_of_birth": "2 July 1877", "date_of_death": "9 August 1962", "place_of_birth": "Calw", "place_of_death": "Montagnola", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ernst_Boris_Chain", "name": "Ernst Boris Chain", "year": 1945, "category": "Physiology or Medicine", "country": null, "born_in": "Germany", "text": "Ernst Boris Chain *, Physiology or Medicine, 1945", "wikidata_code": "Q58054", "date_of_birth": "19 June 1906", "date_of_death": "12 August 1979", "place_of_birth": "Berlin", "place_of_death": "Castlebar", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Otto_Hahn", "name": "Otto Hahn", "year": 1944, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Otto Hahn , Chemistry, 1944", "wikidata_code": "Q57065", "date_of_birth": "8 March 1879", "date_of_death": "28 July 1968", "place_of_birth": "Frankfurt", "place_of_death": "Göttingen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Otto_Stern", "name": "Otto Stern", "year": 1943, "category": "Physics", "country": null, "born_in": "Germany", "text": "Otto Stern *, Physics, 1943", "wikidata_code": "Q57072", "date_of_birth": "17 February 1888", "date_of_death": "17 August 1969", "place_of_birth": "Żory", "place_of_death": "Berkeley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Adolf_Butenandt", "name": "Adolf Butenandt", "year": 1939, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Adolf Butenandt , Chemistry, 1939", "wikidata_code": "Q5327", "date_of_birth": "24 March 1903", "date_of_death": "18 January 1995", "place_of_birth": "Bremerhaven", "place_of_death": "Munich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gerhard_Domagk", "name": "Gerhard Domagk", "year": 1939, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Gerhard Domagk , Physiology or Medicine, 1939", "wikidata_code": "Q57192", "date_of_birth": "30 October 1895", "date_of_death": "24 April 1964", "place_of_birth": "Łagów, Świebodzin County", "place_of_death": "Königsfeld im Schwarzwald", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_Kuhn", "name": "Richard Kuhn", "year": 1938, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Richard Kuhn ,  born in  Austria-Hungary , now  Austria , Chemistry, 1938", "wikidata_code": "Q78483", "date_of_birth": "3 December 1900", "date_of_death": "31 July 1967", "place_of_birth": "Vienna", "place_of_death": "Heidelberg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Otto_Loewi", "name": "Otto Loewi", "year": 1936, "category": "Physiology or Medicine", "country": null, "born_in": "Germany", "text": "Otto Loewi *, Physiology or Medicine, 1936", "wikidata_code": "Q77173", "date_of_birth": "3 June 1873", "date_of_death": "25 December 1961", "place_of_birth": "Frankfurt", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hans_Fischer", "name": "Hans Fischer", "year": 1930, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Hans Fischer , Chemistry, 1930", "wikidata_code": "Q76604", "date_of_birth": "27 July 1881", "date_of_death": "31 March 1945", "place_of_birth": "Höchst", "place_of_death": "Munich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Thomas_Mann", "name": "Thomas Mann", "year": 1929, "category": "Literature", "country": "Germany", "born_in": null, "text": "Thomas Mann , Literature, 1929", "wikidata_code": "Q37030", "date_of_birth": "6 June 1875", "date_of_death": "12 August 1955", "place_of_birth": "Lübeck", "place_of_death": "Zürich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hans_von_Euler-Chelpin", "name": "Hans von Euler-Chelpin", "year": 1929, "category": "Chemistry", "country": null, "born_in": "Germany", "text": "Hans von Euler-Chelpin *, Chemistry, 1929", "wikidata_code": "Q76613", "date_of_birth": "15 February 1873", "date_of_death": "6 November 1964", "place_of_birth": "Augsburg", "place_of_death": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Adolf_Otto_Reinhold_Windaus", "name": "Adolf Otto Reinhold Windaus", "year": 1928, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Adolf Otto Reinhold Windaus , Chemistry, 1928", "wikidata_code": "Q77142", "date_of_birth": "25 December 1876", "date_of_death": "9 June 1959", "place_of_birth": "Berlin", "place_of_death": "Göttingen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ludwig_Quidde", "name": "Ludwig Quidde", "year": 1927, "category": "Peace", "country": "Germany", "born_in": null, "text": "Ludwig Quidde , Peace, 1927", "wikidata_code": "Q76696", "date_of_birth": "23 March 1858", "date_of_death": "4 March 1941", "place_of_birth": "Bremen", "place_of_death": "Geneva", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Heinrich_Otto_Wieland", "name": "Heinrich Otto Wieland", "year": 1927, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Heinrich Otto Wieland , Chemistry, 1927", "wikidata_code": "Q76610", "date_of_birth": "4 June 1877", "date_of_death": "5 August 1957", "place_of_birth": "Pforzheim", "place_of_death": "Starnberg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gustav_Stresemann", "name": "Gustav Stresemann", "year": 1926, "category": "Peace", "country": "Germany", "born_in": null, "text": "Gustav Stresemann , Peace, 1926", "wikidata_code": "Q103955", "date_of_birth": "10 May 1878", "date_of_death": "3 October 1929", "place_of_birth": "Berlin", "place_of_death": "Berlin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hans_Adolf_Krebs", "name": "Hans Adolf Krebs", "year": 1953, "category": "Physiology or Medicine", "country": null, "born_in": "Germany", "text": "Hans Adolf Krebs *, Physiology or Medicine, 1953", "wikidata_code": "Q57191", "date_of_birth": "25 August 1900", "date_of_death": "22 November 1981", "place_of_birth": "Hildesheim", "place_of_death": "Oxford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Albert_Schweitzer", "name": "Albert Schweitzer", "year": 1952, "category": "Peace", "country": null, "born_in": "Germany", "text": "Albert Schweitzer *, Peace, 1952", "wikidata_code": "Q49325", "date_of_birth": "14 January 1875", "date_of_death": "4 September 1965", "place_of_birth": "Kaysersberg", "place_of_death": "Lambaréné", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hans_Bethe", "name": "Hans Bethe", "year": 1967, "category": "Physics", "country": null, "born_in": "Germany", "text": "Hans Bethe *, Physics, 1967", "wikidata_code": "Q155794", "date_of_birth": "2 July 1906", "date_of_death": "6 March 2005", "place_of_birth": "Strasbourg", "place_of_death": "Ithaca", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Nelly_Sachs", "name": "Nelly Sachs", "year": 1966, "category": "Literature", "country": null, "born_in": "Germany", "text": "Nelly Sachs *, Literature, 1966", "wikidata_code": "Q57074", "date_of_birth": "10 December 1891", "date_of_death": "12 May 1970", "place_of_birth": "Schöneberg", "place_of_death": "Stockholm", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Feodor_Felix_Konrad_Lynen", "name": "Feodor Felix Konrad Lynen", "year": 1964, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Feodor Felix Konrad Lynen , Physiology or Medicine, 1964", "wikidata_code": "Q44597", "date_of_birth": "6 April 1911", "date_of_death": "6 August 1979", "place_of_birth": "Munich", "place_of_death": "Munich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Konrad_Emil_Bloch", "name": "Konrad Bloch", "year": 1964, "category": "Physiology or Medicine", "country": null, "born_in": "Germany", "text": "Konrad Bloch *, Physiology or Medicine, 1964", "wikidata_code": "Q35698", "date_of_birth": "21 January 1912", "date_of_death": "15 October 2000", "place_of_birth": "Nysa", "place_of_death": "Lexington", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Karl_Ziegler", "name": "Karl Ziegler", "year": 1963, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Karl Ziegler , Chemistry, 1963", "wikidata_code": "Q76624", "date_of_birth": "26 November 1898", "date_of_death": "12 August 1973", "place_of_birth": "Helsa", "place_of_death": "Mülheim an der Ruhr", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Maria_Goeppert-Mayer", "name": "Maria Goeppert-Mayer", "year": 1963, "category": "Physics", "country": null, "born_in": "Germany", "text": "Maria Goeppert-Mayer *, Physics, 1963", "wikidata_code": "Q57100", "date_of_birth": "28 June 1906", "date_of_death": "20 February 1972", "place_of_birth": "Katowice", "place_of_death": "San Diego", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Bernard_Katz", "name": "Bernard Katz", "year": 1970, "category": "Physiology or Medicine", "country": null, "born_in": "Germany", "text": "Bernard Katz *, Physiology or Medicine, 1970", "wikidata_code": "Q4517", "date_of_birth": "26 March 1911", "date_of_death": "20 April 2003", "place_of_birth": "Leipzig", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Max_Delbr%C3%BCck", "name": "Max Delbrück", "year": 1969, "category": "Physiology or Medicine", "country": null, "born_in": "Germany", "text": "Max Delbrück *, Physiology or Medicine, 1969", "wikidata_code": "Q76807", "date_of_birth": "4 September 1906", "date_of_death": "10 March 1981", "place_of_birth": "Berlin", "place_of_death": "Pasadena", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Manfred_Eigen", "name": "Manfred Eigen", "year": 1967, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Manfred Eigen , Chemistry, 1967", "wikidata_code": "Q76600", "date_of_birth": "9 May 1927", "date_of_death": "6 February 2019", "place_of_birth": "Bochum", "place_of_death": "Göttingen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/J._Hans_D._Jensen", "name": "J. Hans D. Jensen", "year": 1963, "category": "Physics", "country": "Germany", "born_in": null, "text": "J. Hans D. Jensen , Physics, 1963", "wikidata_code": "Q76797", "date_of_birth": "25 June 1907", "date_of_death": "11 February 1973", "place_of_birth": "Hamburg", "place_of_death": "Heidelberg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rudolf_M%C3%B6ssbauer", "name": "Rudolf Mössbauer", "year": 1961, "category": "Physics", "country": "Germany", "born_in": null, "text": "Rudolf Mössbauer , Physics, 1961", "wikidata_code": "Q44286", "date_of_birth": "31 January 1929", "date_of_death": "14 September 2011", "place_of_birth": "Munich", "place_of_death": "Grünwald", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Werner_Forssmann", "name": "Werner Forssmann", "year": 1956, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Werner Forssmann , Physiology or Medicine, 1956", "wikidata_code": "Q77152", "date_of_birth": "29 August 1904", "date_of_death": "1 June 1979", "place_of_birth": "Berlin", "place_of_death": "Schopfheim", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Polykarp_Kusch", "name": "Polykarp Kusch", "year": 1955, "category": "Physics", "country": null, "born_in": "Germany", "text": "Polykarp Kusch *, Physics, 1955", "wikidata_code": "Q184571", "date_of_birth": "26 January 1911", "date_of_death": "20 March 1993", "place_of_birth": "Blankenburg", "place_of_death": "Dallas", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Max_Born", "name": "Max Born", "year": 1954, "category": "Physics", "country": null, "born_in": "Germany", "text": "Max Born *, Physics, 1954", "wikidata_code": "Q58978", "date_of_birth": "11 December 1882", "date_of_death": "5 January 1970", "place_of_birth": "Wrocław", "place_of_death": "Göttingen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Walther_Bothe", "name": "Walther Bothe", "year": 1954, "category": "Physics", "country": "Germany", "born_in": null, "text": "Walther Bothe , Physics, 1954", "wikidata_code": "Q76474", "date_of_birth": "8 January 1891", "date_of_death": "8 February 1957", "place_of_birth": "Oranienburg", "place_of_death": "Heidelberg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hermann_Staudinger", "name": "Hermann Staudinger", "year": 1953, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Hermann Staudinger , Chemistry, 1953", "wikidata_code": "Q48956", "date_of_birth": "23 March 1881", "date_of_death": "8 September 1965", "place_of_birth": "Worms", "place_of_death": "Freiburg im Breisgau", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fritz_Albert_Lipmann", "name": "Fritz Albert Lipmann", "year": 1953, "category": "Physiology or Medicine", "country": null, "born_in": "Germany", "text": "Fritz Albert Lipmann *, Physiology or Medicine, 1953", "wikidata_code": "Q77104", "date_of_birth": "12 June 1899", "date_of_death": "24 July 1986", "place_of_birth": "Königsberg", "place_of_death": "Poughkeepsie", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gerhard_Herzberg", "name": "Gerhard Herzberg", "year": 1971, "category": "Chemistry", "country": null, "born_in": "Germany", "text": "Gerhard Herzberg *, Chemistry, 1971", "wikidata_code": "Q76602", "date_of_birth": "25 December 1904", "date_of_death": "3 March 1999", "place_of_birth": "Hamburg", "place_of_death": "Ottawa", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Willy_Brandt", "name": "Willy Brandt", "year": 1971, "category": "Peace", "country": "Germany", "born_in": null, "text": "Willy Brandt , Peace, 1971", "wikidata_code": "Q2514", "date_of_birth": "18 December 1913", "date_of_death": "8 October 1992", "place_of_birth": "Sankt Lorenz", "place_of_death": "Unkel", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Georg_Wittig", "name": "Georg Wittig", "year": 1979, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Georg Wittig , Chemistry, 1979", "wikidata_code": "Q77171", "date_of_birth": "16 June 1897", "date_of_death": "26 August 1987", "place_of_birth": "Berlin", "place_of_death": "Heidelberg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Arno_Penzias", "name": "Arno Penzias", "year": 1978, "category": "Physics", "country": null, "born_in": "Germany", "text": "Arno Penzias *, Physics, 1978", "wikidata_code": "Q172877", "date_of_birth": "26 April 1933", "place_of_birth": "Munich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henry_Kissinger", "name": "Henry Kissinger", "year": 1978, "category": "Peace", "country": null, "born_in": "Germany", "text": "Henry Kissinger *, Peace, 1978", "wikidata_code": "Q66107", "date_of_birth": "27 May 1923", "place_of_birth": "Fürth", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ernst_Otto_Fischer", "name": "Ernst Otto Fischer", "year": 1973, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Ernst Otto Fischer , Chemistry, 1973", "wikidata_code": "Q44594", "date_of_birth": "10 November 1918", "date_of_death": "23 July 2007", "place_of_birth": "Solln", "place_of_death": "Munich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Klaus_von_Klitzing", "name": "Klaus von Klitzing", "year": 1985, "category": "Physics", "country": "Germany", "born_in": null, "text": "Klaus von Klitzing , Physics, 1985", "wikidata_code": "Q71024", "date_of_birth": "28 June 1943", "place_of_birth": "Środa Wielkopolska", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_Huber", "name": "Robert Huber", "year": 1988, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Robert Huber , Chemistry, 1988", "wikidata_code": "Q76623", "date_of_birth": "20 February 1937", "place_of_birth": "Munich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hartmut_Michel", "name": "Hartmut Michel", "year": 1988, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Hartmut Michel , Chemistry, 1988", "wikidata_code": "Q77086", "date_of_birth": "18 July 1948", "place_of_birth": "Ludwigsburg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jack_Steinberger", "name": "Jack Steinberger", "year": 1988, "category": "Physics", "country": null, "born_in": "Germany", "text": "Jack Steinberger *, Physics, 1988", "wikidata_code": "Q153210", "date_of_birth": "25 May 1921", "date_of_death": "12 December 2020", "place_of_birth": "Bad Kissingen", "place_of_death": "Geneva", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Hans_G._Dehmelt", "name": "Hans G. Dehmelt", "year": 1989, "category": "Physics", "country": null, "born_in": "Germany", "text": "Hans G. Dehmelt *, Physics, 1989", "wikidata_code": "Q70532", "date_of_birth": "9 September 1922", "date_of_death": "7 March 2017", "place_of_birth": "Görlitz", "place_of_death": "Seattle", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Wolfgang_Paul", "name": "Wolfgang Paul", "year": 1989, "category": "Physics", "country": "Germany", "born_in": null, "text": "Wolfgang Paul , Physics, 1989", "wikidata_code": "Q57227", "date_of_birth": "10 August 1913", "date_of_death": "7 December 1993", "place_of_birth": "Lorenzkirch", "place_of_death": "Bonn", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Johann_Deisenhofer", "name": "Johann Deisenhofer", "year": 1988, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Johann Deisenhofer , Chemistry, 1988", "wikidata_code": "Q76612", "date_of_birth": "30 September 1943", "place_of_birth": "Zusamaltheim", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/J._Georg_Bednorz", "name": "J. Georg Bednorz", "year": 1987, "category": "Physics", "country": "Germany", "born_in": null, "text": "J. Georg Bednorz , Physics, 1987", "wikidata_code": "Q76687", "date_of_birth": "16 May 1950", "place_of_birth": "Neuenkirchen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Polanyi", "name": "John Polanyi", "year": 1986, "category": "Chemistry", "country": null, "born_in": "Germany", "text": "John Polanyi *, Chemistry, 1986", "wikidata_code": "Q237825", "date_of_birth": "23 January 1929", "place_of_birth": "Berlin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ernst_Ruska", "name": "Ernst Ruska", "year": 1986, "category": "Physics", "country": "Germany", "born_in": null, "text": "Ernst Ruska , Physics, 1986", "wikidata_code": "Q71022", "date_of_birth": "25 December 1906", "date_of_death": "27 May 1988", "place_of_birth": "Heidelberg", "place_of_death": "West Berlin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gerd_Binnig", "name": "Gerd Binnig", "year": 1986, "category": "Physics", "country": "Germany", "born_in": null, "text": "Gerd Binnig , Physics, 1986", "wikidata_code": "Q76766", "date_of_birth": "20 July 1947", "place_of_birth": "Frankfurt", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Georges_J.F._K%C3%B6hler", "name": "Georges J.F. Köhler", "year": 1984, "category": "Physiology or Medicine", "country": null, "born_in": "Germany", "text": "Georges J.F. Köhler *, Physiology or Medicine, 1984", "wikidata_code": "Q77160", "date_of_birth": "17 April 1946", "date_of_death": "1 March 1995", "place_of_birth": "Munich", "place_of_death": "Freiburg im Breisgau", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Karl_von_Frisch", "name": "Karl von Frisch", "year": 1973, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Karl von Frisch ,  born in  Austria-Hungary , now  Austria , Physiology or Medicine, 1973", "wikidata_code": "Q60060", "date_of_birth": "20 November 1886", "date_of_death": "12 June 1982", "place_of_birth": "Vienna", "place_of_death": "Munich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Heinrich_B%C3%B6ll", "name": "Heinrich Böll", "year": 1972, "category": "Literature", "country": "Germany", "born_in": null, "text": "Heinrich Böll , Literature, 1972", "wikidata_code": "Q42747", "date_of_birth": "21 December 1917", "date_of_death": "16 July 1985", "place_of_birth": "Cologne", "place_of_death": "Langenbroich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Horst_Ludwig_St%C3%B6rmer", "name": "Horst L. Störmer", "year": 1998, "category": "Physics", "country": "Germany", "born_in": null, "text": "Horst L. Störmer , Physics, 1998", "wikidata_code": "Q71015", "date_of_birth": "6 April 1949", "place_of_birth": "Frankfurt", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_J._Crutzen", "name": "Paul J. Crutzen", "year": 1995, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Paul J. Crutzen , Chemistry, 1995", "wikidata_code": "Q135139", "date_of_birth": "3 December 1933", "date_of_death": "28 January 2021", "place_of_birth": "Amsterdam", "place_of_death": "Mainz", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Christiane_N%C3%BCsslein-Volhard", "name": "Christiane Nüsslein-Volhard", "year": 1995, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Christiane Nüsslein-Volhard , Physiology or Medicine, 1995", "wikidata_code": "Q77174", "date_of_birth": "20 October 1942", "place_of_birth": "Magdeburg", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Reinhard_Selten", "name": "Reinhard Selten", "year": 1994, "category": "Economics", "country": "Germany", "born_in": null, "text": "Reinhard Selten , Economics, 1994", "wikidata_code": "Q12830", "date_of_birth": "5 October 1930", "date_of_death": "23 August 2016", "place_of_birth": "Wrocław", "place_of_death": "Poznań", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Bert_Sakmann", "name": "Bert Sakmann", "year": 1991, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Bert Sakmann , Physiology or Medicine, 1991", "wikidata_code": "Q77081", "date_of_birth": "12 June 1942", "place_of_birth": "Stuttgart", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Erwin_Neher", "name": "Erwin Neher", "year": 1991, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Erwin Neher , Physiology or Medicine, 1991", "wikidata_code": "Q77126", "date_of_birth": "20 March 1944", "place_of_birth": "Landsberg am Lech", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Thomas_C._S%C3%BCdhof", "name": "Thomas C. Südhof", "year": 2013, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Thomas C. Südhof , Physiology or Medicine, 2013", "wikidata_code": "Q97270", "date_of_birth": "22 December 1955", "place_of_birth": "Göttingen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Herta_M%C3%BCller", "name": "Herta Müller", "year": 2009, "category": "Literature", "country": "Germany", "born_in": null, "text": "Herta Müller ,  born in  Romania , Literature, 2009", "wikidata_code": "Q38049", "date_of_birth": "17 August 1953", "place_of_birth": "Nițchidorf", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Harald_zur_Hausen", "name": "Harald zur Hausen", "year": 2008, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Harald zur Hausen , Physiology or Medicine, 2008", "wikidata_code": "Q75847", "date_of_birth": "11 March 1936", "date_of_death": "29 May 2023", "place_of_birth": "Gelsenkirchen", "place_of_death": "Heidelberg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gerhard_Ertl", "name": "Gerhard Ertl", "year": 2007, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Gerhard Ertl , Chemistry, 2007", "wikidata_code": "Q60066", "date_of_birth": "10 October 1936", "place_of_birth": "Stuttgart", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Peter_Gr%C3%BCnberg", "name": "Peter Grünberg", "year": 2007, "category": "Physics", "country": "Germany", "born_in": null, "text": "Peter Grünberg ,  born in the  Protectorate of Bohemia and Moravia , now the  Czech Republic , Physics, 2007", "wikidata_code": "Q57120", "date_of_birth": "18 May 1939", "date_of_death": "7 April 2018", "place_of_birth": "Plzeň", "place_of_death": "Jülich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Joachim_Frank", "name": "Joachim Frank", "year": 2017, "category": "Chemistry", "country": null, "born_in": "Germany", "text": "Joachim Frank *, Chemistry, 2017", "wikidata_code": "Q28833112", "date_of_birth": "12 September 1940", "place_of_birth": "Siegen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rainer_Weiss", "name": "Rainer Weiss", "year": 2017, "category": "Physics", "country": null, "born_in": "Germany", "text": "Rainer Weiss *, Physics, 2017", "wikidata_code": "Q2128461", "date_of_birth": "29 September 1932", "place_of_birth": "Berlin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Stefan_Hell", "name": "Stefan Hell", "year": 2014, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Stefan Hell ,  born in  Romania , Chemistry, 2014", "wikidata_code": "Q91410", "date_of_birth": "23 December 1962", "place_of_birth": "Arad", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Theodor_W._H%C3%A4nsch", "name": "Theodor W. Hänsch", "year": 2005, "category": "Physics", "country": "Germany", "born_in": null, "text": "Theodor W. Hänsch , Physics, 2005", "wikidata_code": "Q71013", "date_of_birth": "30 October 1941", "place_of_birth": "Heidelberg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Wolfgang_Ketterle", "name": "Wolfgang Ketterle", "year": 2001, "category": "Physics", "country": "Germany", "born_in": null, "text": "Wolfgang Ketterle , Physics, 2001", "wikidata_code": "Q76462", "date_of_birth": "21 October 1957", "place_of_birth": "Heidelberg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Herbert_Kroemer", "name": "Herbert Kroemer", "year": 2000, "category": "Physics", "country": "Germany", "born_in": null, "text": "Herbert Kroemer , Physics, 2000", "wikidata_code": "Q71016", "date_of_birth": "25 August 1928", "place_of_birth": "Weimar", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/G%C3%BCnter_Blobel", "name": "Günter Blobel", "year": 1999, "category": "Physiology or Medicine", "country": null, "born_in": "Germany", "text": "Günter Blobel *, Physiology or Medicine, 1999", "wikidata_code": "Q60108", "date_of_birth": "21 May 1936", "date_of_death": "18 February 2018", "place_of_birth": "Niegosławice, Lubusz Voivodeship", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/G%C3%BCnter_Grass", "name": "Günter Grass", "year": 1999, "category": "Literature", "country": "Germany", "born_in": null, "text": "Günter Grass ,  born in  Free City of Danzig , now  Poland , Literature, 1999", "wikidata_code": "Q6538", "date_of_birth": "16 October 1927", "date_of_death": "13 April 2015", "place_of_birth": "Free City of Danzig", "place_of_death": "Lübeck", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Svante_P%C3%A4%C3%A4bo", "name": "Svante Pääbo", "year": 2022, "category": "Physiology or Medicine", "country": "Germany", "born_in": null, "text": "Svante Pääbo ,  born in  Sweden , Physiology or Medicine, 2022", "wikidata_code": "Q170342", "date_of_birth": "20 April 1955", "place_of_birth": "Oscar Parish", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Benjamin_List", "name": "Benjamin List", "year": 2021, "category": "Chemistry", "country": "Germany", "born_in": null, "text": "Benjamin List , Chemistry, 2021", "wikidata_code": "Q105572", "date_of_birth": "11 January 1968", "place_of_birth": "Frankfurt", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Klaus_Hasselmann", "name": "Klaus Hasselmann", "year": 2021, "category": "Physics", "country": "Germany", "born_in": null, "text": "Klaus Hasselmann , Physics, 2021", "wikidata_code": "Q109370", "date_of_birth": "25 October 1931", "place_of_birth": "Hamburg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Emmanuelle_Charpentier", "name": "Emmanuelle Charpentier", "year": 2020, "category": "Chemistry", "country": null, "born_in": "Germany", "text": "Emmanuelle Charpentier *, Chemistry, 2020", "wikidata_code": "Q17280087", "date_of_birth": "11 December 1968", "place_of_birth": "Juvisy-sur-Orge", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Fr%C3%A9d%C3%A9ric_Passy", "name": "Frédéric Passy", "year": 1901, "category": "Peace", "country": "France", "born_in": null, "text": "Frédéric Passy , Peace, 1901", "wikidata_code": "Q180409", "date_of_birth": "20 May 1822", "date_of_death": "12 June 1912", "place_of_birth": "Paris", "place_of_death": "Neuilly-sur-Seine", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Sully_Prudhomme", "name": "Sully Prudhomme", "year": 1901, "category": "Literature", "country": "France", "born_in": null, "text": "Sully Prudhomme , Literature, 1901", "wikidata_code": "Q42247", "date_of_birth": "16 March 1839", "date_of_death": "6 September 1907", "place_of_birth": "10th arrondissement of Paris", "place_of_death": "Châtenay-Malabry", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Paul_Sabatier_(chemist)", "name": "Paul Sabatier", "year": 1912, "category": "Chemistry", "country": "France", "born_in": null, "text": "Paul Sabatier , Chemistry, 1912", "wikidata_code": "Q104575", "date_of_birth": "5 November 1854", "date_of_death": "14 August 1941", "place_of_birth": "Carcassonne", "place_of_death": "Toulouse", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Victor_Grignard", "name": "Victor Grignard", "year": 1912, "category": "Chemistry", "country": "France", "born_in": null, "text": "Victor Grignard , Chemistry, 1912", "wikidata_code": "Q104582", "date_of_birth": "6 May 1871", "date_of_death": "13 December 1935", "place_of_birth": "Cherbourg", "place_of_death": "7th arrondissement of Lyon", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Marie_Curie", "name": "Marie Curie", "year": 1911, "category": "Chemistry", "country": "France", "born_in": null, "text": "Marie Curie ,  born in Congress Poland (Russian Empire) , Chemistry, 1911", "wikidata_code": "Q7186", "date_of_birth": "7 November 1867", "date_of_death": "4 July 1934", "place_of_birth": "Warsaw", "place_of_death": "Sancellemoz", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Paul-Henri-Benjamin_d%27Estournelles_de_Constant", "name": "Paul-Henri-Benjamin d'Estournelles de Constant", "year": 1909, "category": "Peace", "country": "France", "born_in": null, "text": "Paul-Henri-Benjamin d'Estournelles de Constant , Peace, 1909", "wikidata_code": "Q238731", "date_of_birth": "22 January 1852", "date_of_death": "15 May 1924", "place_of_birth": "La Flèche", "place_of_death": "Bordeaux", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gabriel_Lippmann", "name": "Gabriel Lippmann", "year": 1908, "category": "Physics", "country": "France", "born_in": null, "text": "Gabriel Lippmann ,  born in Luxembourg , Physics, 1908", "wikidata_code": "Q133232", "date_of_birth": "16 August 1845", "date_of_death": "13 July 1921", "place_of_birth": "Bonnevoie", "place_of_death": "Atlantic Ocean", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_Louis_Alphonse_Laveran", "name": "Charles Louis Alphonse Laveran", "year": 1907, "category": "Physiology or Medicine", "country": "France", "born_in": null, "text": "Charles Louis Alphonse Laveran , Physiology or Medicine, 1907", "wikidata_code": "Q189006", "date_of_birth": "18 June 1845", "date_of_death": "18 May 1922", "place_of_birth": "Paris", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Louis_Renault_(jurist)", "name": "Louis Renault", "year": 1907, "category": "Peace", "country": "France", "born_in": null, "text": "Louis Renault , Peace, 1907", "wikidata_code": "Q230814", "date_of_birth": "21 May 1843", "date_of_death": "8 February 1918", "place_of_birth": "Autun", "place_of_death": "Barbizon", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henri_Moissan", "name": "Henri Moissan", "year": 1906, "category": "Chemistry", "country": "France", "born_in": null, "text": "Henri Moissan , Chemistry, 1906", "wikidata_code": "Q102804", "date_of_birth": "28 September 1852", "date_of_death": "20 February 1907", "place_of_birth": "Paris", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fr%C3%A9d%C3%A9ric_Mistral", "name": "Frédéric Mistral", "year": 1904, "category": "Literature", "country": "France", "born_in": null, "text": "Frédéric Mistral , Literature, 1904", "wikidata_code": "Q42596", "date_of_birth": "8 September 1830", "date_of_death": "25 March 1914", "place_of_birth": "Maillane", "place_of_death": "Maillane", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henri_Becquerel", "name": "Antoine Henri Becquerel", "year": 1903, "category": "Physics", "country": "France", "born_in": null, "text": "Antoine Henri Becquerel , Physics, 1903", "wikidata_code": "Q41269", "date_of_birth": "15 December 1852", "date_of_death": "25 August 1908", "place_of_birth": "Paris", "place_of_death": "manoir de Pen Castel", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Pierre_Curie", "name": "Pierre Curie", "year": 1903, "category": "Physics", "country": "France", "born_in": null, "text": "Pierre Curie , Physics, 1903", "wikidata_code": "Q37463", "date_of_birth": "15 May 1859", "date_of_death": "19 April 1906", "place_of_birth": "Paris", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Marie_Curie", "name": "Marie Curie", "year": 1903, "category": "Physics", "country": "France", "born_in": null, "text": "Marie Curie ,  born in Congress Poland, (Russian Empire) , Physics, 1903", "wikidata_code": "Q7186", "date_of_birth": "7 November 1867", "date_of_death": "4 July 1934", "place_of_birth": "Warsaw", "place_of_death": "Sancellemoz", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Henry_Dunant", "name": "Henry Dunant", "year": 1901, "category": "Peace", "country": "France", "born_in": null, "text": "Henry Dunant ,  born in the Swiss Confederation , Peace, 1901", "wikidata_code": "Q12091", "date_of_birth": "8 May 1828", "date_of_death": "30 October 1910", "place_of_birth": "Geneva", "place_of_death": "Heiden", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ferenc_Krausz", "name": "Ferenc Krausz", "year": 2023, "category": "Physics", "country": "Germany", "born_in": null, "text": "Ferenc Krausz ,  born in  Hungary , Physics, 2023", "wikidata_code": "Q86970", "date_of_birth": "17 May 1962", "place_of_birth": "Mór", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Reinhard_Genzel", "name": "Reinhard Genzel", "year": 2020, "category": "Physics", "country": "Germany", "born_in": null, "text": "Reinhard Genzel , Physics, 2020", "wikidata_code": "Q65807", "date_of_birth": "24 March 1952", "place_of_birth": "Bad Homburg vor der Höhe", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_B._Goodenough", "name": "John B. Goodenough", "year": 2019, "category": "Chemistry", "country": null, "born_in": "Germany", "text": "John B. Goodenough *, Chemistry, 2019", "wikidata_code": "Q906529", "date_of_birth": "25 July 1922", "date_of_death": "25 June 2023", "place_of_birth": "Jena", "place_of_death": "Austin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Romain_Rolland", "name": "Romain Rolland", "year": 1915, "category": "Literature", "country": "France", "born_in": null, "text": "Romain Rolland , Literature, 1915", "wikidata_code": "Q47162", "date_of_birth": "29 January 1866", "date_of_death": "30 December 1944", "place_of_birth": "Clamecy", "place_of_death": "Vézelay", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alfred_Werner", "name": "Alfred Werner", "year": 1913, "category": "Chemistry", "country": null, "born_in": "France", "text": "Alfred Werner *, Chemistry, 1913", "wikidata_code": "Q123014", "date_of_birth": "12 December 1866", "date_of_death": "15 November 1919", "place_of_birth": "Mulhouse", "place_of_death": "Zürich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_Richet", "name": "Charles Richet", "year": 1913, "category": "Physiology or Medicine", "country": "France", "born_in": null, "text": "Charles Richet , Physiology or Medicine, 1913", "wikidata_code": "Q214851", "date_of_birth": "26 August 1850", "date_of_death": "4 December 1935", "place_of_birth": "Paris", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alexis_Carrel", "name": "Alexis Carrel", "year": 1912, "category": "Physiology or Medicine", "country": "France", "born_in": null, "text": "Alexis Carrel , Physiology or Medicine, 1912", "wikidata_code": "Q185777", "date_of_birth": "28 June 1873", "date_of_death": "5 November 1944", "place_of_birth": "Sainte-Foy-lès-Lyon", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fr%C3%A9d%C3%A9ric_Joliot-Curie", "name": "Frédéric Joliot-Curie", "year": 1935, "category": "Chemistry", "country": "France", "born_in": null, "text": "Frédéric Joliot-Curie , Chemistry, 1935", "wikidata_code": "Q150989", "date_of_birth": "19 March 1900", "date_of_death": "14 August 1958", "place_of_birth": "Paris", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ir%C3%A8ne_Joliot-Curie", "name": "Irène Joliot-Curie", "year": 1935, "category": "Chemistry", "country": "France", "born_in": null, "text": "Irène Joliot-Curie , Chemistry, 1935", "wikidata_code": "Q7504", "date_of_birth": "12 September 1897", "date_of_death": "17 March 1956", "place_of_birth": "13th arrondissement of Paris", "place_of_death": "Paris", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Ivan_Bunin", "name": "Ivan Bunin", "year": 1933, "category": "Literature", "country": "France", "born_in": null, "text": "Ivan Bunin ,  born in Russia , Literature, 1933", "wikidata_code": "Q46602", "date_of_birth": "22 October 1870", "date_of_death": "8 November 1953", "place_of_birth": "Voronezh", "place_of_death": "16th arrondissement of Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Louis_de_Broglie", "name": "Louis de Broglie", "year": 1929, "category": "Physics", "country": "France", "born_in": null, "text": "Louis de Broglie , Physics, 1929", "wikidata_code": "Q83331", "date_of_birth": "15 August 1892", "date_of_death": "19 March 1987", "place_of_birth": "Dieppe", "place_of_death": "Louveciennes", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_Nicolle", "name": "Charles Nicolle", "year": 1928, "category": "Physiology or Medicine", "country": "France", "born_in": null, "text": "Charles Nicolle , Physiology or Medicine, 1928", "wikidata_code": "Q233965", "date_of_birth": "21 September 1866", "date_of_death": "28 February 1936", "place_of_birth": "Rouen", "place_of_death": "Tunis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henri_Bergson", "name": "Henri Bergson", "year": 1927, "category": "Literature", "country": "France", "born_in": null, "text": "Henri Bergson , Literature, 1927", "wikidata_code": "Q42156", "date_of_birth": "18 October 1859", "date_of_death": "4 January 1941", "place_of_birth": "Paris", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ferdinand_Buisson", "name": "Ferdinand Buisson", "year": 1927, "category": "Peace", "country": "France", "born_in": null, "text": "Ferdinand Buisson , Peace, 1927", "wikidata_code": "Q273607", "date_of_birth": "20 December 1841", "date_of_death": "16 February 1932", "place_of_birth": "former 1st arrondissement of Paris", "place_of_death": "Thieuloy-Saint-Antoine", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Aristide_Briand", "name": "Aristide Briand", "year": 1926, "category": "Peace", "country": "France", "born_in": null, "text": "Aristide Briand , Peace, 1926", "wikidata_code": "Q179888", "date_of_birth": "28 March 1862", "date_of_death": "7 March 1932", "place_of_birth": "Nantes", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jean_Baptiste_Perrin", "name": "Jean Baptiste Perrin", "year": 1926, "category": "Physics", "country": "France", "born_in": null, "text": "Jean Baptiste Perrin , Physics, 1926", "wikidata_code": "Q134085", "date_of_birth": "30 September 1870", "date_of_death": "17 April 1942", "place_of_birth": "Lille", "place_of_death": "New York City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Anatole_France", "name": "Anatole France", "year": 1921, "category": "Literature", "country": "France", "born_in": null, "text": "Anatole France , Literature, 1921", "wikidata_code": "Q42443", "date_of_birth": "16 April 1844", "date_of_death": "12 October 1924", "place_of_birth": "Paris", "place_of_death": "Q22994052", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/L%C3%A9on_Bourgeois", "name": "Léon Bourgeois", "year": 1920, "category": "Peace", "country": "France", "born_in": null, "text": "Léon Bourgeois , Peace, 1920", "wikidata_code": "Q217706", "date_of_birth": "29 May 1851", "date_of_death": "29 September 1925", "place_of_birth": "former 9th arrondissement of Paris", "place_of_death": "Épernay", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Andr%C3%A9_Gide", "name": "André Gide", "year": 1947, "category": "Literature", "country": "France", "born_in": null, "text": "André Gide , Literature, 1947", "wikidata_code": "Q47484", "date_of_birth": "22 November 1869", "date_of_death": "19 February 1951", "place_of_birth": "Paris", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Roger_Martin_du_Gard", "name": "Roger Martin du Gard", "year": 1937, "category": "Literature", "country": "France", "born_in": null, "text": "Roger Martin du Gard , Literature, 1937", "wikidata_code": "Q129155", "date_of_birth": "23 March 1881", "date_of_death": "22 August 1958", "place_of_birth": "Neuilly-sur-Seine", "place_of_death": "Château du Tertre", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fran%C3%A7ois_Jacob", "name": "François Jacob", "year": 1965, "category": "Physiology or Medicine", "country": "France", "born_in": null, "text": "François Jacob , Physiology or Medicine, 1965", "wikidata_code": "Q218311", "date_of_birth": "17 June 1920", "date_of_death": "19 April 2013", "place_of_birth": "Nancy", "place_of_death": "14th arrondissement of Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jacques_Monod", "name": "Jacques Monod", "year": 1965, "category": "Physiology or Medicine", "country": "France", "born_in": null, "text": "Jacques Monod , Physiology or Medicine, 1965", "wikidata_code": "Q231402", "date_of_birth": "9 February 1910", "date_of_death": "31 May 1976", "place_of_birth": "17th arrondissement of Paris", "place_of_death": "Cannes", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Andr%C3%A9_Michel_Lwoff", "name": "André Lwoff", "year": 1965, "category": "Physiology or Medicine", "country": "France", "born_in": null, "text": "André Lwoff , Physiology or Medicine, 1965", "wikidata_code": "Q223309", "date_of_birth": "8 May 1902", "date_of_death": "30 September 1994", "place_of_birth": "Ainay-le-Château", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jean-Paul_Sartre", "name": "Jean-Paul Sartre", "year": 1964, "category": "Literature", "country": "France", "born_in": null, "text": "Jean-Paul Sartre , Literature, 1964 (declined the prize)", "wikidata_code": "Q9364", "date_of_birth": "21 June 1905", "date_of_death": "15 April 1980", "place_of_birth": "Paris", "place_of_death": "14th arrondissement of Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Se%C3%A1n_MacBride", "name": "Seán MacBride", "year": 1974, "category": "Peace", "country": null, "born_in": "France", "text": "Seán MacBride *, Peace, 1974", "wikidata_code": "Q244395", "date_of_birth": "26 January 1904", "date_of_death": "15 January 1988", "place_of_birth": "Paris", "place_of_death": "Dublin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Louis_N%C3%A9el", "name": "Louis Néel", "year": 1970, "category": "Physics", "country": "France", "born_in": null, "text": "Louis Néel , Physics, 1970", "wikidata_code": "Q155781", "date_of_birth": "22 November 1904", "date_of_death": "17 November 2000", "place_of_birth": "3rd arrondissement of Lyon", "place_of_death": "Brive-la-Gaillarde", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Luis_Federico_Leloir", "name": "Luis Federico Leloir", "year": 1970, "category": "Chemistry", "country": null, "born_in": "France", "text": "Luis Federico Leloir *, Chemistry, 1970", "wikidata_code": "Q233985", "date_of_birth": "6 September 1906", "date_of_death": "2 December 1987", "place_of_birth": "Paris", "place_of_death": "Catamarca", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ren%C3%A9_Cassin", "name": "René Cassin", "year": 1968, "category": "Peace", "country": "France", "born_in": null, "text": "René Cassin , Peace, 1968", "wikidata_code": "Q232873", "date_of_birth": "5 February 1887", "date_of_death": "20 February 1976", "place_of_birth": "Bayonne", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alfred_Kastler", "name": "Alfred Kastler", "year": 1966, "category": "Physics", "country": "France", "born_in": null, "text": "Alfred Kastler , Physics, 1966", "wikidata_code": "Q71023", "date_of_birth": "3 May 1902", "date_of_death": "7 January 1984", "place_of_birth": "Guebwiller", "place_of_death": "Bandol", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Saint-John_Perse", "name": "Saint-John Perse", "year": 1960, "category": "Literature", "country": "France", "born_in": null, "text": "Saint-John Perse , Literature, 1960", "wikidata_code": "Q132684", "date_of_birth": "31 May 1887", "date_of_death": "20 September 1975", "place_of_birth": "Pointe-à-Pitre", "place_of_death": "Hyères", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Albert_Camus", "name": "Albert Camus", "year": 1957, "category": "Literature", "country": "France", "born_in": null, "text": "Albert Camus ,  born in French Algeria , Literature, 1957", "wikidata_code": "Q34670", "date_of_birth": "7 November 1913", "date_of_death": "4 January 1960", "place_of_birth": "Dréan", "place_of_death": "Villeblevin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Andr%C3%A9_Fr%C3%A9d%C3%A9ric_Cournand", "name": "André Frédéric Cournand", "year": 1956, "category": "Physiology or Medicine", "country": "France", "born_in": null, "text": "André Frédéric Cournand , Physiology or Medicine, 1956", "wikidata_code": "Q271757", "date_of_birth": "24 September 1895", "date_of_death": "19 February 1988", "place_of_birth": "Paris", "place_of_death": "Great Barrington", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fran%C3%A7ois_Mauriac", "name": "François Mauriac", "year": 1952, "category": "Literature", "country": "France", "born_in": null, "text": "François Mauriac , Literature, 1952", "wikidata_code": "Q81685", "date_of_birth": "11 October 1885", "date_of_death": "1 September 1970", "place_of_birth": "Bordeaux", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Albert_Schweitzer", "name": "Albert Schweitzer", "year": 1952, "category": "Peace", "country": "France", "born_in": null, "text": "Albert Schweitzer ,  born in Alsace, then in Germany , Peace, 1952", "wikidata_code": "Q49325", "date_of_birth": "14 January 1875", "date_of_death": "4 September 1965", "place_of_birth": "Kaysersberg", "place_of_death": "Lambaréné", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/L%C3%A9on_Jouhaux", "name": "Léon Jouhaux", "year": 1951, "category": "Peace", "country": "France", "born_in": null, "text": "Léon Jouhaux , Peace, 1951", "wikidata_code": "Q155415", "date_of_birth": "1 July 1879", "date_of_death": "28 April 1954", "place_of_birth": "15th arrondissement of Paris", "place_of_death": "12th arrondissement of Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/G%C3%A9rard_Debreu", "name": "Gérard Debreu", "year": 1983, "category": "Economics", "country": "France", "born_in": null, "text": "Gérard Debreu , Economics, 1983", "wikidata_code": "Q210960", "date_of_birth": "4 July 1921", "date_of_death": "31 December 2004", "place_of_birth": "Calais", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jean_Dausset", "name": "Jean Dausset", "year": 1980, "category": "Physiology or Medicine", "country": "France", "born_in": null, "text": "Jean Dausset , Physiology or Medicine, 1980", "wikidata_code": "Q152760", "date_of_birth": "19 October 1916", "date_of_death": "6 June 2009", "place_of_birth": "Toulouse", "place_of_death": "Palma de Mallorca", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Roger_Guillemin", "name": "Roger Guillemin", "year": 1977, "category": "Physiology or Medicine", "country": null, "born_in": "France", "text": "Roger Guillemin *, Physiology or Medicine, 1977", "wikidata_code": "Q242169", "date_of_birth": "11 January 1924", "place_of_birth": "Dijon", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/J._M._G._Le_Cl%C3%A9zio", "name": "J. M. G. Le Clézio", "year": 2008, "category": "Literature", "country": "France", "born_in": null, "text": "J. M. G. Le Clézio , Literature, 2008", "wikidata_code": "Q42037", "date_of_birth": "13 April 1940", "place_of_birth": "Nice", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Luc_Montagnier", "name": "Luc Montagnier", "year": 2008, "category": "Physiology or Medicine", "country": "France", "born_in": null, "text": "Luc Montagnier , Physiology or Medicine, 2008", "wikidata_code": "Q103598", "date_of_birth": "18 August 1932", "date_of_death": "8 February 2022", "place_of_birth": "Chabris", "place_of_death": "Neuilly-sur-Seine", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fran%C3%A7oise_Barr%C3%A9-Sinoussi", "name": "Françoise Barré-Sinoussi", "year": 2008, "category": "Physiology or Medicine", "country": "France", "born_in": null, "text": "Françoise Barré-Sinoussi , Physiology or Medicine, 2008", "wikidata_code": "Q103844", "date_of_birth": "30 July 1947", "place_of_birth": "Paris", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Albert_Fert", "name": "Albert Fert", "year": 2007, "category": "Physics", "country": "France", "born_in": null, "text": "Albert Fert , Physics, 2007", "wikidata_code": "Q153219", "date_of_birth": "7 March 1938", "place_of_birth": "Carcassonne", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Yves_Chauvin", "name": "Yves Chauvin", "year": 2005, "category": "Chemistry", "country": "France", "born_in": null, "text": "Yves Chauvin , Chemistry, 2005", "wikidata_code": "Q202146", "date_of_birth": "10 October 1930", "date_of_death": "28 January 2015", "place_of_birth": "Menen", "place_of_death": "Tours", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gao_Xingjian", "name": "Gao Xingjian", "year": 2000, "category": "Literature", "country": "France", "born_in": null, "text": "Gao Xingjian ,  born in China , Literature, 2000", "wikidata_code": "Q18143", "date_of_birth": "4 January 1940", "place_of_birth": "Ganxian District", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Patrick_Modiano", "name": "Patrick Modiano", "year": 2014, "category": "Literature", "country": "France", "born_in": null, "text": "Patrick Modiano , Literature, 2014", "wikidata_code": "Q222944", "date_of_birth": "30 July 1945", "place_of_birth": "Boulogne-Billancourt", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Serge_Haroche", "name": "Serge Haroche", "year": 2012, "category": "Physics", "country": "France", "born_in": null, "text": "Serge Haroche ,  born in Morocco, then under French protectorate , Physics, 2012", "wikidata_code": "Q109588", "date_of_birth": "11 September 1944", "place_of_birth": "Casablanca", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jules_A._Hoffmann", "name": "Jules A. Hoffmann", "year": 2011, "category": "Physiology or Medicine", "country": "France", "born_in": null, "text": "Jules A. Hoffmann ,  born in Luxembourg , Physiology or Medicine, 2011", "wikidata_code": "Q105605", "date_of_birth": "2 August 1941", "place_of_birth": "Echternach", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Claude_Cohen-Tannoudji", "name": "Claude Cohen-Tannoudji", "year": 1997, "category": "Physics", "country": "France", "born_in": null, "text": "Claude Cohen-Tannoudji ,  born in French Algeria , Physics, 1997", "wikidata_code": "Q190697", "date_of_birth": "1 April 1933", "place_of_birth": "Constantine", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Georges_Charpak", "name": "Georges Charpak", "year": 1992, "category": "Physics", "country": "France", "born_in": null, "text": "Georges Charpak ,  born in then Poland (Second Polish Republic), now Ukraine , Physics, 1992", "wikidata_code": "Q153178", "date_of_birth": "1 August 1924", "date_of_death": "29 September 2010", "place_of_birth": "Dubrovytsia", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Pierre-Gilles_de_Gennes", "name": "Pierre-Gilles de Gennes", "year": 1991, "category": "Physics", "country": "France", "born_in": null, "text": "Pierre-Gilles de Gennes , Physics, 1991", "wikidata_code": "Q187224", "date_of_birth": "24 October 1932", "date_of_death": "18 May 2007", "place_of_birth": "16th arrondissement of Paris", "place_of_death": "Orsay", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Maurice_Allais", "name": "Maurice Allais", "year": 1988, "category": "Economics", "country": "France", "born_in": null, "text": "Maurice Allais , Economics, 1988", "wikidata_code": "Q105962", "date_of_birth": "31 May 1911", "date_of_death": "9 October 2010", "place_of_birth": "Paris", "place_of_death": "Saint-Cloud", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jean-Marie_Lehn", "name": "Jean-Marie Lehn", "year": 1987, "category": "Chemistry", "country": "France", "born_in": null, "text": "Jean-Marie Lehn , Chemistry, 1987", "wikidata_code": "Q107690", "date_of_birth": "30 September 1939", "place_of_birth": "Rosheim", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Claude_Simon", "name": "Claude Simon", "year": 1985, "category": "Literature", "country": "France", "born_in": null, "text": "Claude Simon , Literature, 1985", "wikidata_code": "Q131549", "date_of_birth": "10 October 1913", "date_of_death": "6 July 2005", "place_of_birth": "Antananarivo", "place_of_death": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jean-Pierre_Sauvage", "name": "Jean-Pierre Sauvage", "year": 2016, "category": "Chemistry", "country": "France", "born_in": null, "text": "Jean-Pierre Sauvage , Chemistry, 2016", "wikidata_code": "Q3169751", "date_of_birth": "21 October 1944", "place_of_birth": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jean_Tirole", "name": "Jean Tirole", "year": 2014, "category": "Economics", "country": "France", "born_in": null, "text": "Jean Tirole , Economics, 2014", "wikidata_code": "Q173994", "date_of_birth": "9 August 1953", "place_of_birth": "Troyes", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Artturi_Ilmari_Virtanen", "name": "Artturi Ilmari Virtanen", "year": 1809, "category": "Chemistry", "country": "Finland", "born_in": null, "text": "Artturi Ilmari Virtanen ,  born in the Grand Duchy of Finland, a part of the Russian Empire in 1809–1917 , Chemistry, 1945", "wikidata_code": "Q157239", "date_of_birth": "15 January 1895", "date_of_death": "11 November 1973", "place_of_birth": "Helsinki", "place_of_death": "Helsinki", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Frans_Eemil_Sillanp%C3%A4%C3%A4", "name": "Frans Eemil Sillanpää", "year": 1809, "category": "Literature", "country": "Finland", "born_in": null, "text": "Frans Eemil Sillanpää ,  born in the Grand Duchy of Finland, a part of the Russian Empire in 1809–1917 , Literature, 1939", "wikidata_code": "Q132723", "date_of_birth": "16 September 1888", "date_of_death": "3 June 1964", "place_of_birth": "Hämeenkyrö", "place_of_death": "Helsinki", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Moungi_Bawendi", "name": "Moungi Bawendi", "year": 2023, "category": "Chemistry", "country": "France", "born_in": null, "text": "Moungi Bawendi , Chemistry, 2023", "wikidata_code": "Q15433043", "date_of_birth": "15 March 1961", "place_of_birth": "Paris", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Pierre_Agostini", "name": "Pierre Agostini", "year": 2023, "category": "Physics", "country": "France", "born_in": null, "text": "Pierre Agostini ,  born in Tunisia , Physics, 2023", "wikidata_code": "Q57020342", "date_of_birth": "23 July 1941", "place_of_birth": "Tunis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Anne_L%27Huillier", "name": "Anne L'Huillier", "year": 2023, "category": "Physics", "country": "France", "born_in": null, "text": "Anne L'Huillier , Physics, 2023", "wikidata_code": "Q565544", "date_of_birth": "16 August 1958", "place_of_birth": "Paris", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Annie_Ernaux", "name": "Annie Ernaux", "year": 2022, "category": "Literature", "country": "France", "born_in": null, "text": "Annie Ernaux , Literature, 2022", "wikidata_code": "Q1153825", "date_of_birth": "1 September 1940", "place_of_birth": "Lillebonne", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Niels_Ryberg_Finsen", "name": "Niels Ryberg Finsen", "year": 1903, "category": "Physiology or Medicine", "country": null, "born_in": "Faroe Islands", "text": "Niels Ryberg Finsen *, Physiology or Medicine, 1903", "wikidata_code": "Q182964", "date_of_birth": "15 December 1860", "date_of_death": "24 September 1904", "place_of_birth": "Tórshavn", "place_of_death": "Copenhagen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Bengt_R._Holmstr%C3%B6m", "name": "Bengt R. Holmström", "year": 2016, "category": "Economics", "country": "Finland", "born_in": null, "text": "Bengt R. Holmström , Economics, 2016", "wikidata_code": "Q354897", "date_of_birth": "18 April 1949", "place_of_birth": "Helsinki", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Martti_Ahtisaari", "name": "Martti Ahtisaari", "year": 2008, "category": "Peace", "country": "Finland", "born_in": null, "text": "Martti Ahtisaari , Peace, 2008", "wikidata_code": "Q29230", "date_of_birth": "23 June 1937", "date_of_death": "16 October 2023", "place_of_birth": "Vyborg", "place_of_death": "Helsinki", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Naguib_Mahfouz", "name": "Naguib Mahfouz", "year": 1988, "category": "Literature", "country": "Egypt", "born_in": null, "text": "Naguib Mahfouz , Literature, 1988", "wikidata_code": "Q7176", "date_of_birth": "11 December 1911", "date_of_death": "30 August 2006", "place_of_birth": "Cairo", "place_of_death": "Giza Governorate", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Anwar_Sadat", "name": "Anwar Sadat", "year": 1978, "category": "Peace", "country": "Egypt", "born_in": null, "text": "Anwar Sadat , Peace, 1978", "wikidata_code": "Q42013", "date_of_birth": "25 December 1918", "date_of_death": "6 October 1981", "place_of_birth": "Mit Abu al-Kum", "place_of_death": "Cairo", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Abiy_Ahmed_Ali", "name": "Abiy Ahmed Ali", "year": 2019, "category": "Peace", "country": "Ethiopia", "born_in": null, "text": "Abiy Ahmed Ali , Peace, 2019", "wikidata_code": "Q50365049", "date_of_birth": "15 August 1976", "place_of_birth": "Beshasha", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ragnar_Granit", "name": "Ragnar Granit", "year": 1809, "category": "Physiology or Medicine", "country": "Finland", "born_in": null, "text": "Ragnar Granit ,  born in the Grand Duchy of Finland, a part of the Russian Empire in 1809–1917 , Physiology or Medicine, 1967", "wikidata_code": "Q217722", "date_of_birth": "30 October 1900", "date_of_death": "12 March 1991", "place_of_birth": "Riihimäki", "place_of_death": "Stockholm", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alain_Aspect", "name": "Alain Aspect", "year": 2022, "category": "Physics", "country": "France", "born_in": null, "text": "Alain Aspect , Physics, 2022", "wikidata_code": "Q364997", "date_of_birth": "15 June 1947", "place_of_birth": "Agen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Emmanuelle_Charpentier", "name": "Emmanuelle Charpentier", "year": 2020, "category": "Chemistry", "country": "France", "born_in": null, "text": "Emmanuelle Charpentier , Chemistry, 2020", "wikidata_code": "Q17280087", "date_of_birth": "11 December 1968", "place_of_birth": "Juvisy-sur-Orge", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Esther_Duflo", "name": "Esther Duflo", "year": 2019, "category": "Economics", "country": "France", "born_in": null, "text": "Esther Duflo , Economics, 2019", "wikidata_code": "Q434509", "date_of_birth": "25 October 1972", "place_of_birth": "Paris", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/G%C3%A9rard_Mourou", "name": "Gérard Mourou", "year": 2018, "category": "Physics", "country": "France", "born_in": null, "text": "Gérard Mourou , Physics, 2018", "wikidata_code": "Q556543", "date_of_birth": "22 June 1944", "place_of_birth": "Albertville", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Niels_Ryberg_Finsen", "name": "Niels Ryberg Finsen", "year": 1903, "category": "Physiology or Medicine", "country": "Denmark", "born_in": null, "text": "Niels Ryberg Finsen ,  born in Faroe Islands , Physiology or Medicine, 1903", "wikidata_code": "Q182964", "date_of_birth": "15 December 1860", "date_of_death": "24 September 1904", "place_of_birth": "Tórshavn", "place_of_death": "Copenhagen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carlos_Filipe_Ximenes_Belo", "name": "Carlos Filipe Ximenes Belo", "year": 1996, "category": "Peace", "country": "East Timor", "born_in": null, "text": "Carlos Filipe Ximenes Belo , Peace, 1996", "wikidata_code": "Q234001", "date_of_birth": "3 February 1948", "place_of_birth": "Baucau", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jos%C3%A9_Ramos-Horta", "name": "José Ramos-Horta", "year": 1996, "category": "Peace", "country": "East Timor", "born_in": null, "text": "José Ramos-Horta , Peace, 1996", "wikidata_code": "Q11665", "date_of_birth": "26 December 1949", "place_of_birth": "Dili", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mohamed_ElBaradei", "name": "Mohamed ElBaradei", "year": 2005, "category": "Peace", "country": "Egypt", "born_in": null, "text": "Mohamed ElBaradei , Peace, 2005", "wikidata_code": "Q133308", "date_of_birth": "17 June 1942", "place_of_birth": "Cairo", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ahmed_Zewail", "name": "Ahmed Zewail", "year": 1999, "category": "Chemistry", "country": "Egypt", "born_in": null, "text": "Ahmed Zewail , Chemistry, 1999", "wikidata_code": "Q106624", "date_of_birth": "26 February 1946", "date_of_death": "2 August 2016", "place_of_birth": "Damanhur", "place_of_death": "Pasadena", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/August_Krogh", "name": "August Krogh", "year": 1920, "category": "Physiology or Medicine", "country": "Denmark", "born_in": null, "text": "August Krogh , Physiology or Medicine, 1920", "wikidata_code": "Q152187", "date_of_birth": "15 November 1874", "date_of_death": "13 September 1949", "place_of_birth": "Grenå", "place_of_death": "Copenhagen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Aage_Bohr", "name": "Aage Bohr", "year": 1975, "category": "Physics", "country": "Denmark", "born_in": null, "text": "Aage Bohr , Physics, 1975", "wikidata_code": "Q103854", "date_of_birth": "19 June 1922", "date_of_death": "8 September 2009", "place_of_birth": "Copenhagen", "place_of_death": "Copenhagen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Niels_Kaj_Jerne", "name": "Niels Kaj Jerne", "year": 1984, "category": "Physiology or Medicine", "country": "Denmark", "born_in": null, "text": "Niels Kaj Jerne ,  born in United Kingdom , Physiology or Medicine, 1984", "wikidata_code": "Q309876", "date_of_birth": "23 December 1911", "date_of_death": "7 October 1994", "place_of_birth": "London", "place_of_death": "Castillon-du-Gard", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ben_Roy_Mottelson", "name": "Ben Roy Mottelson", "year": 1975, "category": "Physics", "country": "Denmark", "born_in": null, "text": "Ben Roy Mottelson ,   born in United States , Physics, 1975", "wikidata_code": "Q107423", "date_of_birth": "9 July 1926", "date_of_death": "13 May 2022", "place_of_birth": "Chicago", "place_of_death": "Copenhagen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Peter_Gr%C3%BCnberg", "name": "Peter Grünberg", "year": 2007, "category": "Physics", "country": null, "born_in": "Czech Republic", "text": "Peter Grünberg *,  born in the  Protectorate of Bohemia and Moravia , (now  Czech Republic ) , Physics, 2007", "wikidata_code": "Q57120", "date_of_birth": "18 May 1939", "date_of_death": "7 April 2018", "place_of_birth": "Plzeň", "place_of_death": "Jülich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jaroslav_Seifert", "name": "Jaroslav Seifert", "year": 1984, "category": "Literature", "country": "Czech Republic", "born_in": null, "text": "Jaroslav Seifert ,  born in  Prague ,  Austria-Hungary , (now  Czech Republic ) , Literature, 1984", "wikidata_code": "Q102483", "date_of_birth": "23 September 1901", "date_of_death": "10 January 1986", "place_of_birth": "Žižkov", "place_of_death": "Prague", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jaroslav_Heyrovsk%C3%BD", "name": "Jaroslav Heyrovský", "year": 1959, "category": "Chemistry", "country": "Czech Republic", "born_in": null, "text": "Jaroslav Heyrovský ,  born in  Prague ,  Austria-Hungary , (now  Czech Republic ) , Chemistry, 1959", "wikidata_code": "Q157701", "date_of_birth": "20 December 1890", "date_of_death": "27 March 1967", "place_of_birth": "Prague", "place_of_death": "Prague", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carl_Ferdinand_Cori", "name": "Carl Ferdinand Cori", "year": 1947, "category": "Physiology or Medicine", "country": null, "born_in": "Czech Republic", "text": "Carl Ferdinand Cori *,  born in  Prague ,  Austria-Hungary , (now  Czech Republic ) , Physiology or Medicine, 1947", "wikidata_code": "Q78501", "date_of_birth": "5 December 1896", "date_of_death": "20 October 1984", "place_of_birth": "Prague", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gerty_Cori", "name": "Gerty Cori", "year": 1947, "category": "Physiology or Medicine", "country": null, "born_in": "Czech Republic", "text": "Gerty Cori *,  born in  Prague ,  Austria-Hungary , (now  Czech Republic ) , Physiology or Medicine, 1947", "wikidata_code": "Q204733", "date_of_birth": "15 August 1896", "date_of_death": "26 October 1957", "place_of_birth": "Prague", "place_of_death": "Glendale", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Bertha_von_Suttner", "name": "Bertha von Suttner", "year": 1905, "category": "Peace", "country": null, "born_in": "Czech Republic", "text": "Bertha von Suttner *,  born in  Prague ,  Austria-Hungary , (now  Czech Republic ) , Peace, 1905", "wikidata_code": "Q18456", "date_of_birth": "9 June 1843", "date_of_death": "21 June 1914", "place_of_birth": "Prague", "place_of_death": "Vienna", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Morten_P._Meldal", "name": "Morten P. Meldal", "year": 2022, "category": "Chemistry", "country": "Denmark", "born_in": null, "text": "Morten P. Meldal , Chemistry, 2022", "wikidata_code": "Q6914509", "date_of_birth": "16 January 1954", "place_of_birth": "Copenhagen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jens_Christian_Skou", "name": "Jens Christian Skou", "year": 1997, "category": "Chemistry", "country": "Denmark", "born_in": null, "text": "Jens Christian Skou , Chemistry, 1997", "wikidata_code": "Q1687170", "date_of_birth": "8 October 1918", "date_of_death": "28 May 2018", "place_of_birth": "Lemvig", "place_of_death": "Aarhus", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Johannes_V._Jensen", "name": "Johannes V. Jensen", "year": 1944, "category": "Literature", "country": "Denmark", "born_in": null, "text": "Johannes V. Jensen , Literature, 1944", "wikidata_code": "Q159552", "date_of_birth": "20 January 1873", "date_of_death": "25 November 1950", "place_of_birth": "Farsø", "place_of_death": "Copenhagen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henrik_Dam", "name": "Henrik Dam", "year": 1943, "category": "Physiology or Medicine", "country": "Denmark", "born_in": null, "text": "Henrik Dam , Physiology or Medicine, 1943", "wikidata_code": "Q190501", "date_of_birth": "21 February 1895", "date_of_death": "17 April 1976", "place_of_birth": "Copenhagen", "place_of_death": "Copenhagen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Johannes_Fibiger", "name": "Johannes Fibiger", "year": 1926, "category": "Physiology or Medicine", "country": "Denmark", "born_in": null, "text": "Johannes Fibiger , Physiology or Medicine, 1926", "wikidata_code": "Q216324", "date_of_birth": "23 April 1867", "date_of_death": "30 January 1928", "place_of_birth": "Silkeborg", "place_of_death": "Copenhagen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Niels_Bohr", "name": "Niels Bohr", "year": 1922, "category": "Physics", "country": "Denmark", "born_in": null, "text": "Niels Bohr , Physics, 1922", "wikidata_code": "Q7085", "date_of_birth": "7 October 1885", "date_of_death": "18 November 1962", "place_of_birth": "Copenhagen", "place_of_death": "Copenhagen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Karl_Adolph_Gjellerup", "name": "Karl Adolph Gjellerup", "year": 1917, "category": "Literature", "country": "Denmark", "born_in": null, "text": "Karl Adolph Gjellerup , Literature, 1917", "wikidata_code": "Q131487", "date_of_birth": "1857", "date_of_death": "13 October 1919", "place_of_birth": "Roholte", "place_of_death": "Klotzsche", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henrik_Pontoppidan", "name": "Henrik Pontoppidan", "year": 1917, "category": "Literature", "country": "Denmark", "born_in": null, "text": "Henrik Pontoppidan , Literature, 1917", "wikidata_code": "Q225554", "date_of_birth": "24 July 1857", "date_of_death": "21 August 1943", "place_of_birth": "Fredericia", "place_of_death": "Copenhagen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fredrik_Bajer", "name": "Fredrik Bajer", "year": 1908, "category": "Peace", "country": "Denmark", "born_in": null, "text": "Fredrik Bajer , Peace, 1908", "wikidata_code": "Q191016", "date_of_birth": "21 April 1837", "date_of_death": "22 January 1922", "place_of_birth": "Næstved", "place_of_death": "Copenhagen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gabriel_Garc%C3%ADa_M%C3%A1rquez", "name": "Gabriel García Márquez", "year": 1982, "category": "Literature", "country": "Colombia", "born_in": null, "text": "Gabriel García Márquez , Literature, 1982", "wikidata_code": "Q5878", "date_of_birth": "6 March 1927", "date_of_death": "17 April 2014", "place_of_birth": "Aracataca", "place_of_death": "Mexico City", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Denis_Mukwege", "name": "Denis Mukwege", "year": 2018, "category": "Peace", "country": "Congo, Democratic Republic", "born_in": null, "text": "Denis Mukwege , Peace, 2018", "wikidata_code": "Q1187542", "date_of_birth": "1 March 1955", "place_of_birth": "Bukavu", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/%C3%93scar_Arias", "name": "Óscar Arias Sánchez", "year": 1987, "category": "Peace", "country": "Costa Rica", "born_in": null, "text": "Óscar Arias Sánchez , Peace, 1987", "wikidata_code": "Q49344", "date_of_birth": "13 September 1941", "place_of_birth": "Heredia", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Vladimir_Prelog", "name": "Vladimir Prelog", "year": 1975, "category": "Chemistry", "country": null, "born_in": "Croatia", "text": "Vladimir Prelog *,  born in  Condominium of Bosnia and Herzegovina ,  Austro-Hungarian Empire  (now  Bosnia and Herzegovina ) , Chemistry, 1975", "wikidata_code": "Q83501", "date_of_birth": "23 July 1906", "date_of_death": "7 January 1998", "place_of_birth": "Sarajevo", "place_of_death": "Zürich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Leopold_Ru%C5%BEi%C4%8Dka", "name": "Leopold Ružička", "year": 1939, "category": "Chemistry", "country": null, "born_in": "Croatia", "text": "Leopold Ružička *,  Ethnic Croat and national  born in the  Kingdom of Croatia-Slavonia  part of  Kingdom of Hungary  in  Austro-Hungarian Empire  (now  Croatia ) , Chemistry, 1939", "wikidata_code": "Q122996", "date_of_birth": "13 September 1887", "date_of_death": "26 September 1976", "place_of_birth": "Vukovar", "place_of_death": "Mammern", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Mo_Yan", "name": "Mo Yan", "year": 2012, "category": "Literature", "country": "China (People's Republic of China)", "born_in": null, "text": "Mo Yan , Literature, 2012", "wikidata_code": "Q8998", "date_of_birth": "17 February 1955", "place_of_birth": "Gaomi", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Liu_Xiaobo", "name": "Liu Xiaobo", "year": 2010, "category": "Peace", "country": "China (People's Republic of China)", "born_in": null, "text": "Liu Xiaobo , Peace, 2010", "wikidata_code": "Q41617", "date_of_birth": "28 December 1955", "date_of_death": "13 July 2017", "place_of_birth": "Changchun", "place_of_death": "First Hospital of China Medical University", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_K._Kao", "name": "Charles K. Kao", "year": 2009, "category": "Physics", "country": null, "born_in": "China (People's Republic of China)", "text": "Charles K. Kao *, Physics, 2009", "wikidata_code": "Q16389", "date_of_birth": "4 November 1933", "date_of_death": "23 September 2018", "place_of_birth": "People's Republic of China", "place_of_death": "Bradbury Hospice", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gao_Xingjian", "name": "Gao Xingjian", "year": 2000, "category": "Literature", "country": null, "born_in": "China (People's Republic of China)", "text": "Gao Xingjian *, Literature, 2000", "wikidata_code": "Q18143", "date_of_birth": "4 January 1940", "place_of_birth": "Ganxian District", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Daniel_C._Tsui", "name": "Daniel C. Tsui", "year": 1998, "category": "Physics", "country": null, "born_in": "China (People's Republic of China)", "text": "Daniel C. Tsui *, Physics, 1998", "wikidata_code": "Q202138", "date_of_birth": "28 February 1939", "place_of_birth": "Baofeng County", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Chen-Ning_Yang", "name": "Chen-Ning Yang", "year": 1957, "category": "Physics", "country": null, "born_in": "China (People's Republic of China)", "text": "Chen-Ning Yang *, Physics, 1957", "wikidata_code": "Q181369", "date_of_birth": "1 October 1922", "place_of_birth": "Hefei County", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Tsung-Dao_Lee", "name": "Tsung-Dao Lee", "year": 1957, "category": "Physics", "country": null, "born_in": "China (People's Republic of China)", "text": "Tsung-Dao Lee *, Physics, 1957", "wikidata_code": "Q183679", "date_of_birth": "24 November 1926", "place_of_birth": "Shanghai County", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Juan_Manuel_Santos", "name": "Juan Manuel Santos Calderón", "year": 2016, "category": "Peace", "country": "Colombia", "born_in": null, "text": "Juan Manuel Santos Calderón , Peace, 2016", "wikidata_code": "Q57311", "date_of_birth": "10 August 1951", "place_of_birth": "Bogotá", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Christopher_A._Pissarides", "name": "Christopher A. Pissarides", "year": 2010, "category": "Economics", "country": null, "born_in": "Cyprus", "text": "Christopher A. Pissarides *, Economics, 2010", "wikidata_code": "Q109582", "date_of_birth": "20 February 1948", "place_of_birth": "Nicosia", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Macleod_(physiologist)", "name": "John Macleod", "year": 1923, "category": "Physiology or Medicine", "country": "Canada", "born_in": null, "text": "John Macleod ,  born in the United Kingdom of Great Britain and Ireland , Physiology or Medicine, 1923", "wikidata_code": "Q232024", "date_of_birth": "6 September 1876", "date_of_death": "16 March 1935", "place_of_birth": "Clunie", "place_of_death": "Aberdeen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Pablo_Neruda", "name": "Pablo Neruda", "year": 1971, "category": "Literature", "country": "Chile", "born_in": null, "text": "Pablo Neruda , Literature, 1971", "wikidata_code": "Q34189", "date_of_birth": "12 July 1904", "date_of_death": "23 September 1973", "place_of_birth": "Parral", "place_of_death": "Santiago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gabriela_Mistral", "name": "Gabriela Mistral", "year": 1945, "category": "Literature", "country": "Chile", "born_in": null, "text": "Gabriela Mistral , Literature, 1945", "wikidata_code": "Q80871", "date_of_birth": "7 April 1889", "date_of_death": "10 January 1957", "place_of_birth": "Vicuña", "place_of_death": "Hempstead", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Tu_Youyou", "name": "Tu Youyou", "year": 2015, "category": "Physiology or Medicine", "country": "China (People's Republic of China)", "born_in": null, "text": "Tu Youyou , Physiology or Medicine, 2015", "wikidata_code": "Q462843", "date_of_birth": "30 December 1930", "place_of_birth": "Ningbo", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Rudolph_A._Marcus", "name": "Rudolph A. Marcus", "year": 1992, "category": "Chemistry", "country": null, "born_in": "Canada", "text": "Rudolph A. Marcus *, Chemistry, 1992", "wikidata_code": "Q239067", "date_of_birth": "21 July 1923", "place_of_birth": "Montreal", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Richard_E._Taylor", "name": "Richard E. Taylor", "year": 1990, "category": "Physics", "country": "Canada", "born_in": null, "text": "Richard E. Taylor , Physics, 1990", "wikidata_code": "Q201470", "date_of_birth": "2 November 1929", "date_of_death": "22 February 2018", "place_of_birth": "Medicine Hat", "place_of_death": "Stanford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Sidney_Altman", "name": "Sidney Altman", "year": 1989, "category": "Chemistry", "country": null, "born_in": "Canada", "text": "Sidney Altman *, Chemistry, 1989", "wikidata_code": "Q102266", "date_of_birth": "7 May 1939", "date_of_death": "5 April 2022", "place_of_birth": "Montreal", "place_of_death": "Rockleigh", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Polanyi", "name": "John Polanyi", "year": 1986, "category": "Chemistry", "country": "Canada", "born_in": null, "text": "John Polanyi ,  born in Germany , Chemistry, 1986", "wikidata_code": "Q237825", "date_of_birth": "23 January 1929", "place_of_birth": "Berlin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henry_Taube", "name": "Henry Taube", "year": 1983, "category": "Chemistry", "country": null, "born_in": "Canada", "text": "Henry Taube *, Chemistry, 1983", "wikidata_code": "Q235983", "date_of_birth": "30 November 1915", "date_of_death": "16 November 2005", "place_of_birth": "Neudorf", "place_of_death": "Palo Alto", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_H._Hubel", "name": "David H. Hubel", "year": 1981, "category": "Physiology or Medicine", "country": null, "born_in": "Canada", "text": "David H. Hubel *, Physiology or Medicine, 1981", "wikidata_code": "Q295644", "date_of_birth": "27 February 1926", "date_of_death": "22 September 2013", "place_of_birth": "Windsor", "place_of_death": "Lincoln", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Saul_Bellow", "name": "Saul Bellow", "year": 1976, "category": "Literature", "country": null, "born_in": "Canada", "text": "Saul Bellow *, Literature, 1976", "wikidata_code": "Q83059", "date_of_birth": "10 June 1915", "date_of_death": "5 April 2005", "place_of_birth": "Lachine", "place_of_death": "Brookline", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Gerhard_Herzberg", "name": "Gerhard Herzberg", "year": 1971, "category": "Chemistry", "country": "Canada", "born_in": null, "text": "Gerhard Herzberg ,  born in Germany , Chemistry, 1971", "wikidata_code": "Q76602", "date_of_birth": "25 December 1904", "date_of_death": "3 March 1999", "place_of_birth": "Hamburg", "place_of_death": "Ottawa", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Charles_Brenton_Huggins", "name": "Charles B. Huggins", "year": 1966, "category": "Physiology or Medicine", "country": null, "born_in": "Canada", "text": "Charles B. Huggins *, Physiology or Medicine, 1966", "wikidata_code": "Q155371", "date_of_birth": "22 September 1901", "date_of_death": "12 January 1997", "place_of_birth": "Halifax", "place_of_death": "Chicago", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Lester_B._Pearson", "name": "Lester B. Pearson", "year": 1957, "category": "Peace", "country": "Canada", "born_in": null, "text": "Lester B. Pearson , Peace, 1957", "wikidata_code": "Q128604", "date_of_birth": "23 April 1897", "date_of_death": "27 December 1972", "place_of_birth": "Toronto", "place_of_death": "Ottawa", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Giauque", "name": "William Giauque", "year": 1949, "category": "Chemistry", "country": null, "born_in": "Canada", "text": "William Giauque *, Chemistry, 1949", "wikidata_code": "Q110073", "date_of_birth": "12 May 1895", "date_of_death": "28 March 1982", "place_of_birth": "Niagara Falls", "place_of_death": "Berkeley", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Frederick_Banting", "name": "Frederick Banting", "year": 1923, "category": "Physiology or Medicine", "country": "Canada", "born_in": null, "text": "Frederick Banting , Physiology or Medicine, 1923", "wikidata_code": "Q180350", "date_of_birth": "14 November 1891", "date_of_death": "21 February 1941", "place_of_birth": "Alliston", "place_of_death": "Musgrave Harbour", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Elias_Canetti", "name": "Elias Canetti", "year": 1981, "category": "Literature", "country": null, "born_in": "Bulgaria", "text": "Elias Canetti *, Literature, 1981", "wikidata_code": "Q80064", "date_of_birth": "25 July 1905", "date_of_death": "14 August 1994", "place_of_birth": "Ruse", "place_of_death": "Zürich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/David_Card", "name": "David Card", "year": 2021, "category": "Economics", "country": "Canada", "born_in": null, "text": "David Card , Economics, 2021", "wikidata_code": "Q1173928", "date_of_birth": "1956", "place_of_birth": "Guelph", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jim_Peebles", "name": "Jim Peebles", "year": 2019, "category": "Physics", "country": "Canada", "born_in": null, "text": "Jim Peebles , Physics, 2019", "wikidata_code": "Q728331", "date_of_birth": "25 April 1935", "place_of_birth": "Winnipeg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Donna_Strickland", "name": "Donna Strickland", "year": 2018, "category": "Physics", "country": "Canada", "born_in": null, "text": "Donna Strickland , Physics, 2018", "wikidata_code": "Q56855591", "date_of_birth": "27 May 1959", "place_of_birth": "Guelph", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Arthur_B._McDonald", "name": "Arthur B. McDonald", "year": 2015, "category": "Physics", "country": "Canada", "born_in": null, "text": "Arthur B. McDonald , Physics, 2015", "wikidata_code": "Q710597", "date_of_birth": "29 August 1943", "place_of_birth": "Sydney", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alice_Munro", "name": "Alice Munro", "year": 2013, "category": "Literature", "country": "Canada", "born_in": null, "text": "Alice Munro , Literature, 2013", "wikidata_code": "Q234819", "date_of_birth": "10 July 1931", "place_of_birth": "Wingham", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Albert_Claude", "name": "Albert Claude", "year": 1974, "category": "Physiology or Medicine", "country": "Belgium", "born_in": null, "text": "Albert Claude , Physiology or Medicine, 1974", "wikidata_code": "Q233943", "date_of_birth": "24 August 1898", "date_of_death": "22 May 1983", "place_of_birth": "Neufchâteau", "place_of_death": "Brussels metropolitan area", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Dominique_Pire", "name": "Dominique Pire", "year": 1958, "category": "Peace", "country": "Belgium", "born_in": null, "text": "Dominique Pire , Peace, 1958", "wikidata_code": "Q158850", "date_of_birth": "10 February 1910", "date_of_death": "30 January 1969", "place_of_birth": "Leffe", "place_of_death": "Leuven", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Corneille_Heymans", "name": "Corneille Heymans", "year": 1938, "category": "Physiology or Medicine", "country": "Belgium", "born_in": null, "text": "Corneille Heymans , Physiology or Medicine, 1938", "wikidata_code": "Q156482", "date_of_birth": "28 March 1892", "date_of_death": "18 July 1968", "place_of_birth": "Ghent", "place_of_death": "Knokke-Heist", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jules_Bordet", "name": "Jules Bordet", "year": 1919, "category": "Physiology or Medicine", "country": "Belgium", "born_in": null, "text": "Jules Bordet , Physiology or Medicine, 1919", "wikidata_code": "Q211787", "date_of_birth": "13 June 1870", "date_of_death": "6 April 1961", "place_of_birth": "Soignies", "place_of_death": "City of Brussels", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Henri_La_Fontaine", "name": "Henri La Fontaine", "year": 1913, "category": "Peace", "country": "Belgium", "born_in": null, "text": "Henri La Fontaine , Peace, 1913", "wikidata_code": "Q190894", "date_of_birth": "22 April 1854", "date_of_death": "14 May 1943", "place_of_birth": "City of Brussels", "place_of_death": "City of Brussels", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Maurice_Maeterlinck", "name": "Maurice Maeterlinck", "year": 1911, "category": "Literature", "country": "Belgium", "born_in": null, "text": "Maurice Maeterlinck , Literature, 1911", "wikidata_code": "Q49747", "date_of_birth": "29 August 1862", "date_of_death": "6 May 1949", "place_of_birth": "Ghent", "place_of_death": "Nice", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Auguste_Beernaert", "name": "Auguste Beernaert", "year": 1909, "category": "Peace", "country": "Belgium", "born_in": null, "text": "Auguste Beernaert , Peace, 1909", "wikidata_code": "Q202049", "date_of_birth": "26 July 1829", "date_of_death": "6 October 1912", "place_of_birth": "Ostend", "place_of_death": "Lucerne", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Vladimir_Prelog", "name": "Vladimir Prelog", "year": 1975, "category": "Chemistry", "country": null, "born_in": "Bosnia and Herzegovina", "text": "Vladimir Prelog *,  born in  Condominium of Bosnia and Herzegovina ,  Austro-Hungarian Empire  (now  Bosnia and Herzegovina ) , Chemistry, 1975", "wikidata_code": "Q83501", "date_of_birth": "23 July 1906", "date_of_death": "7 January 1998", "place_of_birth": "Sarajevo", "place_of_death": "Zürich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ivo_Andric", "name": "Ivo Andric", "year": 1961, "category": "Literature", "country": "Bosnia and Herzegovina", "born_in": null, "text": "Ivo Andric ,  born in  Condominium of Bosnia and Herzegovina , now  Bosnia and Herzegovina , Literature, 1961", "wikidata_code": "Q47561", "date_of_birth": "9 October 1892", "date_of_death": "13 March 1975", "place_of_birth": "Dolac", "place_of_death": "Belgrade", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Peter_Brian_Medawar", "name": "Peter Brian Medawar", "year": 1960, "category": "Physiology or Medicine", "country": null, "born_in": "Brazil", "text": "Peter Brian Medawar *, Physiology or Medicine, 1960", "wikidata_code": "Q214209", "date_of_birth": "28 February 1915", "date_of_death": "2 October 1987", "place_of_birth": "Rio de Janeiro", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ralph_M._Steinman", "name": "Ralph M. Steinman", "year": 2011, "category": "Physiology or Medicine", "country": "Canada", "born_in": null, "text": "Ralph M. Steinman , Physiology or Medicine, 2011", "wikidata_code": "Q105494", "date_of_birth": "14 January 1943", "date_of_death": "30 September 2011", "place_of_birth": "Montreal", "place_of_death": "Manhattan", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Willard_S._Boyle", "name": "Willard S. Boyle", "year": 2009, "category": "Physics", "country": null, "born_in": "Canada", "text": "Willard S. Boyle *, Physics, 2009", "wikidata_code": "Q73058", "date_of_birth": "19 August 1924", "date_of_death": "7 May 2011", "place_of_birth": "Amherst", "place_of_death": "Wallace", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Jack_W._Szostak", "name": "Jack W. Szostak", "year": 2009, "category": "Physiology or Medicine", "country": "Canada", "born_in": null, "text": "Jack W. Szostak ,  born in the United Kingdom , Physiology or Medicine, 2009", "wikidata_code": "Q104600", "date_of_birth": "9 November 1952", "place_of_birth": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robert_Mundell", "name": "Robert Mundell", "year": 1999, "category": "Economics", "country": "Canada", "born_in": null, "text": "Robert Mundell , Economics, 1999", "wikidata_code": "Q219721", "date_of_birth": "24 October 1932", "date_of_death": "4 April 2021", "place_of_birth": "Kingston", "place_of_death": "Monteriggioni", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Myron_Scholes", "name": "Myron Scholes", "year": 1997, "category": "Economics", "country": null, "born_in": "Canada", "text": "Myron Scholes *, Economics, 1997", "wikidata_code": "Q295647", "date_of_birth": "1 July 1941", "place_of_birth": "Timmins", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Vickrey", "name": "William Vickrey", "year": 1996, "category": "Economics", "country": null, "born_in": "Canada", "text": "William Vickrey *, Economics, 1996", "wikidata_code": "Q295673", "date_of_birth": "21 June 1914", "date_of_death": "11 October 1996", "place_of_birth": "Victoria", "place_of_death": "Harrison", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Bertram_Brockhouse", "name": "Bertram Brockhouse", "year": 1994, "category": "Physics", "country": "Canada", "born_in": null, "text": "Bertram Brockhouse , Physics, 1994", "wikidata_code": "Q192689", "date_of_birth": "15 July 1918", "date_of_death": "13 October 2003", "place_of_birth": "Lethbridge", "place_of_death": "Hamilton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Michael_Smith_(chemist)", "name": "Michael Smith", "year": 1993, "category": "Chemistry", "country": "Canada", "born_in": null, "text": "Michael Smith ,  born in the United Kingdom , Chemistry, 1993", "wikidata_code": "Q232289", "date_of_birth": "26 April 1932", "date_of_death": "4 October 2000", "place_of_birth": "Blackpool", "place_of_death": "Vancouver", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Zhores_Alferov", "name": "Zhores Alferov", "year": 2000, "category": "Physics", "country": null, "born_in": "Belarus", "text": "Zhores Alferov *, Physics, 2000", "wikidata_code": "Q183279", "date_of_birth": "15 March 1930", "date_of_death": "1 March 2019", "place_of_birth": "Vitebsk", "place_of_death": "Saint Petersburg", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Fran%C3%A7ois_Englert", "name": "François Englert", "year": 2013, "category": "Physics", "country": "Belgium", "born_in": null, "text": "François Englert , Physics, 2013", "wikidata_code": "Q151746", "date_of_birth": "6 November 1932", "place_of_birth": "Etterbeek", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ilya_Prigogine", "name": "Ilya Prigogine", "year": 1977, "category": "Chemistry", "country": "Belgium", "born_in": null, "text": "Ilya Prigogine ,  born in Russia , Chemistry, 1977", "wikidata_code": "Q183509", "date_of_birth": "12 January 1917", "date_of_death": "28 May 2003", "place_of_birth": "Moscow", "place_of_death": "Brussels metropolitan area", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Christian_de_Duve", "name": "Christian de Duve", "year": 1974, "category": "Physiology or Medicine", "country": "Belgium", "born_in": null, "text": "Christian de Duve ,  born in the United Kingdom , Physiology or Medicine, 1974", "wikidata_code": "Q234590", "date_of_birth": "2 October 1917", "date_of_death": "4 May 2013", "place_of_birth": "Thames Ditton", "place_of_death": "Nethen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Frank_Macfarlane_Burnet", "name": "Sir Frank Macfarlane Burnet", "year": 1960, "category": "Physiology or Medicine", "country": "Australia", "born_in": null, "text": "Sir Frank Macfarlane Burnet , Physiology or Medicine, 1960", "wikidata_code": "Q193550", "date_of_birth": "3 September 1899", "date_of_death": "31 August 1985", "place_of_birth": "Traralgon", "place_of_death": "Melbourne", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Howard_Florey", "name": "Howard Florey", "year": 1945, "category": "Physiology or Medicine", "country": "Australia", "born_in": null, "text": "Howard Florey , Physiology or Medicine, 1945", "wikidata_code": "Q137106", "date_of_birth": "24 September 1898", "date_of_death": "21 February 1968", "place_of_birth": "Adelaide", "place_of_death": "Oxford", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Lawrence_Bragg", "name": "William Lawrence Bragg", "year": 1915, "category": "Physics", "country": "Australia", "born_in": null, "text": "William Lawrence Bragg , Physics, 1915", "wikidata_code": "Q131729", "date_of_birth": "31 March 1890", "date_of_death": "1 July 1971", "place_of_birth": "Adelaide", "place_of_death": "Ipswich", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/William_Henry_Bragg", "name": "William Henry Bragg", "year": 1915, "category": "Physics", "country": "Australia", "born_in": null, "text": "William Henry Bragg , Physics, 1915", "wikidata_code": "Q133747", "date_of_birth": "2 July 1862", "date_of_death": "12 March 1942", "place_of_birth": "Westward", "place_of_death": "London", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ferenc_Krausz", "name": "Ferenc Krausz", "year": 2023, "category": "Physics", "country": "Austria", "born_in": null, "text": "Ferenc Krausz ,  born in  Hungary , Physics, 2023", "wikidata_code": "Q86970", "date_of_birth": "17 May 1962", "place_of_birth": "Mór", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Anton_Zeilinger", "name": "Anton Zeilinger", "year": 2022, "category": "Physics", "country": "Austria", "born_in": null, "text": "Anton Zeilinger , Physics, 2022", "wikidata_code": "Q78610", "date_of_birth": "20 May 1945", "place_of_birth": "Ried im Innkreis", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Peter_Handke", "name": "Peter Handke", "year": 2019, "category": "Literature", "country": "Austria", "born_in": null, "text": "Peter Handke , Literature, 2019", "wikidata_code": "Q44107", "date_of_birth": "6 December 1942", "place_of_birth": "Griffen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Martin_Karplus", "name": "Martin Karplus", "year": 2013, "category": "Chemistry", "country": null, "born_in": "Austria", "text": "Martin Karplus *, Chemistry, 2013", "wikidata_code": "Q903471", "date_of_birth": "15 March 1930", "place_of_birth": "Vienna", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Elfriede_Jelinek", "name": "Elfriede Jelinek", "year": 2004, "category": "Literature", "country": "Austria", "born_in": null, "text": "Elfriede Jelinek , Literature, 2004", "wikidata_code": "Q47243", "date_of_birth": "20 October 1946", "place_of_birth": "Mürzzuschlag", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Eric_Kandel", "name": "Eric Kandel", "year": 2000, "category": "Physiology or Medicine", "country": null, "born_in": "Austria", "text": "Eric Kandel *, Physiology or Medicine, 2000", "wikidata_code": "Q155529", "date_of_birth": "7 November 1929", "place_of_birth": "Vienna", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Walter_Kohn", "name": "Walter Kohn", "year": 1998, "category": "Chemistry", "country": null, "born_in": "Austria", "text": "Walter Kohn *, Chemistry, 1998", "wikidata_code": "Q78510", "date_of_birth": "9 March 1923", "date_of_death": "19 April 2016", "place_of_birth": "Vienna", "place_of_death": "Santa Barbara", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Ardem_Patapoutian", "name": "Ardem Patapoutian", "year": 2021, "category": "Physiology or Medicine", "country": "Armenia", "born_in": null, "text": "Ardem Patapoutian ,  born in Lebanon , Physiology or Medicine, 2021", "wikidata_code": "Q60322501", "date_of_birth": "2 October 1967", "place_of_birth": "Beirut", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Brian_Schmidt", "name": "Brian Schmidt", "year": 2011, "category": "Physics", "country": "Australia", "born_in": null, "text": "Brian Schmidt ,  born in the United States , Physics, 2011", "wikidata_code": "Q201452", "date_of_birth": "24 February 1967", "place_of_birth": "Missoula", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Elizabeth_Blackburn", "name": "Elizabeth Blackburn", "year": 2009, "category": "Physiology or Medicine", "country": null, "born_in": "Australia", "text": "Elizabeth Blackburn *, Physiology or Medicine, 2009", "wikidata_code": "Q26321", "date_of_birth": "26 November 1948", "place_of_birth": "Hobart", "gender": "female"}
+{"link": "https://en.wikipedia.org/wiki/Barry_Marshall", "name": "Barry Marshall", "year": 2005, "category": "Physiology or Medicine", "country": "Australia", "born_in": null, "text": "Barry Marshall , Physiology or Medicine, 2005", "wikidata_code": "Q202136", "date_of_birth": "30 September 1951", "place_of_birth": "Kalgoorlie", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Robin_Warren", "name": "J. Robin Warren", "year": 2005, "category": "Physiology or Medicine", "country": "Australia", "born_in": null, "text": "J. Robin Warren , Physiology or Medicine, 2005", "wikidata_code": "Q208670", "date_of_birth": "11 June 1937", "place_of_birth": "Adelaide", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Peter_C._Doherty", "name": "Peter C. Doherty", "year": 1996, "category": "Physiology or Medicine", "country": "Australia", "born_in": null, "text": "Peter C. Doherty , Physiology or Medicine, 1996", "wikidata_code": "Q309814", "date_of_birth": "15 October 1940", "place_of_birth": "Brisbane", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Rolf_Zinkernagel", "name": "Rolf Zinkernagel", "year": 1996, "category": "Physiology or Medicine", "country": "Australia", "born_in": null, "text": "Rolf Zinkernagel , Physiology or Medicine, 1996", "wikidata_code": "Q116064", "date_of_birth": "6 January 1944", "place_of_birth": "Riehen", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Cornforth", "name": "John Cornforth", "year": 1975, "category": "Chemistry", "country": null, "born_in": "Australia", "text": "John Cornforth *, Chemistry, 1975", "wikidata_code": "Q135154", "date_of_birth": "7 September 1917", "date_of_death": "8 December 2013", "place_of_birth": "Sydney", "place_of_death": "Brighton", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Patrick_White", "name": "Patrick White", "year": 1973, "category": "Literature", "country": "Australia", "born_in": null, "text": "Patrick White ,  born in the United Kingdom , Literature, 1973", "wikidata_code": "Q129187", "date_of_birth": "28 May 1912", "date_of_death": "30 September 1990", "place_of_birth": "London", "place_of_death": "Sydney", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Alexander_Prokhorov", "name": "Aleksandr M. Prokhorov", "year": 1964, "category": "Physics", "country": "Australia", "born_in": null, "text": "Aleksandr M. Prokhorov , Physics, 1964", "wikidata_code": "Q83552", "date_of_birth": "11 July 1916", "date_of_death": "8 January 2002", "place_of_birth": "Atherton", "place_of_death": "Moscow", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Albert_Camus", "name": "Albert Camus", "year": 1957, "category": "Literature", "country": null, "born_in": "Algeria", "text": "Albert Camus *, Literature, 1957", "wikidata_code": "Q34670", "date_of_birth": "7 November 1913", "date_of_death": "4 January 1960", "place_of_birth": "Dréan", "place_of_death": "Villeblevin", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/C%C3%A9sar_Milstein", "name": "César Milstein", "year": 1984, "category": "Physiology or Medicine", "country": null, "born_in": "Argentina", "text": "César Milstein *, Physiology or Medicine, 1984", "wikidata_code": "Q155525", "date_of_birth": "8 October 1927", "date_of_death": "24 March 2002", "place_of_birth": "Bahía Blanca", "place_of_death": "Cambridge", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Adolfo_P%C3%A9rez_Esquivel", "name": "Adolfo Pérez Esquivel", "year": 1980, "category": "Peace", "country": "Argentina", "born_in": null, "text": "Adolfo Pérez Esquivel , Peace, 1980", "wikidata_code": "Q206505", "date_of_birth": "26 November 1931", "place_of_birth": "Buenos Aires", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Luis_Federico_Leloir", "name": "Luis Federico Leloir", "year": 1970, "category": "Chemistry", "country": "Argentina", "born_in": null, "text": "Luis Federico Leloir ,  born in France , Chemistry, 1970", "wikidata_code": "Q233985", "date_of_birth": "6 September 1906", "date_of_death": "2 December 1987", "place_of_birth": "Paris", "place_of_death": "Catamarca", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Bernardo_Houssay", "name": "Bernardo Houssay", "year": 1947, "category": "Physiology or Medicine", "country": "Argentina", "born_in": null, "text": "Bernardo Houssay , Physiology or Medicine, 1947", "wikidata_code": "Q237160", "date_of_birth": "10 April 1887", "date_of_death": "21 September 1971", "place_of_birth": "Buenos Aires", "place_of_death": "Buenos Aires", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/Carlos_Saavedra_Lamas", "name": "Carlos Saavedra Lamas", "year": 1936, "category": "Peace", "country": "Argentina", "born_in": null, "text": "Carlos Saavedra Lamas , Peace, 1936", "wikidata_code": "Q193672", "date_of_birth": "1 November 1878", "date_of_death": "5 May 1959", "place_of_birth": "Buenos Aires", "place_of_death": "Buenos Aires", "gender": "male"}
+{"link": "https://en.wikipedia.org/wiki/John_Eccles_(neurophysiologist)", "name": "John Carew Eccles", "year": 1963, "category": "Physiology or Medicine", "country": "Australia", "born_in": null, "text": "John Carew Eccles , Physiology or Medicine, 1963", "wikidata_code": "Q273223", "date_of_birth": "27 January 1903", "date_of_death": "2 May 1997", "place_of_birth": "Melbourne", "place_of_death": "Tenero-Contra", "gender": "male"}
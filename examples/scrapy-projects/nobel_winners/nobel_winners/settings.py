@@ -96,3 +96,9 @@ HTTPCACHE_ENABLED = True
 REQUEST_FINGERPRINTER_IMPLEMENTATION = "2.7"
 TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
 FEED_EXPORT_ENCODING = "utf-8"
+
+# Also export the items of every crawl as JSON Lines, one item per line,
+# so that the feed can be read in chunks without parsing the whole file (see read_winners in winners_cleaning.py)
+FEEDS = {
+    "%(name)s.jl": {"format": "jsonlines", "encoding": "utf8", "overwrite": True},
+}
@@ -144,6 +144,11 @@ This Scrapy example is based on:
 
 # $ head Nobel_winners_by_request_chains.json
 
+# With FEEDS in settings.py, every crawl also writes the items as JSON Lines
+# $ scrapy crawl Nobel_winners_by_request_chains
+# $ head -n 1 Nobel_winners_by_request_chains.jl
+# {"link": "https://en.wikipedia.org/wiki/Richard_Adolf_Zsigmondy", "name": "Richard Adolf Zsigmondy", "year": 1925, ...}
+
 # $ scrapy crawl Nobel_winners_with_images -o Nobel_winners_with_images.json
 
 # List the content of the 'images' folder:
@@ -216,6 +216,39 @@ with Session() as session:
     print("reconstructed list of dictionaries:", nobel_winners)
     # reconstructed list of dictionaries: [{'category': 'Physics', 'name': 'Albert Einstein', 'nationality': 'German and Swiss', 'gender': 'male', 'year': 1921}, {'category': 'Physics', 'name': 'Paul Dirac', 'nationality': 'British', 'gender': 'male', 'year': 1933}, {'category': 'Chemistry', 'name': 'Marie Curie', 'nationality': 'Polish', 'gender': 'female', 'year': 1911}]
 
+    # inst_to_dict builds a Winner instance and a dictionary per row.
+    # For many rows, select only the needed columns with Core and get them as columns
+    # (see query_to_columns in sqlalchemy_columns.py and benchmark_inst_to_dict.py)
+    from sqlalchemy_columns import query_to_columns
+
+    nobel_winners_columns = query_to_columns(session, Winner, delete_id=True, output='lists')
+    # ... INFO sqlalchemy.engine.Engine SELECT winners.category, winners.name, winners.nationality, winners.gender, winners.year
+    # FROM winners
+    # ... INFO sqlalchemy.engine.Engine [generated in 0.00027s] ()
+    print(nobel_winners_columns)
+    # {'category': ['Physics', 'Physics', 'Chemistry'], 'name': ['Albert Einstein', 'Paul Dirac', 'Marie Curie'], 'nationality': ['German and Swiss', 'British', 'Polish'], 'gender': ['male', 'male', 'female'], 'year': [1921, 1933, 1911]}
+    physics_columns = query_to_columns(
+        session,
+        session.query(Winner).filter(Winner.category == 'Physics'),
+        columns=['name', 'year'],
+        output='numpy'
+    )
+    # ... INFO sqlalchemy.engine.Engine SELECT winners.name, winners.year
+    # FROM winners
+    # WHERE winners.category = ?
+    # ... INFO sqlalchemy.engine.Engine [generated in 0.00027s] ('Physics',)
+    print(physics_columns)
+    # {'name': array(['Albert Einstein', 'Paul Dirac'], dtype='<U15'), 'year': array([1921, 1933])}
+    df_winners = query_to_columns(session, Winner, output='dataframe')
+    # ... INFO sqlalchemy.engine.Engine SELECT winners.category, winners.name, winners.nationality, winners.gender, winners.year
+    # FROM winners
+    # ... INFO sqlalchemy.engine.Engine [cached since 0.004763s ago] ()
+    print(df_winners)
+    #     category             name       nationality  gender  year
+    # 0    Physics  Albert Einstein  German and Swiss    male  1921
+    # 1    Physics       Paul Dirac           British    male  1933
+    # 2  Chemistry      Marie Curie            Polish  female  1911
+
     # Update database rows
     marie = session.get(Winner, 3)
     marie.nationality = 'French'
@@ -0,0 +1,395 @@
+"""
+The cleaning of the scraped Nobel winners of pandas_2--data-cleaning.py as reusable stages.
+
+The hand-written fixes of clean_data_v5 (drops, overrides, date-of-birth patches)
+are a rules table here. The rules are compiled into one lookup table per set of matched columns,
+so they are applied with one hash join per lookup table
+instead of one comparison of the whole column per rule: O(rows + rules) instead of O(rows * rules).
+
+The free-text dates of Wikidata are parsed with an ordered list of regex formats ("1 April 1952", "1952", "c. 1898", ...)
+applied to whole columns, instead of pd.to_datetime(errors='coerce') that drops all but one format.
+
+Before the cleaned data are stored, compact_dtypes(...) makes the text columns categorical or Arrow strings
+and the integers as small as they can be.
+
+The JSON Lines feed of the spider can be cleaned in chunks:
+the stages looking at one record at a time run on every chunk as it is read.
+clean_winners_chunks(...) keeps the cleaned records in memory to combine them at the end,
+stream_clean_winners(...) reads the feed twice and keeps only the keys:
+the first pass finds the surviving record of every (name, year) and the "born_in" records,
+the second pass cleans the chunks again and yields the survivors, so the memory is bounded by the chunk size
+and the number of distinct keys, not by the size of the crawl.
+
+This example is based on:
+- "Data Visualization with Python and JavaScript: Scrape, Clean, Explore, and Transform Your Data", Kyran Dale, O'Reilly, 2023;
+- https://pandas.pydata.org/docs/reference/api/pandas.Index.get_indexer.html;
+- https://pandas.pydata.org/docs/user_guide/io.html#line-delimited-json;
+- https://numpy.org/doc/stable/reference/arrays.datetime.html.
+"""
+import calendar
+import re
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+MATCH_COLUMNS = ('name', 'year')
+# The fields of NobelWinnerItem of scrapy-projects/nobel_winners/nobel_winners/spiders/spider_2__nobel_winners_by_request_chains.py
+RAW_DTYPES = {
+    'link': 'object',
+    'name': 'object',
+    'year': 'Int64',  # missing in the items without a year
+    'category': 'object',
+    'country': 'object',
+    'born_in': 'object',
+    'text': 'object',
+    'wikidata_code': 'object',
+    'date_of_birth': 'object',
+    'date_of_death': 'object',
+    'place_of_birth': 'object',
+    'place_of_death': 'object',
+    'gender': 'object',
+}
+RULE_COLUMNS = ('action', 'name', 'year', 'column', 'value')
+
+# A rule matches the rows with its name and year, a missing name or year matches any.
+# "drop" removes the matched rows, "set" writes the value into the column of the matched rows.
+CLEANING_RULES = pd.DataFrame.from_records([
+    ('drop', None, 1809, None, None),
+    ('drop', 'Marie Curie', None, None, None),
+    ('set', 'Marie Skłodowska-Curie', 1911, 'country', 'France'),
+    ('drop', 'Sidney Altman', 1990, None, None),
+    ('set', 'Róbert Bárány', None, 'category', 'Physiology or Medicine'),
+    ('set', 'Venkatraman Ramakrishnan', None, 'date_of_birth', pd.Timestamp("1 April 1952")),
+    ('set', 'Nadia Murad', None, 'date_of_birth', pd.Timestamp("10 March 1993")),
+    ('set', 'Karl Adolph Gjellerup', None, 'date_of_birth', pd.Timestamp("2 June 1857")),
+    ('set', 'David Card', None, 'date_of_birth', pd.Timestamp("1956")),
+    ('set', 'Michael Houghton', None, 'date_of_birth', pd.Timestamp("1949")),
+    ('set', 'Albert Lutuli', None, 'date_of_birth', pd.Timestamp("1898")),
+], columns=RULE_COLUMNS).astype({'year': 'Int64'})
+
+
+@dataclass
+class RuleGroup:
+    """
+    The rules matching on the same columns, with one row per distinct key
+    """
+    match_on: tuple
+    keys: pd.Index
+    rule_ids: list  # key position -> ids of the rules with this key
+    drop: np.ndarray  # key position -> bool
+    values: dict  # column -> (key position -> bool whether the column is set, pd.Series of the values)
+
+
+def key_index(columns: list) -> pd.Index:
+    return pd.Index(columns[0]) if len(columns) == 1 else pd.MultiIndex.from_arrays(columns)
+
+
+def compile_rules(rules: pd.DataFrame) -> list:
+    """
+    Group the rules by the columns they match on.
+    Where the rules of several groups set the same column of a row, the group matching more columns wins,
+    so the groups are returned from the least to the most specific.
+    """
+    entries = {}  # match_on -> key -> {'rule_ids', 'drop', 'values'}
+    for rule_id, rule in enumerate(rules.itertuples(index=False)):
+        match_on = tuple(column for column in MATCH_COLUMNS if pd.notna(getattr(rule, column)))
+        if not match_on:
+            raise ValueError(f"The rule {rule_id} matches no column")
+        key = tuple(getattr(rule, column) for column in match_on)
+        entry = entries.setdefault(match_on, {}).setdefault(key, {'rule_ids': [], 'drop': False, 'values': {}})
+        entry['rule_ids'].append(rule_id)
+        if rule.action == 'drop':
+            entry['drop'] = True
+        elif rule.action == 'set':
+            if rule.column in MATCH_COLUMNS:
+                raise ValueError(f"The rule {rule_id} sets the matched column {rule.column}")
+            entry['values'][rule.column] = rule.value
+        else:
+            raise ValueError(f"The rule {rule_id} has an unknown action: {rule.action}")
+
+    groups = []
+    for match_on in sorted(entries, key=len):
+        group_entries = list(entries[match_on].values())
+        keys = list(entries[match_on])
+        columns = {column for entry in group_entries for column in entry['values']}
+        values = {}
+        for column in columns:
+            is_set = np.array([column in entry['values'] for entry in group_entries])
+            # A Series infers the dtype of the values, e.g. datetime64 for the dates of birth
+            column_values = pd.Series([entry['values'].get(column) for entry in group_entries])
+            values[column] = (is_set, column_values)
+        groups.append(RuleGroup(
+            match_on=match_on,
+            keys=key_index([[key[i] for key in keys] for i in range(len(match_on))]),
+            rule_ids=[entry['rule_ids'] for entry in group_entries],
+            drop=np.array([entry['drop'] for entry in group_entries]),
+            values=values,
+        ))
+    return groups
+
+
+def apply_rules(df: pd.DataFrame, rules: pd.DataFrame = CLEANING_RULES) -> tuple:
+    """
+    Apply the rules in one pass: every group of rules is one hash join of the matched columns of df with its keys.
+    Return the cleaned df and the rules with the number of rows every rule matched.
+    """
+    matched = np.zeros(len(rules), dtype=np.int64)
+    drop = np.zeros(len(df), dtype=bool)
+    columns = {}
+    for group in compile_rules(rules):
+        positions = group.keys.get_indexer(key_index([df[column] for column in group.match_on]))
+        found = positions >= 0
+        key_counts = np.bincount(positions[found], minlength=len(group.keys))
+        for rule_ids, count in zip(group.rule_ids, key_counts):
+            matched[rule_ids] += count
+        positions = np.where(found, positions, 0)
+        drop |= found & group.drop[positions]
+        for column, (is_set, values) in group.values.items():
+            rows = found & is_set[positions]
+            new_values = pd.Series(values.to_numpy()[positions], index=df.index)
+            columns[column] = columns.get(column, df[column]).mask(rows, new_values)
+    return df.assign(**columns)[~drop], rules.assign(matched=matched)
+
+
+MONTHS = {
+    **{name.lower(): number for number, name in enumerate(calendar.month_name) if name},
+    **{name.lower(): number for number, name in enumerate(calendar.month_abbr) if name},
+    'sept': 9,
+}
+MONTH_PATTERN = '(?P<month>' + '|'.join(sorted(MONTHS, key=len, reverse=True)) + r')\.?'
+# The formats of the dates are tried in this order, the first matching one is used.
+# Every format may be preceded by "c."/"circa" and followed by an era (BC, BCE, AD, CE).
+DATE_FORMATS = (
+    ('day month year', r'(?P<day>\d{1,2})\s+' + MONTH_PATTERN + r',?\s+(?P<year>\d{1,4})'),
+    ('month day year', MONTH_PATTERN + r'\s+(?P<day>\d{1,2}),?\s+(?P<year>\d{1,4})'),
+    ('iso', r'(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})'),
+    ('month year', MONTH_PATTERN + r',?\s+(?P<year>\d{1,4})'),
+    ('year', r'(?P<year>\d{1,4})'),
+)
+CIRCA_PATTERN = r'(?:(?P<circa>c\.|ca\.|circa)\s*)?'
+ERA_PATTERN = r'(?:\s*(?P<era>bce|bc|b\.c\.|ce|ad|a\.d\.))?'
+
+
+def parse_dates(values: pd.Series, unit: str = 'ns') -> pd.DataFrame:
+    """
+    Parse free-text dates like "1 April 1952", "April 1952", "1952", "c. 1898" or "500 BC" into datetime64.
+    A missing day or month is the first one, BC years are counted astronomically (1 BC is the year 0).
+    Every distinct value is parsed once with one regex pass per format, so repeated dates cost nothing.
+    Return the dates and the format that matched, e.g. "circa year", or NaT and NaN like errors='coerce'.
+    With unit='ns', only the dates from 1677 to 2262 fit, use unit='s' for older ones.
+    """
+    codes, uniques = pd.factorize(values)
+    text = pd.Series(uniques, dtype=object).astype(str).str.strip()
+    parts = pd.DataFrame(index=text.index, columns=['year', 'month', 'day', 'circa', 'era', 'format'], dtype=object)
+    remaining = pd.Series(True, index=text.index)
+    for name, pattern in DATE_FORMATS:
+        extracted = text[remaining].str.extract(
+            f'^{CIRCA_PATTERN}{pattern}{ERA_PATTERN}$', flags=re.IGNORECASE,
+        )
+        extracted = extracted[extracted.year.notna()]
+        parts.loc[extracted.index, extracted.columns] = extracted
+        parts.loc[extracted.index, 'format'] = name
+        remaining[extracted.index] = False
+
+    matched = parts.format.notna().to_numpy()
+    month_text = parts.month.fillna('1').str.lower()
+    month = pd.to_numeric(month_text, errors='coerce').fillna(month_text.map(MONTHS)).fillna(0).to_numpy(np.int64)
+    day = pd.to_numeric(parts.day, errors='coerce').fillna(1).to_numpy(np.int64)
+    year = pd.to_numeric(parts.year, errors='coerce').fillna(1970).to_numpy(np.int64)
+    bc = parts.era.str.lower().isin(['bc', 'bce', 'b.c.']).to_numpy()
+    year = np.where(bc, 1 - year, year)
+
+    months = (year - 1970).astype('datetime64[Y]').astype('datetime64[M]') + (month - 1)
+    days = months.astype('datetime64[D]') + (day - 1)
+    # The day must be in the month, e.g. not 31 April
+    valid = matched & (month >= 1) & (month <= 12) & (day >= 1) & (days.astype('datetime64[M]') == months)
+    if unit == 'ns':
+        valid &= (days >= np.datetime64(pd.Timestamp.min.ceil('D').date())) & (days <= np.datetime64(pd.Timestamp.max.floor('D').date()))
+    dates = np.where(valid, days, np.datetime64('NaT')).astype(f'datetime64[{unit}]')
+
+    formats = parts.format.where(valid)
+    formats = formats.where(parts.circa.isna(), 'circa ' + formats)
+    formats = formats.where(~bc, formats + ' BC')
+    dates = np.append(dates, np.datetime64('NaT'))  # code -1 of the missing values takes the last item
+    formats = np.append(formats.to_numpy(), np.nan)
+    return pd.DataFrame({'date': dates[codes], 'format': formats[codes]}, index=values.index)
+
+
+def deduplicate(df: pd.DataFrame, keys: tuple = ('name', 'year'), keep: str = 'first') -> pd.DataFrame:
+    """
+    Keep one row per key in one hashing pass, in the order of df.
+    keep: 'first' or 'last' row of a key, or 'most complete', the row with the most values (the first of them on ties).
+    The result is the same when df is deduplicated chunk by chunk and then the concatenated chunks again.
+    """
+    if keep in ('first', 'last'):
+        return df[~df.duplicated(list(keys), keep=keep)]
+    if keep != 'most complete':
+        raise ValueError(f"Unknown survivor: {keep}")
+    codes = df.groupby(list(keys), sort=False, dropna=False).ngroup().to_numpy()
+    completeness = pd.Series(df.notna().sum(axis=1).to_numpy())
+    positions = completeness.groupby(codes).idxmax().to_numpy()
+    return df.iloc[np.sort(positions)]
+
+
+def enrich(df: pd.DataFrame, lookup: pd.DataFrame, on: str, columns: list, duplicates: str = 'first') -> pd.DataFrame:
+    """
+    Add the columns of lookup to the rows of df with the same key "on": a left hash join keeping the index of df.
+    The keys of lookup found more than once are resolved by the duplicates policy:
+    'first' or 'last' keeps one row of the key, 'error' raises ValueError.
+    """
+    if duplicates == 'error':
+        duplicated = lookup[on][lookup[on].duplicated()]
+        if not duplicated.empty:
+            raise ValueError(f"Duplicated keys in the lookup: {duplicated.unique()[:10].tolist()}")
+    elif duplicates in ('first', 'last'):
+        lookup = lookup.drop_duplicates(subset=[on], keep=duplicates)
+    else:
+        raise ValueError(f"Unknown duplicates policy: {duplicates}")
+    positions = pd.Index(lookup[on]).get_indexer(df[on])
+    # The missing keys have the position -1, which takes a missing value
+    return df.assign(**{
+        column: pd.Series(lookup[column].array.take(positions, allow_fill=True), index=df.index)
+        for column in columns
+    })
+
+
+def clean_records(df: pd.DataFrame, rules: pd.DataFrame = CLEANING_RULES) -> tuple:
+    """
+    The stages of the cleaning that look at one record at a time, so they can run on chunks of the records.
+    Return the cleaned records, the "born_in" records and the rules with their match counts.
+    """
+    df = df.replace('', np.nan)
+    df_born_in = df[df.born_in.notnull()][["name", "born_in"]]
+    df = df[df.born_in.isnull()]  # The data have either "country" or "born_in"
+    df = df.drop('born_in', axis=1)
+    df.date_of_birth = parse_dates(df.date_of_birth).date
+    df.date_of_death = parse_dates(df.date_of_death).date
+    df, rule_counts = apply_rules(df, rules)
+    df = df[df.gender.notnull()]
+    return df, df_born_in, rule_counts
+
+
+def finish_records(df: pd.DataFrame, df_born_in: pd.DataFrame) -> pd.DataFrame:
+    """
+    The stages of the cleaning after the deduplication: "born_in", the name index and the award age
+    """
+    df = enrich(df, df_born_in, on='name', columns=['born_in'], duplicates='first')
+    df = df.set_index('name')
+    df['year'] = df.year.astype("int64")  # Int64 when read from the feed, every cleaned record has a year
+    df['award_age'] = (df.year - pd.DatetimeIndex(df.date_of_birth).year).astype("int64")
+    return df
+
+
+def combine_records(df: pd.DataFrame, df_born_in: pd.DataFrame, keep: str = 'first') -> pd.DataFrame:
+    """
+    The stages of the cleaning that combine the records of a name: deduplication and "born_in"
+    """
+    return finish_records(deduplicate(df, ('name', 'year'), keep), df_born_in)
+
+
+def clean_winners(df: pd.DataFrame, rules: pd.DataFrame = CLEANING_RULES, keep: str = 'first') -> tuple:
+    """
+    clean_data_v5 of pandas_2--data-cleaning.py with the fixes applied from the rules
+    and the duplicates resolved by the keep survivor of deduplicate(...) instead of at random.
+    Return the cleaned df indexed by name and the rules with their match counts.
+    """
+    df, df_born_in, rule_counts = clean_records(df, rules)
+    return combine_records(df, df_born_in, keep), rule_counts
+
+
+def clean_winners_chunks(chunks, rules: pd.DataFrame = CLEANING_RULES, keep: str = 'first') -> tuple:
+    """
+    clean_winners of an iterable of raw chunks, e.g. read_winners(...).
+    Only one raw chunk is in memory at a time, but the cleaned records of all the chunks are kept,
+    deduplicated within every chunk, and combined at the end: see stream_clean_winners(...) for large crawls.
+    """
+    cleaned, born_in, matched = [], [], 0
+    for chunk in chunks:
+        df, df_born_in, rule_counts = clean_records(chunk, rules)
+        cleaned.append(deduplicate(df, ('name', 'year'), keep))
+        born_in.append(deduplicate(df_born_in, ('name',), 'first'))
+        matched = matched + rule_counts.matched.to_numpy()
+    df = combine_records(pd.concat(cleaned), pd.concat(born_in), keep)
+    return df, rules.assign(matched=matched)
+
+
+def survivor_keys(df: pd.DataFrame, keep: str) -> pd.DataFrame:
+    """
+    The position (the index in the feed) of the surviving record of every (name, year), as deduplicate(...) keeps it.
+    df has the columns name, year, position and completeness (the number of values of the record), ordered by position.
+    """
+    keys = list(MATCH_COLUMNS)
+    if keep in ('first', 'last'):
+        return df[~df.duplicated(keys, keep=keep)]
+    if keep != 'most complete':
+        raise ValueError(f"Unknown survivor: {keep}")
+    df = df.reset_index(drop=True)
+    # idxmax takes the first of the equally complete records
+    return df.loc[np.sort(df.groupby(keys, sort=False, dropna=False).completeness.idxmax().to_numpy())]
+
+
+def stream_clean_winners(path: str, rules: pd.DataFrame = CLEANING_RULES, keep: str = 'first',
+                         chunksize: int = 10_000) -> tuple:
+    """
+    clean_winners of the JSON Lines feed at path in two passes of read_winners(...) chunks,
+    without the records of the whole crawl in memory.
+    Return the generator of the cleaned chunks (their concatenation is the df of clean_winners)
+    and the rules with their match counts.
+    """
+    keys, born_in, matched = None, None, 0
+    for chunk in read_winners(path, chunksize):
+        df, df_born_in, rule_counts = clean_records(chunk, rules)
+        chunk_keys = df[list(MATCH_COLUMNS)].assign(position=df.index, completeness=df.notna().sum(axis=1))
+        keys = survivor_keys(pd.concat([keys, chunk_keys]), keep)
+        born_in = deduplicate(pd.concat([born_in, df_born_in]), ('name',), 'first')
+        matched = matched + rule_counts.matched.to_numpy()
+    survivors = pd.Index(keys.position if keys is not None else [])
+
+    def cleaned_chunks():
+        for chunk in read_winners(path, chunksize):
+            df, _, _ = clean_records(chunk, rules)
+            df = df[df.index.isin(survivors)]
+            if len(df):
+                yield finish_records(df, born_in)
+
+    return cleaned_chunks(), rules.assign(matched=matched)
+
+
+def compact_dtypes(df: pd.DataFrame, max_category_ratio: float = 0.5, text_dtype: str = 'string[pyarrow]') -> tuple:
+    """
+    Store every column in the smallest dtype that keeps its values:
+    - integers get the smallest integer dtype (int16 for the years, int8 for the ages);
+    - text columns with few distinct values (at most max_category_ratio of the values) become categorical;
+    - the other text columns become text_dtype, Arrow-backed strings by default (None leaves them as objects).
+    Return the compacted df and the dtypes and memory in bytes of every column before and after.
+    """
+    columns = {}
+    for name, column in df.items():
+        if pd.api.types.is_integer_dtype(column):
+            columns[name] = pd.to_numeric(column, downcast='integer')
+        elif column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) == 'string':
+            if column.nunique() <= max_category_ratio * column.count():
+                columns[name] = column.astype('category')
+            elif text_dtype is not None:
+                columns[name] = column.astype(text_dtype)
+    compacted = df.assign(**columns)
+    memory = pd.DataFrame({
+        'dtype_before': df.dtypes,
+        'dtype_after': compacted.dtypes,
+        'bytes_before': df.memory_usage(deep=True),
+        'bytes_after': compacted.memory_usage(deep=True),
+    }).reindex(['Index', *df.columns])
+    return compacted, memory
+
+
+def read_winners(path: str, chunksize: int = 10_000):
+    """
+    Stream the records of a JSON Lines feed of the spider as DataFrame chunks of chunksize records,
+    indexed by their positions in the feed.
+    The feed leaves out the keys of missing values, so a chunk may lack whole columns:
+    every chunk gets all the columns of RAW_DTYPES and their dtypes, whatever values it happens to contain.
+    """
+    with pd.read_json(path, lines=True, chunksize=chunksize, dtype=RAW_DTYPES, convert_dates=False) as reader:
+        for chunk in reader:
+            yield chunk.reindex(columns=list(RAW_DTYPES)).astype(RAW_DTYPES)
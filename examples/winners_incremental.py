@@ -0,0 +1,101 @@
+"""
+Incremental cleaning of the scraped Nobel winners:
+only the new or changed raw records are cleaned and merged into the cleaned data of the previous run.
+
+Every raw record is fingerprinted by its link and a hash of its content.
+The fingerprints are stored next to the cleaned data in Parquet, so the next run finds
+the added records (a new link or new content) and the removed ones (a link or content that is gone).
+The cleaning combines the records of the same name (duplicates, "born_in" records),
+so all the records of a name with an added or removed record are cleaned again
+and replace the cleaned rows of this name. A change of the rules changes every fingerprint.
+
+To clean everything from scratch, delete the stored Parquet files.
+
+This example is based on:
+- https://pandas.pydata.org/docs/reference/api/pandas.util.hash_pandas_object.html;
+- https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.to_parquet.html.
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from winners_cleaning import CLEANING_RULES, clean_winners
+
+
+def content_hash(df: pd.DataFrame) -> np.ndarray:
+    # The columns are sorted, so the hash does not depend on their order in the feed
+    return pd.util.hash_pandas_object(df[sorted(df.columns)].astype(str), index=False).to_numpy()
+
+
+def fingerprint(raw: pd.DataFrame, rules: pd.DataFrame = CLEANING_RULES) -> pd.DataFrame:
+    rules_hash = np.bitwise_xor.reduce(content_hash(rules), initial=np.uint64(0))
+    return pd.DataFrame({
+        'link': raw.link.to_numpy(),
+        'name': raw.name.to_numpy(),
+        'fingerprint': content_hash(raw) ^ rules_hash,
+    })
+
+
+def clean_incrementally(raw: pd.DataFrame, cleaned_path: str, fingerprints_path: str,
+                        rules: pd.DataFrame = CLEANING_RULES) -> tuple:
+    """
+    Clean the records of raw that differ from the previous run and store the merged result.
+    Return the cleaned df indexed by name and the sizes of the delta.
+    """
+    fingerprints = fingerprint(raw, rules)
+    if os.path.exists(cleaned_path) and os.path.exists(fingerprints_path):
+        cleaned = pd.read_parquet(cleaned_path)
+        previous = pd.read_parquet(fingerprints_path)
+    else:
+        cleaned = None
+        previous = fingerprints.iloc[:0]
+
+    keys = pd.MultiIndex.from_frame(fingerprints[['link', 'fingerprint']])
+    previous_keys = pd.MultiIndex.from_frame(previous[['link', 'fingerprint']])
+    added = ~keys.isin(previous_keys)
+    removed = ~previous_keys.isin(keys)
+    names = pd.Index(fingerprints.name[added]).union(pd.Index(previous.name[removed])).unique().dropna()
+
+    delta = {
+        'records': len(raw),
+        'added': int(added.sum()),
+        'removed': int(removed.sum()),
+        'names': len(names),
+        'recleaned': 0,
+    }
+    if cleaned is not None and names.empty:
+        return cleaned, delta
+
+    changed = raw[raw.name.isin(names)] if cleaned is not None else raw
+    delta['recleaned'] = len(changed)
+    cleaned_changed, _ = clean_winners(changed, rules)
+    if cleaned is None:
+        cleaned = cleaned_changed
+    else:
+        cleaned = pd.concat([cleaned[~cleaned.index.isin(names)], cleaned_changed])
+
+    cleaned.to_parquet(cleaned_path)
+    fingerprints.to_parquet(fingerprints_path, index=False)
+    return cleaned, delta
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--input', default='scrapy-projects/nobel_winners/Nobel_winners_by_request_chains.json')
+    parser.add_argument('--cleaned', default='parquet-files/nobel_winners_cleaned_incrementally.parquet')
+    parser.add_argument('--fingerprints', default='parquet-files/nobel_winners_fingerprints.parquet')
+    args = parser.parse_args()
+
+    raw = pd.read_json(args.input)
+    df, delta = clean_incrementally(raw, args.cleaned, args.fingerprints)
+    print(f"{delta['records']} records: {delta['added']} added, {delta['removed']} removed, "
+          f"{delta['recleaned']} records of {delta['names']} names cleaned again")
+    print(f"{len(df)} cleaned winners stored in {args.cleaned}")
+
+"""
+Run from the examples directory:
+$ python winners_incremental.py
+The first run cleans all the records, the next runs clean only the changed ones.
+"""
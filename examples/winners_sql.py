@@ -0,0 +1,276 @@
+"""
+Loading the cleaned winners from DataFrames into SQL and reading them back with SQLAlchemy Core,
+for any table like Winner.__table__ of pandas_4--dataframe-to-sql.py.
+
+The bulk load inserts chunks of rows with one executemany per chunk:
+no ORM object and no identity map entry per row, and one round of parameter binding per chunk.
+On SQLite, the load also
+- switches the journal to WAL and turns off the fsync of every commit (synchronous=OFF) while loading,
+and sets both back after the load;
+- drops the indexes of the table and builds them again after the load,
+which is faster than updating them for every inserted row.
+
+The upsert compares the incoming DataFrame with the table by key, e.g. (name, year, category) or wikidata_code,
+and writes only the differences: "INSERT ... ON CONFLICT DO UPDATE" of the new and changed rows
+and DELETE of the rows that are gone. The unchanged rows are not written,
+so a refresh does not rewrite the table like to_sql(if_exists='replace').
+
+The chunked reader streams the rows of a query with a server-side cursor (stream_results)
+and builds a DataFrame of every chunk with the dtypes of the declared column types:
+dates as datetime64, enumerations as categoricals, integers as nullable Int64.
+The chunks can be written one by one into a Parquet file, so a large extract is never whole in memory.
+
+This example is based on:
+- https://docs.sqlalchemy.org/en/20/tutorial/data_insert.html#insert-usually-generates-the-values-clause-automatically;
+- https://docs.sqlalchemy.org/en/20/core/connections.html#engine-insertmanyvalues;
+- https://www.sqlite.org/pragma.html#pragma_synchronous;
+- https://www.sqlite.org/wal.html;
+- https://www.sqlite.org/lang_upsert.html;
+- https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert;
+- https://docs.sqlalchemy.org/en/20/core/connections.html#using-server-side-cursors-a-k-a-stream-results;
+- https://arrow.apache.org/docs/python/parquet.html#writing-to-parquet-files-incrementally.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import (
+    Boolean, Date, DateTime, Enum, Float, Index, Integer, MetaData, Numeric, Table, and_, bindparam, inspect, select, text
+)
+from sqlalchemy.dialects import postgresql, sqlite as sqlite_dialect
+
+UPSERT_DIALECTS = {'sqlite': sqlite_dialect.insert, 'postgresql': postgresql.insert}
+
+
+def iter_chunks(data, chunksize: int):
+    """
+    Chunks of a DataFrame, or the chunks of an iterable of DataFrames as they are
+    """
+    if isinstance(data, pd.DataFrame):
+        for start in range(0, len(data), chunksize):
+            yield data.iloc[start:start + chunksize]
+    else:
+        yield from data
+
+
+def to_rows(df: pd.DataFrame, table: Table) -> tuple:
+    """
+    The columns of df that the table has and the rows of df as tuples of Python values:
+    missing values become None, dates become strings unless the column is a DateTime
+    """
+    names = [column.name for column in table.columns if column.name in df.columns]
+    arrays = []
+    for name in names:
+        column = df[name]
+        if pd.api.types.is_datetime64_any_dtype(column) and not isinstance(table.c[name].type, DateTime):
+            column = column.astype(str)
+        values = column.to_numpy(dtype=object)
+        values[column.isna().to_numpy()] = None
+        arrays.append(values)
+    return names, list(zip(*arrays))
+
+
+def sqlite_indexes(connection, table: Table) -> list:
+    # All the indexes of the table in the database, also the ones not declared on the Table object
+    rows = connection.exec_driver_sql(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+        (table.name,),
+    )
+    return [tuple(row) for row in rows]
+
+
+def bulk_load(engine, table: Table, data, chunksize: int = 50_000, replace: bool = False,
+              fast_sqlite: bool = True) -> dict:
+    """
+    Insert a DataFrame or an iterable of DataFrame chunks into the table, committing every chunk:
+    if the load fails, the chunks committed before stay in the table.
+    replace deletes the rows of the table first and loads all the chunks in the same transaction,
+    so a failed load leaves the table as it was.
+    Return the number of rows, the seconds and the rows per second.
+    """
+    table.create(engine, checkfirst=True)
+    sqlite = engine.dialect.name == 'sqlite' and fast_sqlite
+    rows = 0
+    start = time.perf_counter()
+    with engine.connect() as connection:
+        indexes = []
+        if sqlite:
+            synchronous = connection.exec_driver_sql("PRAGMA synchronous").scalar()
+            journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+            connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+            connection.exec_driver_sql("PRAGMA synchronous=OFF")
+            indexes = sqlite_indexes(connection, table)
+            for name, _ in indexes:
+                connection.exec_driver_sql(f'DROP INDEX "{name}"')
+            connection.commit()
+        try:
+            if replace:
+                connection.execute(table.delete())
+            for chunk in iter_chunks(data, chunksize):
+                names, chunk_rows = to_rows(chunk, table)
+                if not chunk_rows:
+                    continue
+                if sqlite:
+                    # The executemany of the driver with tuples skips the parameter processing of SQLAlchemy
+                    insert = table.insert().compile(dialect=engine.dialect, column_keys=names)
+                    connection.exec_driver_sql(str(insert), chunk_rows)
+                else:
+                    connection.execute(table.insert(), [dict(zip(names, row)) for row in chunk_rows])
+                if not replace:
+                    connection.commit()
+                rows += len(chunk_rows)
+            connection.commit()
+        finally:
+            if sqlite:
+                connection.rollback()
+                for _, sql in indexes:
+                    connection.exec_driver_sql(sql)
+                connection.commit()
+                connection.exec_driver_sql(f"PRAGMA synchronous={synchronous}")
+                # The database file keeps the journal mode, so it is not left in WAL
+                connection.exec_driver_sql(f"PRAGMA journal_mode={journal_mode}")
+    seconds = time.perf_counter() - start
+    return {'rows': rows, 'seconds': seconds, 'rows_per_second': rows / seconds if seconds else 0.0}
+
+
+def row_hashes(df: pd.DataFrame) -> pd.Series:
+    """
+    A hash of the values of every row, the same for equal values of different dtypes (e.g. int64 and Int16, None and NaN)
+    """
+    values = df.astype(object)
+    values = values.where(values.notna(), None).astype(str)
+    return pd.util.hash_pandas_object(values, index=False)
+
+
+def upsert(engine, table_name: str, df: pd.DataFrame, keys: tuple = ('name', 'year', 'category'),
+           delete: bool = True, chunksize: int = 50_000) -> dict:
+    """
+    Make the table equal to df by writing only the rows that differ: insert the new keys,
+    update the rows of the existing keys whose values changed and, if delete is true, delete the missing keys.
+    A named index of df, like the name of the cleaned winners, is a column.
+    The keys must be unique in df, a unique index on them is created if the table has none.
+    Return the number of inserted, updated, deleted and unchanged rows.
+    """
+    if engine.dialect.name not in UPSERT_DIALECTS:
+        raise NotImplementedError(f"No INSERT ... ON CONFLICT for {engine.dialect.name}")
+    keys = list(keys)
+    if df.index.name is not None:
+        df = df.reset_index()
+    duplicated = df.duplicated(keys)
+    if duplicated.any():
+        raise ValueError(f"{duplicated.sum()} rows have the same {keys} as other rows")
+    if not inspect(engine).has_table(table_name):
+        df.head(0).to_sql(table_name, engine, index=False)
+    table = Table(table_name, MetaData(), autoload_with=engine)
+    unique_keys = [index['column_names'] for index in inspect(engine).get_indexes(table_name) if index['unique']]
+    if keys not in unique_keys:
+        Index(f"ux_{table_name}_{'_'.join(keys)}", *(table.c[key] for key in keys), unique=True).create(engine)
+
+    columns = [column.name for column in table.columns if column.name in df.columns]
+    existing = pd.read_sql_query(select(*(table.c[column] for column in columns)), engine)
+    incoming_keys = pd.MultiIndex.from_frame(df[keys])
+    existing_keys = pd.MultiIndex.from_frame(existing[keys])
+    positions = existing_keys.get_indexer(incoming_keys)
+    found = positions >= 0
+    changed = np.zeros(len(df), dtype=bool)
+    changed[found] = row_hashes(df[columns]).to_numpy()[found] != row_hashes(existing).to_numpy()[positions[found]]
+    deleted = ~existing_keys.isin(incoming_keys) if delete else np.zeros(len(existing), dtype=bool)
+
+    stats = {
+        'inserted': int((~found).sum()),
+        'updated': int(changed.sum()),
+        'deleted': int(deleted.sum()),
+        'unchanged': int((found & ~changed).sum()),
+    }
+    insert = UPSERT_DIALECTS[engine.dialect.name](table)
+    insert = insert.on_conflict_do_update(
+        index_elements=keys,
+        set_={column: insert.excluded[column] for column in columns if column not in keys},
+    )
+    delete_by_key = table.delete().where(and_(*(table.c[key] == bindparam(f"key_{key}") for key in keys)))
+    with engine.begin() as connection:
+        for chunk in iter_chunks(df[~found | changed], chunksize):
+            names, chunk_rows = to_rows(chunk, table)
+            connection.execute(insert, [dict(zip(names, row)) for row in chunk_rows])
+        deleted_keys = existing.loc[deleted, keys]
+        if len(deleted_keys):
+            connection.execute(delete_by_key, [
+                {f"key_{key}": value for key, value in zip(keys, row)}
+                for row in deleted_keys.itertuples(index=False)
+            ])
+    return stats
+
+
+def column_dtype(sql_type):
+    """
+    The pandas dtype of an SQLAlchemy column type, None to keep the Python objects
+    """
+    if isinstance(sql_type, Enum):
+        return pd.CategoricalDtype(sql_type.enums)
+    if isinstance(sql_type, (Date, DateTime)):
+        return 'datetime64[ns]'
+    if isinstance(sql_type, Boolean):
+        return 'boolean'
+    if isinstance(sql_type, Integer):
+        return 'Int64'
+    if isinstance(sql_type, (Float, Numeric)):
+        return 'float64'
+    return None
+
+
+def to_statement(engine, query):
+    """
+    A statement for a table, a table name, an SQL string or a select
+    """
+    if isinstance(query, Table):
+        return query.select()
+    if isinstance(query, str):
+        if inspect(engine).has_table(query):
+            return Table(query, MetaData(), autoload_with=engine).select()
+        return text(query)
+    return query
+
+
+def read_sql_chunks(engine, query, chunksize: int = 50_000, dtypes: dict = None):
+    """
+    Yield DataFrames of at most chunksize rows of the query, fetched with a server-side cursor.
+    The dtypes come from the column types of the query (see column_dtype) updated by dtypes,
+    e.g. {'date_of_birth': 'datetime64[ns]'} for the string form dates of Winner.
+    A 'category' dtype without categories gives the categories of every chunk, which may differ.
+    """
+    statement = to_statement(engine, query)
+    columns_dtypes = {column.name: column_dtype(column.type) for column in getattr(statement, 'selected_columns', [])}
+    columns_dtypes.update(dtypes or {})
+    with engine.connect() as connection:
+        result = connection.execution_options(yield_per=chunksize).execute(statement)
+        names = list(result.keys())
+        chunk_dtypes = {name: dtype for name, dtype in columns_dtypes.items() if name in names and dtype is not None}
+        for rows in result.partitions():
+            yield pd.DataFrame.from_records(rows, columns=names, coerce_float=True).astype(chunk_dtypes)
+
+
+def sql_to_parquet(engine, query, path: str, chunksize: int = 50_000, dtypes: dict = None) -> int:
+    """
+    Write the rows of the query into a Parquet file, one row group per chunk of read_sql_chunks,
+    no file if the query has no rows. Return the number of rows.
+    The schema comes from the first chunk, where a column of Python objects with only NULLs
+    has no type: it is written as strings, so the values of the next chunks fit.
+    """
+    import pyarrow as pa  # precondition: pyarrow installed
+    import pyarrow.parquet as pq
+
+    rows = 0
+    writer = None
+    try:
+        for chunk in read_sql_chunks(engine, query, chunksize, dtypes):
+            if writer is None:
+                schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                schema = pa.schema([field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+                                    for field in schema], metadata=schema.metadata)
+                writer = pq.ParquetWriter(path, schema)
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows